@@ -19,23 +19,36 @@ from typing import Dict
 from typing import List
 from types import ModuleType
 
+from asyncio import AbstractEventLoop
+from asyncio import get_running_loop
 from os import environ
 
 from neuro_san.internals.authorization.interfaces.abstract_authorizer import AbstractAuthorizer
 from neuro_san.internals.authorization.interfaces.authorizer import Authorizer
+from neuro_san.internals.authorization.openfga.open_fga_decision_cache import OpenFgaDecisionCache
 from neuro_san.internals.authorization.openfga.open_fga_store_cache import OpenFgaStoreCache
 
 
 class OpenFgaAuthorizer(AbstractAuthorizer):
     """
     AbstractAuthorizer implementation for Open FGA ("Fine Grained Authorization").
+
+    Clients to the OpenFGA server are long-lived: one is kept per event loop
+    (as the underlying web session is bound to the loop it was created on)
+    and reused across authorization sessions, as recommended by the OpenFGA docs.
+
+    Decisions are cached for a short while by an OpenFgaDecisionCache,
+    which is invalidated whenever this authorizer grants or revokes anything.
     """
 
-    def __init__(self, fga_client: Any = None):
+    def __init__(self, fga_client: Any = None, decision_cache: OpenFgaDecisionCache = None):
         """
         Constructor
 
-        :param fga_client: A pre-initialized OpenFgaClient
+        :param fga_client: A pre-initialized OpenFgaClient to use for all calls.
+                    Default of None gets clients from the OpenFgaStoreCache as needed.
+        :param decision_cache: An OpenFgaDecisionCache to use.
+                    Default of None creates one configured by environment variables.
         """
         super().__init__()
 
@@ -48,27 +61,63 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
         self.debug: bool = debug_auth is not None and len(debug_auth) > 0 and debug_auth != "false"
         self.fail_on_unauthorized: bool = environ.get("AGENT_DEBUG_AUTH") == "hard"
 
-        # Note: we don't initialize the client because constructors cannot be async
-        # This is what we use aenter() and aexit() for.
+        # Note: we don't initialize the client because constructors cannot be async.
+        # Clients are created lazily by get_fga_client().
         self.fga_client: self.openfga_sdk.client.client.OpenFgaClient = fga_client
+        self.fga_clients: Dict[AbstractEventLoop, Any] = {}
+
+        self.decision_cache: OpenFgaDecisionCache = decision_cache
+        if self.decision_cache is None:
+            self.decision_cache = OpenFgaDecisionCache()
 
     async def __aenter__(self) -> Authorizer:
         """
         Opens a scoped session with an Authorizer.
+        The client to the server outlives the session.
         """
-        if self.fga_client is not None:
-            await self.fga_client.close()
-
-        # Open a new client
-        self.fga_client = await OpenFgaStoreCache.get_client()
+        await self.get_fga_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """
         Closes a scoped session with an Authorizer.
+        Clients are kept open for the next session. See close().
         """
-        await self.fga_client.close()
-        self.fga_client = None
+
+    async def get_fga_client(self) -> Any:
+        """
+        :return: The OpenFgaClient to use on the current event loop, creating one if necessary
+        """
+        if self.fga_client is not None:
+            return self.fga_client
+
+        loop: AbstractEventLoop = get_running_loop()
+        fga_client: Any = self.fga_clients.get(loop)
+        if fga_client is None:
+            # Forget about clients whose loops are gone.
+            for one_loop in list(self.fga_clients.keys()):
+                if one_loop.is_closed():
+                    del self.fga_clients[one_loop]
+
+            new_client: Any = await OpenFgaStoreCache.get_client()
+            fga_client = self.fga_clients.setdefault(loop, new_client)
+            if fga_client is not new_client:
+                # Someone else on this loop beat us to it.
+                await new_client.close()
+        return fga_client
+
+    async def close(self):
+        """
+        Closes the client to the server for the current event loop, if any.
+        """
+        fga_client: Any = None
+        if self.fga_client is not None:
+            fga_client = self.fga_client
+            self.fga_client = None
+        else:
+            fga_client = self.fga_clients.pop(get_running_loop(), None)
+        if fga_client is not None:
+            await fga_client.close()
 
     async def authorize(self, actor: Dict[str, Any], action: str, resource: Dict[str, Any]) -> bool:
         """
@@ -113,19 +162,13 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
             self.logger.info("authorize(%s, %s, %s:%s)", use_actor, use_action,
                              use_resource.get("type"), use_resource.get("id"))
 
-        # Use classes from the lazily imported module to avoid extra required dependencies
-        # pylint: disable=invalid-name
-        ClientCheckRequest = self.openfga_sdk.client.models.check_request.ClientCheckRequest
-        CheckResponse = self.openfga_sdk.models.check_response.CheckResponse
+        user: str = f"{use_actor.get('type')}:{use_actor.get('id')}"
+        fga_object: str = f"{use_resource.get('type')}:{use_resource.get('id')}"
 
-        # Prepare a request to see if the server can tell us the answer.
-        check_request = ClientCheckRequest(user=f"{use_actor.get('type')}:{use_actor.get('id')}",
-                                           relation=use_action,
-                                           object=f"{use_resource.get('type')}:{use_resource.get('id')}")
-
-        # No async with here, as that would close the client
-        check_response: CheckResponse = await self.fga_client.check(check_request)
-        authorized = check_response.allowed
+        authorized = self.decision_cache.get(user, use_action, fga_object)
+        if authorized is None:
+            authorized = await self.check(user, use_action, fga_object)
+            self.decision_cache.put(user, use_action, fga_object, authorized)
 
         if not authorized:
             message: str = f"Actor: {actor}   action: {action}   resource: {resource}"
@@ -140,6 +183,29 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
 
         return authorized
 
+    async def check(self, user: str, relation: str, fga_object: str) -> bool:
+        """
+        Ask the server for a single decision, bypassing the cache.
+        :param user: The OpenFGA user string, like "User:alice"
+        :param relation: The relation, like "read"
+        :param fga_object: The OpenFGA object string, like "AgentNetwork:hello_world"
+        :return: True if the server says the user has the relation to the object
+        """
+        # Use classes from the lazily imported module to avoid extra required dependencies
+        # pylint: disable=invalid-name
+        ClientCheckRequest = self.openfga_sdk.client.models.check_request.ClientCheckRequest
+        CheckResponse = self.openfga_sdk.models.check_response.CheckResponse
+
+        # Prepare a request to see if the server can tell us the answer.
+        check_request = ClientCheckRequest(user=user,
+                                           relation=relation,
+                                           object=fga_object)
+
+        # No async with here, as that would close the client
+        fga_client: Any = await self.get_fga_client()
+        check_response: CheckResponse = await fga_client.check(check_request)
+        return check_response.allowed
+
     # pylint: disable=too-many-locals
     async def list(self, actor: Dict[str, Any], relation: str, resource: Dict[str, Any]) -> List[str]:
         """
@@ -172,7 +238,7 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
             # We are looking for a specific id. Faster through authorize()
             if self.debug:
                 self.logger.info("using authorize() for list()")
-            authorized: bool = self.authorize(actor, relation, resource)
+            authorized: bool = await self.authorize(actor, relation, resource)
             if authorized:
                 ids.append(str(resource.get("id")))
             return ids
@@ -202,13 +268,19 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
                                         type=resource_type)
 
         # No async with here, as that would close the client
-        response: ListObjectsResponse = await self.fga_client.list_objects(body, options)
+        fga_client: Any = await self.get_fga_client()
+        response: ListObjectsResponse = await fga_client.list_objects(body, options)
 
         for one_object in response.objects:
             # Results come in the format of a single string "<type>:<identifier>"
             one_id: str = one_object.split(":")[1]
             ids.append(one_id)
 
+        # Enumeration is typically followed by checks on individual objects of the same type.
+        # Let the listing allow the objects it has. Anything else still gets checked.
+        if request_user is not None:
+            self.decision_cache.put_listing(request_user, relation, resource_type, response.objects)
+
         if self.debug:
             self.logger.info("list length is %d", len(ids))
 
@@ -270,7 +342,8 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
                                    object=request_object)
 
         # No async with here, as that would close the client
-        response: ReadResponse = await self.fga_client.read(body, options)
+        fga_client: Any = await self.get_fga_client()
+        response: ReadResponse = await fga_client.read(body, options)
 
         # Process the response
         retval: List[str] = []
@@ -349,7 +422,8 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
         retval: bool = True
         try:
             # No async with here, as that would close the client
-            _ = await self.fga_client.write(body)
+            fga_client: Any = await self.get_fga_client()
+            _ = await fga_client.write(body)
 
         except self.openfga_sdk.exceptions.ValidationException as err:
             if (str(err).find("tuple to be written already existed") > 0) and self.debug:
@@ -359,6 +433,10 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
             else:
                 raise
 
+        finally:
+            # Any number of decisions might have changed as the authorization model is a graph.
+            self.decision_cache.invalidate()
+
         return retval
 
     async def revoke(self, actor: Dict[str, Any], relation: str, resource: Dict[str, Any]) -> bool:
@@ -412,7 +490,8 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
         retval: bool = True
         try:
             # No async with here, as that would close the client
-            _ = await self.fga_client.write(body)
+            fga_client: Any = await self.get_fga_client()
+            _ = await fga_client.write(body)
 
         except self.openfga_sdk.exceptions.ValidationException as err:
             if (str(err).find("tuple to be deleted did not exist") > 0) and self.debug:
@@ -422,6 +501,10 @@ class OpenFgaAuthorizer(AbstractAuthorizer):
             else:
                 raise
 
+        finally:
+            # Any number of decisions might have changed as the authorization model is a graph.
+            self.decision_cache.invalidate()
+
         return retval
 
     async def handle_special_user_writes(self, writes: List[Any], actor: Dict[str, Any], resource: Dict[str, Any]):
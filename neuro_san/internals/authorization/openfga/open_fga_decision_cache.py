@@ -0,0 +1,201 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import Tuple
+
+from collections import OrderedDict
+from os import environ
+from threading import Lock
+
+import time
+
+
+class OpenFgaDecisionCache:
+    """
+    Bounded, time-limited cache of OpenFGA authorization decisions.
+
+    Decisions are keyed by the (user, relation, object) triple in OpenFGA string form,
+    for example ("User:alice", "read", "AgentNetwork:hello_world").
+    Denials are cached too, but for a shorter time (negative_ttl_seconds),
+    so that a freshly granted permission kicks in quickly even if it was
+    granted by some other process.
+
+    Results of list_objects() calls can be recorded as well.  While such a
+    listing is fresh, it allows checks for the objects it lists for that user
+    and relation, so enumeration paths (like MCP tools/list, which checks each
+    agent in turn) cost a single round trip.  Listings can be truncated by the
+    server (deadline or maximum number of results), so an object missing from
+    a listing is not taken as a denial; that is left to a regular check.
+
+    Since authorization models are graphs, a single grant or revoke can
+    change the answer for any number of triples, so invalidate() is coarse.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, ttl_seconds: float = None,
+                 negative_ttl_seconds: float = None,
+                 max_entries: int = None):
+        """
+        Constructor
+
+        :param ttl_seconds: How long an allowed decision is kept.
+                    Default of None uses AGENT_AUTH_CACHE_TTL_SECONDS, or 30 seconds.
+                    A value <= 0 disables the cache altogether.
+        :param negative_ttl_seconds: How long a denied decision is kept.
+                    Default of None uses AGENT_AUTH_CACHE_NEGATIVE_TTL_SECONDS, or 5 seconds.
+                    A value <= 0 means denials are not cached.
+        :param max_entries: Maximum number of decisions and listings kept, least recently used go first.
+                    Default of None uses AGENT_AUTH_CACHE_MAX_ENTRIES, or 10000.
+        """
+        if ttl_seconds is None:
+            ttl_seconds = float(environ.get("AGENT_AUTH_CACHE_TTL_SECONDS", "30"))
+        if negative_ttl_seconds is None:
+            negative_ttl_seconds = float(environ.get("AGENT_AUTH_CACHE_NEGATIVE_TTL_SECONDS", "5"))
+        if max_entries is None:
+            max_entries = int(environ.get("AGENT_AUTH_CACHE_MAX_ENTRIES", "10000"))
+
+        self.ttl_seconds: float = ttl_seconds
+        self.negative_ttl_seconds: float = negative_ttl_seconds
+        self.max_entries: int = max_entries
+
+        # Threaded lock - on purpose even though async access is used,
+        # as an Authorizer can be shared by different AsyncioExecutor threads.
+        self.lock = Lock()
+
+        # Map of (user, relation, object) -> (allowed, expiry time)
+        self.decisions: OrderedDict[Tuple[str, str, str], Tuple[bool, float]] = OrderedDict()
+
+        # Map of (user, relation, object type) -> (set of allowed objects, expiry time)
+        self.listings: OrderedDict[Tuple[str, str, str], Tuple[Set[str], float]] = OrderedDict()
+
+        # Statistics
+        self.num_hits: int = 0
+        self.num_misses: int = 0
+
+    def is_enabled(self) -> bool:
+        """
+        :return: True if decisions are cached at all
+        """
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, user: str, relation: str, fga_object: str) -> bool:
+        """
+        :param user: The OpenFGA user string, like "User:alice"
+        :param relation: The relation, like "read"
+        :param fga_object: The OpenFGA object string, like "AgentNetwork:hello_world"
+        :return: The cached decision, or None if there is no fresh one
+        """
+        if not self.is_enabled():
+            return None
+
+        now: float = time.monotonic()
+        key: Tuple[str, str, str] = (user, relation, fga_object)
+        object_type: str = fga_object.split(":", 1)[0]
+        listing_key: Tuple[str, str, str] = (user, relation, object_type)
+        with self.lock:
+            decision: Tuple[bool, float] = self.decisions.get(key)
+            if decision is not None:
+                if decision[1] > now:
+                    self.decisions.move_to_end(key)
+                    self.num_hits += 1
+                    return decision[0]
+                del self.decisions[key]
+
+            listing: Tuple[Set[str], float] = self.listings.get(listing_key)
+            if listing is not None:
+                if listing[1] <= now:
+                    del self.listings[listing_key]
+                elif fga_object in listing[0]:
+                    # Listings only ever answer "allowed"
+                    self.listings.move_to_end(listing_key)
+                    self.num_hits += 1
+                    return True
+
+            self.num_misses += 1
+        return None
+
+    def put(self, user: str, relation: str, fga_object: str, allowed: bool):
+        """
+        Record a decision from the server.
+
+        :param user: The OpenFGA user string, like "User:alice"
+        :param relation: The relation, like "read"
+        :param fga_object: The OpenFGA object string, like "AgentNetwork:hello_world"
+        :param allowed: The decision
+        """
+        ttl_seconds: float = self.ttl_seconds if allowed else self.negative_ttl_seconds
+        if not self.is_enabled() or ttl_seconds <= 0:
+            return
+
+        key: Tuple[str, str, str] = (user, relation, fga_object)
+        with self.lock:
+            self.decisions[key] = (allowed, time.monotonic() + ttl_seconds)
+            self.decisions.move_to_end(key)
+            self._trim(self.decisions)
+
+    def put_listing(self, user: str, relation: str, object_type: str, fga_objects: List[str]):
+        """
+        Record the result of a list_objects() call from the server.
+        Only the objects listed are taken as allowed.
+
+        :param user: The OpenFGA user string, like "User:alice"
+        :param relation: The relation, like "read"
+        :param object_type: The type of the objects listed, like "AgentNetwork"
+        :param fga_objects: OpenFGA object strings the user has the relation to,
+                    like ["AgentNetwork:hello_world"]. Need not be complete.
+        """
+        if not self.is_enabled():
+            return
+        ttl_seconds: float = self.ttl_seconds
+
+        key: Tuple[str, str, str] = (user, relation, object_type)
+        with self.lock:
+            self.listings[key] = (set(fga_objects), time.monotonic() + ttl_seconds)
+            self.listings.move_to_end(key)
+            self._trim(self.listings)
+
+    def invalidate(self):
+        """
+        Forget everything, as is needed after a grant or revoke.
+        """
+        with self.lock:
+            self.decisions.clear()
+            self.listings.clear()
+
+    def _trim(self, entries: OrderedDict[Any, Any]):
+        """
+        Drop least recently used entries beyond the bound. Caller holds the lock.
+        :param entries: The OrderedDict to trim
+        """
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        :return: A dictionary of cache statistics
+        """
+        with self.lock:
+            return {
+                "hits": self.num_hits,
+                "misses": self.num_misses,
+                "decisions": len(self.decisions),
+                "listings": len(self.listings)
+            }
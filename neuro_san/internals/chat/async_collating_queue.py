@@ -1,4 +1,3 @@
-
 # Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -17,17 +16,36 @@
 
 from typing import Any
 from typing import AsyncIterator
+from typing import Deque
 from typing import Dict
+from typing import List
+from typing import Tuple
 
-from janus import Queue
+from asyncio import AbstractEventLoop
+from asyncio import Future
+from asyncio import get_running_loop
+from collections import deque
+from os import environ
+from threading import Lock
 
 from neuro_san.internals.interfaces.async_hopper import AsyncHopper
 
 
+# pylint: disable=too-many-instance-attributes
 class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
     """
     AsyncIterator instance to asynchronously iterate over/consume the contents of
     a Queue as they come in.
+
+    Producers and the single consumer can each be running in a different asyncio event loop,
+    and none of them ever block their loop's thread for longer than it takes to take a lock
+    for a deque append or swap. A waiting consumer is woken up by way of its own loop,
+    and takes everything that has come in so far in one go.
+
+    The queue has a capacity for the number of items put() but not yet consumed.
+    When full, put() asynchronously waits until the consumer has worked through
+    what it last took. The final item is always accepted, so the end of data can
+    always be signalled. A capacity <= 0 means no limit.
     """
     # Constant for the end key
     END_KEY: str = "end"
@@ -35,22 +53,38 @@ class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
     # Constant for the end message to be put in a Queue when all the messages are done
     END_MESSAGE: Dict[str, Any] = {END_KEY: True}
 
-    def __init__(self, queue: Queue = None):
+    DEFAULT_CAPACITY: int = 1000
+
+    def __init__(self, capacity: int = None):
         """
         Constructor
 
-        :param queue: The queue we will be iterating over.
-                      Default value is None, indicating a standard Queue will be used.
+        :param capacity: The maximum number of items put() but not yet consumed.
+                      Default value of None means to use the AGENT_MESSAGE_QUEUE_CAPACITY
+                      environment variable, or DEFAULT_CAPACITY if that is not set.
+                      A value <= 0 means no limit.
         """
-        self.queue: Queue = queue
-        if self.queue is None:
-            self.queue = Queue()
+        if capacity is None:
+            capacity = int(environ.get("AGENT_MESSAGE_QUEUE_CAPACITY", str(self.DEFAULT_CAPACITY)))
+        self.capacity: int = capacity
 
-    def get_queue(self) -> Queue:
-        """
-        :return: The Queue associated with this instance
-        """
-        return self.queue
+        self.lock = Lock()
+        self.closed: bool = False
+
+        # Items put() but not yet taken by the consumer
+        self.items: Deque[Any] = deque()
+
+        # Items taken by the consumer in its last go, and how many of those there were.
+        # Those still count against the capacity until the consumer comes back for more.
+        self.batch: Deque[Any] = deque()
+        self.batch_size: int = 0
+
+        # (loop, future) pairs for whoever is waiting
+        self.consumer_waiter: Tuple[AbstractEventLoop, Future] = None
+        self.producer_waiters: List[Tuple[AbstractEventLoop, Future]] = []
+
+        # Number of times a put() had to wait for room
+        self.num_backpressure_waits: int = 0
 
     def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
         """
@@ -65,40 +99,99 @@ class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
                 Will throw StopAsyncIteration when the final item is detected
                 via the is_final_item() method..
         """
-        message = await self.queue.async_q.get()
+        if not self.batch:
+            await self.take_batch()
+
+        message = self.batch.popleft()
         if self.is_final_item(message):
             raise StopAsyncIteration
 
         return message
 
+    async def take_batch(self):
+        """
+        Asynchronously waits until there is something on the queue,
+        then takes everything there is into our batch.
+        """
+        while True:
+            waiter: Future = None
+            with self.lock:
+                if self.closed:
+                    raise RuntimeError("AsyncCollatingQueue is closed")
+
+                # We are done with our last batch, which makes room for anyone waiting for it.
+                self.batch_size = 0
+                producer_waiters: List[Tuple[AbstractEventLoop, Future]] = self.producer_waiters
+                self.producer_waiters = []
+
+                if self.items:
+                    self.batch, self.items = self.items, self.batch
+                    self.batch_size = len(self.batch)
+                else:
+                    loop: AbstractEventLoop = get_running_loop()
+                    waiter = loop.create_future()
+                    self.consumer_waiter = (loop, waiter)
+
+            for producer_waiter in producer_waiters:
+                self.wake(producer_waiter)
+
+            if waiter is None:
+                return
+            await waiter
+
+    def drain(self) -> List[Any]:
+        """
+        Synchronously takes everything on the queue without waiting.
+        This is for consumers that poll from outside of any event loop.
+        :return: A list of all the items put() since the last drain(), possibly empty.
+        """
+        with self.lock:
+            items: List[Any] = list(self.items)
+            self.items.clear()
+            producer_waiters = self.producer_waiters
+            self.producer_waiters = []
+
+        for producer_waiter in producer_waiters:
+            self.wake(producer_waiter)
+        return items
+
     async def put(self, item: Any, synchronous: bool = False):
         """
         Fulfills AsyncHopper interface
 
         :param item: The item to put on the queue.
-        :param synchronous: When False (the default), we use the asynchronous-side
-                of the queue for our put() operation.  This is generally what
-                would be expected inside an async call, which is why it is the default.
-                When True, we use the synchronous side of the queue for put().
-                This ends up being necessary when each end of the queue is serviced
-                in a different asyncio event loop.
-        """
-        if synchronous:
-            self.queue.sync_q.put(item)
-        else:
-            await self.queue.async_q.put(item)
+        :param synchronous: No longer used. Puts work from any event loop without
+                blocking its thread, so there is no need to choose a side of the queue.
+                Kept for compatibility with existing callers.
+        """
+        _ = synchronous
+        while True:
+            with self.lock:
+                if self.closed:
+                    raise RuntimeError("AsyncCollatingQueue is closed")
+                pending: int = len(self.items) + self.batch_size
+                if self.capacity <= 0 or pending < self.capacity or self.is_final_item(item):
+                    self.items.append(item)
+                    consumer_waiter: Tuple[AbstractEventLoop, Future] = self.consumer_waiter
+                    self.consumer_waiter = None
+                    break
+
+                # Full. Wait for the consumer to take what is there.
+                self.num_backpressure_waits += 1
+                loop: AbstractEventLoop = get_running_loop()
+                waiter: Future = loop.create_future()
+                self.producer_waiters.append((loop, waiter))
+            await waiter
+
+        if consumer_waiter is not None:
+            self.wake(consumer_waiter)
 
     async def put_final_item(self, synchronous: bool = False):
         """
         Puts the final item on the queue indicating that no more data will
         be on the queue and the consumer's iteration can cease when it sees
-        this item.
-        :param synchronous: When False (the default), we use the asynchronous-side
-                of the queue for our put() operation.  This is generally what
-                would be expected inside an async call, which is why it is the default.
-                When True, we use the synchronous side of the queue for put().
-                This ends up being necessary when each end of the queue is serviced
-                in a different asyncio event loop.
+        this item. This never waits for room on the queue.
+        :param synchronous: No longer used. See put().
         """
         await self.put(self.END_MESSAGE, synchronous)
 
@@ -110,8 +203,55 @@ class AsyncCollatingQueue(AsyncIterator, AsyncHopper):
         """
         return isinstance(item, Dict) and item.get(self.END_KEY) is not None
 
+    def qsize(self) -> int:
+        """
+        :return: The number of items put() but not yet consumed
+        """
+        with self.lock:
+            return len(self.items) + len(self.batch)
+
+    @staticmethod
+    def wake(loop_and_waiter: Tuple[AbstractEventLoop, Future]):
+        """
+        Wakes up whoever is waiting on the future, by way of the future's own event loop.
+        :param loop_and_waiter: A tuple of (event loop, future) for the waiter
+        """
+        loop, waiter = loop_and_waiter
+        try:
+            running_loop: AbstractEventLoop = get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if loop is running_loop:
+            AsyncCollatingQueue.set_waiter_result(waiter)
+            return
+
+        try:
+            loop.call_soon_threadsafe(AsyncCollatingQueue.set_waiter_result, waiter)
+        except RuntimeError:
+            # Loop has been closed. Nobody is waiting any more.
+            pass
+
+    @staticmethod
+    def set_waiter_result(waiter: Future):
+        """
+        :param waiter: The future to mark as done, unless it already is (or was cancelled)
+        """
+        if not waiter.done():
+            waiter.set_result(None)
+
     def close(self):
         """
-        Close this queue
+        Close this queue.
+        Anyone waiting on the queue gets a RuntimeError, as does anyone using it after this.
         """
-        self.queue.close()
+        with self.lock:
+            self.closed = True
+            waiters: List[Tuple[AbstractEventLoop, Future]] = self.producer_waiters
+            self.producer_waiters = []
+            if self.consumer_waiter is not None:
+                waiters.append(self.consumer_waiter)
+                self.consumer_waiter = None
+
+        for waiter in waiters:
+            self.wake(waiter)
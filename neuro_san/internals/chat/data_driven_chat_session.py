@@ -18,8 +18,6 @@ from typing import Any
 from typing import Dict
 from typing import Iterator
 from typing import List
-from typing import Tuple
-from typing import Type
 from typing import Union
 
 import copy
@@ -31,8 +29,6 @@ from inspect import iscoroutinefunction
 
 from langchain_core.messages.base import BaseMessage
 
-from leaf_common.config.resolver_util import ResolverUtil
-
 from neuro_san.interfaces.reservationist import Reservationist
 from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
 from neuro_san.internals.chat.chat_history_message_processor import ChatHistoryMessageProcessor
@@ -53,11 +49,12 @@ from neuro_san.internals.run_context.interfaces.run_context import RunContext
 from neuro_san.message_processing.message_processor import MessageProcessor
 from neuro_san.message_processing.answer_message_processor import AnswerMessageProcessor
 from neuro_san.message_processing.structure_message_processor import StructureMessageProcessor
+from neuro_san.internals.utils.lazy_type_tuple import LazyTypeTuple
 
 # Lazily import specific errors from llm providers
-PATIENCE_ERRORS: Tuple[Type[Any], ...] = ResolverUtil.create_type_tuple([
-                                            "openai.BadRequestError",
-                                         ])
+PATIENCE_ERRORS: LazyTypeTuple = LazyTypeTuple([
+    "openai.BadRequestError",
+])
 
 
 # pylint: disable=too-many-instance-attributes
@@ -74,8 +71,9 @@ class DataDrivenChatSession(RunTarget):
         :param agent_network: The AgentNetwork to use.
         """
         # We make a copy of the AgentNetwork at this level to allow for interactions
-        # within this scope to modify the network topology.
-        agent_network_copy: AgentNetwork = copy.deepcopy(agent_network)
+        # within this scope to modify the network topology.  The copy is cheap,
+        # as the agent specs themselves are read-only and shared.
+        agent_network_copy: AgentNetwork = agent_network.create_copy()
         self.registry: AgentToolRegistry = AgentToolRegistry(agent_network_copy)
 
         self.front_man: FrontMan = None
@@ -165,7 +163,7 @@ class DataDrivenChatSession(RunTarget):
             #       messages from downstream agents.
             raw_messages: List[BaseMessage] = await self.front_man.submit_message(user_input)
 
-        except PATIENCE_ERRORS:
+        except PATIENCE_ERRORS.get():
             # This can happen if the user is trying to send a new message
             # while it is still working on a previous message that has not
             # yet returned.
@@ -297,11 +295,8 @@ class DataDrivenChatSession(RunTarget):
         # The consumer await-s for queue.get()
         queue: AsyncCollatingQueue = self.invocation_context.get_queue()
 
-        # The synchronous=True is necessary when an async HTTP request is at the get()-ing end of the queue,
-        # as the journal messages come from inside a separate event loop from that request. The lock
-        # taken here ends up being harmless in the synchronous request case (like for gRPC) because
-        # we would only be blocking our own event loop.
-        await queue.put_final_item(synchronous=True)
+        # This works across event loops, and never waits on a full queue.
+        await queue.put_final_item()
 
         # Now that we are done, tell the Reservationist that we used for this request
         # that there will be no more Reservations to corral.
@@ -16,6 +16,7 @@
 # END COPYRIGHT
 from typing import Any
 from typing import Dict
+from typing import List
 
 from neuro_san.internals.filters.message_filter import MessageFilter
 from neuro_san.internals.messages.chat_message_type import ChatMessageType
@@ -43,3 +44,13 @@ class ChatContextMessageFilter(MessageFilter):
 
         # Meets all our criteria. Let it through.
         return True
+
+    def may_allow(self, message_type: ChatMessageType, origin: List[Dict[str, Any]]) -> bool:
+        """
+        Quick check on a message before it is even converted to a ChatMessage dictionary.
+
+        :param message_type: The ChatMessageType of the message
+        :param origin: The origin list of the message. Can be None.
+        :return: False if allow_message() would never let the message through.
+        """
+        return message_type == ChatMessageType.AGENT_FRAMEWORK
@@ -52,6 +52,19 @@ class CompoundMessageFilter(MessageFilter):
         # Nobody wanted it.
         return False
 
+    def may_allow(self, message_type: ChatMessageType, origin: List[Dict[str, Any]]) -> bool:
+        """
+        Quick check on a message before it is even converted to a ChatMessage dictionary.
+
+        :param message_type: The ChatMessageType of the message
+        :param origin: The origin list of the message. Can be None.
+        :return: False if allow_message() would never let the message through.
+        """
+        for one_filter in self.filters:
+            if one_filter.may_allow(message_type, origin):
+                return True
+        return False
+
     def add_message_filter(self, message_filter: MessageFilter):
         """
         Adds a message_filter to the list
@@ -16,6 +16,7 @@
 # END COPYRIGHT
 from typing import Any
 from typing import Dict
+from typing import List
 
 from neuro_san.internals.messages.chat_message_type import ChatMessageType
 
@@ -55,3 +56,16 @@ class MessageFilter:
         :return: True if the message should be allowed through to the client. False otherwise.
         """
         raise NotImplementedError
+
+    def may_allow(self, message_type: ChatMessageType, origin: List[Dict[str, Any]]) -> bool:
+        """
+        Quick check on a message before it is even converted to a ChatMessage dictionary.
+        Journals call this so as not to bother converting messages that would never get through.
+
+        :param message_type: The ChatMessageType of the message
+        :param origin: The origin list of the message. Can be None.
+        :return: False if allow_message() would never let the message through.
+                True if it might, depending on the rest of the message.
+        """
+        _ = message_type, origin
+        return True
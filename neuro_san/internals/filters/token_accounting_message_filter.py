@@ -56,3 +56,15 @@ class TokenAccountingMessageFilter(MessageFilter):
 
         # Meets all our criteria. Let it through.
         return True
+
+    def may_allow(self, message_type: ChatMessageType, origin: List[Dict[str, Any]]) -> bool:
+        """
+        Quick check on a message before it is even converted to a ChatMessage dictionary.
+
+        :param message_type: The ChatMessageType of the message
+        :param origin: The origin list of the message. Can be None.
+        :return: False if allow_message() would never let the message through.
+        """
+        if message_type != ChatMessageType.AGENT:
+            return False
+        return origin is None or len(origin) <= 1
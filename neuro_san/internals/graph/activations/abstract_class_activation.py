@@ -20,7 +20,7 @@ from typing import List
 from typing import Type
 from typing import Union
 
-from asyncio import AbstractEventLoop
+import asyncio
 
 from copy import deepcopy
 from logging import getLogger
@@ -30,7 +30,6 @@ import traceback
 from langchain_core.messages.ai import AIMessage
 from langchain_core.messages.base import BaseMessage
 
-from leaf_common.asyncio.asyncio_executor import AsyncioExecutor
 from leaf_common.config.resolver import Resolver
 from leaf_common.parsers.dictionary_extractor import DictionaryExtractor
 
@@ -38,6 +37,8 @@ from neuro_san.interfaces.coded_tool import CodedTool
 from neuro_san.interfaces.reservationist import Reservationist
 from neuro_san.internals.graph.activations.abstract_callable_activation import AbstractCallableActivation
 from neuro_san.internals.graph.activations.branch_activation import BranchActivation
+from neuro_san.internals.graph.activations.coded_tool_class_cache import CodedToolClassCache
+from neuro_san.internals.graph.activations.coded_tool_thread_pool import CodedToolThreadPool
 from neuro_san.internals.graph.interfaces.agent_tool_factory import AgentToolFactory
 from neuro_san.internals.interfaces.invocation_context import InvocationContext
 from neuro_san.internals.journals.journal import Journal
@@ -180,6 +181,8 @@ class AbstractClassActivation(AbstractCallableActivation):
     def resolve_class(self, class_name: str, module_name: str):
         """
         Resolve the class by trying progressively higher levels in the agent network hierarchy.
+        Results, including the levels where the class could not be found,
+        are kept in the CodedToolClassCache for subsequent invocations.
 
         :param class_name: The name of the class to resolve
         :param module_name: The module name containing the class
@@ -191,7 +194,11 @@ class AbstractClassActivation(AbstractCallableActivation):
         agent_network_name_parts: List[str] = agent_network_name.split("/")
         this_agent_tool_path_parts: List[str] = this_agent_tool_path.split(".")
 
-        python_class: Type[Any] = None
+        python_class: Type[Any] = CodedToolClassCache.get_class(agent_network_name, this_agent_tool_path,
+                                                                module_name, class_name)
+        if python_class is not None:
+            return python_class
+
         last_exception: Union[ValueError, AttributeError] = None
 
         # Try resolving from most specific to most general (root level)
@@ -205,15 +212,27 @@ class AbstractClassActivation(AbstractCallableActivation):
                 current_path: str = ".".join(path_parts)
                 packages = [current_path]
 
+            # Do not bother with importing from where we already know the class is not
+            failure: Exception = CodedToolClassCache.get_failure(agent_network_name, packages[0],
+                                                                 module_name, class_name)
+            if failure is not None:
+                last_exception = failure
+                continue
+
             resolver = Resolver(packages)
 
             try:
                 self.logger.info("Attempting to resolve class `%s` in module `%s` using path `%s`",
                                  class_name, module_name, packages[0])
+                CodedToolClassCache.count_import()
                 python_class = resolver.resolve_class_in_module(class_name, module_name)
+                CodedToolClassCache.put_class(agent_network_name, this_agent_tool_path,
+                                              module_name, class_name, python_class)
                 break  # Successfully resolved, exit the loop
             except (ValueError, AttributeError) as exception:
                 last_exception = exception
+                CodedToolClassCache.put_failure(agent_network_name, packages[0],
+                                                module_name, class_name, exception)
                 self.logger.warning("Failed to resolve class `%s` in module `%s` using path `%s`: %s",
                                     class_name, module_name, packages[0], str(exception))
                 # Continue to the next level up
@@ -327,11 +346,8 @@ This can lead to performance problems when running within a server. Consider por
                 self.logger.info(message)
                 await self.journal.write_message(AgentMessage(content=message))
 
-                # Try to run in the executor.
-                invocation_context = self.run_context.get_invocation_context()
-                executor: AsyncioExecutor = invocation_context.get_asyncio_executor()
-                loop: AbstractEventLoop = executor.get_event_loop()
-                retval = await loop.run_in_executor(None, coded_tool.invoke, arguments, sly_data)
+                # Run on the pool dedicated to synchronous CodedTools.
+                retval = await self.invoke_synchronously(coded_tool, arguments, sly_data)
         # pylint: disable=broad-exception-caught
         except Exception as exception:
             # There was an error invoking the CodedTool.
@@ -350,3 +366,45 @@ This can lead to performance problems when running within a server. Consider por
         await self.journal.write_message(message)
 
         return retval
+
+    async def invoke_synchronously(self, coded_tool: CodedTool, arguments: Dict[str, Any],
+                                   sly_data: Dict[str, Any]) -> Any:
+        """
+        Run the synchronous invoke() of a CodedTool on the CodedToolThreadPool,
+        observing the "max_concurrent_invocations" and "invoke_timeout_seconds"
+        settings of the agent spec.
+
+        :param coded_tool: The CodedTool instance to invoke
+        :param arguments: The arguments dictionary to pass as input to the coded_tool
+        :param sly_data: The sly_data dictionary to pass as input to the coded_tool
+        :return: The result of the coded_tool, whatever that is.
+        """
+        agent_network_name: str = self.factory.agent_network.get_network_name()
+        agent_name: str = self.factory.get_name_from_spec(self.agent_tool_spec)
+        tool_key: str = f"{agent_network_name}/{agent_name}"
+
+        max_concurrent: Any = self.agent_tool_spec.get("max_concurrent_invocations")
+        if not isinstance(max_concurrent, int):
+            # Includes None for unspecified
+            max_concurrent = 0
+
+        timeout_seconds: Any = self.agent_tool_spec.get("invoke_timeout_seconds")
+        if not isinstance(timeout_seconds, (int, float)) or timeout_seconds <= 0:
+            # For asyncio.timeout(), None means no timeout
+            timeout_seconds = None
+
+        future = CodedToolThreadPool.submit(tool_key, max_concurrent, coded_tool.invoke, arguments, sly_data)
+        timeout_manager: asyncio.Timeout = None
+        try:
+            async with asyncio.timeout(timeout_seconds) as timeout_manager:
+                return await asyncio.wrap_future(future)
+        except TimeoutError as exception:
+            if not timeout_manager.expired():
+                # The TimeoutError is the tool's own, say from a socket
+                raise
+            # If the call has not started yet, it never will. If it has,
+            # there is no stopping a thread, but at least we stop waiting.
+            future.cancel()
+            CodedToolThreadPool.count_timeout()
+            raise TimeoutError(f"{coded_tool.__class__.__name__}.invoke() did not finish "
+                               f"within {timeout_seconds} seconds") from exception
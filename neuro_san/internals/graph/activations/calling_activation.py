@@ -18,6 +18,8 @@ from typing import Any
 from typing import Dict
 from typing import List
 
+import asyncio
+
 from langchain_core.messages.base import BaseMessage
 
 from leaf_common.config.dictionary_overlay import DictionaryOverlay
@@ -73,6 +75,9 @@ class CallingActivation(AbstractCallableActivation, ToolCaller):
                                                                             config=run_context_config)
         self.journal: Journal = self.run_context.get_journal()
 
+        # Created on first use by get_tool_call_semaphore()
+        self.tool_call_semaphore: asyncio.Semaphore = None
+
     @staticmethod
     def prepare_run_context_config(agent_network_config: Dict[str, Any],
                                    spec_llm_config: Dict[str, Any]) -> Dict[str, Any]:
@@ -173,6 +178,11 @@ context with which it will proces input, essentially telling it what to do.
         """
         Calls all of the callable_components' functions
 
+        Tool calls from a single LLM turn are independent of each other,
+        so they are run concurrently, bounded by the agent spec's
+        "max_concurrent_tool_calls" value.  Tool outputs are always submitted
+        in the same order the LLM asked for them.
+
         :param component_run: The Run which the component is operating under
         :return: A potentially updated Run for the component
         """
@@ -180,23 +190,69 @@ context with which it will proces input, essentially telling it what to do.
         #      to tell us the tool calls it *needs* to make vs the tool calls
         #      it *could* make.
         component_tool_calls: List[ToolCall] = component_run.get_tool_calls()
-        tool_outputs: List[Dict[str, Any]] = []  # Initialize an empty list to store tool outputs
 
-        # Call each of the the listed tools and collect the results
-        # of their function(s).
+        # Create all the activations up front and in order, so that
+        # the origin information they get for journaling is deterministic
+        # regardless of the order in which they finish.
+        callable_components: List[CallableActivation] = []
         for component_tool_call in component_tool_calls:
-
-            tool_output: Dict[str, Any] = await self.make_one_tool_function_call(component_tool_call)
-
-            # Add the tool output for the current component_tool_call to the list
-            tool_outputs.append(tool_output)
-
-        # Submit all tool outputs at once after the loop has gathered all
-        # outputs of all CallableActivation' functions.
+            callable_component: CallableActivation = self.create_tool_activation(component_tool_call)
+            callable_components.append(callable_component)
+
+        semaphore: asyncio.Semaphore = self.get_tool_call_semaphore()
+
+        async def bounded_call(callable_component: CallableActivation, component_tool_call: ToolCall) \
+                -> Dict[str, Any]:
+            if semaphore is None:
+                return await self.call_tool_activation(callable_component, component_tool_call)
+            async with semaphore:
+                return await self.call_tool_activation(callable_component, component_tool_call)
+
+        tasks: List[asyncio.Task] = []
+        for callable_component, component_tool_call in zip(callable_components, component_tool_calls):
+            tasks.append(asyncio.create_task(bounded_call(callable_component, component_tool_call)))
+
+        try:
+            # gather() returns results in the order of the tasks,
+            # which is the order of the tool calls.
+            tool_outputs: List[Dict[str, Any]] = await asyncio.gather(*tasks)
+        except BaseException:
+            # Don't leave any siblings running if one of them failed or we got cancelled.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        # Submit all tool outputs at once after all
+        # outputs of all CallableActivation' functions have been gathered.
         component_run = await self.run_context.submit_tool_outputs(component_run, tool_outputs)
 
         return component_run
 
+    def get_tool_call_semaphore(self) -> asyncio.Semaphore:
+        """
+        :return: The semaphore bounding how many tool calls of this agent run at the same time,
+                 or None if there is no limit.  It is shared by all calls to make_tool_function_calls(),
+                 as langchain's AgentExecutor makes each of the tool calls of one turn with a call of its own.
+        """
+        if self.tool_call_semaphore is None:
+            max_concurrent: int = self.get_max_concurrent_tool_calls()
+            if max_concurrent > 0:
+                self.tool_call_semaphore = asyncio.Semaphore(max_concurrent)
+        return self.tool_call_semaphore
+
+    def get_max_concurrent_tool_calls(self) -> int:
+        """
+        :return: The maximum number of tool calls from a single LLM turn
+                 to run at the same time, as per the agent spec.
+                 A value <= 0 means no limit.
+        """
+        max_concurrent: Any = self.agent_tool_spec.get("max_concurrent_tool_calls")
+        if not isinstance(max_concurrent, int):
+            # Includes None for unspecified
+            return 0
+        return max_concurrent
+
     async def make_one_tool_function_call(self, component_tool_call: ToolCall) -> Dict[str, Any]:
         """
         Calls a single callable_component's function
@@ -207,6 +263,17 @@ context with which it will proces input, essentially telling it what to do.
                 "tool_call_id" a string id representing the call to the tool itself
                 "output" a JSON string representing the output of the tool's function
         """
+        callable_component: CallableActivation = self.create_tool_activation(component_tool_call)
+        return await self.call_tool_activation(callable_component, component_tool_call)
+
+    def create_tool_activation(self, component_tool_call: ToolCall) -> CallableActivation:
+        """
+        Creates the activation for a single callable_component's function
+
+        :param component_tool_call: A ToolCall instance to get the function
+                            arguments from
+        :return: The CallableActivation to build()
+        """
         # Get the function args as a dictionary
         tool_name: str = component_tool_call.get_function_name()
         tool_arguments: Dict[str, Any] = component_tool_call.get_function_arguments()
@@ -225,26 +292,40 @@ context with which it will proces input, essentially telling it what to do.
         callable_component: CallableActivation = \
             self.factory.create_agent_activation(self.run_context, our_agent_spec, use_tool_name,
                                                  self.sly_data, tool_arguments)
+        return callable_component
 
-        message: BaseMessage = await callable_component.build()
-
-        # Prepare the tool output
-        tool_output: Dict[str, Any] = {
-            "origin": callable_component.get_origin(),
-            "tool_call_id": component_tool_call.get_id(),
-            "output": message,
-            # Add the component's sly_data to the mix.
-            # External tools have separate dictionaries of redacted sly_data that need to
-            # be reintegrated with the single copy that floats around the agent network.
-            "sly_data": callable_component.sly_data
-        }
+    async def call_tool_activation(self, callable_component: CallableActivation,
+                                   component_tool_call: ToolCall) -> Dict[str, Any]:
+        """
+        Builds a single callable_component and cleans up after it.
 
-        # Clean up after this CallableActivation.
-        # Note that the run_context passed here is used as a comparison to be sure
-        # that the CallableActivation's cleanup does not accidentally clean up
-        # any resources that should still remain open for this
-        # CallingActivation's purposes.
-        await callable_component.delete_resources(self.run_context)
+        :param callable_component: The CallableActivation from create_tool_activation()
+        :param component_tool_call: The ToolCall instance the activation was created for
+        :return: A dictionary with keys:
+                "tool_call_id" a string id representing the call to the tool itself
+                "output" a JSON string representing the output of the tool's function
+        """
+        try:
+            message: BaseMessage = await callable_component.build()
+
+            # Prepare the tool output
+            tool_output: Dict[str, Any] = {
+                "origin": callable_component.get_origin(),
+                "tool_call_id": component_tool_call.get_id(),
+                "output": message,
+                # Add the component's sly_data to the mix.
+                # External tools have separate dictionaries of redacted sly_data that need to
+                # be reintegrated with the single copy that floats around the agent network.
+                "sly_data": callable_component.sly_data
+            }
+        finally:
+            # Clean up after this CallableActivation, even if it failed or got cancelled
+            # because a sibling tool call failed.
+            # Note that the run_context passed here is used as a comparison to be sure
+            # that the CallableActivation's cleanup does not accidentally clean up
+            # any resources that should still remain open for this
+            # CallingActivation's purposes.
+            await callable_component.delete_resources(self.run_context)
 
         return tool_output
 
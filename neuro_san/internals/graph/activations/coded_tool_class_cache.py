@@ -0,0 +1,192 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import Tuple
+from typing import Type
+
+from collections import OrderedDict
+from os import environ
+from threading import Lock
+
+import importlib
+
+
+class CodedToolClassCache:
+    """
+    Process-wide cache of the CodedTool classes resolved for the agents of agent networks.
+
+    The "class" of an agent spec does not change for the lifetime of its agent network,
+    so once it has been found under one of the packages searched for that network,
+    later invocations need not go through the Resolver and its import attempts again.
+    Packages where a class could *not* be found are remembered as well, so that
+    a CodedTool living in a more general package does not cost failed imports
+    in the more specific ones on every call.
+
+    Entries are keyed by the agent network name, so that they can be dropped
+    when that network is reloaded or, for temporary networks, expires.
+    Both maps are bounded, least recently used entries going first.
+    Failures only keep the type and message of the exception, not the exception
+    itself, which would keep its traceback and all of its frames alive.
+    """
+
+    # Maximum number of entries in each of the maps below
+    max_entries: int = int(environ.get("AGENT_CODED_TOOL_CLASS_CACHE_MAX_ENTRIES", "10000"))
+
+    # Map of (network name, agent tool path, module name, class name) -> resolved class
+    classes: OrderedDict[Tuple[str, str, str, str], Type[Any]] = OrderedDict()
+
+    # Map of (network name, package, module name, class name) -> (exception type, message) of the failed attempt
+    failures: OrderedDict[Tuple[str, str, str, str], Tuple[Type[Exception], str]] = OrderedDict()
+
+    lock: Lock = Lock()
+
+    # Statistics
+    num_hits: int = 0
+    num_misses: int = 0
+    # Number of attempts to resolve a class that actually had to go through importlib
+    num_imports: int = 0
+
+    @classmethod
+    def get_class(cls, network_name: str, agent_tool_path: str,
+                  module_name: str, class_name: str) -> Type[Any]:
+        """
+        :param network_name: The name of the agent network using the class
+        :param agent_tool_path: The most specific package under which the class is looked for
+        :param module_name: The module name containing the class
+        :param class_name: The name of the class
+        :return: The class resolved earlier, or None if it has not been resolved yet
+        """
+        key: Tuple[str, str, str, str] = (network_name, agent_tool_path, module_name, class_name)
+        with cls.lock:
+            python_class: Type[Any] = cls.classes.get(key)
+            if python_class is None:
+                cls.num_misses += 1
+            else:
+                cls.classes.move_to_end(key)
+                cls.num_hits += 1
+        return python_class
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    @classmethod
+    def put_class(cls, network_name: str, agent_tool_path: str,
+                  module_name: str, class_name: str, python_class: Type[Any]):
+        """
+        :param network_name: The name of the agent network using the class
+        :param agent_tool_path: The most specific package under which the class is looked for
+        :param module_name: The module name containing the class
+        :param class_name: The name of the class
+        :param python_class: The resolved class
+        """
+        key: Tuple[str, str, str, str] = (network_name, agent_tool_path, module_name, class_name)
+        with cls.lock:
+            cls.classes[key] = python_class
+            cls.classes.move_to_end(key)
+            cls._trim(cls.classes)
+
+    @classmethod
+    def get_failure(cls, network_name: str, package: str,
+                    module_name: str, class_name: str) -> Exception:
+        """
+        :param network_name: The name of the agent network using the class
+        :param package: A single package the class was looked for in
+        :param module_name: The module name containing the class
+        :param class_name: The name of the class
+        :return: A new exception like the one from an earlier failed attempt to resolve
+                the class in the package, or None if there has been no such failure.
+        """
+        key: Tuple[str, str, str, str] = (network_name, package, module_name, class_name)
+        with cls.lock:
+            failure: Tuple[Type[Exception], str] = cls.failures.get(key)
+            if failure is None:
+                return None
+            cls.failures.move_to_end(key)
+        exception_type, message = failure
+        return exception_type(message)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    @classmethod
+    def put_failure(cls, network_name: str, package: str,
+                    module_name: str, class_name: str, exception: Exception):
+        """
+        :param network_name: The name of the agent network using the class
+        :param package: A single package the class was looked for in
+        :param module_name: The module name containing the class
+        :param class_name: The name of the class
+        :param exception: The exception from the failed attempt
+        """
+        key: Tuple[str, str, str, str] = (network_name, package, module_name, class_name)
+        with cls.lock:
+            cls.failures[key] = (type(exception), str(exception))
+            cls.failures.move_to_end(key)
+            cls._trim(cls.failures)
+
+    @classmethod
+    def _trim(cls, entries: OrderedDict[Any, Any]):
+        """
+        Drop least recently used entries beyond the bound. Caller holds the lock.
+        :param entries: The OrderedDict to trim
+        """
+        while len(entries) > cls.max_entries:
+            entries.popitem(last=False)
+
+    @classmethod
+    def count_import(cls):
+        """
+        Record an attempt to resolve a class that had to go through importlib.
+        """
+        with cls.lock:
+            cls.num_imports += 1
+
+    @classmethod
+    def invalidate(cls, network_name: str = None, refresh_imports: bool = True):
+        """
+        Forget what was resolved for an agent network, so that its classes
+        are looked up afresh the next time they are used.
+        :param network_name: The name of the agent network to forget about.
+                    If None, everything is forgotten.
+        :param refresh_imports: Whether the network may come back with new files on disk,
+                    in which case the import system is told to look again as well.
+                    False is for networks that are gone for good.
+        """
+        with cls.lock:
+            if network_name is None:
+                cls.classes.clear()
+                cls.failures.clear()
+            else:
+                for key in [key for key in cls.classes if key[0] == network_name]:
+                    del cls.classes[key]
+                for key in [key for key in cls.failures if key[0] == network_name]:
+                    del cls.failures[key]
+
+        if refresh_imports:
+            # Failed imports may succeed now if new files showed up on disk
+            # since the finders last looked at the directories.
+            importlib.invalidate_caches()
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, int]:
+        """
+        :return: A dictionary of statistics about the cache
+        """
+        with cls.lock:
+            return {
+                "Hits": cls.num_hits,
+                "Misses": cls.num_misses,
+                "Imports": cls.num_imports,
+                "Classes": len(cls.classes),
+                "Failures": len(cls.failures),
+            }
@@ -0,0 +1,184 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Tuple
+
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import os
+import time
+
+
+class CodedToolThreadPool:
+    """
+    Process-wide, bounded thread pool on which the synchronous invoke() methods
+    of CodedTools are run, so that they neither block any event loop nor compete
+    with unrelated blocking work in the event loops' default executors.
+
+    The number of threads comes from the AGENT_CODED_TOOL_THREADS environment variable.
+
+    In addition, each tool can be limited in how many of its calls run at the same time.
+    Calls past that limit wait in a FIFO queue of their own without occupying a thread,
+    so that one slow tool cannot take over the whole pool.
+    """
+
+    # Same default as for the ThreadPoolExecutor itself
+    DEFAULT_NUM_THREADS: int = min(32, (os.cpu_count() or 1) + 4)
+
+    executor: ThreadPoolExecutor = None
+    num_threads: int = 0
+    lock: Lock = Lock()
+
+    # Map of tool key -> number of its calls that have been handed to the executor
+    running: Dict[str, int] = {}
+
+    # Map of tool key -> calls waiting for the tool's concurrency limit
+    pending: Dict[str, Deque[Tuple[Future, Callable, Tuple, float]]] = {}
+
+    # Statistics
+    num_queued: int = 0
+    num_running: int = 0
+    num_completed: int = 0
+    num_cancelled: int = 0
+    num_timed_out: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        """
+        :return: The shared ThreadPoolExecutor, created on first use
+        """
+        with cls.lock:
+            if cls.executor is None:
+                num_threads: int = int(os.environ.get("AGENT_CODED_TOOL_THREADS", "0"))
+                if num_threads <= 0:
+                    num_threads = cls.DEFAULT_NUM_THREADS
+                cls.num_threads = num_threads
+                cls.executor = ThreadPoolExecutor(max_workers=num_threads,
+                                                  thread_name_prefix="coded_tool")
+            return cls.executor
+
+    @classmethod
+    def submit(cls, tool_key: str, max_concurrent: int, function: Callable, *args) -> Future:
+        """
+        Run a function on the pool, subject to the concurrency limit of its tool.
+
+        :param tool_key: A string identifying the tool across the process
+        :param max_concurrent: The maximum number of calls for the tool to run at the same time.
+                    A value <= 0 means no limit other than the size of the pool.
+        :param function: The function to call
+        :param args: The arguments to the function
+        :return: A concurrent.futures.Future for the result of the call.
+                Cancelling it before the call starts means the call will not happen.
+        """
+        executor: ThreadPoolExecutor = cls.get_executor()
+        future: Future = Future()
+        call: Tuple[Future, Callable, Tuple, float] = (future, function, args, time.monotonic())
+
+        with cls.lock:
+            cls.num_queued += 1
+            if 0 < max_concurrent <= cls.running.get(tool_key, 0):
+                cls.pending.setdefault(tool_key, deque()).append(call)
+                return future
+            cls.running[tool_key] = cls.running.get(tool_key, 0) + 1
+
+        executor.submit(cls.run, tool_key, call)
+        return future
+
+    @classmethod
+    def run(cls, tool_key: str, call: Tuple[Future, Callable, Tuple, float]):
+        """
+        Run a single call on a pool thread and then pass the tool's slot on
+        to its next waiting call, if any.
+        :param tool_key: A string identifying the tool across the process
+        :param call: A tuple of (future, function, args, submit time)
+        """
+        future, function, args, submit_time = call
+        try:
+            if future.set_running_or_notify_cancel():
+                wait_seconds: float = time.monotonic() - submit_time
+                with cls.lock:
+                    cls.num_queued -= 1
+                    cls.num_running += 1
+                    cls.total_wait_seconds += wait_seconds
+                    cls.max_wait_seconds = max(cls.max_wait_seconds, wait_seconds)
+                try:
+                    future.set_result(function(*args))
+                except BaseException as exception:  # pylint: disable=broad-exception-caught
+                    future.set_exception(exception)
+                with cls.lock:
+                    cls.num_running -= 1
+                    cls.num_completed += 1
+            else:
+                with cls.lock:
+                    cls.num_queued -= 1
+                    cls.num_cancelled += 1
+        finally:
+            cls.release(tool_key)
+
+    @classmethod
+    def release(cls, tool_key: str):
+        """
+        Pass the slot of a finished call on to the next waiting call of the same tool,
+        or give it back if there is none.
+        :param tool_key: A string identifying the tool across the process
+        """
+        next_call: Tuple[Future, Callable, Tuple, float] = None
+        with cls.lock:
+            waiting: Deque[Tuple[Future, Callable, Tuple, float]] = cls.pending.get(tool_key)
+            if waiting:
+                # Slot transfers as-is, so the running count of the tool stays the same.
+                next_call = waiting.popleft()
+                if len(waiting) == 0:
+                    cls.pending.pop(tool_key, None)
+            else:
+                cls.running[tool_key] = cls.running.get(tool_key, 1) - 1
+                if cls.running[tool_key] <= 0:
+                    cls.running.pop(tool_key, None)
+        if next_call is not None:
+            cls.executor.submit(cls.run, tool_key, next_call)
+
+    @classmethod
+    def count_timeout(cls):
+        """
+        Record a call that its caller stopped waiting for.
+        """
+        with cls.lock:
+            cls.num_timed_out += 1
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        """
+        :return: A dictionary of statistics about the pool
+        """
+        with cls.lock:
+            return {
+                "Threads": cls.num_threads,
+                "Running": cls.num_running,
+                "Queued": cls.num_queued,
+                "Completed": cls.num_completed,
+                "Cancelled": cls.num_cancelled,
+                "TimedOut": cls.num_timed_out,
+                "TotalWaitSeconds": cls.total_wait_seconds,
+                "MaxWaitSeconds": cls.max_wait_seconds,
+            }
@@ -45,6 +45,7 @@ class DefaultsConfigFilter(ConfigFilter):
         "verbose": None,
         "max_iterations": None,
         "max_execution_seconds": None,
+        "max_concurrent_tool_calls": None,
         "error_formatter": None,
         "error_fragments": None,
     }
@@ -0,0 +1,102 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import json
+
+from json.decoder import JSONDecodeError
+from pyparsing.exceptions import ParseException
+from pyparsing.exceptions import ParseSyntaxException
+
+from neuro_san.internals.interfaces.agent_name_mapper import AgentNameMapper
+from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.validation.network.manifest_network_validator import ManifestNetworkValidator
+
+
+class AgentNetworkConfigRestorer:
+    """
+    Does the CPU-bound part of restoring the agent networks of a manifest:
+    parsing each agent network file, running it through the config filters and validating it.
+
+    Instances are picklable and have no side effects, so that restore_config()
+    can be run in worker processes.  Instead of logging, problems are returned
+    as error messages for the caller to report in manifest order.
+    """
+
+    def __init__(self, manifest_dir: str, agent_mapper: AgentNameMapper, external_network_names: List[str]):
+        """
+        Constructor
+
+        :param manifest_dir: The directory of the manifest file
+        :param agent_mapper: The AgentNameMapper to get from manifest keys to agent network files
+        :param external_network_names: The external network names the validator knows about
+        """
+        self.manifest_dir: str = manifest_dir
+        self.agent_mapper: AgentNameMapper = agent_mapper
+        # DEF - need mcp servers as well at some point
+        self.validator = ManifestNetworkValidator(external_network_names)
+
+    def restore_config(self, manifest_key: str) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        :param manifest_key: The manifest key of the agent network to restore
+        :return: A tuple of:
+                * The filtered and validated config of the agent network,
+                  or None if it could not be restored or validated.
+                * A list of error messages saying why not
+        """
+        errors: List[str] = []
+        agent_filepath: str = self.agent_mapper.agent_name_to_filepath(manifest_key)
+        agent_network: AgentNetwork = self.restore_one_agent_network(agent_filepath, manifest_key, errors)
+        if agent_network is None:
+            errors.append(f"manifest registry {manifest_key} not found in {self.manifest_dir}")
+            return None, errors
+
+        validation_errors: List[str] = self.validator.validate(agent_network.get_config())
+        if len(validation_errors) > 0:
+            errors.append(f"manifest registry {agent_filepath} has validation errors. Skipping. Errors: "
+                          f"{json.dumps(validation_errors, indent=4, sort_keys=True)}")
+            return None, errors
+
+        return agent_network.get_config(), errors
+
+    def restore_one_agent_network(self, agent_filepath: str, manifest_key: str, errors: List[str]) -> AgentNetwork:
+        """
+        :param agent_filepath: The file reference for the agent network description to restore
+        :param manifest_key: the key to use when restoring
+        :param errors: A list of error messages to add to when the file cannot be restored
+        :return: The restored AgentNetwork, or None if it could not be restored
+        """
+        registry_restorer = AgentNetworkRestorer(registry_dir=self.manifest_dir, agent_mapper=self.agent_mapper)
+        try:
+            return registry_restorer.restore(file_reference=agent_filepath)
+        except FileNotFoundError as exception:
+            errors.append(f"Failed to restore registry item {manifest_key}. Skipping. - {str(exception)}")
+        except (ParseException, ParseSyntaxException, JSONDecodeError) as exception:
+
+            # Be sure we spit out the right exception message with relevant parsing
+            # information as the error.  If not, we don't get enough good information
+            # to act on when there is a problem.
+            use_exception: Exception = exception
+            if exception.__cause__ is not None:
+                use_exception = exception.__cause__
+
+            errors.append(f"Parse error in registry item {manifest_key}. Skipping. - {str(use_exception)}")
+
+        return None
@@ -0,0 +1,189 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Set
+from typing import Tuple
+
+from hashlib import sha256
+from pathlib import Path
+from threading import Lock
+
+import os
+import re
+
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+
+
+class AgentNetworkFileCache:
+    """
+    Remembers the AgentNetworks restored from agent network files, together with
+    a fingerprint of every file that went into each of them, so that a manifest
+    reload only needs to re-parse and re-validate the networks whose files changed.
+
+    The files of a network are its own file plus anything it pulls in
+    with HOCON include statements, transitively.  So a change to a shared
+    common-defs file invalidates every network that includes it.
+
+    A file is considered unchanged if its modification time and size are
+    the same as before.  If they differ, the content hash decides, so that
+    merely touching a file does not cause a re-parse.
+    """
+
+    # Matches the HOCON include forms that refer to local files:
+    #   include "x.hocon"
+    #   include file("x.hocon")
+    #   include required("x.hocon")
+    #   include required(file("x.hocon"))
+    # url() and classpath() includes are not tracked.
+    INCLUDE_REGEX = re.compile(r'^\s*include\s+(?:required\s*\(\s*)?(?:file\s*\(\s*)?"([^"]+)"',
+                               re.MULTILINE)
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        # Map of the absolute path of an agent network file -> entry dictionary with keys:
+        #   "agent_network" - the AgentNetwork restored from the file
+        #   "validity"      - anything else the network's usability depends on, as given to put()
+        #   "files"         - map of absolute path of every file the network depends on -> fingerprint
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.lock = Lock()
+
+        # Statistics
+        self.num_hits: int = 0
+        self.num_misses: int = 0
+
+    def get(self, network_file: str, validity: Any = None) -> AgentNetwork:
+        """
+        :param network_file: The path to an agent network file
+        :param validity: Anything else the usability of the network depends on,
+                    for instance the names of other networks it may refer to.
+                    Must compare equal to what was given to put().
+        :return: The AgentNetwork restored from the file earlier if neither it nor any
+                of the files it includes have changed since.  None otherwise.
+        """
+        key: str = os.path.abspath(network_file)
+        with self.lock:
+            entry: Dict[str, Any] = self.entries.get(key)
+
+        if entry is not None and entry.get("validity") == validity:
+            files: Dict[str, Tuple[int, int, str]] = entry.get("files")
+            if all(self.is_unchanged(one_file, fingerprint) for one_file, fingerprint in files.items()):
+                with self.lock:
+                    self.num_hits += 1
+                return entry.get("agent_network")
+
+        with self.lock:
+            self.num_misses += 1
+        return None
+
+    def put(self, network_file: str, agent_network: AgentNetwork, validity: Any = None):
+        """
+        :param network_file: The path to the agent network file the network was restored from
+        :param agent_network: The AgentNetwork restored (and validated) from the file
+        :param validity: Anything else the usability of the network depends on. See get().
+        """
+        key: str = os.path.abspath(network_file)
+        files: Dict[str, Tuple[int, int, str]] = {}
+        for one_file in self.find_dependencies(key):
+            files[one_file] = self.fingerprint(one_file)
+
+        with self.lock:
+            self.entries[key] = {
+                "agent_network": agent_network,
+                "validity": validity,
+                "files": files,
+            }
+
+    def retain(self, network_files: List[str]):
+        """
+        Forget about everything but the given files, so that networks
+        no longer in any manifest do not linger.
+        :param network_files: The paths of the agent network files still in use
+        """
+        keep: Set[str] = {os.path.abspath(network_file) for network_file in network_files}
+        with self.lock:
+            for key in list(self.entries.keys()):
+                if key not in keep:
+                    del self.entries[key]
+
+    def find_dependencies(self, network_file: str) -> List[str]:
+        """
+        :param network_file: The absolute path to an agent network file
+        :return: A list of the absolute paths of the file itself
+                and all the local files it includes, transitively
+        """
+        found: List[str] = []
+        to_visit: List[str] = [network_file]
+        while len(to_visit) > 0:
+            one_file: str = to_visit.pop()
+            if one_file in found:
+                continue
+            found.append(one_file)
+
+            try:
+                with open(one_file, "r", encoding="utf-8") as file_handle:
+                    contents: str = file_handle.read()
+            except (OSError, UnicodeDecodeError):
+                # Missing or unreadable files are still fingerprinted,
+                # so that their (re)appearance is noticed.
+                continue
+
+            # Depending on how the file is parsed, relative includes are resolved
+            # against the directory of the including file or the current working
+            # directory. Keep an eye on both.
+            base_dir: Path = Path(one_file).parent
+            for include in self.INCLUDE_REGEX.findall(contents):
+                to_visit.append(os.path.abspath(base_dir / include))
+                to_visit.append(os.path.abspath(include))
+
+        return found
+
+    @staticmethod
+    def fingerprint(one_file: str) -> Tuple[int, int, str]:
+        """
+        :param one_file: The path to a file
+        :return: A tuple of (modification time in ns, size, content hash) for the file.
+                All values are None for a file that does not exist.
+        """
+        try:
+            stat: os.stat_result = os.stat(one_file)
+            with open(one_file, "rb") as file_handle:
+                digest: str = sha256(file_handle.read()).hexdigest()
+        except OSError:
+            return (None, None, None)
+        return (stat.st_mtime_ns, stat.st_size, digest)
+
+    def is_unchanged(self, one_file: str, fingerprint: Tuple[int, int, str]) -> bool:
+        """
+        :param one_file: The path to a file
+        :param fingerprint: A fingerprint of the file taken earlier
+        :return: True if the file has the same contents as when the fingerprint was taken
+        """
+        try:
+            stat: os.stat_result = os.stat(one_file)
+        except OSError:
+            return fingerprint[0] is None
+
+        if (stat.st_mtime_ns, stat.st_size) == fingerprint[:2]:
+            return True
+
+        # Modification time or size changed. Let the contents decide.
+        return self.fingerprint(one_file)[2] == fingerprint[2]
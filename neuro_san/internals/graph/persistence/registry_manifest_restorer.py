@@ -18,15 +18,17 @@ from typing import Any
 from typing import Dict
 from typing import List
 from typing import Sequence
+from typing import Tuple
 from typing import Union
 
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
 import os
-import json
 import logging
-
-from json.decoder import JSONDecodeError
-from pyparsing.exceptions import ParseException
-from pyparsing.exceptions import ParseSyntaxException
+import multiprocessing
 
 from leaf_common.config.config_filter import ConfigFilter
 from leaf_common.config.dictionary_overlay import DictionaryOverlay
@@ -36,12 +38,12 @@ from leaf_common.persistence.interface.restorer import Restorer
 from neuro_san import REGISTRIES_DIR
 from neuro_san.internals.interfaces.agent_name_mapper import AgentNameMapper
 from neuro_san.internals.graph.persistence.agent_filetree_mapper import AgentFileTreeMapper
-from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
+from neuro_san.internals.graph.persistence.agent_network_config_restorer import AgentNetworkConfigRestorer
+from neuro_san.internals.graph.persistence.agent_network_file_cache import AgentNetworkFileCache
 from neuro_san.internals.graph.persistence.manifest_filter_chain import ManifestFilterChain
 from neuro_san.internals.graph.persistence.raw_manifest_restorer import RawManifestRestorer
 from neuro_san.internals.graph.persistence.served_manifest_config_filter import ServedManifestConfigFilter
 from neuro_san.internals.graph.registry.agent_network import AgentNetwork
-from neuro_san.internals.validation.network.manifest_network_validator import ManifestNetworkValidator
 
 
 class RegistryManifestRestorer(Restorer):
@@ -50,7 +52,12 @@ class RegistryManifestRestorer(Restorer):
     for agent networks/registries.
     """
 
-    def __init__(self, manifest_files: Union[str, List[str]] = None, agent_mapper: AgentNameMapper = None):
+    # Below this many agent network files to restore, starting worker processes
+    # takes longer than parsing the files in this one.
+    MIN_NETWORKS_FOR_WORKERS: int = 32
+
+    def __init__(self, manifest_files: Union[str, List[str]] = None, agent_mapper: AgentNameMapper = None,
+                 network_cache: AgentNetworkFileCache = None, max_workers: int = None):
         """
         Constructor
 
@@ -60,7 +67,16 @@ class RegistryManifestRestorer(Restorer):
             * None (the default) which gets a single manifest file from a known source.
         :param agent_mapper: optional AgentNameMapper;
             if None, AgentFileTreeMapper instance will be used.
+        :param network_cache: optional AgentNetworkFileCache which is kept across restore() calls
+            so that only agent network files which have changed are parsed and validated again.
+            If None, every agent network file is parsed and validated on every restore().
+        :param max_workers: optional maximum number of worker processes to parse and validate
+            agent network files in.  If None, the AGENT_MANIFEST_RESTORE_WORKERS environment variable
+            is used, falling back to 1, which restores in this process.  A value of 0 or less
+            from the environment variable means to use the number of CPUs available.
         """
+        self.network_cache: AgentNetworkFileCache = network_cache
+        self.network_files: List[str] = []
         self.agent_mapper = agent_mapper
         if not self.agent_mapper:
             self.agent_mapper = AgentFileTreeMapper()
@@ -83,6 +99,13 @@ class RegistryManifestRestorer(Restorer):
         else:
             self.manifest_files = manifest_files
 
+        self.max_workers: int = max_workers
+        if self.max_workers is None:
+            self.max_workers = int(os.environ.get("AGENT_MANIFEST_RESTORE_WORKERS", "1"))
+            if self.max_workers <= 0:
+                self.max_workers = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") \
+                    else os.cpu_count() or 1
+
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def restore_from_files(self, file_references: Sequence[str]) -> Dict[str, Dict[str, AgentNetwork]]:
@@ -93,6 +116,7 @@ class RegistryManifestRestorer(Restorer):
 
         all_agent_networks: Dict[str, Dict[str, AgentNetwork]] = {}
         overlayer = DictionaryOverlay()
+        self.network_files = []
 
         # Loop through all the manifest files in the list to make a composite
         for manifest_file in file_references:
@@ -108,6 +132,10 @@ class RegistryManifestRestorer(Restorer):
         for storage_type, storage_dict in all_agent_networks.items():
             all_agent_networks[storage_type] = config_filter.filter_config(storage_dict)
 
+        if self.network_cache is not None:
+            # Don't hang on to networks which are no longer in any manifest
+            self.network_cache.retain(self.network_files)
+
         return all_agent_networks
 
     # pylint: disable=too-many-locals
@@ -134,79 +162,114 @@ class RegistryManifestRestorer(Restorer):
 
         external_network_names: List[str] = self.find_external_network_names(one_manifest)
 
-        # DEF - need mcp servers as well at some point
-        validator = ManifestNetworkValidator(external_network_names)
-
         # At this point only hocon files we are going to serve up are in the one_manifest.
+        usable_keys: List[str] = [manifest_key for manifest_key, manifest_dict in one_manifest.items()
+                                  if isinstance(manifest_dict, dict) and manifest_dict.get("serve", False)]
+        valid_networks: Dict[str, AgentNetwork] = self.restore_valid_agent_networks(manifest_dir, one_manifest,
+                                                                                    usable_keys,
+                                                                                    external_network_names)
         for manifest_key, manifest_dict in one_manifest.items():
 
-            usable_network: bool = isinstance(manifest_dict, dict) and manifest_dict.get("serve", False)
-
             # We'll need to use an agent mapper to get to this agent definition file.
             agent_filepath: str = self.agent_mapper.agent_name_to_filepath(manifest_key)
             agent_network: AgentNetwork = None
-            if usable_network:
-                agent_network = self.restore_one_agent_network(manifest_dir, agent_filepath, manifest_key)
+            if manifest_key in usable_keys:
+                agent_network = valid_networks.get(manifest_key)
+                if agent_network is None:
+                    continue
+
+            network_name: str = self.agent_mapper.filepath_to_agent_network_name(agent_filepath)
+
+            # Figure out where we want to put the network per the network's manifest dictionary
+            storage: str = "public"
+            if not manifest_dict.get("public"):
+                storage = "protected"
+
+            agent_networks[storage][network_name] = agent_network
 
-            if agent_network is not None:
+        return agent_networks
 
-                validation_errors: List[str] = validator.validate(agent_network.get_config())
-                if len(validation_errors) > 0:
-                    self.logger.error("manifest registry %s has validation errors. Skipping. Errors: %s",
-                                      agent_filepath,
-                                      json.dumps(validation_errors, indent=4, sort_keys=True))
-                    agent_network = None
+    def restore_valid_agent_networks(self, manifest_dir: str, one_manifest: Dict[str, Dict[str, Any]],
+                                     manifest_keys: List[str],
+                                     external_network_names: List[str]) -> Dict[str, AgentNetwork]:
+        """
+        :param manifest_dir: The directory of the manifest file
+        :param one_manifest: The filtered manifest the keys come from
+        :param manifest_keys: The manifest keys of the agent networks to restore
+        :param external_network_names: The external network names the validator knows about
+        :return: A map of manifest key -> validated AgentNetwork for those agent networks
+                which could be restored and validated.
+                If an agent network file and everything it includes are unchanged
+                since the last restore, the AgentNetwork from that time is used.
+        """
+        agent_networks: Dict[str, AgentNetwork] = {}
+        validities: Dict[str, Tuple[Any, ...]] = {}
+        network_files: Dict[str, str] = {}
+        to_restore: List[str] = []
+        for manifest_key in manifest_keys:
+            agent_filepath: str = self.agent_mapper.agent_name_to_filepath(manifest_key)
+            network_files[manifest_key] = str(Path(manifest_dir) / agent_filepath)
+            is_mcp: bool = bool(one_manifest.get(manifest_key).get("mcp", False))
+            validities[manifest_key] = (tuple(external_network_names), is_mcp)
+            if self.network_cache is not None:
+                self.network_files.append(network_files[manifest_key])
+                agent_network: AgentNetwork = self.network_cache.get(network_files[manifest_key],
+                                                                     validities[manifest_key])
+                if agent_network is not None:
+                    agent_networks[manifest_key] = agent_network
                     continue
+            to_restore.append(manifest_key)
 
-            if usable_network and agent_network is None:
-                self.logger.error("manifest registry %s not found in %s", manifest_key, manifest_file)
+        config_restorer = AgentNetworkConfigRestorer(manifest_dir, self.agent_mapper, external_network_names)
+        results: List[Tuple[Dict[str, Any], List[str]]] = self.restore_configs(config_restorer, to_restore)
+
+        # Report and build in manifest order, no matter which process did the restoring.
+        for manifest_key, (config, errors) in zip(to_restore, results):
+            for error in errors:
+                self.logger.error(error)
+            if config is None:
                 continue
 
+            agent_filepath: str = self.agent_mapper.agent_name_to_filepath(manifest_key)
             network_name: str = self.agent_mapper.filepath_to_agent_network_name(agent_filepath)
+            agent_network = AgentNetwork(config, network_name)
 
             # Check if this agent network has been declared as MCP tool:
-            if usable_network and manifest_dict.get("mcp", False):
+            if validities[manifest_key][1]:
                 agent_network.set_as_mcp_tool()
 
-            # Figure out where we want to put the network per the network's manifest dictionary
-            storage: str = "public"
-            if not manifest_dict.get("public"):
-                storage = "protected"
+            if self.network_cache is not None:
+                self.network_cache.put(network_files[manifest_key], agent_network, validities[manifest_key])
 
-            agent_networks[storage][network_name] = agent_network
+            agent_networks[manifest_key] = agent_network
 
         return agent_networks
 
-    def restore_one_agent_network(self, manifest_dir: str, agent_filepath: str, manifest_key: str) -> AgentNetwork:
+    def restore_configs(self, config_restorer: AgentNetworkConfigRestorer,
+                        manifest_keys: List[str]) -> List[Tuple[Dict[str, Any], List[str]]]:
         """
-        :param manifest_dir: The directory of the manifest file
-        :param agent_filepath: The file reference for the agent network description to restore
-        :param manifest_key: the key to use when restoring
-        :return: a built map of agent networks
-        """
-
-        agent_network: AgentNetwork = None
-        registry_restorer = AgentNetworkRestorer(registry_dir=manifest_dir, agent_mapper=self.agent_mapper)
-        try:
-            agent_network = registry_restorer.restore(file_reference=agent_filepath)
-        except FileNotFoundError as exception:
-            message: str = f"Failed to restore registry item {manifest_key}. Skipping. - {str(exception)}"
-            self.logger.error(message)
-            agent_network = None
-        except (ParseException, ParseSyntaxException, JSONDecodeError) as exception:
-
-            # Be sure we spit out the right exception message with relevant parsing
-            # information as the error.  If not, we don't get enough good information
-            # to act on when there is a problem.
-            use_exception: Exception = exception
-            if exception.__cause__ is not None:
-                use_exception = exception.__cause__
-
-            message: str = f"Parse error in registry item {manifest_key}. Skipping. - {str(use_exception)}"
-            self.logger.error(message)
-            agent_network = None
-
-        return agent_network
+        Parse, filter and validate agent network files, in worker processes
+        when there are enough of them to be worth starting the processes.
+
+        :param config_restorer: The AgentNetworkConfigRestorer to use
+        :param manifest_keys: The manifest keys of the agent networks to restore
+        :return: A list of the results of AgentNetworkConfigRestorer.restore_config(),
+                in the same order as the manifest keys
+        """
+        num_workers: int = min(self.max_workers, len(manifest_keys))
+        if num_workers > 1 and len(manifest_keys) >= self.MIN_NETWORKS_FOR_WORKERS:
+            try:
+                # Spawn rather than fork, as the server may already have threads running.
+                with ProcessPoolExecutor(max_workers=num_workers,
+                                         mp_context=multiprocessing.get_context("spawn")) as executor:
+                    futures: List[Future] = [executor.submit(config_restorer.restore_config, manifest_key)
+                                             for manifest_key in manifest_keys]
+                    return [future.result() for future in futures]
+            except (BrokenProcessPool, OSError) as exception:
+                self.logger.warning("Could not restore agent networks in %d worker processes. "
+                                    "Restoring them here instead. - %s", num_workers, str(exception))
+
+        return [config_restorer.restore_config(manifest_key) for manifest_key in manifest_keys]
 
     def restore(self, file_reference: str = None) -> Dict[str, Dict[str, AgentNetwork]]:
         """
@@ -17,6 +17,8 @@
 from typing import Any
 from typing import Dict
 
+from copy import deepcopy
+
 import os
 
 from pathlib import Path
@@ -241,8 +243,10 @@ Check to be sure your value for PYTHONPATH includes where you expect where your
             # Nothing to override
             return llm_args
 
+        # The config_args are part of the read-only agent spec.
+        # Deep copy so that whoever gets the merged args can modify them freely.
         overlay = DictionaryOverlay()
-        merged_args: Dict[str, Any] = overlay.overlay(llm_args, config_args)
+        merged_args: Dict[str, Any] = overlay.overlay(llm_args, deepcopy(config_args))
         return merged_args
 
     def _redact_sly_data(self, parent_run_context: RunContext, sly_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -18,16 +18,24 @@ from typing import Any
 from typing import Dict
 from typing import List
 
+from copy import copy
+
 from leaf_common.parsers.dictionary_extractor import DictionaryExtractor
 
 from neuro_san.internals.run_context.interfaces.agent_network_inspector import \
     AgentNetworkInspector
+from neuro_san.internals.utils.frozen_config import FrozenConfig
 
 
 class AgentNetwork(AgentNetworkInspector):
     """
     AgentNetworkInspector implementation for handling queries about a single
     agent network spec.  The data from the hocon file essentially lives here.
+
+    Chat sessions each get their own copy of the network via create_copy().
+    Those copies are cheap, as they all share a single read-only snapshot
+    of the config (see FrozenConfig), taken the first time a copy is made.
+    Per-session changes go through replace_agent_tool_spec() on the copy.
     """
 
     def __init__(self, config: Dict[str, Any], name: str):
@@ -47,6 +55,10 @@ class AgentNetwork(AgentNetworkInspector):
 
         self.first_agent: str = None
 
+        # Read-only snapshot of config and agent_spec_map shared by all copies
+        self.frozen_config: Dict[str, Any] = None
+        self.frozen_spec_map: Dict[str, Dict[str, Any]] = None
+
         agent_specs = self.config.get("tools")
         if agent_specs is not None:
             for agent_spec in agent_specs:
@@ -58,6 +70,45 @@ class AgentNetwork(AgentNetworkInspector):
         """
         return self.config
 
+    def create_copy(self) -> "AgentNetwork":
+        """
+        Use this instead of copy.deepcopy() when a private version of the network is needed.
+        Note that later changes made to the dictionary returned by get_config()
+        of this instance will not show up in any copies.
+
+        :return: A copy of this AgentNetwork whose config and agent specs are read-only
+                and shared with all other copies, but whose set of agent specs can be changed
+                with replace_agent_tool_spec() without affecting anyone else.
+        """
+        frozen_config: Dict[str, Any] = self.frozen_config
+        frozen_spec_map: Dict[str, Dict[str, Any]] = self.frozen_spec_map
+        if frozen_config is None:
+            # Any race here is benign: at worst more than one equivalent snapshot gets made.
+            frozen_config = FrozenConfig.freeze(self.config)
+            frozen_spec_map = {}
+            for agent_spec in frozen_config.get("tools") or []:
+                if agent_spec is not None:
+                    frozen_spec_map[self.get_name_from_spec(agent_spec)] = agent_spec
+            self.frozen_spec_map = frozen_spec_map
+            self.frozen_config = frozen_config
+
+        network_copy: AgentNetwork = copy(self)
+        network_copy.config = frozen_config
+        network_copy.agent_spec_map = dict(frozen_spec_map)
+        return network_copy
+
+    def replace_agent_tool_spec(self, name: str, agent_spec: Dict[str, Any]):
+        """
+        Adds or replaces the spec for a single agent in this instance only.
+        Other copies of the network are not affected.
+
+        :param name: The name of the agent
+        :param agent_spec: The new spec for the agent. A read-only copy of this is kept.
+        """
+        if self.first_agent is None:
+            self.first_agent = name
+        self.agent_spec_map[name] = FrozenConfig.freeze(agent_spec)
+
     def set_as_mcp_tool(self):
         """
         Marks this agent network as being served as an MCP tool.
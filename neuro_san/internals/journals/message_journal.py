@@ -20,9 +20,11 @@ from typing import List
 
 from langchain_core.messages.base import BaseMessage
 
+from neuro_san.internals.filters.message_filter import MessageFilter
 from neuro_san.internals.interfaces.async_hopper import AsyncHopper
 from neuro_san.internals.journals.journal import Journal
 from neuro_san.internals.messages.base_message_dictionary_converter import BaseMessageDictionaryConverter
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
 
 
 class MessageJournal(Journal):
@@ -31,14 +33,25 @@ class MessageJournal(Journal):
     for storage for later processing.
     """
 
-    def __init__(self, hopper: AsyncHopper):
+    def __init__(self, hopper: AsyncHopper, message_filter: MessageFilter = None):
         """
         Constructor
 
         :param hopper: A handle to an AsyncHopper implementation, onto which
                        any message will be put().
+        :param message_filter: An optional MessageFilter whose may_allow() decides
+                       which messages are worth converting and putting on the hopper at all.
+                       Default of None means all messages are.
         """
         self.hopper: AsyncHopper = hopper
+        self.message_filter: MessageFilter = message_filter
+
+    def set_message_filter(self, message_filter: MessageFilter):
+        """
+        :param message_filter: The MessageFilter for whoever is consuming the hopper.
+                       None means all messages are put on the hopper.
+        """
+        self.message_filter = message_filter
 
     async def write_message(self, message: BaseMessage, origin: List[Dict[str, Any]]):
         """
@@ -51,13 +64,19 @@ class MessageJournal(Journal):
                     "instantiation_index"   An integer indicating which incarnation
                                             of the tool is being dealt with.
         """
+        if self.message_filter is not None:
+            message_type: ChatMessageType = ChatMessageType.from_message(message)
+            if not self.message_filter.may_allow(message_type, origin):
+                # Nobody downstream wants this one, so don't bother with it.
+                return
+
         converter = BaseMessageDictionaryConverter(origin=origin)
         message_dict: Dict[str, Any] = converter.to_dict(message)
 
         # Queue Producer from this:
         #   https://stackoverflow.com/questions/74130544/asyncio-yielding-results-from-multiple-futures-as-they-arrive
-        # The synchronous=True is necessary when an async HTTP request is at the get()-ing end of the queue,
-        # as the journal messages come from inside a separate event loop from that request. The lock
-        # taken here ends up being harmless in the synchronous request case (like for gRPC) because
-        # we would only be blocking our own event loop.
-        await self.hopper.put(message_dict, synchronous=True)
+        # The journal messages can come from inside a separate event loop from the one
+        # at the get()-ing end of the queue (like for an async HTTP request).
+        # The put() never blocks our event loop, but will asynchronously wait
+        # if the consumer has fallen too far behind.
+        await self.hopper.put(message_dict)
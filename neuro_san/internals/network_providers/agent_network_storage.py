@@ -80,8 +80,12 @@ class AgentNetworkStorage(AgentStorageSource):
         """
         Replace agents networks with a new collection.
         Previous state could be empty.
+        Only the differences are applied: agents whose AgentNetwork instance
+        is the one already stored are left alone, and their listeners are not notified.
         """
-        current_agents = set(self.agents_table.keys())
+        with self.lock:
+            current_table: Dict[str, AgentNetwork] = dict(self.agents_table)
+        current_agents = set(current_table.keys())
         new_agents = set(agent_networks.keys())
         # Remove agents which are not in the new collection:
         agents_to_remove = current_agents - new_agents
@@ -89,7 +93,9 @@ class AgentNetworkStorage(AgentStorageSource):
             self.remove_agent_network(agent_name)
         # Now add (or possibly replace) agents from new collection:
         for agent_name in new_agents:
-            self.add_agent_network(agent_name, agent_networks[agent_name])
+            agent_network: AgentNetwork = agent_networks[agent_name]
+            if current_table.get(agent_name) is not agent_network:
+                self.add_agent_network(agent_name, agent_network)
 
     def remove_agent_network(self, agent_name: str):
         """
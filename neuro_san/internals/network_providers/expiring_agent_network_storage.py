@@ -22,6 +22,7 @@ from typing import List
 import time
 
 from neuro_san.interfaces.reservation import Reservation
+from neuro_san.internals.graph.activations.coded_tool_class_cache import CodedToolClassCache
 from neuro_san.internals.graph.registry.agent_network import AgentNetwork
 from neuro_san.internals.interfaces.reservations_storage import ReservationsStorage
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
@@ -120,6 +121,11 @@ class ExpiringAgentNetworkStorage(AgentNetworkStorage, ReservationsStorage):
 
             self.last_modified = time.time()
 
+        # Temporary networks have unique names which are never used again,
+        # so forget the CodedTool classes resolved for them.
+        for agent_name in expired:
+            CodedToolClassCache.invalidate(agent_name, refresh_imports=False)
+
         # Notify listeners about this state change:
         # do it outside of internal lock
         for listener in self.listeners:
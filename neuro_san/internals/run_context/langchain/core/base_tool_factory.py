@@ -20,6 +20,7 @@ from typing import List
 from typing import Set
 from typing import Union
 
+from copy import copy
 from logging import Logger
 from logging import getLogger
 
@@ -34,7 +35,6 @@ from neuro_san.internals.run_context.interfaces.agent_network_inspector import A
 from neuro_san.internals.run_context.interfaces.tool_caller import ToolCaller
 from neuro_san.internals.run_context.langchain.core.langchain_openai_function_tool \
     import LangChainOpenAIFunctionTool
-from neuro_san.internals.run_context.langchain.mcp.langchain_mcp_adapter import LangChainMcpAdapter
 from neuro_san.internals.run_context.utils.external_agent_parsing import ExternalAgentParsing
 from neuro_san.internals.run_context.utils.external_tool_adapter import ExternalToolAdapter
 
@@ -165,6 +165,11 @@ class BaseToolFactory:
         # Get specific headers for the MCP server if available
         headers: Dict[str, Any] = http_headers.get(server_url)
 
+        # Lazy loading of LangChainMcpAdapter, as the MCP client packages take a while to import
+        # and most agent networks never call out to an MCP server.
+        # pylint: disable=import-outside-toplevel
+        from neuro_san.internals.run_context.langchain.mcp.langchain_mcp_adapter import LangChainMcpAdapter
+
         try:
             mcp_adapter = LangChainMcpAdapter()
             mcp_tools: List[BaseTool] = await mcp_adapter.get_mcp_tools(server_url, allowed_tools, headers)
@@ -273,6 +278,9 @@ class BaseToolFactory:
         # Also, most internal agents do not have a name identifier on their functional
         # JSON, which is required.  Use the agent name we are using for look-up for that
         # regardless of intent.
+        # The function_json can be part of a read-only config shared between sessions,
+        # so set the name on a copy.
+        function_json = copy(function_json)
         function_json["name"] = name
 
         return LangChainOpenAIFunctionTool.from_function_json(function_json, self.tool_caller)
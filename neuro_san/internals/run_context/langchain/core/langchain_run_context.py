@@ -18,7 +18,6 @@ from typing import Any
 from typing import Dict
 from typing import List
 from typing import Tuple
-from typing import Type
 from typing import Union
 
 import json
@@ -40,8 +39,6 @@ from langchain_core.runnables.base import Runnable
 from langchain_core.runnables.passthrough import RunnablePassthrough
 from langchain_core.tools.base import BaseTool
 
-from leaf_common.config.resolver_util import ResolverUtil
-
 from neuro_san.internals.errors.error_detector import ErrorDetector
 from neuro_san.internals.interfaces.context_type_llm_factory import ContextTypeLlmFactory
 from neuro_san.internals.interfaces.invocation_context import InvocationContext
@@ -62,13 +59,6 @@ from neuro_san.internals.run_context.langchain.llms.langchain_llm_resources impo
 
 MINUTES: float = 60.0
 
-# Lazily import specific errors from llm providers
-API_ERROR_TYPES: Tuple[Type[Any], ...] = ResolverUtil.create_type_tuple([
-                                            "openai.APIError",
-                                            "anthropic.APIError",
-                                            "langchain_google_genai.chat_models.ChatGoogleGenerativeAIError",
-                                         ])
-
 
 # pylint: disable=too-many-instance-attributes,too-many-public-methods
 class LangChainRunContext(RunContext):
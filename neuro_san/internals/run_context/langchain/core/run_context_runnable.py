@@ -17,8 +17,6 @@
 from typing import Any
 from typing import Dict
 from typing import List
-from typing import Tuple
-from typing import Type
 from typing import Union
 
 import traceback
@@ -36,8 +34,6 @@ from langchain_core.runnables.base import Runnable
 from langchain_core.runnables.utils import Input
 from langchain_core.runnables.utils import Output
 
-from leaf_common.config.resolver_util import ResolverUtil
-
 from neuro_san.internals.errors.error_detector import ErrorDetector
 from neuro_san.internals.journals.journal import Journal
 from neuro_san.internals.messages.origination import Origination
@@ -46,15 +42,16 @@ from neuro_san.internals.run_context.langchain.journaling.journaling_callback_ha
 from neuro_san.internals.run_context.langchain.token_counting.langchain_token_counter import LangChainTokenCounter
 from neuro_san.internals.run_context.langchain.tracing.neuro_san_runnable import NeuroSanRunnable
 from neuro_san.internals.run_context.langchain.util.api_key_error_check import ApiKeyErrorCheck
+from neuro_san.internals.utils.lazy_type_tuple import LazyTypeTuple
 
 MINUTES: float = 60.0
 
 # Lazily import specific errors from llm providers
-API_ERROR_TYPES: Tuple[Type[Any], ...] = ResolverUtil.create_type_tuple([
-                                            "openai.APIError",
-                                            "anthropic.APIError",
-                                            "langchain_google_genai.chat_models.ChatGoogleGenerativeAIError",
-                                         ])
+API_ERROR_TYPES: LazyTypeTuple = LazyTypeTuple([
+    "openai.APIError",
+    "anthropic.APIError",
+    "langchain_google_genai.chat_models.ChatGoogleGenerativeAIError",
+])
 
 
 class RunContextRunnable(NeuroSanRunnable):
@@ -150,7 +147,7 @@ class RunContextRunnable(NeuroSanRunnable):
         while chain_result is None and retries > 0:
             try:
                 chain_result: Dict[str, Any] = await self.agent_chain.ainvoke(input=inputs, config=runnable_config)
-            except API_ERROR_TYPES as api_error:
+            except API_ERROR_TYPES.get() as api_error:
                 backtrace = traceback.format_exc()
                 message: str = None
                 if not ApiKeyErrorCheck.check_for_internal_error(backtrace):
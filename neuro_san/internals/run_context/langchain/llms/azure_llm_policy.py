@@ -67,7 +67,8 @@ class AzureLlmPolicy(OpenAILlmPolicy):
 
         # From lanchain_openai.chat_models.azure.py
         default_headers: Dict[str, str] = {}
-        default_headers = config.get("default_headers", default_headers)
+        # Copy, as the configured headers can be part of a read-only config shared between sessions
+        default_headers = dict(config.get("default_headers", default_headers))
         default_headers.update({
             "User-Agent": "langchain-partner-python-azure-openai",
         })
@@ -100,6 +101,20 @@ class AzureLlmPolicy(OpenAILlmPolicy):
         # to pass to the BaseLanguageModel constructor.
         return self.async_openai_client.chat.completions
 
+    def get_client_pool_key_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param config: The fully specified llm config
+        :return: A dictionary of the fully-resolved values from the config (and environment)
+                which determine whether or not a web client can be shared.
+        """
+        key_config: Dict[str, Any] = super().get_client_pool_key_config(config)
+        key_config.update({
+            "azure_endpoint": self.get_value_or_env(config, "azure_endpoint", "AZURE_OPENAI_ENDPOINT"),
+            "azure_api_key": self.get_value_or_env(config, "openai_api_key", "AZURE_OPENAI_API_KEY"),
+            "azure_ad_token": self.get_value_or_env(config, "azure_ad_token", "AZURE_OPENAI_AD_TOKEN"),
+        })
+        return key_config
+
     def create_llm(self, config: Dict[str, Any], model_name: str, client: Any) -> BaseLanguageModel:
         """
         Create a BaseLanguageModel instance from the fully-specified llm config
@@ -22,6 +22,9 @@ from typing import Set
 from typing import Type
 from typing import Tuple
 
+from copy import deepcopy
+from threading import Lock
+
 import os
 
 from langchain_core.language_models.base import BaseLanguageModel
@@ -37,15 +40,18 @@ from neuro_san.internals.run_context.langchain.llms.llm_info_restorer import Llm
 from neuro_san.internals.run_context.langchain.llms.standard_langchain_llm_factory import StandardLangChainLlmFactory
 from neuro_san.internals.run_context.langchain.util.api_key_error_check import ApiKeyErrorCheck
 from neuro_san.internals.run_context.langchain.util.argument_validator import ArgumentValidator
+from neuro_san.internals.utils.lazy_type_tuple import LazyTypeTuple
 
 KEYS_TO_REMOVE_FOR_USER_CLASS: Set[str] = {"class", "verbose"}
 
+MAX_FULL_CONFIG_CACHE_ENTRIES: int = 1000
+
 # Lazily import specific errors from llm providers
-API_KEY_ERRORS: Tuple[Type[Any], ...] = ResolverUtil.create_type_tuple([
-                                            "google.auth.exceptions.DefaultCredentialsError",
-                                            "openai.OpenAIError",
-                                            "pydantic_core.ValidationError",
-                                        ])
+API_KEY_ERRORS: LazyTypeTuple = LazyTypeTuple([
+    "google.auth.exceptions.DefaultCredentialsError",
+    "openai.OpenAIError",
+    "pydantic_core.ValidationError",
+])
 
 
 class DefaultLlmFactory(ContextTypeLlmFactory, LangChainLlmFactory):
@@ -84,6 +90,13 @@ class DefaultLlmFactory(ContextTypeLlmFactory, LangChainLlmFactory):
         """
         self.llm_infos: Dict[str, Any] = {}
         self.overlayer = DictionaryOverlay()
+
+        # Fully resolved configs are remembered per llm_config, as long as the llm_infos they
+        # were resolved against stay the same. Each load() starts a new generation of llm_infos.
+        self.llm_infos_generation: int = 0
+        # Map of cache key -> (fully specified config, keys in it with values that need a deep copy)
+        self.full_config_cache: Dict[Tuple[int, str], Tuple[Dict[str, Any], List[str]]] = {}
+        self.full_config_lock = Lock()
         self.llm_factories: List[LangChainLlmFactory] = [
             StandardLangChainLlmFactory()
         ]
@@ -123,6 +136,11 @@ class DefaultLlmFactory(ContextTypeLlmFactory, LangChainLlmFactory):
         # sanitize the llm_infos keys
         self.llm_infos = self.sanitize_keys(self.llm_infos)
 
+        # Anything resolved against the previous llm_infos is no longer valid
+        with self.full_config_lock:
+            self.llm_infos_generation += 1
+            self.full_config_cache = {}
+
         # Resolve any new llm factories
         extractor = DictionaryExtractor(self.llm_infos)
         llm_factory_classes: List[str] = []
@@ -178,6 +196,50 @@ class DefaultLlmFactory(ContextTypeLlmFactory, LangChainLlmFactory):
         return llm_resources
 
     def create_full_llm_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param config: The llm_config from the user
+        :return: The fully specified config with defaults filled in.
+                 This is a copy the caller is free to modify.
+        """
+        cache_key: Tuple[int, str] = self.get_full_config_cache_key(config)
+
+        with self.full_config_lock:
+            cached: Tuple[Dict[str, Any], List[str]] = self.full_config_cache.get(cache_key)
+
+        if cached is None:
+            # Exceptions for bad configs are not cached, and are raised every time.
+            full_config: Dict[str, Any] = self.resolve_full_llm_config(config)
+            container_keys: List[str] = [key for key, value in full_config.items()
+                                         if isinstance(value, (dict, list))]
+            cached = (full_config, container_keys)
+            with self.full_config_lock:
+                if cache_key[0] == self.llm_infos_generation:
+                    if len(self.full_config_cache) >= MAX_FULL_CONFIG_CACHE_ENTRIES:
+                        # Should not happen with configs that come from agent network files alone
+                        self.full_config_cache = {}
+                    self.full_config_cache[cache_key] = cached
+
+        # LlmPolicies are known to modify parts of the config they are given,
+        # so nothing they get to see can be shared with the cache.
+        full_config, container_keys = cached
+        full_config = dict(full_config)
+        for key in container_keys:
+            full_config[key] = deepcopy(full_config[key])
+        return full_config
+
+    def get_full_config_cache_key(self, config: Dict[str, Any]) -> Tuple[int, str]:
+        """
+        :param config: The llm_config from the user
+        :return: A key for the fully specified config in the cache, based on the
+                current generation of llm_infos and the contents of the config.
+        """
+        # The llm_configs from agent network files only contain plain values,
+        # so their repr() describes their contents.  This is much cheaper than
+        # a canonical serialization, and all that happens with an unusual
+        # ordering of nested keys is a few more entries in the cache.
+        return (self.llm_infos_generation, repr(sorted(config.items())))
+
+    def resolve_full_llm_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """
         :param config: The llm_config from the user
         :return: The fully specified config with defaults filled in.
@@ -331,7 +393,7 @@ class DefaultLlmFactory(ContextTypeLlmFactory, LangChainLlmFactory):
 
             # Catch some common wrong or missing API key errors in a single place
             # with some verbose error messaging.
-            except API_KEY_ERRORS as exception:
+            except API_KEY_ERRORS.get() as exception:
                 # Will re-raise but with the right exception text it will
                 # also provide some more helpful failure text.
                 message: str = ApiKeyErrorCheck.check_for_api_key_exception(exception)
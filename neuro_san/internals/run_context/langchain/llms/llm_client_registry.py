@@ -0,0 +1,221 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from asyncio import AbstractEventLoop
+from asyncio import get_running_loop
+from contextlib import suppress
+from hashlib import sha256
+from os import environ
+from threading import Lock
+
+import json
+import time
+
+
+class LlmClientRegistry:
+    """
+    Process-wide registry of reference-counted web clients used to talk to LLM providers.
+
+    Creating a new web client for every agent on every request means that no
+    TCP/TLS connection is ever reused across turns of a conversation.
+    LlmPolicy implementations that can pass an externally created web client
+    to their BaseLanguageModel use this registry to share those clients instead.
+
+    Clients are keyed by a hash of the fully-resolved configuration values that
+    affect the connection (provider, base url, credentials, timeouts, etc.)
+    together with the event loop they were created on. Async web clients are
+    bound to the event loop that first uses them, and each AsyncioExecutor
+    has its own loop, so clients are never shared across loops.
+
+    Clients that are no longer referenced are closed after they have been idle
+    for IDLE_SECONDS. The number of pooled clients per provider is capped at
+    MAX_CLIENTS_PER_PROVIDER. Past that cap, callers get an unpooled client
+    which is closed when it is released, which is the same as the behavior
+    without pooling.
+    """
+
+    # Threaded lock - on purpose even though async access is used,
+    # as different AsyncioExecutor threads share this registry.
+    lock = Lock()
+
+    # Map of pool key -> pooled entry dictionary with keys:
+    #   "client"    - the pooled web client
+    #   "provider"  - the provider name the client was created for
+    #   "loop"      - the event loop the client was created on
+    #   "refcount"  - number of outstanding users of the client
+    #   "last_used" - time.monotonic() of the last release
+    entries: Dict[str, Dict[str, Any]] = {}
+
+    IDLE_SECONDS: float = float(environ.get("AGENT_LLM_CLIENT_IDLE_SECONDS", "300"))
+    MAX_CLIENTS_PER_PROVIDER: int = int(environ.get("AGENT_LLM_CLIENT_MAX_PER_PROVIDER", "16"))
+
+    @classmethod
+    def make_key(cls, provider: str, key_config: Dict[str, Any], loop: AbstractEventLoop) -> str:
+        """
+        :param provider: The name of the LLM provider
+        :param key_config: A dictionary of the resolved config values which affect
+                    the connection. Secrets are only ever kept as part of a hash.
+        :param loop: The event loop the client will be used on
+        :return: A string key for the registry
+        """
+        key_string: str = json.dumps(key_config, sort_keys=True, default=str)
+        digest: str = sha256(key_string.encode("utf-8")).hexdigest()
+        return f"{provider}:{id(loop)}:{digest}"
+
+    @classmethod
+    def acquire(cls, provider: str, key_config: Dict[str, Any],
+                create_client: Callable[[], Any]) -> Tuple[Any, str]:
+        """
+        Get a shared web client for the given configuration, creating one if necessary.
+
+        :param provider: The name of the LLM provider
+        :param key_config: A dictionary of the resolved config values which affect the connection
+        :param create_client: A no-argument function that creates a new web client
+        :return: A tuple of (web client, pool key).  The pool key is None when the
+                client is not pooled, in which case the caller owns the client.
+                Either way, the pair should be handed back to release() when done.
+        """
+        loop: AbstractEventLoop = None
+        with suppress(RuntimeError):
+            loop = get_running_loop()
+
+        if loop is None or cls.MAX_CLIENTS_PER_PROVIDER <= 0:
+            # Without a running loop we cannot know where the client will be used,
+            # so do not share it.
+            return create_client(), None
+
+        key: str = cls.make_key(provider, key_config, loop)
+        with cls.lock:
+            # Clients of closed loops are of no use to anyone, and should not count against the limit.
+            cls.drop_closed_loops()
+
+            entry: Dict[str, Any] = cls.entries.get(key)
+            if entry is not None and entry.get("loop") is loop:
+                entry["refcount"] += 1
+                return entry["client"], key
+
+            num_for_provider: int = 0
+            for one_entry in cls.entries.values():
+                if one_entry.get("provider") == provider:
+                    num_for_provider += 1
+            if num_for_provider >= cls.MAX_CLIENTS_PER_PROVIDER:
+                return create_client(), None
+
+            client: Any = create_client()
+            cls.entries[key] = {
+                "client": client,
+                "provider": provider,
+                "loop": loop,
+                "refcount": 1,
+                "last_used": time.monotonic(),
+            }
+        return client, key
+
+    @classmethod
+    async def release(cls, key: str, client: Any):
+        """
+        Give back a web client obtained from acquire().
+        Unpooled clients are closed right away.  Pooled clients stay open
+        for reuse until they have been idle long enough to be evicted.
+
+        :param key: The pool key returned by acquire()
+        :param client: The web client returned by acquire()
+        """
+        if client is None:
+            return
+
+        if key is None:
+            await cls.close_client(client)
+            return
+
+        with cls.lock:
+            entry: Dict[str, Any] = cls.entries.get(key)
+            if entry is not None and entry.get("client") is client:
+                entry["refcount"] = max(0, entry["refcount"] - 1)
+                entry["last_used"] = time.monotonic()
+
+        await cls.evict_idle()
+
+    @classmethod
+    async def evict_idle(cls, idle_seconds: float = None):
+        """
+        Close pooled clients belonging to the current event loop which have
+        not been used for a while. Entries for event loops which have since
+        been closed are dropped as there is no way to close them cleanly anymore.
+
+        :param idle_seconds: Override for the idle time after which unreferenced
+                    clients get closed.  Default of None uses IDLE_SECONDS.
+        """
+        if idle_seconds is None:
+            idle_seconds = cls.IDLE_SECONDS
+
+        loop: AbstractEventLoop = get_running_loop()
+        now: float = time.monotonic()
+        to_close: List[Any] = []
+        with cls.lock:
+            cls.drop_closed_loops()
+            for key, entry in list(cls.entries.items()):
+                if entry.get("loop") is loop and entry.get("refcount") <= 0 \
+                        and now - entry.get("last_used") >= idle_seconds:
+                    del cls.entries[key]
+                    to_close.append(entry.get("client"))
+
+        for client in to_close:
+            await cls.close_client(client)
+
+    @classmethod
+    def drop_closed_loops(cls):
+        """
+        Drop the entries for event loops which have been closed, as there is
+        no way to close their clients cleanly anymore.  Call with the lock held.
+        """
+        for key, entry in list(cls.entries.items()):
+            if entry.get("loop").is_closed():
+                del cls.entries[key]
+
+    @classmethod
+    async def close_client(cls, client: Any):
+        """
+        :param client: The web client to close.
+        """
+        with suppress(Exception):
+            await client.aclose()
+
+    @classmethod
+    def get_num_pooled(cls, provider: str = None) -> int:
+        """
+        :param provider: Optional provider name to restrict the count to
+        :return: The number of pooled clients
+        """
+        with cls.lock:
+            if provider is None:
+                return len(cls.entries)
+            return len([entry for entry in cls.entries.values() if entry.get("provider") == provider])
+
+    @classmethod
+    def reset_for_testing(cls):
+        """
+        Forget about all pooled clients for testing purposes only.
+        """
+        with cls.lock:
+            cls.entries = {}
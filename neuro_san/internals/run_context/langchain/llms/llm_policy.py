@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import Tuple
 
@@ -25,6 +26,7 @@ from langchain_core.language_models.base import BaseLanguageModel
 from leaf_common.config.resolver import Resolver
 
 from neuro_san.internals.interfaces.environment_configuration import EnvironmentConfiguration
+from neuro_san.internals.run_context.langchain.llms.llm_client_registry import LlmClientRegistry
 
 
 class LlmPolicy(EnvironmentConfiguration):
@@ -63,6 +65,11 @@ class LlmPolicy(EnvironmentConfiguration):
              to your LLM.  This is only required if your BaseLanguageModel implementation
              can take some kind of externally instantiated web client as an argument to
              its constructor and you care about delete_resources() cleanup.
+
+    Implementations which do create their own web clients can share them across requests
+    by overriding get_client_pool_key_config() and using acquire_pooled_client() and
+    release_pooled_client() instead of creating and closing the web clients directly.
+    See LlmClientRegistry for details.
     """
 
     def __init__(self, llm: BaseLanguageModel = None):
@@ -77,6 +84,9 @@ class LlmPolicy(EnvironmentConfiguration):
         # langchain_* packages to prevent installing the world.
         self.resolver: Resolver = Resolver()
 
+        # Key of the web client acquired from the LlmClientRegistry, if any.
+        self.client_pool_key: str = None
+
     # pylint: disable=useless-return
     def create_client(self, config: Dict[str, Any]) -> Any:
         """
@@ -96,6 +106,45 @@ class LlmPolicy(EnvironmentConfiguration):
         _ = config
         return None
 
+    def get_client_pool_key_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param config: The fully specified llm config
+        :return: A dictionary of the fully-resolved values from the config (and environment)
+                which determine whether or not a web client can be shared.
+                Things like base urls, credentials, proxies and timeouts go in here.
+                By default this is None, meaning web clients are not shared.
+        """
+        _ = config
+        return None
+
+    def acquire_pooled_client(self, config: Dict[str, Any], create_client: Callable[[], Any]) -> Any:
+        """
+        Get a web client which might be shared with other requests using the same settings.
+
+        :param config: The fully specified llm config
+        :param create_client: A no-argument function creating a new web client if needed
+        :return: The web client. Hand this back to release_pooled_client() when done with it.
+        """
+        key_config: Dict[str, Any] = self.get_client_pool_key_config(config)
+        if key_config is None:
+            self.client_pool_key = None
+            return create_client()
+
+        provider: str = self.__class__.__name__
+        client: Any = None
+        client, self.client_pool_key = LlmClientRegistry.acquire(provider, key_config, create_client)
+        return client
+
+    async def release_pooled_client(self, client: Any):
+        """
+        Give back a web client obtained from acquire_pooled_client().
+        Clients that are not shared are closed.
+
+        :param client: The web client to release.
+        """
+        await LlmClientRegistry.release(self.client_pool_key, client)
+        self.client_pool_key = None
+
     def create_llm(self, config: Dict[str, Any], model_name: str, client: Any) -> BaseLanguageModel:
         """
         Create a BaseLanguageModel instance from the fully-specified llm config
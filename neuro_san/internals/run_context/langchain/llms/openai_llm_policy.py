@@ -89,13 +89,29 @@ class OpenAILlmPolicy(LlmPolicy):
     def create_http_client(self, config: Dict[str, Any]):
         """
         Creates the http client from the given config.
+        The http client is shared with other requests that use the same settings.
 
         :param config: The fully specified llm config
         """
         # Our run-time model resource here is httpx client which we need to control directly:
         openai_proxy: str = self.get_value_or_env(config, "openai_proxy", "OPENAI_PROXY")
         request_timeout: int = config.get("request_timeout")
-        self.http_client = AsyncClient(proxy=openai_proxy, timeout=request_timeout)
+        self.http_client = self.acquire_pooled_client(
+            config, lambda: AsyncClient(proxy=openai_proxy, timeout=request_timeout))
+
+    def get_client_pool_key_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param config: The fully specified llm config
+        :return: A dictionary of the fully-resolved values from the config (and environment)
+                which determine whether or not a web client can be shared.
+        """
+        return {
+            "base_url": self.get_value_or_env(config, "openai_api_base", "OPENAI_API_BASE"),
+            "api_key": self.get_value_or_env(config, "openai_api_key", "OPENAI_API_KEY"),
+            "organization": self.get_value_or_env(config, "openai_organization", "OPENAI_ORG_ID"),
+            "proxy": self.get_value_or_env(config, "openai_proxy", "OPENAI_PROXY"),
+            "request_timeout": config.get("request_timeout"),
+        }
 
     def create_llm(self, config: Dict[str, Any], model_name: str, client: Any) -> BaseLanguageModel:
         """
@@ -182,6 +198,6 @@ class OpenAILlmPolicy(LlmPolicy):
 
         if self.http_client is not None:
             with suppress(Exception):
-                await self.http_client.aclose()
+                await self.release_pooled_client(self.http_client)
 
         self.http_client = None
@@ -28,6 +28,7 @@ import threading
 from langchain_core.tools import BaseTool
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from neuro_san.internals.run_context.langchain.mcp.mcp_servers_info_restorer import McpServersInfoRestorer
+from neuro_san.internals.run_context.langchain.mcp.mcp_tools_cache import McpToolsCache
 
 
 class LangChainMcpAdapter:
@@ -91,18 +92,23 @@ class LangChainMcpAdapter:
             else:
                 self.logger.error("MCP client headers for server %s must be a dictionary.",  server_url)
 
-        client = MultiServerMCPClient(
-            {"server": mcp_tool_dict}
-        )
-
-        # The get_tools() method returns a list of StructuredTool instances, which are subclasses of BaseTool.
-        # Internally, it calls load_mcp_tools(), which uses an `async with create_session(...)` block.
-        # This guarantees that any temporary MCP session created is properly closed when the block exits,
-        # even if an error is raised during tool loading.
-        # See: https://github.com/langchain-ai/langchain-mcp-adapters/blob/main/langchain_mcp_adapters/tools.py#L164
-        # Optimization:
-        #   It's possible we might want to cache these results somehow to minimize tool calls.
-        mcp_tools: List[BaseTool] = await client.get_tools()
+        async def fetch_tools() -> List[BaseTool]:
+            client = MultiServerMCPClient(
+                {"server": mcp_tool_dict}
+            )
+            # The get_tools() method returns a list of StructuredTool instances, which are subclasses of BaseTool.
+            # Internally, it calls load_mcp_tools(), which uses an `async with create_session(...)` block.
+            # This guarantees that any temporary MCP session created is properly closed when the block exits,
+            # even if an error is raised during tool loading.
+            # See: https://github.com/langchain-ai/langchain-mcp-adapters/blob/main/langchain_mcp_adapters/tools.py#L164
+            return await client.get_tools()
+
+        # Tool discovery results are shared across requests, so the handshake
+        # and tools/list round trip only happen once per TTL for any given server url + headers.
+        # The transport opens and terminates an MCP session of its own for each use,
+        # so there is no client session to keep around between requests.
+        mcp_tools: List[BaseTool] = await McpToolsCache.get_tools(server_url, mcp_tool_dict.get("headers"),
+                                                                  fetch_tools)
 
         # If allowed_tools is provided, filter the list to include only those tools.
         client_allowed_tools: List[str] = allowed_tools
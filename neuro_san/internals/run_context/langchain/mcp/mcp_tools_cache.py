@@ -0,0 +1,190 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+
+from concurrent.futures import Future
+from hashlib import sha256
+from os import environ
+from threading import Lock
+
+import asyncio
+import json
+import time
+
+from langchain_core.tools import BaseTool
+
+
+class McpToolsCache:
+    """
+    Process-wide cache of the tools discovered on MCP servers.
+
+    Without it, every agent that references an MCP server goes through
+    a full MCP handshake and tools/list round trip on every request
+    before its LLM can even be invoked.
+
+    Entries are keyed by server url together with a hash of the http headers
+    used to connect, so that different credentials never share results.
+    Entries expire after TTL_SECONDS and can be dropped explicitly with invalidate().
+
+    Concurrent requests for the same key are de-duplicated: only one of them
+    (the "leader") talks to the server and everyone else waits for its result,
+    even across the event loops of different AsyncioExecutors.
+    Failures are not cached.
+
+    Tools returned by the langchain MCP adapters do not hold on to a session
+    of their own (each tool call opens one), so they are safe to share
+    across requests and event loops.
+    """
+
+    # Threaded lock - on purpose even though async access is used,
+    # as different AsyncioExecutor threads share this cache.
+    lock = Lock()
+
+    # Map of cache key -> entry dictionary with keys:
+    #   "server_url"    - the url of the MCP server
+    #   "tools"         - the list of BaseTools discovered on the server
+    #   "expires"       - time.monotonic() after which the entry is stale
+    entries: Dict[str, Dict[str, Any]] = {}
+
+    # Map of cache key -> Future for the result of a fetch in progress
+    in_flight: Dict[str, Future] = {}
+
+    # Incremented by every invalidate() so that fetches which started before
+    # an invalidation do not put their results in the cache.
+    generation: int = 0
+
+    # Statistics
+    num_hits: int = 0
+    num_fetches: int = 0
+
+    TTL_SECONDS: float = float(environ.get("AGENT_MCP_TOOLS_CACHE_TTL_SECONDS", "300"))
+
+    @classmethod
+    def make_key(cls, server_url: str, headers: Dict[str, Any]) -> str:
+        """
+        :param server_url: URL of the MCP server
+        :param headers: Optional dictionary of http headers used to connect to the server.
+                    Secrets are only ever kept as part of a hash.
+        :return: A string key for the cache
+        """
+        headers_string: str = json.dumps(headers or {}, sort_keys=True, default=str)
+        digest: str = sha256(headers_string.encode("utf-8")).hexdigest()
+        return f"{server_url}:{digest}"
+
+    @classmethod
+    async def get_tools(cls, server_url: str, headers: Dict[str, Any],
+                        fetch_tools: Callable[[], Awaitable[List[BaseTool]]]) -> List[BaseTool]:
+        """
+        :param server_url: URL of the MCP server
+        :param headers: Optional dictionary of http headers used to connect to the server
+        :param fetch_tools: A no-argument coroutine function which gets the list
+                    of tools from the server when there is nothing usable in the cache
+        :return: A new list of the tools available on the server
+        """
+        if cls.TTL_SECONDS <= 0:
+            return await fetch_tools()
+
+        key: str = cls.make_key(server_url, headers)
+        while True:
+            is_leader: bool = False
+            with cls.lock:
+                entry: Dict[str, Any] = cls.entries.get(key)
+                if entry is not None and entry.get("expires") > time.monotonic():
+                    cls.num_hits += 1
+                    return list(entry.get("tools"))
+
+                future: Future = cls.in_flight.get(key)
+                if future is None:
+                    future = Future()
+                    cls.in_flight[key] = future
+                    is_leader = True
+                generation: int = cls.generation
+
+            if is_leader:
+                return await cls._fetch(key, server_url, generation, future, fetch_tools)
+
+            try:
+                tools: List[BaseTool] = await asyncio.wrap_future(future)
+                return list(tools)
+            except asyncio.CancelledError:
+                if not future.cancelled() or asyncio.current_task().cancelling() > 0:
+                    # We ourselves are being cancelled.
+                    raise
+                # Otherwise the leader was cancelled. Go around again.
+
+    @classmethod
+    async def _fetch(cls, key: str, server_url: str, generation: int, future: Future,
+                     fetch_tools: Callable[[], Awaitable[List[BaseTool]]]) -> List[BaseTool]:
+        """
+        Get the tools from the server on behalf of everyone waiting on the future.
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        try:
+            tools: List[BaseTool] = await fetch_tools()
+        except BaseException as exception:
+            with cls.lock:
+                cls.in_flight.pop(key, None)
+            if isinstance(exception, Exception):
+                future.set_exception(exception)
+            else:
+                future.cancel()
+            raise
+
+        with cls.lock:
+            cls.num_fetches += 1
+            cls.in_flight.pop(key, None)
+            if generation == cls.generation:
+                cls.entries[key] = {
+                    "server_url": server_url,
+                    "tools": tools,
+                    "expires": time.monotonic() + cls.TTL_SECONDS,
+                }
+        future.set_result(tools)
+        return list(tools)
+
+    @classmethod
+    def invalidate(cls, server_url: str = None):
+        """
+        Drop cached tools, for instance when a server is known to have changed.
+        :param server_url: URL of the MCP server whose tools should be forgotten.
+                    Default of None forgets the tools of all servers.
+        """
+        with cls.lock:
+            cls.generation += 1
+            if server_url is None:
+                cls.entries = {}
+                return
+            for key, entry in list(cls.entries.items()):
+                if entry.get("server_url") == server_url:
+                    del cls.entries[key]
+
+    @classmethod
+    def reset_for_testing(cls):
+        """
+        Forget about everything for testing purposes only.
+        """
+        with cls.lock:
+            cls.entries = {}
+            cls.in_flight = {}
+            cls.generation = 0
+            cls.num_hits = 0
+            cls.num_fetches = 0
@@ -0,0 +1,46 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+
+from neuro_san.internals.utils.frozen_dict import FrozenDict
+from neuro_san.internals.utils.frozen_list import FrozenList
+
+
+class FrozenConfig:
+    """
+    Utilities for making read-only versions of config dictionaries,
+    so that they can be shared safely instead of being copied for each user.
+    """
+
+    @staticmethod
+    def freeze(config: Any) -> Any:
+        """
+        :param config: A structure of dicts, lists and scalar values as read from a config file
+        :return: An equivalent structure in which all dicts are FrozenDicts and all lists
+                are FrozenLists.  The structure passed in is left untouched,
+                except for any parts of it that were already frozen, which are shared.
+        """
+        if isinstance(config, (FrozenDict, FrozenList)):
+            return config
+        if isinstance(config, dict):
+            return FrozenDict((key, FrozenConfig.freeze(value)) for key, value in config.items())
+        if isinstance(config, list):
+            return FrozenList(FrozenConfig.freeze(value) for value in config)
+        if isinstance(config, tuple):
+            return tuple(FrozenConfig.freeze(value) for value in config)
+        return config
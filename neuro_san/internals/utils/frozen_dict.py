@@ -0,0 +1,59 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import NoReturn
+
+from copy import deepcopy
+
+
+class FrozenDict(dict):
+    """
+    A dict that cannot be modified in place.
+
+    It is still a dict as far as isinstance(), json.dumps() and friends are concerned,
+    so it can be handed to code that only reads from it without any conversion.
+    Both copy.copy() and copy.deepcopy() hand back a regular, modifiable dict,
+    which is the way to go for anyone who needs to change one.
+    """
+
+    def _read_only(self, *args, **kwargs) -> NoReturn:
+        """
+        Shared implementation of all the modifying methods
+        """
+        raise TypeError("This dictionary is shared and read-only. "
+                        "Use copy.deepcopy() on it to get one that can be modified.")
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return {deepcopy(key, memo): deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        # Pickles (and unpickles) as a regular dict
+        return (dict, (dict(self),))
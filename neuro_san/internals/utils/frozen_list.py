@@ -0,0 +1,60 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import NoReturn
+
+from copy import deepcopy
+
+
+class FrozenList(list):
+    """
+    A list that cannot be modified in place.
+    See FrozenDict for the rationale.
+    """
+
+    def _read_only(self, *args, **kwargs) -> NoReturn:
+        """
+        Shared implementation of all the modifying methods
+        """
+        raise TypeError("This list is shared and read-only. "
+                        "Use copy.deepcopy() on it to get one that can be modified.")
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only
+    __imul__ = _read_only
+    append = _read_only
+    clear = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only
+    remove = _read_only
+    reverse = _read_only
+    sort = _read_only
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        return [deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        # Pickles (and unpickles) as a regular list
+        return (list, (list(self),))
@@ -0,0 +1,52 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import List
+from typing import Tuple
+from typing import Type
+
+from leaf_common.config.resolver_util import ResolverUtil
+
+
+class LazyTypeTuple:
+    """
+    A tuple of types given by their fully qualified names, which are only resolved
+    the first time the tuple is asked for.
+
+    The expression of an except clause is only evaluated when an exception is being matched,
+    so "except lazy_types.get()" catches errors from optional packages (like those of llm providers)
+    without importing any of those packages when the module doing the catching is imported.
+    Types whose packages are not installed are left out.
+    """
+
+    def __init__(self, type_names: List[str]):
+        """
+        Constructor
+
+        :param type_names: The list of fully qualified names of the types
+        """
+        self.type_names: List[str] = type_names
+        self.types: Tuple[Type[Any], ...] = None
+
+    def get(self) -> Tuple[Type[Any], ...]:
+        """
+        :return: The tuple of resolved types
+        """
+        if self.types is None:
+            # No lock needed, as any thread would resolve the same thing.
+            self.types = ResolverUtil.create_type_tuple(self.type_names)
+        return self.types
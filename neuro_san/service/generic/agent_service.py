@@ -22,6 +22,7 @@ from typing import Iterator
 import contextlib
 import copy
 import json
+import threading
 import uuid
 
 from janus import Queue
@@ -99,6 +100,7 @@ class AgentService:
 
         # Stuff needed for ServiceAgentReservationist
         self.queues: Queue[AsyncCollatingQueue] = server_context.get_queues()
+        self.deployment_wakeup: threading.Event = server_context.get_deployment_wakeup()
 
         agent_network: AgentNetwork = self.agent_network_provider.get_agent_network()
         config: Dict[str, Any] = agent_network.get_config()
@@ -250,7 +252,7 @@ class AgentService:
         # Create a reservationist
         reservationist: Reservationist = None
         if self.queues is not None:
-            reservationist = ServiceAgentReservationist()
+            reservationist = ServiceAgentReservationist(wakeup=self.deployment_wakeup)
             self.queues.sync_q.put(reservationist.get_queue())
 
         # Prepare
@@ -21,6 +21,7 @@ from typing import Generator
 
 import json
 import contextlib
+import threading
 import uuid
 
 from janus import Queue
@@ -32,6 +33,7 @@ from leaf_common.utils.atomic_counter import AtomicCounter
 from neuro_san.interfaces.reservationist import Reservationist
 from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
 from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.interfaces.async_agent_session_factory import AsyncAgentSessionFactory
 from neuro_san.internals.interfaces.agent_network_provider import AgentNetworkProvider
 from neuro_san.internals.interfaces.context_type_toolbox_factory import ContextTypeToolboxFactory
 from neuro_san.internals.interfaces.context_type_llm_factory import ContextTypeLlmFactory
@@ -43,6 +45,8 @@ from neuro_san.service.generic.chat_message_converter import ChatMessageConverte
 from neuro_san.service.interfaces.event_loop_logger import EventLoopLogger
 from neuro_san.service.usage.usage_logger_factory import UsageLoggerFactory
 from neuro_san.service.usage.wrapped_usage_logger import WrappedUsageLogger
+from neuro_san.service.utils.agent_response_cache import AgentResponseCache
+from neuro_san.service.utils.cached_response import CachedResponse
 from neuro_san.service.utils.server_context import ServerContext
 from neuro_san.session.async_direct_agent_session import AsyncDirectAgentSession
 from neuro_san.session.external_agent_session_factory import ExternalAgentSessionFactory
@@ -89,11 +93,13 @@ class AsyncAgentService:
 
         # Stuff needed for ServiceAgentReservationist
         self.queues: Queue[AsyncCollatingQueue] = server_context.get_queues()
+        self.deployment_wakeup: threading.Event = server_context.get_deployment_wakeup()
 
         self.agent_network_provider: AgentNetworkProvider = agent_network_provider
         self.agent_name: str = agent_name
         self.request_counter = AtomicCounter()
         self.port: int = server_context.get_server_port()
+        self.server_context: ServerContext = server_context
 
         self.async_executor_pool: AsyncioExecutorPool = server_context.get_executor_pool()
         self.reload_factories()
@@ -142,37 +148,18 @@ class AsyncAgentService:
         :param request_metadata: request metadata
         :return: a FunctionResponse dictionary
         """
-        self.request_counter.increment()
-        do_log: bool = "Function" not in DO_NOT_LOG_REQUESTS
-        log_marker: str = "function request"
-        metadata: Dict[str, str] = {
-            "request_id": f"server-{uuid.uuid4()}"
-        }
-        metadata.update(request_metadata)
-        if do_log:
-            self.request_logger.info(
-                metadata,
-                "Received a %s request for %s",
-                f"{self.agent_name}.Function", log_marker)
-
-        # Delegate to Direct*Session
-        agent_network: AgentNetwork = self.agent_network_provider.get_agent_network()
-        session: AsyncDirectAgentSession =\
-            AsyncDirectAgentSession(
-                agent_network=agent_network,
-                invocation_context=None,
-                metadata=metadata,
-                security_cfg=self.security_cfg)
-        response_dict = await session.function(request_dict)
-
-        if do_log:
-            self.request_logger.info(
-                metadata,
-                "Done with %s request for %s",
-                f"{self.agent_name}.Function", log_marker)
+        cached: CachedResponse = await self.get_function_response(request_dict, request_metadata)
+        return cached.get_response()
 
-        self.request_counter.decrement()
-        return response_dict
+    async def get_function_response(self, request_dict: Dict[str, Any],
+                                    request_metadata: Dict[str, Any]) \
+            -> CachedResponse:
+        """
+        :param request_dict: a FunctionRequest dictionary
+        :param request_metadata: request metadata
+        :return: a CachedResponse with the FunctionResponse dictionary
+        """
+        return await self.get_cached_response("Function", request_dict, request_metadata)
 
     async def connectivity(self, request_dict: Dict[str, Any],
                            request_metadata: Dict[str, Any]) \
@@ -185,42 +172,120 @@ class AsyncAgentService:
         :param request_metadata: request metadata
         :return: a ConnectivityResponse dictionary
         """
+        cached: CachedResponse = await self.get_connectivity_response(request_dict, request_metadata)
+        return cached.get_response()
+
+    async def get_connectivity_response(self, request_dict: Dict[str, Any],
+                                        request_metadata: Dict[str, Any]) \
+            -> CachedResponse:
+        """
+        :param request_dict: a ConnectivityRequest dictionary
+        :param request_metadata: request metadata
+        :return: a CachedResponse with the ConnectivityResponse dictionary
+        """
+        return await self.get_cached_response("Connectivity", request_dict, request_metadata)
+
+    async def get_cached_response(self, method: str, request_dict: Dict[str, Any],
+                                  request_metadata: Dict[str, Any]) \
+            -> CachedResponse:
+        """
+        Responses of "function" and "connectivity" only change when the agent network
+        does, so they are computed once per version of the agent network and kept
+        in the AgentResponseCache of the server.
+
+        :param method: The name of the API method, either "Function" or "Connectivity"
+        :param request_dict: the request dictionary. Neither method takes anything from it.
+        :param request_metadata: request metadata
+        :return: a CachedResponse with the response dictionary
+        """
         self.request_counter.increment()
-        do_log: bool = "Connectivity" not in DO_NOT_LOG_REQUESTS
-        log_marker: str = "connectivity request"
+        do_log: bool = method not in DO_NOT_LOG_REQUESTS
+        operation: str = method.lower()
+        log_marker: str = f"{operation} request"
         metadata: Dict[str, str] = {
             "request_id": f"server-{uuid.uuid4()}"
         }
         metadata.update(request_metadata)
-
         if do_log:
             self.request_logger.info(
                 metadata,
                 "Received a %s request for %s",
-                f"{self.agent_name}.Connectivity", log_marker)
-
-        # Delegate to Direct*Session
-        agent_network: AgentNetwork = self.agent_network_provider.get_agent_network()
-        session: AsyncDirectAgentSession =\
-            AsyncDirectAgentSession(
-                agent_network=agent_network,
-                invocation_context=None,
-                metadata=metadata,
-                security_cfg=self.security_cfg)
-        response_dict = await session.connectivity(request_dict)
+                f"{self.agent_name}.{method}", log_marker)
+
+        response_cache: AgentResponseCache = self.server_context.get_agent_response_cache()
+        cached: CachedResponse = response_cache.get_response(self.agent_name, operation, request_metadata)
+        if cached is None:
+            # Get the version before the agent network, so a change in between is not kept.
+            network_version: int = response_cache.get_network_version(self.agent_name)
+
+            # Delegate to Direct*Session
+            agent_network: AgentNetwork = self.agent_network_provider.get_agent_network()
+            session: AsyncDirectAgentSession =\
+                AsyncDirectAgentSession(
+                    agent_network=agent_network,
+                    invocation_context=None,
+                    metadata=metadata,
+                    security_cfg=self.security_cfg)
+            if operation == "function":
+                response_dict = await session.function(request_dict)
+            else:
+                response_dict = await session.connectivity(request_dict)
+            cached = response_cache.put_response(self.agent_name, operation, network_version,
+                                                 request_metadata, response_dict)
 
         if do_log:
             self.request_logger.info(
                 metadata,
                 "Done with %s request for %s",
-                f"{self.agent_name}.Connectivity", log_marker)
+                f"{self.agent_name}.{method}", log_marker)
 
         self.request_counter.decrement()
-        return response_dict
+        return cached
+
+    def create_invocation_context(self, metadata: Dict[str, str],
+                                  reservationist: Reservationist,
+                                  parent_invocation_context: SessionInvocationContext) \
+            -> SessionInvocationContext:
+        """
+        :param metadata: request metadata
+        :param reservationist: The Reservationist for the request, if any
+        :param parent_invocation_context: The SessionInvocationContext of another agent network
+                        on this server calling this one as an external agent, if any.
+        :return: A started SessionInvocationContext for the request
+        """
+        if parent_invocation_context is not None:
+            # Logging on the caller's executor is already set up for the caller's request
+            return parent_invocation_context.nested_copy(
+                self.agent_name,
+                self.llm_factory,
+                self.toolbox_factory,
+                metadata,
+                reservationist)
+
+        factory: AsyncAgentSessionFactory = self.server_context.get_external_agent_session_factory()
+        if factory is None:
+            factory = ExternalAgentSessionFactory(use_direct=False)
+        invocation_context = SessionInvocationContext(
+            self.agent_name,
+            factory,
+            self.async_executor_pool,
+            self.llm_factory,
+            self.toolbox_factory,
+            metadata,
+            reservationist,
+            self.port)
+        invocation_context.start()
+
+        # Set up logging inside async thread
+        # Prefer any request_id from the client over what we generated on the server.
+        executor: AsyncioExecutor = invocation_context.get_asyncio_executor()
+        _ = executor.submit(None, self.server_logging.setup_logging, metadata, metadata.get("request_id"))
+        return invocation_context
 
     # pylint: disable=too-many-locals
     async def streaming_chat(self, request_dict: Dict[str, Any],
-                             request_metadata: Dict[str, Any]) \
+                             request_metadata: Dict[str, Any],
+                             parent_invocation_context: SessionInvocationContext = None) \
             -> Generator[Dict[str, Any], None, None]:
         """
         Initiates or continues the agent chat with the session_id
@@ -228,6 +293,9 @@ class AsyncAgentService:
 
         :param request_dict: a ChatRequest dictionary
         :param request_metadata: request metadata
+        :param parent_invocation_context: The SessionInvocationContext of another agent network
+                        on this server calling this one as an external agent, if any.
+                        The request then runs on the caller's executor instead of a new one.
         :return: an iterator for (eventually) returned responses dictionaries
         """
         self.request_counter.increment()
@@ -249,26 +317,12 @@ class AsyncAgentService:
         # Create a reservationist for the occasion
         reservationist: Reservationist = None
         if self.queues is not None:
-            reservationist = ServiceAgentReservationist()
+            reservationist = ServiceAgentReservationist(wakeup=self.deployment_wakeup)
             self.queues.sync_q.put(reservationist.get_queue())
 
         # Prepare
-        factory = ExternalAgentSessionFactory(use_direct=False)
-        invocation_context = SessionInvocationContext(
-            self.agent_name,
-            factory,
-            self.async_executor_pool,
-            self.llm_factory,
-            self.toolbox_factory,
-            metadata,
-            reservationist,
-            self.port)
-        invocation_context.start()
-
-        # Set up logging inside async thread
-        # Prefer any request_id from the client over what we generated on the server.
-        executor: AsyncioExecutor = invocation_context.get_asyncio_executor()
-        _ = executor.submit(None, self.server_logging.setup_logging, metadata, metadata.get("request_id"))
+        invocation_context: SessionInvocationContext = self.create_invocation_context(
+            metadata, reservationist, parent_invocation_context)
 
         # Delegate to Direct*Session
         agent_network: AgentNetwork = self.agent_network_provider.get_agent_network()
@@ -0,0 +1,133 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import Generator
+
+from contextlib import suppress
+import asyncio
+import logging
+
+from neuro_san.interfaces.async_agent_session import AsyncAgentSession
+from neuro_san.service.generic.async_agent_service import AsyncAgentService
+from neuro_san.service.generic.async_agent_service_provider import AsyncAgentServiceProvider
+from neuro_san.service.generic.chat_message_converter import ChatMessageConverter
+from neuro_san.service.interfaces.agent_authorizer import AgentAuthorizer
+from neuro_san.session.session_invocation_context import SessionInvocationContext
+
+
+class InProcessAgentSession(AsyncAgentSession):
+    """
+    AsyncAgentSession for an external agent network hosted by the same server as the
+    agent network calling it.
+
+    Requests go to the AsyncAgentService of the called network just as they would
+    once they arrived at the server over http, after the same authorization check.
+    What is saved is the serialization, the socket traffic and the flushing of
+    the streamed responses, as well as taking another executor from the pool.
+    """
+
+    def __init__(self, agent_name: str,
+                 agent_policy: AgentAuthorizer,
+                 invocation_context: SessionInvocationContext,
+                 metadata: Dict[str, Any]):
+        """
+        Constructor
+
+        :param agent_name: The name of the agent network to call
+        :param agent_policy: The AgentAuthorizer the server checks requests against
+        :param invocation_context: The SessionInvocationContext of the calling agent network
+        :param metadata: The request metadata as the server would have received it over http
+        """
+        self.agent_name: str = agent_name
+        self.agent_policy: AgentAuthorizer = agent_policy
+        self.invocation_context: SessionInvocationContext = invocation_context
+        self.metadata: Dict[str, Any] = metadata
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def get_service(self) -> AsyncAgentService:
+        """
+        :return: The AsyncAgentService for the agent network, if the request is allowed to use it
+        """
+        is_authorized: bool = False
+        service_provider: AsyncAgentServiceProvider = None
+        is_authorized, service_provider = await self.agent_policy.allow_agent(self.agent_name, self.metadata)
+        if service_provider is None:
+            raise ValueError(f"Agent network {self.agent_name} is not served by this server")
+        if not is_authorized:
+            raise ValueError(f"Request is not authorized to use agent network {self.agent_name}")
+        return service_provider.get_service()
+
+    async def function(self, request_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param request_dict: A dictionary version of the FunctionRequest
+                    protobufs structure. Has the following keys:
+                        <None>
+        :return: A dictionary version of the FunctionResponse
+                    protobufs structure. Has the following keys:
+                "function" - the dictionary description of the function
+        """
+        service: AsyncAgentService = await self.get_service()
+        return await service.function(request_dict, self.metadata)
+
+    async def connectivity(self, request_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param request_dict: A dictionary version of the ConnectivityRequest
+                    protobufs structure. Has the following keys:
+                        <None>
+        :return: A dictionary version of the ConnectivityResponse
+                    protobufs structure. Has the following keys:
+                "connectivity_info" - the list of connectivity descriptions for
+                                    each node in the agent network the service
+                                    wants the client ot know about.
+        """
+        service: AsyncAgentService = await self.get_service()
+        return await service.connectivity(request_dict, self.metadata)
+
+    async def streaming_chat(self, request_dict: Dict[str, Any]) -> Generator[Dict[str, Any], None, None]:
+        """
+        :param request_dict: A dictionary version of the ChatRequest
+                    protobufs structure. Has the following keys:
+            "user_message" - A ChatMessage dict representing the user input to the chat stream
+            "chat_context" - A ChatContext dict representing the state of the previous conversation
+                            (if any)
+        :return: An iterator of dictionary versions of the ChatResponse
+                    protobufs structure. Has the following keys:
+            "response"      - An optional ChatMessage dictionary.  See chat.proto for details.
+        """
+        service: AsyncAgentService = await self.get_service()
+
+        request_timeout: float = service.get_request_timeout_seconds()
+        if request_timeout <= 0.0:
+            # For asyncio.timeout(), None means no timeout:
+            request_timeout = None
+
+        # Over http, the called network gets its own copy of everything in the request,
+        # sly_data included. Make sure nothing is shared with the caller here either.
+        request_copy: Dict[str, Any] = ChatMessageConverter().to_json_safe(request_dict)
+
+        response_generator = service.streaming_chat(request_copy, self.metadata, self.invocation_context)
+        try:
+            async with asyncio.timeout(request_timeout):
+                async for response_dict in response_generator:
+                    yield response_dict
+        except asyncio.TimeoutError:
+            # Over http, the stream just ends when the server times out the request.
+            self.logger.info("Chat request timeout for %s in %f seconds.", self.agent_name, request_timeout)
+        finally:
+            with suppress(Exception):
+                await response_generator.aclose()
@@ -21,6 +21,8 @@ from typing import Union
 from asyncio import Event
 from asyncio import get_running_loop
 
+import threading
+
 from neuro_san.interfaces.reservation import Reservation
 from neuro_san.interfaces.reservationist import Reservationist
 from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
@@ -33,14 +35,18 @@ class ServiceAgentReservationist(Reservationist):
     for a specific amount of time.
     """
 
-    def __init__(self, max_lifetime_in_seconds: float = Reservationist.DEFAULT_LIFETIME):
+    def __init__(self, max_lifetime_in_seconds: float = Reservationist.DEFAULT_LIFETIME,
+                 wakeup: threading.Event = None):
         """
         Constructor
 
         :param max_lifetime_in_seconds: The maximum lifetime allowed for any Reservation.
+        :param wakeup: An optional threading.Event to set whenever something is put
+                    on our queue, so the deployment consumer can get to it right away.
         """
         self.max_lifetime_in_seconds: float = max_lifetime_in_seconds
         self.queue: AsyncCollatingQueue = AsyncCollatingQueue()
+        self.wakeup: threading.Event = wakeup
 
     def get_queue(self) -> AsyncCollatingQueue:
         """
@@ -110,14 +116,23 @@ class ServiceAgentReservationist(Reservationist):
                     queued_item["event"] = key
                     queued_item["event_loop"] = get_running_loop()
 
-                await self.queue.put(queued_item, synchronous=False)
+                await self.queue.put(queued_item)
 
+        self.wake_consumer()
         return None
 
     async def close(self):
         """
         Tell the deployment consumer we are all done.
         """
-        # Use synchronous side of the queue because this will not
-        # be part of the same event loop the put() in deploy() above is done.
-        await self.queue.put_final_item(synchronous=True)
+        # This will not be part of the same event loop the put() in deploy() above is done,
+        # but the queue does not mind.
+        await self.queue.put_final_item()
+        self.wake_consumer()
+
+    def wake_consumer(self):
+        """
+        Let the deployment consumer know there is something on our queue.
+        """
+        if self.wakeup is not None:
+            self.wakeup.set()
@@ -0,0 +1,118 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from neuro_san.interfaces.async_agent_session import AsyncAgentSession
+from neuro_san.internals.interfaces.agent_network_provider import AgentNetworkProvider
+from neuro_san.internals.interfaces.invocation_context import InvocationContext
+from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.service.generic.in_process_agent_session import InProcessAgentSession
+from neuro_san.service.interfaces.agent_authorizer import AgentAuthorizer
+from neuro_san.session.external_agent_session_factory import ExternalAgentSessionFactory
+
+
+class ServiceExternalAgentSessionFactory(ExternalAgentSessionFactory):
+    """
+    ExternalAgentSessionFactory used by the server, which calls the external agents
+    it hosts itself in-process with an InProcessAgentSession.
+    All other external agents are called over http as usual.
+    """
+
+    # Host names which refer to the machine the server runs on
+    LOCAL_HOSTS: List[str] = ["localhost", "127.0.0.1"]
+
+    def __init__(self, network_storage_dict: Dict[str, AgentNetworkStorage],
+                 agent_policy: AgentAuthorizer,
+                 forwarded_request_metadata: List[str]):
+        """
+        Constructor
+
+        :param network_storage_dict: A dictionary of AgentNetworkStorage instances
+                    which keeps all the AgentNetworks the server hosts.
+        :param agent_policy: The AgentAuthorizer the server checks requests against
+        :param forwarded_request_metadata: The list of request metadata keys the server
+                    takes from the headers of http requests
+        """
+        super().__init__(use_direct=False)
+        self.network_storage_dict = network_storage_dict
+        self.agent_policy: AgentAuthorizer = agent_policy
+        self.forwarded_request_metadata: List[str] = forwarded_request_metadata
+
+    def create_session_from_location_dict(self, agent_location: Dict[str, str],
+                                          invocation_context: InvocationContext) -> AsyncAgentSession:
+        """
+        :param agent_location: An agent location dictionary returned by
+                    ExternalAgentParsing.parse_external_agent()
+        :param invocation_context: The context policy container that pertains to the invocation
+                    of the agent.
+        :return: An AsyncAgentSession through which communications about the external agent can be made.
+        """
+        if not self.is_hosted_here(agent_location, invocation_context):
+            return super().create_session_from_location_dict(agent_location, invocation_context)
+
+        metadata: Dict[str, Any] = self.forward_metadata(invocation_context.get_metadata())
+        return InProcessAgentSession(agent_location.get("agent_name"), self.agent_policy,
+                                     invocation_context, metadata)
+
+    def is_hosted_here(self, agent_location: Dict[str, str], invocation_context: InvocationContext) -> bool:
+        """
+        :param agent_location: An agent location dictionary returned by
+                    ExternalAgentParsing.parse_external_agent()
+        :param invocation_context: The context policy container that pertains to the invocation
+                    of the agent.
+        :return: True if the agent location refers to an agent network hosted by this server
+        """
+        if agent_location is None or invocation_context is None:
+            return False
+
+        if agent_location.get("host") not in self.LOCAL_HOSTS:
+            return False
+
+        # Another server could be running on the same machine
+        port: Any = agent_location.get("port")
+        server_port: int = invocation_context.get_port()
+        if port is None or server_port is None or str(port) != str(server_port):
+            return False
+
+        agent_name: str = agent_location.get("agent_name")
+        for network_storage in self.network_storage_dict.values():
+            agent_network_provider: AgentNetworkProvider = network_storage.get_agent_network_provider(agent_name)
+            if agent_network_provider.get_agent_network() is not None:
+                return True
+
+        return False
+
+    def forward_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param metadata: The request metadata of the calling agent network
+        :return: The request metadata as the server would have received it in the headers
+                of an http request sent by an AsyncHttpServiceAgentSession
+        """
+        if metadata is None:
+            metadata = {}
+
+        forwarded: Dict[str, Any] = {}
+        for key in self.forwarded_request_metadata:
+            forwarded[key] = metadata.get(key, "None")
+
+        if forwarded.get("request_id") == "None":
+            # Let the AsyncAgentService come up with one
+            forwarded.pop("request_id")
+
+        return forwarded
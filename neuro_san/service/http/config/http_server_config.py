@@ -22,12 +22,16 @@ DEFAULT_HTTP_CONNECTIONS_BACKLOG: int = 128
 DEFAULT_HTTP_IDLE_CONNECTIONS_TIMEOUT_SECONDS: int = 3600
 DEFAULT_HTTP_SERVER_INSTANCES: int = 1
 DEFAULT_HTTP_SERVER_MONITOR_INTERVAL_SECONDS: int = 0
+DEFAULT_MAX_CONCURRENT_REQUESTS: int = 0
+DEFAULT_MAX_QUEUED_REQUESTS: int = 100
+DEFAULT_QUEUED_REQUEST_TIMEOUT_SECONDS: float = 30.0
 
 
 class HttpServerConfig:
     """
     Class aggregating Tornado http server run-time configuration parameters.
     """
+    # pylint: disable=too-many-instance-attributes
 
     def __init__(self):
         self.http_connections_backlog: int = DEFAULT_HTTP_CONNECTIONS_BACKLOG
@@ -35,3 +39,7 @@ class HttpServerConfig:
         self.http_server_instances: int = DEFAULT_HTTP_SERVER_INSTANCES
         self.http_port: int = 80
         self.http_server_monitor_interval_seconds: int = DEFAULT_HTTP_SERVER_MONITOR_INTERVAL_SECONDS
+        self.max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS
+        self.max_queued_requests: int = DEFAULT_MAX_QUEUED_REQUESTS
+        self.queued_request_timeout_seconds: float = DEFAULT_QUEUED_REQUEST_TIMEOUT_SECONDS
+        self.external_agents_in_process: bool = True
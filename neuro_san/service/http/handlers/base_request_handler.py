@@ -20,12 +20,12 @@ See class comment for details
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Type
 
 from http import HTTPStatus
 
 import json
 import os
-import asyncio
 
 import tornado
 from tornado.web import RequestHandler
@@ -34,7 +34,9 @@ from leaf_common.utils.async_atomic_counter import AsyncAtomicCounter
 from neuro_san.service.generic.async_agent_service import AsyncAgentService
 from neuro_san.service.generic.async_agent_service_provider import AsyncAgentServiceProvider
 from neuro_san.service.interfaces.agent_authorizer import AgentAuthorizer
+from neuro_san.service.utils.cached_response import CachedResponse
 from neuro_san.service.utils.server_context import ServerContext
+from neuro_san.service.http.handlers.streaming_response_writer import StreamingResponseWriter
 from neuro_san.service.http.logging.http_logger import HttpLogger
 
 
@@ -44,6 +46,7 @@ class BaseRequestHandler(RequestHandler):
     Provides logic to inject neuro-san service specific data
     into local handler context.
     """
+    # pylint: disable=too-many-instance-attributes
     request_id_counter: AsyncAtomicCounter = AsyncAtomicCounter()
 
     # pylint: disable=attribute-defined-outside-init
@@ -66,6 +69,7 @@ class BaseRequestHandler(RequestHandler):
         self.logger = HttpLogger(self.forwarded_request_metadata)
         self.show_absent: bool = os.environ.get("SHOW_ABSENT_METADATA") is not None
         self.request_id: int = 0
+        self.admitted: bool = False
 
         if os.environ.get("AGENT_ALLOW_CORS_HEADERS") is not None:
             self.set_header("Access-Control-Allow-Origin", "*")
@@ -150,6 +154,47 @@ class BaseRequestHandler(RequestHandler):
 
         return service_provider.get_service()
 
+    async def admit_request(self, metadata: Dict[str, Any], error_body: Dict[str, Any] = None) -> bool:
+        """
+        Wait for the server's AdmissionController to let this request through.
+        When the server is saturated, a 503 response with a Retry-After header
+        is finished right here.
+        Every admitted request must call release_request() once it is done.
+        :param metadata: metadata to be used for logging if necessary.
+        :param error_body: Optional dictionary to send as the body of a rejection.
+                Default of None sends a plain error message.
+        :return: True if the request was admitted, False if it was rejected
+        """
+        admission_controller = self.application.get_admission_controller()
+        self.admitted = await admission_controller.acquire()
+        if self.admitted:
+            return True
+
+        if error_body is None:
+            error_body = {"error": "Server is busy"}
+        self.set_status(HTTPStatus.SERVICE_UNAVAILABLE)
+        self.set_header("Retry-After", str(admission_controller.retry_after_seconds))
+        self.write(error_body)
+        self.logger.warning(metadata, "Server is busy, rejected %s %s", self.request.method, self.request.uri)
+        self.do_finish()
+        return False
+
+    def release_request(self):
+        """
+        Give back the admission obtained by admit_request(), if any.
+        Safe to call more than once.
+        """
+        if self.admitted:
+            self.admitted = False
+            self.application.get_admission_controller().release()
+
+    def on_finish(self):
+        """
+        Called by Tornado once the response is finished, including error responses
+        generated by the framework itself. Backstop to never leak an admission.
+        """
+        self.release_request()
+
     def process_exception(self, exc: Exception):
         """
         Process exception raised during request handling
@@ -206,25 +251,44 @@ class BaseRequestHandler(RequestHandler):
         with check for closed client connection.
         """
         try:
+            # Note: Tornado's flush() future resolves once the data has been handed
+            # over to the transport, so awaiting it is our backpressure.
+            # Clients of the streaming API are expected to accept multiple
+            # line-delimited data items in one read, so no extra delay is added here.
+            # See StreamingResponseWriter for coalescing of streamed messages.
             await self.flush()
-            # What happens here: we have finished writing out one data item in our output stream,
-            # and we have flushed Tornado output.
-            # BUT: this does not guarantee in general that underlying TCP/IP transport
-            # will flush its own buffers, so low-level buffering is still possible.
-            # Result would be that several chat responses will be bunched together
-            # and received by a client as one data piece.
-            # If client is not ready for this, there will be problems.
-            # SO: this real wall clock delay here helps to encourage underlying transport
-            # to flush its own buffers - and we are good.
-            # Duration of delay is speculative and maybe could be adjusted.
-            # But best solution and reliable one: make client accept multiple data items
-            # in one "get" request - as it should when dealing with streaming service.
-            await asyncio.sleep(0.3)
             return True
         except tornado.iostream.StreamClosedError:
             self.logger.warning(self.get_metadata(), "Flush: client closed connection unexpectedly.")
             return False
 
+    def create_response_writer(self, writer_class: Type[StreamingResponseWriter] = StreamingResponseWriter) \
+            -> StreamingResponseWriter:
+        """
+        :param writer_class: The class of StreamingResponseWriter to create
+        :return: A StreamingResponseWriter for this request, with coalescing
+                 parameters optionally overridden by environment variables.
+        """
+        max_delay_seconds: float = float(os.environ.get("AGENT_STREAMING_FLUSH_DELAY_SECONDS",
+                                                        StreamingResponseWriter.DEFAULT_MAX_DELAY_SECONDS))
+        max_buffer_bytes: int = int(os.environ.get("AGENT_STREAMING_FLUSH_BUFFER_BYTES",
+                                                   StreamingResponseWriter.DEFAULT_MAX_BUFFER_BYTES))
+        return writer_class(self, max_delay_seconds, max_buffer_bytes)
+
+    def write_cached_response(self, cached: CachedResponse):
+        """
+        Write a response kept by the AgentResponseCache along with its ETag.
+        Clients sending a matching If-None-Match header get an empty 304 response instead.
+        :param cached: The CachedResponse to write
+        """
+        # Tornado only computes its own ETag from the body when none is set.
+        self.set_header("Etag", cached.get_etag())
+        if self.check_etag_header():
+            self.set_status(HTTPStatus.NOT_MODIFIED)
+            return
+        self.set_header("Content-Type", "application/json")
+        self.write(cached.get_body())
+
     async def options(self, *_args, **_kwargs):
         """
         Handles OPTIONS requests for CORS support
@@ -22,6 +22,7 @@ from typing import Dict
 
 from neuro_san.service.generic.async_agent_service import AsyncAgentService
 from neuro_san.service.http.handlers.base_request_handler import BaseRequestHandler
+from neuro_san.service.utils.cached_response import CachedResponse
 
 
 class ConnectivityHandler(BaseRequestHandler):
@@ -41,11 +42,10 @@ class ConnectivityHandler(BaseRequestHandler):
         self.application.start_client_request(metadata, f"{agent_name}/connectivity")
         try:
             data: Dict[str, Any] = {}
-            result_dict: Dict[str, Any] = await service.connectivity(data, metadata)
+            cached: CachedResponse = await service.get_connectivity_response(data, metadata)
 
-            # Return response to the HTTP client
-            self.set_header("Content-Type", "application/json")
-            self.write(result_dict)
+            # Return response to the HTTP client, unless it already has it
+            self.write_cached_response(cached)
 
         except Exception as exc:  # pylint: disable=broad-exception-caught
             self.process_exception(exc)
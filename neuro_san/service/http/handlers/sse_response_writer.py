@@ -0,0 +1,42 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+
+import json
+
+from neuro_san.service.http.handlers.streaming_response_writer import StreamingResponseWriter
+
+
+class SseResponseWriter(StreamingResponseWriter):
+    """
+    Coalescing writer for Server-Sent Events (text/event-stream) responses,
+    as used by the Streamable HTTP transport of MCP.
+    Each dictionary goes out as the data of a single "message" event.
+    See StreamingResponseWriter for how messages are batched and flushed.
+    """
+
+    def format_message(self, result_dict: Dict[str, Any]) -> str:
+        """
+        :param result_dict: The dictionary to send to the client
+        :return: The text of the dictionary as a single server-sent event
+        """
+        # json.dumps() escapes newlines, so the data always fits on a single line.
+        return f"event: message\ndata: {json.dumps(result_dict)}\n\n"
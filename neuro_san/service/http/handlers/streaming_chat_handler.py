@@ -29,6 +29,7 @@ import tornado
 
 from neuro_san.service.generic.async_agent_service import AsyncAgentService
 from neuro_san.service.http.handlers.base_request_handler import BaseRequestHandler
+from neuro_san.service.http.handlers.streaming_response_writer import StreamingResponseWriter
 
 
 class StreamingChatHandler(BaseRequestHandler):
@@ -45,6 +46,8 @@ class StreamingChatHandler(BaseRequestHandler):
         service: AsyncAgentService = await self.get_service(agent_name, metadata)
         if service is None:
             return
+        if not await self.admit_request(metadata):
+            return
 
         self.application.start_client_request(metadata, f"{agent_name}/streaming_chat")
         # Set up request timeout if it is specified:
@@ -53,6 +56,7 @@ class StreamingChatHandler(BaseRequestHandler):
             # For asyncio.timeout(), None means no timeout:
             request_timeout = None
         result_generator = None
+        writer: StreamingResponseWriter = self.create_response_writer()
         try:
             # Parse JSON body
             data = json.loads(self.request.body)
@@ -71,13 +75,10 @@ class StreamingChatHandler(BaseRequestHandler):
             async with asyncio.timeout(request_timeout):
                 result_generator = service.streaming_chat(data, metadata)
                 async for result_dict in result_generator:
-                    result_str: str = json.dumps(result_dict) + "\n"
-                    self.write(result_str)
-                    flush_ok = await self.do_flush()
-                    if not flush_ok:
-                        # Raise exception to be handled as a general
-                        # "stream abruptly closed" case:
-                        raise tornado.iostream.StreamClosedError()
+                    # Writer raises StreamClosedError if client has gone away,
+                    # which is handled as a general "stream abruptly closed" case.
+                    await writer.write(result_dict)
+                await writer.flush()
 
         except (asyncio.CancelledError, tornado.iostream.StreamClosedError):
             self.logger.info(metadata, "Request handler cancelled/stream closed.")
@@ -103,5 +104,9 @@ class StreamingChatHandler(BaseRequestHandler):
                     # It is possible we will call .aclose() twice
                     # on our result_generator - it is allowed and has no effect.
                     await result_generator.aclose()
+            with contextlib.suppress(Exception):
+                # Send out whatever is still buffered, if we still can.
+                await writer.close()
             self.do_finish()
+            self.release_request()
             self.application.finish_client_request(metadata, f"{agent_name}/streaming_chat", get_stats=True)
@@ -0,0 +1,166 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+
+import asyncio
+import json
+
+from tornado.iostream import StreamClosedError
+from tornado.web import RequestHandler
+
+
+class StreamingResponseWriter:
+    """
+    Coalescing writer for line-delimited JSON streaming responses.
+
+    Messages that arrive within a small time window are batched together
+    and sent to the client with a single Tornado flush().
+    A flush happens when either:
+        * the oldest buffered message has waited for max_delay_seconds, or
+        * the buffered data has reached max_buffer_bytes.
+    Producers that outpace the client are slowed down by awaiting
+    the future returned by Tornado's flush(), which resolves only when
+    the data has been handed over to the transport.
+    This replaces a fixed wall-clock delay after every single message.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    DEFAULT_MAX_DELAY_SECONDS: float = 0.02
+    DEFAULT_MAX_BUFFER_BYTES: int = 64 * 1024
+
+    def __init__(self, handler: RequestHandler,
+                 max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+                 max_buffer_bytes: int = DEFAULT_MAX_BUFFER_BYTES):
+        """
+        Constructor
+        :param handler: Tornado RequestHandler to write the response to
+        :param max_delay_seconds: maximum time a message may sit in the buffer
+                    before it is flushed. A value <= 0 means flush every message immediately.
+        :param max_buffer_bytes: buffered size at which a flush is forced
+                    regardless of the time window.
+        """
+        self.handler: RequestHandler = handler
+        self.max_delay_seconds: float = max_delay_seconds
+        self.max_buffer_bytes: int = max_buffer_bytes
+
+        self.buffer: List[str] = []
+        self.buffered_bytes: int = 0
+        self.flush_lock: asyncio.Lock = asyncio.Lock()
+        self.timer_task: asyncio.Task = None
+        self.error: Exception = None
+
+        # Statistics
+        self.num_messages: int = 0
+        self.num_flushes: int = 0
+
+    async def write(self, result_dict: Dict[str, Any]):
+        """
+        Buffer a single response dictionary as one line of output.
+        May wait for the transport if buffer limits are reached.
+        :param result_dict: The dictionary to send to the client
+        """
+        if self.error is not None:
+            raise StreamClosedError() from self.error
+
+        line: str = self.format_message(result_dict)
+        self.buffer.append(line)
+        self.buffered_bytes += len(line)
+        self.num_messages += 1
+
+        if self.max_delay_seconds <= 0.0 or self.buffered_bytes >= self.max_buffer_bytes:
+            # Flush now, and have the producer wait on the transport.
+            await self.flush()
+        elif self.timer_task is None:
+            # First message in a new window. Make sure it goes out in a timely fashion
+            # even if nothing else shows up.
+            self.timer_task = asyncio.create_task(self._flush_after_delay())
+
+    def format_message(self, result_dict: Dict[str, Any]) -> str:
+        """
+        :param result_dict: The dictionary to send to the client
+        :return: The text of the dictionary as it goes out on the wire,
+                 which here is a single line of JSON.
+        """
+        return json.dumps(result_dict) + "\n"
+
+    async def flush(self):
+        """
+        Send everything that is buffered and wait for Tornado to accept it.
+        Raises StreamClosedError if the client has gone away.
+        """
+        self._cancel_timer()
+        async with self.flush_lock:
+            if self.error is not None:
+                raise StreamClosedError() from self.error
+            if len(self.buffer) == 0:
+                return
+
+            chunk: str = "".join(self.buffer)
+            self.buffer = []
+            self.buffered_bytes = 0
+            try:
+                self.handler.write(chunk)
+                await self.handler.flush()
+                self.num_flushes += 1
+            except StreamClosedError as exc:
+                self.error = exc
+                raise
+
+    async def close(self):
+        """
+        Flush any remaining buffered output and stop the flush timer.
+        """
+        try:
+            await self.flush()
+        finally:
+            self._cancel_timer()
+
+    def discard(self):
+        """
+        Drop any buffered output and stop the flush timer,
+        for when there is nobody left to read the response.
+        """
+        self._cancel_timer()
+        self.buffer = []
+        self.buffered_bytes = 0
+
+    async def _flush_after_delay(self):
+        """
+        Timer task which flushes the current window once it has expired.
+        """
+        await asyncio.sleep(self.max_delay_seconds)
+        # Clear ourselves out first so flush() does not cancel the running task.
+        self.timer_task = None
+        try:
+            await self.flush()
+        except StreamClosedError:
+            # Error is recorded and will be reported to the producer on its next write.
+            pass
+
+    def _cancel_timer(self):
+        """
+        Cancel any pending timer task, unless that is what is currently running.
+        """
+        timer_task: asyncio.Task = self.timer_task
+        self.timer_task = None
+        if timer_task is not None and timer_task is not asyncio.current_task():
+            timer_task.cancel()
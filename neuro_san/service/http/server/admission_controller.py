@@ -0,0 +1,144 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Deque
+from typing import Dict
+
+from collections import deque
+
+import asyncio
+
+
+class AdmissionController:
+    """
+    Bounds the number of agent requests an http server instance works on at the same time.
+
+    Up to max_in_flight requests are admitted right away.  Past that,
+    up to max_queued requests wait in FIFO order for a slot to free up,
+    but for no longer than queue_timeout_seconds.  Anything else is
+    rejected immediately so the handler can tell the client to come back
+    later instead of piling more work onto a saturated server.
+
+    All calls are expected to come from the single event loop of
+    the Tornado server instance, so no threaded locking is done here.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    DEFAULT_RETRY_AFTER_SECONDS: int = 1
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, max_in_flight: int = 0,
+                 max_queued: int = 0,
+                 queue_timeout_seconds: float = 0.0,
+                 retry_after_seconds: int = DEFAULT_RETRY_AFTER_SECONDS):
+        """
+        Constructor
+        :param max_in_flight: maximum number of requests admitted at the same time.
+                    A value <= 0 means no limit.
+        :param max_queued: maximum number of requests waiting for a slot.
+                    A value <= 0 means requests are rejected as soon as all slots are taken.
+        :param queue_timeout_seconds: maximum time a request waits for a slot before
+                    it is rejected. A value <= 0 disables waiting altogether.
+        :param retry_after_seconds: value to suggest to rejected clients for
+                    when to try again
+        """
+        self.max_in_flight: int = max_in_flight
+        self.max_queued: int = max_queued
+        self.queue_timeout_seconds: float = queue_timeout_seconds
+        self.retry_after_seconds: int = retry_after_seconds
+
+        self.in_flight: int = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+
+        # Statistics
+        self.num_admitted: int = 0
+        self.num_rejected: int = 0
+        self.num_timed_out: int = 0
+
+    async def acquire(self) -> bool:
+        """
+        Ask for admission of a single request, waiting in the queue if allowed.
+        Every successful acquire() must be paired with a release().
+        :return: True if the request was admitted, False if it was rejected.
+        """
+        if self.max_in_flight <= 0 or \
+                (self.in_flight < self.max_in_flight and len(self.waiters) == 0):
+            self.in_flight += 1
+            self.num_admitted += 1
+            return True
+
+        if self.queue_timeout_seconds <= 0.0 or len(self.waiters) >= self.max_queued:
+            self.num_rejected += 1
+            return False
+
+        # Wait for release() to hand over its slot to us.
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.waiters.append(future)
+        try:
+            async with asyncio.timeout(self.queue_timeout_seconds):
+                await future
+        except TimeoutError:
+            if not future.done() or future.cancelled():
+                self.remove_waiter(future)
+                self.num_timed_out += 1
+                return False
+            # Otherwise we were handed a slot right as the deadline passed. Take it.
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # We were handed a slot just as we were cancelled. Pass it on.
+                self.release()
+            else:
+                self.remove_waiter(future)
+            raise
+
+        self.num_admitted += 1
+        return True
+
+    def release(self):
+        """
+        Give back the slot of an admitted request, handing it
+        directly to the longest-waiting queued request if there is one.
+        """
+        while len(self.waiters) > 0:
+            future: asyncio.Future = self.waiters.popleft()
+            if not future.done():
+                # Slot transfers as-is, so in_flight stays the same.
+                future.set_result(True)
+                return
+        self.in_flight = max(0, self.in_flight - 1)
+
+    def remove_waiter(self, future: asyncio.Future):
+        """
+        :param future: The future of a request that has stopped waiting
+        """
+        if future in self.waiters:
+            self.waiters.remove(future)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary of admission statistics suitable for server stats reporting
+        """
+        return {
+            "InFlight": self.in_flight,
+            "Queued": len(self.waiters),
+            "Admitted": self.num_admitted,
+            "Rejected": self.num_rejected,
+            "QueueTimeouts": self.num_timed_out
+        }
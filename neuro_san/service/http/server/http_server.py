@@ -34,6 +34,7 @@ from neuro_san.internals.interfaces.agent_storage_source import AgentStorageSour
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
 from neuro_san.service.generic.agent_server_logging import AgentServerLogging
 from neuro_san.service.generic.async_agent_service_provider import AsyncAgentServiceProvider
+from neuro_san.service.generic.service_external_agent_session_factory import ServiceExternalAgentSessionFactory
 from neuro_san.service.http.config.http_server_config import HttpServerConfig
 from neuro_san.service.http.handlers.concierge_handler import ConciergeHandler
 from neuro_san.service.http.handlers.connectivity_handler import ConnectivityHandler
@@ -42,6 +43,7 @@ from neuro_san.service.http.handlers.health_check_handler import HealthCheckHand
 from neuro_san.service.http.handlers.openapi_publish_handler import OpenApiPublishHandler
 from neuro_san.service.http.handlers.streaming_chat_handler import StreamingChatHandler
 from neuro_san.service.http.logging.http_logger import HttpLogger
+from neuro_san.service.http.server.admission_controller import AdmissionController
 from neuro_san.service.http.server.agent_authorization_policy import AgentAuthorizationPolicy
 from neuro_san.service.http.server.http_server_app import HttpServerApp
 from neuro_san.service.http.server.resources_usage_logger import ResourcesUsageLogger
@@ -56,7 +58,6 @@ from neuro_san.service.utils.server_status import ServerStatus
 
 DEFAULT_SERVER_NAME: str = 'neuro-san.Agent'
 DEFAULT_SERVER_NAME_FOR_LOGS: str = 'Agent Server'
-DEFAULT_MAX_CONCURRENT_REQUESTS: int = 10
 
 # Better that we kill ourselves than kubernetes doing it for us
 # in the middle of a request if there are resource leaks.
@@ -112,11 +113,25 @@ class HttpServer(AgentStateListener):
         self.authorization_policy: AgentAuthorizer = AgentAuthorizationPolicy(self.allowed_agents)
         self.lock = threading.Lock()
 
+        network_storage_dict: Dict[str, AgentNetworkStorage] = self.server_context.get_network_storage_dict()
+        if self.server_config.external_agents_in_process:
+            # Calls to external agents hosted right here skip the round trip over http.
+            external_agent_session_factory = ServiceExternalAgentSessionFactory(network_storage_dict,
+                                                                                self.authorization_policy,
+                                                                                self.forwarded_request_metadata)
+            self.server_context.set_external_agent_session_factory(external_agent_session_factory)
+
         # Add listener to handle adding per-agent http service
         # (services map is defined by self.allowed_agents dictionary)
-        network_storage_dict: Dict[str, AgentNetworkStorage] = self.server_context.get_network_storage_dict()
         for network_storage in network_storage_dict.values():
             network_storage.add_listener(self)
+            # Forget cached responses of agent networks that change
+            network_storage.add_listener(self.server_context.get_agent_response_cache())
+
+        # MCP tools are only ever listed from the public agent networks
+        public_storage: AgentNetworkStorage = network_storage_dict.get("public")
+        if public_storage is not None:
+            public_storage.add_listener(self.server_context.get_mcp_server_context().get_tool_descriptor_cache())
 
     def start(self, startables: List[Startable]):
         """
@@ -158,6 +173,10 @@ class HttpServer(AgentStateListener):
         self.logger.info({}, "HTTP server idle connections timeout: %d seconds",
                          self.server_config.http_idle_connection_timeout_seconds)
         self.logger.info({}, "HTTP server is shutting down after %d requests", self.requests_limit)
+        self.logger.info({}, "HTTP server admits %d concurrent requests, queueing up to %d for %.1f seconds",
+                         self.server_config.max_concurrent_requests,
+                         self.server_config.max_queued_requests,
+                         self.server_config.queued_request_timeout_seconds)
 
         # If HTTP server is ready, our MCP server is also ready, if requested to run.
         if server_status.mcp_service.is_requested():
@@ -216,9 +235,17 @@ class HttpServer(AgentStateListener):
         # Register MCP "root" handler for all MCP requests
         # if MCP server is enabled:
         if self.server_context.get_mcp_server_context().is_enabled():
+            # Build the tool call validator once for all requests
+            self.server_context.get_mcp_server_context().set_service_schema(
+                request_initialize_data.get("openapi_service_spec"))
             handlers.append((r"/mcp", McpRootHandler, request_initialize_data))
 
-        return HttpServerApp(handlers, requests_limit, logger, self.forwarded_request_metadata)
+        # Each server instance (process) gets its own limits.
+        admission_controller = AdmissionController(self.server_config.max_concurrent_requests,
+                                                   self.server_config.max_queued_requests,
+                                                   self.server_config.queued_request_timeout_seconds)
+        return HttpServerApp(handlers, requests_limit, logger, self.forwarded_request_metadata,
+                             admission_controller=admission_controller)
 
     def agent_added(self, agent_name: str, source: AgentStorageSource):
         """
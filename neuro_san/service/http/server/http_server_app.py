@@ -30,8 +30,11 @@ from tornado.web import Application
 from tornado.web import ErrorHandler
 from tornado.ioloop import IOLoop
 
+from neuro_san.internals.graph.activations.coded_tool_thread_pool import CodedToolThreadPool
 from neuro_san.service.http.handlers.base_request_handler import BaseRequestHandler
+from neuro_san.service.http.server.admission_controller import AdmissionController
 from neuro_san.service.interfaces.event_loop_logger import EventLoopLogger
+from neuro_san.session.aiohttp_session_pool import AiohttpSessionPool
 
 
 class HttpServerApp(Application):
@@ -42,16 +45,21 @@ class HttpServerApp(Application):
     # pylint: disable=too-many-instance-attributes
     SHUTDOWN_TIMEOUT_SECONDS: int = 30
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(self, handlers,
                  requests_limit: int,
                  logger: EventLoopLogger,
-                 forwarded_request_metadata: List[str]):
+                 forwarded_request_metadata: List[str],
+                 admission_controller: AdmissionController = None):
         """
         Constructor:
         :param handlers: list of request handlers
         :param requests_limit: limit for number of requests we can execute
         :param logger: logger to use
         :param forwarded_request_metadata: list of client metadata keys
+        :param admission_controller: AdmissionController bounding the number of
+                agent requests worked on at the same time.
+                Default of None means no limit.
         """
         # Call the base constructor
         super().__init__(handlers=handlers)
@@ -65,6 +73,9 @@ class HttpServerApp(Application):
         self.shutdown_initiated: bool = False
         self.lock: Lock = Lock()
         self.shutdown_thread = None
+        self.admission_controller: AdmissionController = admission_controller
+        if self.admission_controller is None:
+            self.admission_controller = AdmissionController()
 
     def is_serving(self) -> bool:
         """
@@ -120,6 +131,8 @@ class HttpServerApp(Application):
             time.sleep(wait_period_seconds)
             time_waited_seconds += wait_period_seconds
         self.logger.info({}, "SERVER EXITING")
+        # Close shared outgoing connections while their event loops are still running.
+        AiohttpSessionPool.shutdown()
         self.stop_server(loop)
 
     def stop_server(self, loop):
@@ -140,6 +153,12 @@ class HttpServerApp(Application):
         self.shutdown_thread = Thread(target=self.do_shutdown, args=(IOLoop.current(),), daemon=True)
         self.shutdown_thread.start()
 
+    def get_admission_controller(self) -> AdmissionController:
+        """
+        :return: The AdmissionController shared by all agent request handlers
+        """
+        return self.admission_controller
+
     def get_stats(self) -> str:
         """
         Construct a string with current server requests statistics.
@@ -148,6 +167,8 @@ class HttpServerApp(Application):
             "NumProcessing": self.num_processing,
             "Total": self.total
         }
+        stats_dict.update(self.admission_controller.get_stats())
+        stats_dict["CodedToolPool"] = CodedToolThreadPool.get_stats()
         stats_dict.update(self.requests_stats)
         return str(stats_dict)
 
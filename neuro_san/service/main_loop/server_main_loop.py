@@ -28,17 +28,20 @@ from neuro_san import DEPLOY_DIR
 from neuro_san import TOP_LEVEL_DIR
 from neuro_san.interfaces.agent_session import AgentSession
 from neuro_san.service.interfaces.startable import Startable
+from neuro_san.internals.graph.persistence.agent_network_file_cache import AgentNetworkFileCache
 from neuro_san.internals.graph.persistence.registry_manifest_restorer import RegistryManifestRestorer
 from neuro_san.internals.graph.registry.agent_network import AgentNetwork
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
 from neuro_san.service.http.server.http_server import DEFAULT_SERVER_NAME
 from neuro_san.service.http.server.http_server import DEFAULT_SERVER_NAME_FOR_LOGS
-from neuro_san.service.http.server.http_server import DEFAULT_MAX_CONCURRENT_REQUESTS
 from neuro_san.service.http.server.http_server import DEFAULT_REQUEST_LIMIT
 from neuro_san.service.http.config.http_server_config import DEFAULT_HTTP_CONNECTIONS_BACKLOG
 from neuro_san.service.http.config.http_server_config import DEFAULT_HTTP_IDLE_CONNECTIONS_TIMEOUT_SECONDS
 from neuro_san.service.http.config.http_server_config import DEFAULT_HTTP_SERVER_INSTANCES
 from neuro_san.service.http.config.http_server_config import DEFAULT_HTTP_SERVER_MONITOR_INTERVAL_SECONDS
+from neuro_san.service.http.config.http_server_config import DEFAULT_MAX_CONCURRENT_REQUESTS
+from neuro_san.service.http.config.http_server_config import DEFAULT_MAX_QUEUED_REQUESTS
+from neuro_san.service.http.config.http_server_config import DEFAULT_QUEUED_REQUEST_TIMEOUT_SECONDS
 from neuro_san.service.http.config.http_server_config import HttpServerConfig
 from neuro_san.service.interfaces.agent_server import AgentServer
 from neuro_san.service.http.server.http_server import HttpServer
@@ -95,7 +98,21 @@ class ServerMainLoop:
         arg_parser.add_argument("--max_concurrent_requests", type=int,
                                 default=int(os.environ.get("AGENT_MAX_CONCURRENT_REQUESTS",
                                                            self.max_concurrent_requests)),
-                                help="Maximum number of requests that can be served at the same time")
+                                help="Maximum number of agent requests (streaming_chat and MCP tools/call)"
+                                     " that can be served at the same time by each http server instance."
+                                     " 0 means no limit, which is the default. Calls to external agents"
+                                     " of this same server made over http take slots of their own.")
+        arg_parser.add_argument("--max_queued_requests", type=int,
+                                default=int(os.environ.get("AGENT_MAX_QUEUED_REQUESTS",
+                                                           DEFAULT_MAX_QUEUED_REQUESTS)),
+                                help="Maximum number of requests waiting for one of the"
+                                     " --max_concurrent_requests slots. Requests past that are"
+                                     " rejected with 503 and a Retry-After header.")
+        arg_parser.add_argument("--queued_request_timeout_seconds", type=float,
+                                default=float(os.environ.get("AGENT_QUEUED_REQUEST_TIMEOUT_SECONDS",
+                                                             DEFAULT_QUEUED_REQUEST_TIMEOUT_SECONDS)),
+                                help="Maximum time in seconds a request waits for a slot before it is"
+                                     " rejected with 503. Value <= 0 disables waiting.")
         arg_parser.add_argument("--request_limit", type=int,
                                 default=int(os.environ.get("AGENT_REQUEST_LIMIT", self.request_limit)),
                                 help="Number of requests served before the server shuts down in an orderly fashion")
@@ -139,6 +156,10 @@ class ServerMainLoop:
                                                            DEFAULT_HTTP_SERVER_MONITOR_INTERVAL_SECONDS)),
                                 help="Http server resources monitoring/logging interval in seconds "
                                      "0 means no logging")
+        arg_parser.add_argument("--external_agents_in_process", type=str,
+                                default=os.environ.get("AGENT_EXTERNAL_AGENTS_IN_PROCESS", "true"),
+                                help="'true' if external agents hosted by this server should be called"
+                                     " in-process instead of over http")
         arg_parser.add_argument("--mcp_enable", type=str,
                                 default=os.environ.get("AGENT_MCP_ENABLE", "true"),
                                 help="'true' if MCP protocol service should be enabled")
@@ -147,9 +168,10 @@ class ServerMainLoop:
                                 help="'true' if only MCP protocol service will be run (no HTTP service)")
         return arg_parser
 
-    def parse_args(self):
+    def parse_args(self, args: List[str] = None):
         """
         Parse command-line arguments into member variables
+        :param args: An optional list of arguments to parse instead of those on the command line
         """
         arg_parser: ArgumentParser = self.prepare_args()
 
@@ -157,7 +179,7 @@ class ServerMainLoop:
 
         # Incorrectly flagged as Path Traversal 3, 7
         # See destination below ~ line 139, 154 for explanation.
-        args = arg_parser.parse_args()
+        args = arg_parser.parse_args(args)
 
         self.server_name = args.server_name
         server_status = ServerStatus(self.server_name)
@@ -200,13 +222,20 @@ class ServerMainLoop:
         self.http_server_config.http_server_instances = args.http_server_instances
         self.http_server_config.http_server_monitor_interval_seconds = args.http_resources_monitor_interval_seconds
         self.http_server_config.http_port = args.http_port
-
-        manifest_restorer = RegistryManifestRestorer()
+        self.http_server_config.max_concurrent_requests = args.max_concurrent_requests
+        self.http_server_config.max_queued_requests = args.max_queued_requests
+        self.http_server_config.queued_request_timeout_seconds = args.queued_request_timeout_seconds
+        self.http_server_config.external_agents_in_process = args.external_agents_in_process.lower() == "true"
+
+        # Shared with the RegistryStorageUpdater so manifest updates only parse what changed
+        network_cache = AgentNetworkFileCache()
+        manifest_restorer = RegistryManifestRestorer(network_cache=network_cache)
         manifest_agent_networks: Dict[str, Dict[str, AgentNetwork]] = manifest_restorer.restore()
         manifest_files: List[str] = manifest_restorer.get_manifest_files()
 
         self.watcher_config = {
             "manifest_path": manifest_files,
+            "network_cache": network_cache,
             "manifest_update_period_seconds": args.manifest_update_period_seconds,
             "temporary_network_update_period_seconds": args.temporary_network_update_period_seconds
         }
@@ -220,11 +249,12 @@ class ServerMainLoop:
         """
         return TOP_LEVEL_DIR.get_file_in_basis("api/grpc/agent_service.json")
 
-    def main_loop(self):
+    def main_loop(self, args: List[str] = None):
         """
         Command line entry point
+        :param args: An optional list of arguments to use instead of those on the command line
         """
-        self.parse_args()
+        self.parse_args(args)
 
         # Make for easy running from the neuro-san repo
         if os.environ.get("AGENT_SERVICE_LOG_JSON") is None:
@@ -25,9 +25,14 @@ from typing import Tuple
 
 from http import HTTPStatus
 
+import asyncio
+import tornado
+
 from neuro_san.internals.interfaces.dictionary_validator import DictionaryValidator
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
 from neuro_san.service.http.handlers.base_request_handler import BaseRequestHandler
+from neuro_san.service.http.handlers.sse_response_writer import SseResponseWriter
+from neuro_san.service.http.handlers.streaming_response_writer import StreamingResponseWriter
 from neuro_san.service.utils.mcp_server_context import McpServerContext
 from neuro_san.service.mcp.interfaces.client_session_policy import ClientSessionPolicy
 from neuro_san.service.mcp.interfaces.client_session_policy import MCP_SESSION_ID, MCP_PROTOCOL_VERSION
@@ -58,6 +63,9 @@ class McpRootHandler(BaseRequestHandler):
         # Initialize members of the base class BaseRequestHandler:
         super().initialize(**kwargs)
 
+        # The task running a tool call, while there is one
+        self.tool_call_task: asyncio.Task = None
+
         # type: McpServerContext
         self.mcp_context: McpServerContext = self.server_context.get_mcp_server_context()
         # A dictionary of string (describing scope) to
@@ -65,8 +73,12 @@ class McpRootHandler(BaseRequestHandler):
         #     of a particular grouping.
         self.network_storage_dict: Dict[str, AgentNetworkStorage] = self.server_context.get_network_storage_dict()
 
-        # For tool requests, we need to validate tool call arguments:
-        self.tool_request_validator: ToolRequestValidator = ToolRequestValidator(self.openapi_service_spec)
+        # For tool requests, we need to validate tool call arguments.
+        # The validator is normally built once when the server starts.
+        self.tool_request_validator: ToolRequestValidator = self.mcp_context.get_tool_request_validator()
+        if self.tool_request_validator is None:
+            self.mcp_context.set_service_schema(self.openapi_service_spec)
+            self.tool_request_validator = self.mcp_context.get_tool_request_validator()
 
         self.set_header("Access-Control-Allow-Origin", "*")
         self.set_header("Access-Control-Allow-Methods", "GET, POST, DELETE, OPTIONS")
@@ -84,6 +96,7 @@ class McpRootHandler(BaseRequestHandler):
         # pylint: disable=too-many-locals
         # pylint: disable=too-many-branches
         # pylint: disable=too-many-statements
+        # pylint: disable=too-many-return-statements
 
         metadata: Dict[str, Any] = self.get_metadata()
         request_id = "unknown"
@@ -158,52 +171,21 @@ class McpRootHandler(BaseRequestHandler):
             self.do_finish()
             return
 
+        # Tool calls run agents, so they are subject to admission control.
+        if method == "tools/call":
+            busy_error: Dict[str, Any] =\
+                McpErrorsUtil.get_protocol_error(request_id, McpError.ServerError, "server is busy")
+            if not await self.admit_request(metadata, busy_error):
+                return
+
         try:
             if method == "tools/list":
-                tools_processor: McpToolsProcessor =\
-                    McpToolsProcessor(
-                        self.logger,
-                        self.network_storage_dict,
-                        self.agent_policy,
-                        self.tool_request_validator)
+                tools_processor: McpToolsProcessor = self.create_tools_processor()
                 result_dict: Dict[str, Any] = await tools_processor.list_tools(request_id, metadata)
                 self.set_status(HTTPStatus.OK)
                 self.write(result_dict)
             elif method == "tools/call":
-                tools_processor: McpToolsProcessor =\
-                    McpToolsProcessor(
-                        self.logger,
-                        self.network_storage_dict,
-                        self.agent_policy,
-                        self.tool_request_validator)
-                call_params: Dict[str, Any] = data.get("params", {})
-                tool_name: str = call_params.get("name")
-                call_args: Dict[str, Any] = call_params.get("arguments", {})
-                # Validate tool arguments:
-                validation_errors = self.tool_request_validator.validate(call_args)
-                if validation_errors:
-                    extra_error: str = "; ".join(validation_errors)
-                    error_msg: Dict[str, Any] = \
-                        McpErrorsUtil.get_protocol_error(request_id, McpError.InvalidRequest, extra_error)
-                    self.set_status(HTTPStatus.BAD_REQUEST)
-                    self.write(error_msg)
-                    self.logger.error(self.get_metadata(), f"Error: Invalid tool call request: {extra_error}")
-                    return
-
-                prompt: Dict[str, Any] = call_args.get("user_message", {})
-                chat_context: Dict[str, Any] = call_args.get("chat_context", None)
-                chat_filter: Dict[str, Any] = call_args.get("chat_filter", None)
-                sly_data: Dict[str, Any] = call_args.get("sly_data", None)
-                result_dict: Dict[str, Any] =\
-                    await tools_processor.call_tool(
-                        request_id, metadata,
-                        tool_name,
-                        prompt,
-                        chat_context,
-                        chat_filter,
-                        sly_data)
-                self.set_status(HTTPStatus.OK)
-                self.write(result_dict)
+                await self.handle_tool_call(request_id, data, metadata)
             elif method == "resources/list":
                 resources_processor: McpResourcesProcessor = McpResourcesProcessor(self.logger)
                 result_dict: Dict[str, Any] = await resources_processor.list_resources(request_id, metadata)
@@ -222,6 +204,8 @@ class McpRootHandler(BaseRequestHandler):
                 self.set_status(HTTPStatus.BAD_REQUEST)
                 self.write(error_msg)
                 self.logger.error(self.get_metadata(), f"error: Method {method} not found")
+        except tornado.iostream.StreamClosedError:
+            self.logger.info(self.get_metadata(), "Client closed connection during %s.", method)
         except Exception as exc:  # pylint: disable=broad-exception-caught
             error_msg: Dict[str, Any] =\
                 McpErrorsUtil.get_protocol_error(
@@ -234,6 +218,101 @@ class McpRootHandler(BaseRequestHandler):
         finally:
             # We are done with response stream:
             self.do_finish()
+            self.release_request()
+
+    def create_tools_processor(self) -> McpToolsProcessor:
+        """
+        :return: A McpToolsProcessor for a "tools" request
+        """
+        return McpToolsProcessor(
+            self.logger,
+            self.network_storage_dict,
+            self.agent_policy,
+            self.tool_request_validator,
+            self.mcp_context.get_tool_descriptor_cache(),
+            self.mcp_context.get_max_concurrent_authorizations())
+
+    async def handle_tool_call(self, request_id, request_data: Dict[str, Any], metadata: Dict[str, Any]):
+        """
+        Handle a "tools/call" request.
+        If the client accepts a text/event-stream, the response is streamed as Server-Sent Events,
+        with progress notifications for agent messages as they come when the client asked for them
+        with a progress token, followed by the tool call result.
+        Otherwise, the tool call result is sent as a single JSON-RPC payload.
+        Either way, the tool call is cancelled if the client disconnects.
+        :param request_id: MCP request id
+        :param request_data: MCP request data dictionary
+        :param metadata: http-level request metadata;
+        """
+        tools_processor: McpToolsProcessor = self.create_tools_processor()
+        call_params: Dict[str, Any] = request_data.get("params", {})
+        tool_name: str = call_params.get("name")
+        call_args: Dict[str, Any] = call_params.get("arguments", {})
+        # Validate tool arguments:
+        validation_errors = self.tool_request_validator.validate(call_args)
+        if validation_errors:
+            extra_error: str = "; ".join(validation_errors)
+            error_msg: Dict[str, Any] = \
+                McpErrorsUtil.get_protocol_error(request_id, McpError.InvalidRequest, extra_error)
+            self.set_status(HTTPStatus.BAD_REQUEST)
+            self.write(error_msg)
+            self.logger.error(self.get_metadata(), f"Error: Invalid tool call request: {extra_error}")
+            return
+
+        writer: StreamingResponseWriter = None
+        if "text/event-stream" in self.request.headers.get("Accept", ""):
+            writer = self.create_response_writer(SseResponseWriter)
+            self.set_status(HTTPStatus.OK)
+            self.set_header("Content-Type", "text/event-stream")
+            self.set_header("Cache-Control", "no-cache")
+            # Flush headers immediately
+            if not await self.do_flush():
+                raise tornado.iostream.StreamClosedError()
+
+        progress_token = call_params.get("_meta", {}).get("progressToken", None)
+        self.tool_call_task = asyncio.ensure_future(
+            tools_processor.call_tool(
+                request_id, metadata,
+                tool_name,
+                call_args.get("user_message", {}),
+                call_args.get("chat_context", None),
+                call_args.get("chat_filter", None),
+                call_args.get("sly_data", None),
+                writer,
+                progress_token))
+        tool_call_task: asyncio.Task = self.tool_call_task
+        try:
+            result_dict: Dict[str, Any] = await tool_call_task
+        except asyncio.CancelledError:
+            if not tool_call_task.cancelled() or asyncio.current_task().cancelling() > 0:
+                # It is this request which is being cancelled, not just its tool call.
+                raise
+            # The client has gone away, so there is nobody to write a result to.
+            self.logger.info(metadata, "Tool call %s cancelled.", tool_name)
+            if writer is not None:
+                writer.discard()
+            return
+        finally:
+            self.tool_call_task = None
+
+        if writer is None:
+            self.set_status(HTTPStatus.OK)
+            self.write(result_dict)
+            return
+
+        try:
+            await writer.write(result_dict)
+        finally:
+            await writer.close()
+
+    def on_connection_close(self):
+        """
+        Called by Tornado when the client closes its connection before the response is finished.
+        """
+        # Stop the agents working on a tool call nobody is waiting for anymore.
+        if self.tool_call_task is not None:
+            self.tool_call_task.cancel()
+        super().on_connection_close()
 
     async def handle_handshake(
             self,
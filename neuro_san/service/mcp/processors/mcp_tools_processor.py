@@ -20,22 +20,24 @@ See class comment for details
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Set
 from typing import Tuple
+from typing import Union
 
 import asyncio
 import contextlib
 import json
 import tornado
 
-from neuro_san.internals.graph.registry.agent_network import AgentNetwork
-from neuro_san.internals.interfaces.agent_network_provider import AgentNetworkProvider
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
 from neuro_san.service.generic.async_agent_service import AsyncAgentService
 from neuro_san.service.generic.async_agent_service_provider import AsyncAgentServiceProvider
 from neuro_san.service.interfaces.agent_authorizer import AgentAuthorizer
 from neuro_san.service.mcp.util.mcp_errors_util import McpErrorsUtil
 from neuro_san.service.mcp.util.mcp_request_util import McpRequestUtil
+from neuro_san.service.mcp.util.mcp_tool_descriptor_cache import McpToolDescriptorCache
 from neuro_san.service.mcp.validation.tool_request_validator import ToolRequestValidator
+from neuro_san.service.http.handlers.streaming_response_writer import StreamingResponseWriter
 from neuro_san.service.http.logging.http_logger import HttpLogger
 
 
@@ -46,15 +48,33 @@ class McpToolsProcessor:
     https://modelcontextprotocol.io/specification/2025-06-18/server/tools
     """
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
     def __init__(self,
                  logger: HttpLogger,
                  network_storage_dict: AgentNetworkStorage,
                  agent_policy: AgentAuthorizer,
-                 tool_request_validator: ToolRequestValidator):
+                 tool_request_validator: ToolRequestValidator,
+                 tool_descriptor_cache: McpToolDescriptorCache = None,
+                 max_concurrent_authorizations: int = 16):
+        """
+        Constructor
+        :param logger: The HttpLogger to log with
+        :param network_storage_dict: A dictionary of string (describing scope) to AgentNetworkStorage
+        :param agent_policy: The AgentAuthorizer to ask which agents are allowed
+        :param tool_request_validator: The validator of tool call requests
+        :param tool_descriptor_cache: The cache of MCP tool descriptors shared by all requests.
+                    If None, descriptors are built anew for each request.
+        :param max_concurrent_authorizations: How many authorization checks listing tools
+                    may have going at once
+        """
         self.logger: HttpLogger = logger
         self.network_storage_dict: AgentNetworkStorage = network_storage_dict
         self.agent_policy: AgentAuthorizer = agent_policy
         self.tool_request_validator: ToolRequestValidator = tool_request_validator
+        self.tool_descriptor_cache: McpToolDescriptorCache = tool_descriptor_cache
+        if self.tool_descriptor_cache is None:
+            self.tool_descriptor_cache = McpToolDescriptorCache()
+        self.max_concurrent_authorizations: int = max(1, max_concurrent_authorizations)
 
     async def list_tools(self, request_id, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -64,22 +84,18 @@ class McpToolsProcessor:
         :return: json dictionary with tools list in MCP format
         """
         # See which agents the user has access to per authorization policy
-        authorized_agents: List[str] = await self.agent_policy.list_agents(metadata)
+        authorized_agents: Set[str] = set(await self.agent_policy.list_agents(metadata))
 
         public_storage: AgentNetworkStorage = self.network_storage_dict.get("public")
-        tools_description: List[Dict[str, Any]] = []
-        for agent_name in public_storage.get_agent_names():
-
-            # Skip agents that are not authorized
-            if agent_name not in authorized_agents:
-                continue
-
-            provider: AgentNetworkProvider = public_storage.get_agent_network_provider(agent_name)
-            if provider is not None:
-                agent_network: AgentNetwork = provider.get_agent_network()
-                if agent_network.is_mcp_tool():
-                    tool_dict: Dict[str, Any] = await self._get_tool_description(agent_name, metadata)
-                    tools_description.append(tool_dict)
+        agent_names: List[str] = [agent_name for agent_name in public_storage.get_agent_names()
+                                  if agent_name in authorized_agents]
+
+        # Check each tool with the authorizer, a bounded number at a time, keeping the order of tools.
+        semaphore = asyncio.Semaphore(self.max_concurrent_authorizations)
+        tool_dicts: List[Dict[str, Any]] = await asyncio.gather(
+            *[self._get_tool_description(agent_name, public_storage, semaphore, metadata)
+              for agent_name in agent_names])
+        tools_description: List[Dict[str, Any]] = [tool_dict for tool_dict in tool_dicts if tool_dict is not None]
         return {
             "jsonrpc": "2.0",
             "id": McpRequestUtil.safe_request_id(request_id),
@@ -88,13 +104,15 @@ class McpToolsProcessor:
             }
         }
 
-    # pylint: disable=too-many-return-statements
+    # pylint: disable=too-many-return-statements,too-many-branches
     async def call_tool(self, request_id, metadata: Dict[str, Any],
                         tool_name: str,
                         prompt: Dict[str, Any],
                         chat_context: Dict[str, Any],
                         chat_filter: Dict[str, Any],
-                        sly_data: Dict[str, Any]) -> Dict[str, Any]:
+                        sly_data: Dict[str, Any],
+                        progress_writer: StreamingResponseWriter = None,
+                        progress_token: Union[int, str] = None) -> Dict[str, Any]:
         """
         Call MCP tool, which executes neuro-san agent chat request.
         :param request_id: MCP request id;
@@ -104,6 +122,10 @@ class McpToolsProcessor:
         :param chat_context: chat context JSON structure, could be None;
         :param chat_filter: chat filter type JSON structure, could be None;
         :param sly_data: arbitrary JSON dictionary containing sly_data, could be None;
+        :param progress_writer: writer of a streamed response to send progress notifications to
+                 while the tool is running, could be None;
+        :param progress_token: progress token given by the client, could be None.
+                 Progress notifications are only sent when there is both a writer and a token;
         :return: json dictionary with tool response in MCP format;
                  or json dictionary with error message in MCP format.
         """
@@ -132,21 +154,35 @@ class McpToolsProcessor:
             # For asyncio.timeout(), None means no timeout:
             tool_timeout_seconds = None
 
+        send_progress: bool = progress_writer is not None and progress_token is not None
+        num_notifications: int = 0
+
         input_request: Dict[str, Any] = self._get_chat_input_request(prompt, chat_context, chat_filter, sly_data)
-        response_text: str = ""
+        response_parts: List[str] = []
         response_structure: Dict[str, Any] = None
+        result_generator = None
         try:
             async with asyncio.timeout(tool_timeout_seconds):
                 result_generator = service.streaming_chat(input_request, metadata)
                 async for result_dict in result_generator:
                     partial_response, structure_data = await self._extract_tool_response_part(result_dict)
                     if partial_response is not None:
-                        response_text = response_text + partial_response
+                        response_parts.append(partial_response)
                     if structure_data is not None:
                         response_structure = structure_data
+                    if send_progress:
+                        # Let the client see intermediate agent messages and pieces
+                        # of the result as they come.
+                        num_notifications = await self._send_progress_notification(
+                            progress_writer, result_dict, progress_token, num_notifications)
 
-        except (asyncio.CancelledError, tornado.iostream.StreamClosedError):
-            self.logger.info(metadata, "Tool execution %s cancelled/stream closed.", tool_name)
+        except asyncio.CancelledError:
+            # Whoever cancelled us is not waiting for a result.
+            self.logger.info(metadata, "Tool execution %s cancelled.", tool_name)
+            raise
+
+        except tornado.iostream.StreamClosedError:
+            self.logger.info(metadata, "Tool execution %s stream closed.", tool_name)
             return McpErrorsUtil.get_tool_error(request_id, f"Stream closed for tool {tool_name}")
 
         except asyncio.TimeoutError:
@@ -170,7 +206,7 @@ class McpToolsProcessor:
 
         # Return tool call result:
         call_result: Dict[str, Any] =\
-            await self.build_tool_call_result(request_id, response_text, response_structure)
+            await self.build_tool_call_result(request_id, "".join(response_parts), response_structure)
         return call_result
 
     async def build_tool_call_result(
@@ -211,21 +247,32 @@ class McpToolsProcessor:
         call_result["result"]["content"][0]["text"] = McpRequestUtil.safe_message(result_text)
         return call_result
 
-    async def _get_tool_description(self, agent_name: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    async def _get_tool_description(self, agent_name: str, public_storage: AgentNetworkStorage,
+                                    semaphore: asyncio.Semaphore, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param agent_name: name of an agent network
+        :param public_storage: The AgentNetworkStorage of public agent networks
+        :param semaphore: The semaphore bounding concurrent authorization checks
+        :param metadata: http-level request metadata;
+        :return: The MCP tool description of the agent network,
+                 or None if it is not an MCP tool the request is authorized for.
+        """
+        descriptor: Dict[str, Any] = self.tool_descriptor_cache.get_descriptor(agent_name, public_storage)
+        if descriptor is None:
+            # Not an MCP tool, so no need to bother the authorizer
+            return None
 
         is_authorized: bool = False
         service_provider: AsyncAgentServiceProvider = None
-        is_authorized, service_provider = await self.agent_policy.allow_agent(agent_name, metadata)
+        async with semaphore:
+            is_authorized, service_provider = await self.agent_policy.allow_agent(agent_name, metadata)
 
         if service_provider is None or not is_authorized:
             return None
 
-        service: AsyncAgentService = service_provider.get_service()
-        function_dict: Dict[str, Any] = await service.function({}, metadata)
-        tool_description: str = function_dict.get("function", {}).get("description", "")
         return {
-            "name": agent_name,
-            "description": tool_description,
+            "name": descriptor.get("name"),
+            "description": descriptor.get("description"),
             "inputSchema": self.tool_request_validator.get_request_schema()
         }
 
@@ -247,6 +294,30 @@ class McpToolsProcessor:
             return text, structure_data
         return None, None
 
+    async def _send_progress_notification(self, progress_writer: StreamingResponseWriter,
+                                          response_dict: Dict[str, Any],
+                                          progress_token: Union[int, str],
+                                          num_notifications: int) -> int:
+        """
+        Send an MCP progress notification for the message of the given streaming chat response,
+        if that has any text to report.
+        The writer raises StreamClosedError if the client has gone away.
+        :param progress_writer: writer of the streamed response;
+        :param response_dict: streaming chat response dictionary;
+        :param progress_token: progress token given by the client;
+        :param num_notifications: the number of notifications sent so far;
+        :return: the number of notifications sent, including this one
+        """
+        response_part_dict: Dict[str, Any] = response_dict.get("response", {})
+        text: str = response_part_dict.get("text", None)
+        if not text:
+            return num_notifications
+        num_notifications += 1
+        notification: Dict[str, Any] = McpRequestUtil.get_progress_notification(
+            progress_token, num_notifications, text, response_part_dict.get("type", ""))
+        await progress_writer.write(notification)
+        return num_notifications
+
     def construct_mcp_structed_content(self, response_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
         Construct MCP structured content dictionary from the given streaming chat response dictionary.
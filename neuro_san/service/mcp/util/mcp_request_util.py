@@ -68,6 +68,34 @@ class McpRequestUtil:
             }
         }
 
+    @classmethod
+    def get_progress_notification(cls, progress_token: Union[int, str], progress: int,
+                                  message: str, message_type: str) -> Dict[str, Any]:
+        """
+        Generate an MCP progress notification for a request still being worked on.
+        See https://modelcontextprotocol.io/specification/2025-06-18/basic/utilities/progress
+        :param progress_token: The progress token the client gave in its request;
+        :param progress: The number of messages sent for the request so far;
+        :param message: The text of the latest message;
+        :param message_type: The neuro-san ChatMessageType of the latest message;
+        :return: json dictionary with the notification in MCP format suitable for sending to a client.
+        """
+        # Clients match the token exactly, so only string tokens are escaped.
+        if isinstance(progress_token, str):
+            progress_token = html.escape(progress_token)
+        return {
+            "jsonrpc": "2.0",
+            "method": "notifications/progress",
+            "params": {
+                "progressToken": progress_token,
+                "progress": progress,
+                "message": McpRequestUtil.safe_message(message),
+                "_meta": {
+                    "messageType": message_type
+                }
+            }
+        }
+
     @staticmethod
     def safe_request_id(request_id: Union[int, str]) -> str:
         """
@@ -0,0 +1,122 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+
+import threading
+
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.interfaces.agent_network_provider import AgentNetworkProvider
+from neuro_san.internals.interfaces.agent_state_listener import AgentStateListener
+from neuro_san.internals.interfaces.agent_storage_source import AgentStorageSource
+
+
+class McpToolDescriptorCache(AgentStateListener):
+    """
+    Keeps the MCP tool descriptor of each agent network, so that "tools/list" requests
+    do not have to put together the description of every agent network every time.
+
+    Descriptors are built when agent networks are added or modified, as told by
+    the AgentNetworkStorage this listens to, and forgotten when they are removed.
+    Anything not yet known is built on first use.
+
+    A descriptor has the "name" and "description" of the tool.
+    Agent networks which are not served as MCP tools have a descriptor of None.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.lock = threading.Lock()
+        self.descriptors: Dict[str, Dict[str, Any]] = {}
+        self.num_builds: int = 0
+
+    def get_descriptor(self, agent_name: str, source: AgentStorageSource) -> Dict[str, Any]:
+        """
+        :param agent_name: name of an agent network
+        :param source: The AgentStorageSource to find the agent network in when it is not yet known
+        :return: The MCP tool descriptor of the agent network,
+                 or None if the agent network is not served as an MCP tool or does not exist.
+        """
+        with self.lock:
+            if agent_name in self.descriptors:
+                return self.descriptors.get(agent_name)
+            return self.build_descriptor(agent_name, source)
+
+    def build_descriptor(self, agent_name: str, source: AgentStorageSource) -> Dict[str, Any]:
+        """
+        Build and remember the MCP tool descriptor of an agent network.
+        Callers are expected to hold the lock.
+        :param agent_name: name of an agent network
+        :param source: The AgentStorageSource to find the agent network in
+        :return: The MCP tool descriptor of the agent network, or None if there is none.
+        """
+        agent_network: AgentNetwork = None
+        provider: AgentNetworkProvider = source.get_agent_network_provider(agent_name)
+        if provider is not None:
+            agent_network = provider.get_agent_network()
+        if agent_network is None:
+            # Nothing to remember about networks that do not exist
+            return None
+
+        descriptor: Dict[str, Any] = None
+        if agent_network.is_mcp_tool():
+            # Same as what the "function" API call tells about the front man
+            description: str = ""
+            front_man: str = agent_network.find_front_man()
+            if front_man is not None:
+                spec: Dict[str, Any] = agent_network.get_agent_tool_spec(front_man)
+                description = spec.get("function", {}).get("description", "")
+            descriptor = {
+                "name": agent_name,
+                "description": description,
+            }
+
+        self.descriptors[agent_name] = descriptor
+        self.num_builds += 1
+        return descriptor
+
+    def agent_added(self, agent_name: str, source: AgentStorageSource):
+        """
+        Agent is being added to the service.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        with self.lock:
+            self.build_descriptor(agent_name, source)
+
+    def agent_modified(self, agent_name: str, source: AgentStorageSource):
+        """
+        Existing agent has been modified in service scope.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        with self.lock:
+            self.build_descriptor(agent_name, source)
+
+    def agent_removed(self, agent_name: str, source: AgentStorageSource):
+        """
+        Agent is being removed from the service.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        with self.lock:
+            self.descriptors.pop(agent_name, None)
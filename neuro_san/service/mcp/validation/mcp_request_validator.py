@@ -23,15 +23,36 @@ from typing import List
 
 import jsonschema
 
+from jsonschema.protocols import Validator
+
 from neuro_san.internals.interfaces.dictionary_validator import DictionaryValidator
 
 
 class McpRequestValidator(DictionaryValidator):
     """
     Class implementing MCP request validation against MCP protocol schema.
+
+    The schema is checked and compiled into a jsonschema Validator once at construction,
+    so instances are meant to be created once and shared by all requests.
     """
     def __init__(self, validation_schema: Dict[str, Any]):
+        """
+        Constructor
+        :param validation_schema: The MCP protocol json schema to validate against
+        """
         self.validation_schema = validation_schema
+        self.validator: Validator = McpRequestValidator.compile_schema(self.validation_schema)
+
+    @staticmethod
+    def compile_schema(schema: Dict[str, Any]) -> Validator:
+        """
+        :param schema: A json schema
+        :return: A jsonschema Validator for the schema's dialect, ready for repeated use.
+                References within the schema are resolved once and cached by the Validator.
+        """
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        return validator_class(schema)
 
     def validate(self, candidate: Dict[str, Any]) -> List[str]:
         """
@@ -40,7 +61,7 @@ class McpRequestValidator(DictionaryValidator):
         :return: A list of error messages, if any
         """
         try:
-            jsonschema.validate(instance=candidate, schema=self.validation_schema)
+            self.validator.validate(candidate)
         except jsonschema.exceptions.ValidationError:
             # We don't return detailed validation errors to the client,
             # since they tend to be very long and complex.
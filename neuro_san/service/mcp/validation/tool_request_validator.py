@@ -26,12 +26,18 @@ import copy
 import re
 import jsonschema
 
+from jsonschema.protocols import Validator
+
 from neuro_san.internals.interfaces.dictionary_validator import DictionaryValidator
+from neuro_san.service.mcp.validation.mcp_request_validator import McpRequestValidator
 
 
 class ToolRequestValidator(DictionaryValidator):
     """
     Class implementing MCP tool call request validation against tool call schema.
+
+    Extracting the tool call schema and compiling it is done once at construction,
+    so instances are meant to be created once and shared by all requests.
     """
     def __init__(self, service_schema: Dict[str, Any]):
         """
@@ -46,6 +52,7 @@ class ToolRequestValidator(DictionaryValidator):
             service_schema,
             self.tool_request_method,
             self.required_property)
+        self.validator: Validator = McpRequestValidator.compile_schema(self.request_schema)
 
     def validate(self, candidate: Dict[str, Any]) -> List[str]:
         """
@@ -54,7 +61,7 @@ class ToolRequestValidator(DictionaryValidator):
         :return: A list of error messages, if any
         """
         try:
-            jsonschema.validate(instance=candidate, schema=self.request_schema)
+            self.validator.validate(candidate)
         except jsonschema.exceptions.ValidationError:
             # We don't return detailed validation errors to a client,
             # since they tend to be very long and complex.
@@ -0,0 +1,165 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import threading
+
+from neuro_san.internals.interfaces.agent_state_listener import AgentStateListener
+from neuro_san.internals.interfaces.agent_storage_source import AgentStorageSource
+from neuro_san.service.utils.cached_response import CachedResponse
+
+
+class AgentResponseCache(AgentStateListener):
+    """
+    Keeps the responses of agent network API calls whose answers only change
+    when the agent network definition does, like "function" and "connectivity".
+
+    Responses are kept per (agent name, operation, network version, metadata values).
+    An agent network gets a new version, never handed out before, whenever the
+    AgentNetworkStorage this listens to tells about it being added or modified.
+    When it is removed, its version is forgotten along with its responses, so that
+    short-lived temporary networks leave nothing behind.  Either way, responses
+    computed against a network version that has since gone away are not kept.
+
+    Only the request metadata keys the responses are allowed to vary on
+    are part of the key, so that clients with different request ids share responses.
+    """
+
+    def __init__(self, vary_metadata: List[str] = None, max_entries: int = 10000):
+        """
+        Constructor
+
+        :param vary_metadata: The request metadata keys whose values responses may differ by.
+                    Default is None, meaning responses do not depend on request metadata.
+        :param max_entries: The maximum number of responses to keep.
+                    The oldest ones are dropped first when there are more.
+        """
+        self.vary_metadata: List[str] = vary_metadata or []
+        self.max_entries: int = max_entries
+        self.lock = threading.Lock()
+        self.versions: Dict[str, int] = {}
+        self.last_version: int = 0
+        self.responses: Dict[Tuple[Any, ...], CachedResponse] = {}
+
+    def get_network_version(self, agent_name: str) -> int:
+        """
+        :param agent_name: name of an agent network
+        :return: The version of the agent network as far as this cache knows,
+                0 if it does not know about it
+        """
+        with self.lock:
+            return self.versions.get(agent_name, 0)
+
+    def get_response(self, agent_name: str, operation: str, metadata: Dict[str, Any]) -> CachedResponse:
+        """
+        :param agent_name: name of an agent network
+        :param operation: The API call the response is for, e.g. "function"
+        :param metadata: The request metadata
+        :return: The CachedResponse for the current version of the agent network, or None if there is none
+        """
+        with self.lock:
+            key: Tuple[Any, ...] = self.make_key(agent_name, operation, self.versions.get(agent_name, 0), metadata)
+            return self.responses.get(key)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def put_response(self, agent_name: str, operation: str, network_version: int,
+                     metadata: Dict[str, Any], response: Dict[str, Any]) -> CachedResponse:
+        """
+        :param agent_name: name of an agent network
+        :param operation: The API call the response is for, e.g. "function"
+        :param network_version: The version of the agent network from get_network_version()
+                    from before the response was computed
+        :param metadata: The request metadata
+        :param response: The response dictionary
+        :return: A CachedResponse for the response. It is only kept if the
+                agent network has not changed while the response was computed.
+        """
+        cached = CachedResponse(response)
+        with self.lock:
+            if network_version != self.versions.get(agent_name, 0):
+                # Agent network changed in the meantime
+                return cached
+
+            if len(self.responses) >= self.max_entries:
+                # Dictionaries keep insertion order, so the first one is the oldest.
+                oldest: Tuple[Any, ...] = next(iter(self.responses))
+                self.responses.pop(oldest)
+
+            key: Tuple[Any, ...] = self.make_key(agent_name, operation, network_version, metadata)
+            self.responses[key] = cached
+        return cached
+
+    def make_key(self, agent_name: str, operation: str, network_version: int,
+                 metadata: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        :param agent_name: name of an agent network
+        :param operation: The API call the response is for
+        :param network_version: The version of the agent network
+        :param metadata: The request metadata
+        :return: The key to keep a response under
+        """
+        empty: Dict[str, Any] = {}
+        metadata = metadata or empty
+        values: Tuple[str, ...] = tuple(str(metadata.get(name)) for name in self.vary_metadata)
+        return (agent_name, operation, network_version, values)
+
+    def invalidate(self, agent_name: str, removed: bool = False):
+        """
+        Forget all responses for an agent network and move on to its next version.
+        :param agent_name: name of an agent network
+        :param removed: True if the agent network has gone away,
+                    in which case its version is forgotten as well
+        """
+        with self.lock:
+            if removed:
+                self.versions.pop(agent_name, None)
+            else:
+                self.last_version += 1
+                self.versions[agent_name] = self.last_version
+            stale: List[Tuple[Any, ...]] = [key for key in self.responses if key[0] == agent_name]
+            for key in stale:
+                self.responses.pop(key)
+
+    def agent_added(self, agent_name: str, source: AgentStorageSource):
+        """
+        Agent is being added to the service.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        self.invalidate(agent_name)
+
+    def agent_modified(self, agent_name: str, source: AgentStorageSource):
+        """
+        Existing agent has been modified in service scope.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        self.invalidate(agent_name)
+
+    def agent_removed(self, agent_name: str, source: AgentStorageSource):
+        """
+        Agent is being removed from the service.
+        :param agent_name: name of an agent
+        :param source: The AgentStorageSource source of the message
+        """
+        self.invalidate(agent_name, removed=True)
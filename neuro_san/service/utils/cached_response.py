@@ -0,0 +1,62 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+See class comment for details
+"""
+from typing import Any
+from typing import Dict
+
+import copy
+import hashlib
+import json
+
+
+class CachedResponse:
+    """
+    A computed response dictionary of an agent network API call which does not change
+    until the agent network does, kept along with its JSON body and an ETag for it.
+    """
+
+    def __init__(self, response: Dict[str, Any]):
+        """
+        Constructor
+
+        :param response: The response dictionary. It is not to be modified after this.
+        """
+        self.response: Dict[str, Any] = response
+        # Encoded once, so every client asking gets the same bytes.
+        self.body: str = json.dumps(response, sort_keys=True)
+        digest: str = hashlib.sha256(self.body.encode("utf-8")).hexdigest()
+        self.etag: str = f'"{digest[:32]}"'
+
+    def get_response(self) -> Dict[str, Any]:
+        """
+        :return: A copy of the response dictionary that callers are free to modify
+        """
+        return copy.deepcopy(self.response)
+
+    def get_body(self) -> str:
+        """
+        :return: The JSON body of the response
+        """
+        return self.body
+
+    def get_etag(self) -> str:
+        """
+        :return: The quoted ETag of the response
+        """
+        return self.etag
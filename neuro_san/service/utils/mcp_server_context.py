@@ -17,14 +17,21 @@
 """
 See class comment for details
 """
+from typing import Any
+from typing import Dict
+
 import json
 
+from os import environ
+
 from neuro_san import TOP_LEVEL_DIR
 from neuro_san.internals.interfaces.dictionary_validator import DictionaryValidator
 from neuro_san.service.mcp.validation.mcp_request_validator import McpRequestValidator
+from neuro_san.service.mcp.validation.tool_request_validator import ToolRequestValidator
 from neuro_san.service.mcp.interfaces.client_session_policy import ClientSessionPolicy
 from neuro_san.service.mcp.session.mcp_no_sessions_policy import McpNoSessionsPolicy
 from neuro_san.service.mcp.util.mcp_request_util import McpRequestUtil
+from neuro_san.service.mcp.util.mcp_tool_descriptor_cache import McpToolDescriptorCache
 
 
 class McpServerContext:
@@ -32,12 +39,17 @@ class McpServerContext:
     Class representing the server run-time context,
     necessary for handling MCP clients requests.
     """
+    # pylint: disable=too-many-instance-attributes
 
     def __init__(self):
         self.protocol_schema_filepath = None
         self.protocol_schema = None
         self.session_policy = None
         self.request_validator = None
+        self.tool_request_validator: ToolRequestValidator = None
+        self.tool_descriptor_cache: McpToolDescriptorCache = McpToolDescriptorCache()
+        # How many authorization checks a "tools/list" request may have going at once
+        self.max_concurrent_authorizations: int = int(environ.get("AGENT_MCP_MAX_CONCURRENT_AUTHORIZATIONS", "16"))
         self.enabled: bool = False
 
     def set_enabled(self, enabled: bool) -> None:
@@ -82,9 +94,36 @@ class McpServerContext:
         """
         return self.request_validator
 
+    def set_service_schema(self, service_schema: Dict[str, Any]) -> None:
+        """
+        Set up validation of tool call requests, once for all requests.
+        :param service_schema: The OpenAPI schema dictionary for the neuro-san service API
+        """
+        self.tool_request_validator = ToolRequestValidator(service_schema)
+
+    def get_tool_request_validator(self) -> ToolRequestValidator:
+        """
+        Get the tool call request validator for this context.
+        :return: The tool call request validator, or None if set_service_schema() has not been called
+        """
+        return self.tool_request_validator
+
     def get_session_policy(self) -> ClientSessionPolicy:
         """
         Get the MCP session policy for this context.
         :return: The session policy instance
         """
         return self.session_policy
+
+    def get_tool_descriptor_cache(self) -> McpToolDescriptorCache:
+        """
+        Get the cache of MCP tool descriptors of agent networks.
+        :return: The McpToolDescriptorCache instance
+        """
+        return self.tool_descriptor_cache
+
+    def get_max_concurrent_authorizations(self) -> int:
+        """
+        :return: The maximum number of authorization checks a "tools/list" request may have going at once
+        """
+        return self.max_concurrent_authorizations
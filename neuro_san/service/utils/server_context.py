@@ -17,18 +17,25 @@
 
 from typing import Dict
 
+import threading
+
+from os import environ
+
 from janus import Queue
 
 from leaf_common.asyncio.asyncio_executor_pool import AsyncioExecutorPool
 
 from neuro_san.interfaces.agent_session_constants import AgentSessionConstants
 from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
+from neuro_san.internals.interfaces.async_agent_session_factory import AsyncAgentSessionFactory
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
 from neuro_san.internals.network_providers.expiring_agent_network_storage import ExpiringAgentNetworkStorage
+from neuro_san.service.utils.agent_response_cache import AgentResponseCache
 from neuro_san.service.utils.server_status import ServerStatus
 from neuro_san.service.utils.mcp_server_context import McpServerContext
 
 
+# pylint: disable=too-many-instance-attributes
 class ServerContext:
     """
     Class that contains global-ish state for each instance of a server.
@@ -41,8 +48,15 @@ class ServerContext:
         self.server_status: ServerStatus = None
         self.executor_pool = AsyncioExecutorPool(reuse_mode=True)
         self.queues: Queue[AsyncCollatingQueue] = Queue()
+        self.deployment_wakeup: threading.Event = threading.Event()
         self.mcp_server_context: McpServerContext = McpServerContext()
         self.server_port: int = AgentSessionConstants.DEFAULT_HTTP_PORT
+        self.external_agent_session_factory: AsyncAgentSessionFactory = None
+
+        # Responses of "function" and "connectivity" calls, which only change with the agent network
+        vary_metadata: str = environ.get("AGENT_RESPONSE_CACHE_VARY_METADATA", "")
+        max_entries: int = int(environ.get("AGENT_RESPONSE_CACHE_MAX_ENTRIES", "10000"))
+        self.agent_response_cache = AgentResponseCache(vary_metadata.split(), max_entries)
 
         # Dictionary is string key (describing scope) to AgentNetworkStorage grouping.
         self.network_storage_dict: Dict[str, AgentNetworkStorage] = {
@@ -81,6 +95,13 @@ class ServerContext:
         """
         return self.queues
 
+    def get_deployment_wakeup(self) -> threading.Event:
+        """
+        :return: The threading.Event set whenever something is put on any of the queues
+                for temporary agent deployment
+        """
+        return self.deployment_wakeup
+
     def no_queues(self):
         """
         Resets the queues to None as a signal to other parts of code base
@@ -105,3 +126,23 @@ class ServerContext:
         :return: The Server port
         """
         return self.server_port
+
+    def set_external_agent_session_factory(self, factory: AsyncAgentSessionFactory):
+        """
+        :param factory: The AsyncAgentSessionFactory shared by all requests
+                    for creating sessions with external agents
+        """
+        self.external_agent_session_factory = factory
+
+    def get_external_agent_session_factory(self) -> AsyncAgentSessionFactory:
+        """
+        :return: The AsyncAgentSessionFactory shared by all requests
+                for creating sessions with external agents. Can be None.
+        """
+        return self.external_agent_session_factory
+
+    def get_agent_response_cache(self) -> AgentResponseCache:
+        """
+        :return: The AgentResponseCache shared by all agent network services
+        """
+        return self.agent_response_cache
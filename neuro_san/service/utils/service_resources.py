@@ -194,6 +194,14 @@ class ServiceResources:
         # Windows / unknown
         return counts, None, None
 
+    @classmethod
+    def get_rss_bytes(cls) -> int:
+        """
+        Returns the resident set size (RSS) of the current process in bytes.
+        Works the same on all platforms supported by psutil.
+        """
+        return psutil.Process().memory_info().rss
+
     # --- internal helper: get this process's TCP connections, psutil-6-safe ---
     @classmethod
     def _proc_tcp_conns(cls) -> List[Any]:
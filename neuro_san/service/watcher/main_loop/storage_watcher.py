@@ -56,7 +56,7 @@ class StorageWatcher(Startable):
         self.storage_updaters: List[StorageUpdater] = [
             RegistryStorageUpdater(server_context.get_network_storage_dict(), watcher_config),
             TempNetworkStorageUpdater(server_context.get_network_storage_dict(), watcher_config,
-                                      server_context.get_queues())
+                                      server_context.get_queues(), server_context.get_deployment_wakeup())
         ]
 
         self.update_period_in_seconds: int = self.compute_update_period_in_seconds(self.storage_updaters)
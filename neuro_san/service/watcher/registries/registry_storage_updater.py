@@ -22,6 +22,8 @@ import datetime
 from logging import getLogger
 from logging import Logger
 
+from neuro_san.internals.graph.activations.coded_tool_class_cache import CodedToolClassCache
+from neuro_san.internals.graph.persistence.agent_network_file_cache import AgentNetworkFileCache
 from neuro_san.internals.graph.persistence.registry_manifest_restorer import RegistryManifestRestorer
 from neuro_san.internals.graph.registry.agent_network import AgentNetwork
 from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
@@ -55,6 +57,12 @@ class RegistryStorageUpdater(AbstractStorageUpdater):
         self.network_storage_dict: Dict[str, AgentNetworkStorage] = network_storage_dict
         self.manifest_path: str = watcher_config.get("manifest_path")
 
+        # Remembers what was restored before, so only changed agent network files are parsed again.
+        # Ideally this comes from whoever did the initial restore of the manifest.
+        self.network_cache: AgentNetworkFileCache = watcher_config.get("network_cache")
+        if self.network_cache is None:
+            self.network_cache = AgentNetworkFileCache()
+
         self.observer: RegistryObserver = None
         if self.use_polling:
             poll_interval: int = self.compute_polling_interval()
@@ -107,10 +115,29 @@ class RegistryStorageUpdater(AbstractStorageUpdater):
                          modified, added, deleted)
         self.logger.info("Updating manifest file: %s", self.manifest_path)
 
-        agent_networks: Dict[str, Dict[str, AgentNetwork]] = RegistryManifestRestorer(self.manifest_path).restore()
+        num_hits: int = self.network_cache.num_hits
+        num_misses: int = self.network_cache.num_misses
+
+        restorer = RegistryManifestRestorer(self.manifest_path, network_cache=self.network_cache)
+        agent_networks: Dict[str, Dict[str, AgentNetwork]] = restorer.restore()
+        self.logger.info("Agent network files parsed: %d, reused: %d",
+                         self.network_cache.num_misses - num_misses, self.network_cache.num_hits - num_hits)
 
         for storage_type in ["public", "protected"]:
             storage: AgentNetworkStorage = self.network_storage_dict.get(storage_type)
+            self.invalidate_coded_tools(storage, agent_networks.get(storage_type))
             storage.setup_agent_networks(agent_networks.get(storage_type))
 
         self.log_next_update_time()
+
+    def invalidate_coded_tools(self, storage: AgentNetworkStorage, agent_networks: Dict[str, AgentNetwork]):
+        """
+        Forget the CodedTool classes resolved for networks that are about to be
+        replaced or removed, so that they are looked up afresh.
+        :param storage: The AgentNetworkStorage about to be updated
+        :param agent_networks: The new agent networks for the storage
+        """
+        for agent_name in storage.get_agent_names():
+            current: AgentNetwork = storage.get_agent_network_provider(agent_name).get_agent_network()
+            if agent_networks.get(agent_name) is not current:
+                CodedToolClassCache.invalidate(agent_name)
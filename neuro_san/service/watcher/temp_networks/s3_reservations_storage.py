@@ -1,4 +1,3 @@
-
 # Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
@@ -17,16 +16,20 @@
 
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Tuple
 
+import math
 import os
 import time
 
+from concurrent.futures import ThreadPoolExecutor
 from json import dumps
 from json import loads
 from json.decoder import JSONDecodeError
 from logging import getLogger
 from logging import Logger
+from threading import Lock
 
 from boto3 import client as boto3_client
 from botocore.client import BaseClient
@@ -39,14 +42,29 @@ from neuro_san.internals.reservations.reservation_dictionary_converter import Re
 from neuro_san.service.interfaces.startable import Startable
 
 
+# pylint: disable=too-many-instance-attributes
 class S3ReservationsStorage(ReservationsStorage, Startable):
     """
     AWS S3-based implementation of ReservationsStorage.
 
     Stores reservations as JSON objects in an S3 bucket, with each reservation
     stored in its associated agent spec as metadata.
+
+    The expiration time of each reservation is also part of its object key:
+        <prefix>by_expiration/<expiration time in whole seconds>/<reservation id>.json
+    so that expiring reservations only needs the bucket listing and no object downloads.
+    Objects stored under the older key format of <prefix><reservation id>.json
+    are still read, and expired by looking inside them.
     """
 
+    # Sub-prefix for keys carrying the expiration time
+    EXPIRATION_PREFIX: str = "by_expiration/"
+
+    # Most keys allowed in a single delete_objects() call
+    MAX_DELETE_BATCH: int = 1000
+
+    DEFAULT_MAX_CONCURRENCY: int = 16
+
     def __init__(self, bucket_name: str = "", prefix: str = "reservations/"):
         """
         Initialize S3 reservations storage.
@@ -68,6 +86,14 @@ class S3ReservationsStorage(ReservationsStorage, Startable):
         self.sync_target: ReservationsStorage = None
         self.s3_client: BaseClient = None
 
+        # Number of S3 requests to have in flight at the same time for reading and writing objects
+        self.max_concurrency: int = int(os.getenv("AGENT_RESERVATIONS_S3_MAX_CONCURRENCY", "0"))
+        if self.max_concurrency <= 0:
+            self.max_concurrency = self.DEFAULT_MAX_CONCURRENCY
+        self.executor: ThreadPoolExecutor = None
+        # The deployer thread adds reservations while the StorageWatcher thread syncs them
+        self.executor_lock = Lock()
+
         # Track last sync timestamp for incremental syncing (0.0 means sync all)
         self.last_sync_timestamp: float = 0.0
         self.converter = ReservationDictionaryConverter()
@@ -100,6 +126,27 @@ class S3ReservationsStorage(ReservationsStorage, Startable):
                 raise ValueError(f"Access denied to S3 bucket '{self.bucket_name}'") from exception
             raise ValueError(f"Error accessing S3 bucket '{self.bucket_name}': {exception}") from exception
 
+    def get_executor(self) -> ThreadPoolExecutor:
+        """
+        :return: The ThreadPoolExecutor for talking to S3, created on first use
+        """
+        with self.executor_lock:
+            if self.executor is None:
+                # boto3 clients are thread-safe, so all threads share the one client.
+                self.executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                   thread_name_prefix="s3_reservations")
+            return self.executor
+
+    def stop(self):
+        """
+        Shut down the threads used for talking to S3.
+        """
+        with self.executor_lock:
+            executor: ThreadPoolExecutor = self.executor
+            self.executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
     def set_sync_target(self, sync_target: ReservationsStorage):
         """
         Set the sync target for this storage implementation.
@@ -110,6 +157,51 @@ class S3ReservationsStorage(ReservationsStorage, Startable):
         # This allows S3 storage to push reservations to in-memory or other storage types
         self.sync_target = sync_target
 
+    def get_key(self, reservation: Reservation) -> str:
+        """
+        :param reservation: The Reservation to store
+        :return: The S3 object key for the reservation
+        """
+        reservation_id: str = reservation.get_reservation_id()
+        expiration_time: float = reservation.get_expiration_time_in_seconds()
+        if expiration_time is None:
+            # Nothing to put in the key, so use the older format.
+            return f"{self.prefix}{reservation_id}.json"
+
+        # Round up so that the key never says a reservation expires early.
+        return f"{self.prefix}{self.EXPIRATION_PREFIX}{math.ceil(expiration_time)}/{reservation_id}.json"
+
+    def parse_key(self, obj_key: str) -> Tuple[str, float]:
+        """
+        :param obj_key: S3 object key for a reservation
+        :return: A tuple of (reservation id, expiration time) for the key.
+                The expiration time is None for keys of the older format that do not have it.
+        """
+        name: str = obj_key[len(self.prefix):]
+        if name.endswith(".json"):
+            name = name[:-len(".json")]
+
+        if name.startswith(self.EXPIRATION_PREFIX):
+            expiration, _, reservation_id = name[len(self.EXPIRATION_PREFIX):].partition("/")
+            try:
+                return reservation_id, float(expiration)
+            except ValueError:
+                # Not one of ours after all. Treat it like the older format.
+                pass
+
+        return name, None
+
+    def list_objects(self) -> List[Dict[str, Any]]:
+        """
+        :return: A list of the S3 object descriptions for all reservation objects
+                under our prefix, across as many pages of listing as it takes.
+        """
+        objects: List[Dict[str, Any]] = []
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=self.prefix):
+            objects.extend(page.get("Contents", []))
+        return objects
+
     def add_reservations(self, reservations_dict: Dict[Reservation, Any],
                          source: str = None):
         """
@@ -120,7 +212,8 @@ class S3ReservationsStorage(ReservationsStorage, Startable):
         """
         self.logger.info("Adding %d reservations to S3", len(reservations_dict))
 
-        # Process each reservation/agent spec pair individually
+        # Prepare each reservation/agent spec pair
+        to_store: List[Tuple[str, str]] = []
         reservation: Reservation = None
         agent_spec: Dict[str, Any] = None
         for reservation, agent_spec in reservations_dict.items():
@@ -133,20 +226,29 @@ class S3ReservationsStorage(ReservationsStorage, Startable):
                 "stored_at": current_time              # When stored in S3
             }
 
-            # Generate S3 key using prefix and reservation ID for easy lookup
-            reservation_id: str = reservation.get_reservation_id()
-            key: str = f"{self.prefix}{reservation_id}.json"
-
             # Store as JSON object in S3 with proper content type
             json_body: str = dumps(agent_spec, indent=4)  # Pretty-printed JSON
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=json_body,
-                ContentType="application/json"
-            )
+            to_store.append((self.get_key(reservation), json_body))
 
-            self.logger.debug("Successfully stored reservation %s in S3", reservation_id)
+        # Store them all, a bounded number at a time.
+        # list() makes any exception from the puts come out here.
+        list(self.get_executor().map(self.put_one_reservation, to_store))
+
+    def put_one_reservation(self, key_and_body: Tuple[str, str]):
+        """
+        Store a single reservation in S3.
+
+        :param key_and_body: A tuple of (S3 object key, JSON body) for the reservation
+        """
+        key, json_body = key_and_body
+        self.s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=key,
+            Body=json_body,
+            ContentType="application/json"
+        )
+
+        self.logger.debug("Successfully stored reservation object %s in S3", key)
 
     def sync_one_reservation(self, obj_key: str) -> Tuple[Reservation, Any]:
         """
@@ -194,6 +296,31 @@ class S3ReservationsStorage(ReservationsStorage, Startable):
 
         return reservation, agent_spec
 
+    def get_keys_to_sync(self, objects: List[Dict[str, Any]]) -> List[str]:
+        """
+        :param objects: The S3 object descriptions from the bucket listing
+        :return: The keys of the objects that need reading for a sync
+        """
+        # When a reservation was stored more than once with different expiration times,
+        # only the one expiring last matters.
+        to_read: Dict[str, Tuple[float, str]] = {}
+        obj: Dict[str, Any]
+        for obj in objects:
+            # Skip objects that haven't been modified since last sync
+            if self.last_sync_timestamp > 0.0:
+                obj_modified_time: float = obj["LastModified"].timestamp()
+                if obj_modified_time <= self.last_sync_timestamp:
+                    continue
+
+            reservation_id, expiration_time = self.parse_key(obj["Key"])
+            if expiration_time is None:
+                expiration_time = -1.0
+            previous: Tuple[float, str] = to_read.get(reservation_id)
+            if previous is None or previous[0] < expiration_time:
+                to_read[reservation_id] = (expiration_time, obj["Key"])
+
+        return [obj_key for _, obj_key in to_read.values()]
+
     def sync_reservations(self):
         """
         Sync reservations from S3 to the sync target (if set).
@@ -213,37 +340,26 @@ class S3ReservationsStorage(ReservationsStorage, Startable):
             self.logger.debug("Starting full sync operation from S3 to configured sync target")
 
         # List all reservation objects in S3 bucket with our prefix
-        response: Dict[str, Any] = self.s3_client.list_objects_v2(
-            Bucket=self.bucket_name,
-            Prefix=self.prefix
-        )
+        objects: List[Dict[str, Any]] = self.list_objects()
 
         # Handle case where no reservations exist in S3
-        if "Contents" not in response:
+        if not objects:
             self.logger.debug("No reservations found in S3 bucket")
             # Update sync timestamp even if no objects found
             self.last_sync_timestamp = sync_start_time
             return
 
+        # Read the objects that need it, a bounded number at a time.
+        obj_keys: List[str] = self.get_keys_to_sync(objects)
+        skipped_count: int = len(objects) - len(obj_keys)
+        results: List[Tuple[Reservation, Any]] = list(self.get_executor().map(self.sync_one_reservation, obj_keys))
+
         # Build dictionary of active reservations to sync
         reservations_dict: Dict[Reservation, Any] = {}
-        processed_count: int = 0
-        skipped_count: int = 0
-
-        # Process each S3 object individually using our helper method
-        obj: Dict[str, Any]
-        for obj in response["Contents"]:
-            # Skip objects that haven't been modified since last sync
-            if self.last_sync_timestamp > 0.0:
-                obj_modified_time: float = obj["LastModified"].timestamp()
-                if obj_modified_time <= self.last_sync_timestamp:
-                    skipped_count += 1
-                    continue
-
-            processed_count += 1
-            reservation: Reservation = None
-            agent_spec: Dict[str, Any] = None
-            reservation, agent_spec = self.sync_one_reservation(obj["Key"])
+        processed_count: int = len(obj_keys)
+        reservation: Reservation = None
+        agent_spec: Dict[str, Any] = None
+        for reservation, agent_spec in results:
             if reservation is None or agent_spec is None:
                 # Skip anything that had an error associated with it
                 continue
@@ -269,13 +385,14 @@ class S3ReservationsStorage(ReservationsStorage, Startable):
         # Update the last sync timestamp to mark successful completion
         self.last_sync_timestamp = sync_start_time
 
-    def expire_one_reservation(self, obj_key: str, current_time: float) -> bool:
+    def is_expired_without_key_info(self, obj_key: str, current_time: float) -> bool:
         """
-        Check and expire a single reservation if it's expired.
+        Check whether a single reservation stored under the older key format is expired.
+        These need their object downloaded, as the key does not tell.
 
         :param obj_key: S3 object key for the reservation
         :param current_time: Current timestamp to compare against
-        :return: True if reservation was expired and deleted, False otherwise
+        :return: True if reservation is expired and should be deleted, False otherwise
         """
         expired: bool = False
         try:
@@ -293,32 +410,12 @@ class S3ReservationsStorage(ReservationsStorage, Startable):
 
             # Compare current time against reservation's expiration timestamp
             expiration_time: float = reservation_data.get("expiration_time_in_seconds")
-            if current_time > expiration_time:
-                # Reservation has expired - remove it from S3 storage
-                try:
-                    self.s3_client.delete_object(
-                        Bucket=self.bucket_name,
-                        Key=obj_key
-                    )
-                    reservation_id: str = reservation_data.get("id")
-                    self.logger.debug("Deleted expired reservation %s from S3", reservation_id)
-                    expired = True
-                except ClientError as delete_error:
-                    # Handle case where another process already deleted the object
-                    if delete_error.response["Error"]["Code"] != "NoSuchKey":
-                        # Re-raise other delete errors
-                        raise delete_error
-
-                    self.logger.debug("Reservation %s was already deleted by another process", obj_key)
-                    expired = True  # Consider this a successful expiration
-
-            # Reservation is still active - no action needed
+            expired = current_time > expiration_time
 
         except ClientError as exception:
             # Handle case where another process already removed the object before we could read it
             if exception.response["Error"]["Code"] == "NoSuchKey":
                 self.logger.debug("Reservation %s was already removed by another process", obj_key)
-                expired = True  # Object is gone, which is the desired outcome for expiration
             else:
                 # Log other S3 errors but don't raise - allows expiration to continue
                 self.logger.error("S3 error processing reservation object %s: %s", obj_key, str(exception))
@@ -330,6 +427,35 @@ class S3ReservationsStorage(ReservationsStorage, Startable):
 
         return expired
 
+    def delete_objects(self, obj_keys: List[str]) -> int:
+        """
+        Delete objects from S3 in as few requests as possible.
+
+        :param obj_keys: The S3 object keys to delete
+        :return: The number of objects deleted
+        """
+        deleted_count: int = 0
+        for start in range(0, len(obj_keys), self.MAX_DELETE_BATCH):
+            batch: List[str] = obj_keys[start:start + self.MAX_DELETE_BATCH]
+            response: Dict[str, Any] = self.s3_client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={
+                    "Objects": [{"Key": obj_key} for obj_key in batch],
+                    "Quiet": True
+                }
+            )
+
+            # In quiet mode, only the failures are reported.
+            errors: List[Dict[str, Any]] = response.get("Errors", [])
+            for error in errors:
+                # Another process having deleted the object already is just fine.
+                if error.get("Code") != "NoSuchKey":
+                    self.logger.error("S3 error deleting reservation object %s: %s",
+                                      error.get("Key"), error.get("Message"))
+            deleted_count += len(batch) - len(errors)
+
+        return deleted_count
+
     def expire_reservations(self):
         """
         Remove expired reservations from S3 storage.
@@ -337,27 +463,35 @@ class S3ReservationsStorage(ReservationsStorage, Startable):
         self.logger.debug("Starting expiration process for S3 reservations")
 
         # List all reservation objects in S3 bucket with our prefix
-        response: Dict[str, Any] = self.s3_client.list_objects_v2(
-            Bucket=self.bucket_name,
-            Prefix=self.prefix
-        )
+        objects: List[Dict[str, Any]] = self.list_objects()
 
         # Handle case where no reservations exist in S3
-        if "Contents" not in response:
+        if not objects:
             self.logger.debug("No reservations found in S3 bucket for expiration")
             return
 
-        # Track how many reservations we expire for reporting
-        expired_count: int = 0
         # Get current timestamp once for consistent expiration checking
         current_time: float = time.time()
 
-        # Process each S3 object individually using our helper method
+        # Most keys tell their expiration time. Older ones need a look inside.
+        expired_keys: List[str] = []
+        unknown_keys: List[str] = []
         obj: Dict[str, Any]
-        for obj in response["Contents"]:
-            # Attempt to expire this reservation and increment counter if successful
-            if self.expire_one_reservation(obj["Key"], current_time):
-                expired_count += 1
+        for obj in objects:
+            _, expiration_time = self.parse_key(obj["Key"])
+            if expiration_time is None:
+                unknown_keys.append(obj["Key"])
+            elif current_time > expiration_time:
+                expired_keys.append(obj["Key"])
+
+        if unknown_keys:
+            current_times: List[float] = [current_time] * len(unknown_keys)
+            expired_flags: List[bool] = list(self.get_executor().map(self.is_expired_without_key_info,
+                                                                     unknown_keys, current_times))
+            expired_keys.extend(obj_key for obj_key, expired in zip(unknown_keys, expired_flags) if expired)
+
+        # Track how many reservations we expire for reporting
+        expired_count: int = self.delete_objects(expired_keys)
 
         if expired_count > 0:
             self.logger.info("Expiration complete: removed %d expired reservations from S3", expired_count)
@@ -25,6 +25,10 @@ from asyncio import Event
 from asyncio import run_coroutine_threadsafe
 from logging import getLogger
 from logging import Logger
+from threading import Lock
+from threading import Thread
+
+import threading
 
 from janus import Queue
 
@@ -39,14 +43,21 @@ from neuro_san.service.watcher.interfaces.abstract_storage_updater import Abstra
 from neuro_san.service.interfaces.startable import Startable
 
 
+# pylint: disable=too-many-instance-attributes
 class TempNetworkStorageUpdater(AbstractStorageUpdater):
     """
     StorageUpdater implementation for temporary network updates.
+
+    Deployments are picked up from the queues by a thread of our own as soon as
+    a Reservationist signals the wakeup Event after putting something there.
+    The periodic update_storage() from the StorageWatcher also looks at the queues,
+    but only as a safety net for any missed wakeups.
     """
 
     def __init__(self, network_storage_dict: Dict[str, AgentNetworkStorage],
                  watcher_config: Dict[str, Any],
-                 queues: Queue[AsyncCollatingQueue]):
+                 queues: Queue[AsyncCollatingQueue],
+                 wakeup: threading.Event = None):
         """
         Constructor
 
@@ -55,6 +66,8 @@ class TempNetworkStorageUpdater(AbstractStorageUpdater):
                     of a particular grouping.
         :param watcher_config: A config dictionary for StorageUpdaters
         :param queues: A Queue of AsyncCollatingQueues for temp network deployment
+        :param wakeup: A threading.Event set by Reservationists whenever they have put
+                    something on one of the queues. Default of None means we make our own.
         """
         super().__init__(watcher_config.get("temporary_network_update_period_seconds"))
         self.logger: Logger = getLogger(self.__class__.__name__)
@@ -82,6 +95,23 @@ class TempNetworkStorageUpdater(AbstractStorageUpdater):
         self.queue_pool: Set[AsyncCollatingQueue] = set()
         self.reservationist = AbstractAgentReservationist(self.reservations_storage)
 
+        self.wakeup: threading.Event = wakeup
+        if self.wakeup is None:
+            self.wakeup = threading.Event()
+
+        # Serializes the deployer thread with the StorageWatcher thread over the queue pool.
+        # Syncing and expiring reservations do not need it, so a slow remote sync
+        # does not hold up deployments.
+        self.lock = Lock()
+        self.deployer_thread: Thread = None
+        self.keep_running: bool = True
+
+    def get_wakeup(self) -> threading.Event:
+        """
+        :return: The threading.Event to set whenever something is put on the queues
+        """
+        return self.wakeup
+
     def start(self):
         """
         Perform start up.
@@ -94,6 +124,28 @@ class TempNetworkStorageUpdater(AbstractStorageUpdater):
             if isinstance(storage, Startable):
                 storage.start()
 
+        if self.incoming is not None and len(self.reservations_storage) > 0:
+            self.deployer_thread = Thread(target=self._run_deployer, name="TempNetworkDeployer", daemon=True)
+            self.deployer_thread.start()
+
+    def _run_deployer(self):
+        """
+        Deploy whatever is on the queues whenever we are woken up.
+        """
+        while self.keep_running:
+            self.wakeup.wait()
+            # Anything put on the queues before the next wakeup will be seen below.
+            self.wakeup.clear()
+            if not self.keep_running:
+                break
+
+            try:
+                with self.lock:
+                    self.deploy_from_queues()
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Keep going. The next wakeup or update_storage() will try again.
+                self.logger.exception("Error deploying temp networks")
+
     def update_storage(self):
         """
         Perform an update
@@ -106,6 +158,14 @@ class TempNetworkStorageUpdater(AbstractStorageUpdater):
         for storage in self.reservations_storage:
             storage.expire_reservations()
 
+        # Catch anything the deployer thread might have missed
+        with self.lock:
+            self.deploy_from_queues()
+
+    def deploy_from_queues(self):
+        """
+        Deploy whatever has come in over all the queues.
+        """
         # Get any new queues
         self.add_new_queues_to_pool()
 
@@ -139,13 +199,9 @@ class TempNetworkStorageUpdater(AbstractStorageUpdater):
 
         :param async_collating_queue: The AsyncCollatingQueue to process
         """
-        janus_queue: Queue = async_collating_queue.get_queue()
-
         # See what has come over this particular queue
-        while janus_queue.sync_q.qsize() > 0:
-
-            # Get an item off the queue
-            queued_item: Dict[str, Any] = janus_queue.sync_q.get()
+        queued_item: Dict[str, Any]
+        for queued_item in async_collating_queue.drain():
             if async_collating_queue.is_final_item(queued_item):
                 # We have exhausted this queue.
                 # No one needs to worry about it any more.
@@ -183,6 +239,11 @@ class TempNetworkStorageUpdater(AbstractStorageUpdater):
         """
         self.logger.info("Stopping TempNetworkStorageUpdater")
 
+        self.keep_running = False
+        if self.deployer_thread is not None:
+            self.wakeup.set()
+            self.deployer_thread.join()
+
         # Stop any Startables
         for storage in self.reservations_storage:
             if isinstance(storage, Startable):
@@ -0,0 +1,135 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from asyncio import AbstractEventLoop
+from asyncio import get_running_loop
+from asyncio import run_coroutine_threadsafe
+from contextlib import suppress
+from os import environ
+from threading import Lock
+
+from aiohttp import ClientSession
+from aiohttp import TCPConnector
+
+
+class AiohttpSessionPool:
+    """
+    Process-wide provider of shared aiohttp ClientSessions with keep-alive connection pools.
+
+    An aiohttp ClientSession is bound to the event loop it was created on,
+    and each AsyncioExecutor runs its own event loop, so there is one shared
+    session per event loop.  Requests made through a shared session reuse
+    open connections instead of paying DNS + TCP (+TLS) setup every time.
+
+    Connector limits can be configured with environment variables:
+        AGENT_HTTP_CLIENT_CONNECTION_LIMIT          - total connections per session. Default 100.
+        AGENT_HTTP_CLIENT_CONNECTION_LIMIT_PER_HOST - connections per host. Default 0, meaning no limit.
+        AGENT_HTTP_CLIENT_KEEPALIVE_SECONDS         - how long idle connections are kept. Default 30.
+    """
+
+    # Threaded lock - on purpose even though async access is used,
+    # as different AsyncioExecutor threads share this pool.
+    lock = Lock()
+
+    # Map of event loop -> shared session for that loop
+    sessions: Dict[AbstractEventLoop, ClientSession] = {}
+
+    # Number of sessions ever created, for metrics
+    num_sessions_created: int = 0
+
+    CONNECTION_LIMIT: int = int(environ.get("AGENT_HTTP_CLIENT_CONNECTION_LIMIT", "100"))
+    CONNECTION_LIMIT_PER_HOST: int = int(environ.get("AGENT_HTTP_CLIENT_CONNECTION_LIMIT_PER_HOST", "0"))
+    KEEPALIVE_SECONDS: float = float(environ.get("AGENT_HTTP_CLIENT_KEEPALIVE_SECONDS", "30"))
+
+    @classmethod
+    def get_session(cls) -> ClientSession:
+        """
+        Must be called from within a running event loop.
+
+        :return: The shared ClientSession for the current event loop.
+                Callers must not close this session.  Per-request headers
+                and timeouts should be passed to the individual request calls.
+        """
+        loop: AbstractEventLoop = get_running_loop()
+        with cls.lock:
+            cls.prune_closed_loops()
+            session: ClientSession = cls.sessions.get(loop)
+            if session is None or session.closed:
+                connector = TCPConnector(limit=cls.CONNECTION_LIMIT,
+                                         limit_per_host=cls.CONNECTION_LIMIT_PER_HOST,
+                                         keepalive_timeout=cls.KEEPALIVE_SECONDS)
+                session = ClientSession(connector=connector)
+                cls.sessions[loop] = session
+                cls.num_sessions_created += 1
+        return session
+
+    @classmethod
+    def prune_closed_loops(cls):
+        """
+        Forget about sessions whose event loops have been closed,
+        for instance when an AsyncioExecutor was shut down.
+        The caller is expected to hold the lock.
+        """
+        for loop in list(cls.sessions.keys()):
+            if loop.is_closed():
+                del cls.sessions[loop]
+
+    @classmethod
+    async def close_session(cls):
+        """
+        Gracefully close the shared session of the current event loop, if any.
+        Intended to be called as a shutdown hook from the loop itself.
+        """
+        loop: AbstractEventLoop = get_running_loop()
+        with cls.lock:
+            session: ClientSession = cls.sessions.pop(loop, None)
+        if session is not None:
+            with suppress(Exception):
+                await session.close()
+
+    @classmethod
+    def shutdown(cls, timeout_seconds: float = 5.0):
+        """
+        Gracefully close the shared sessions of all event loops.
+        Sessions are closed on their own loops, so this can be called from any thread
+        other than those of the loops themselves.
+
+        :param timeout_seconds: How long to wait for each session to close
+        """
+        with cls.lock:
+            items: List[Tuple[AbstractEventLoop, ClientSession]] = list(cls.sessions.items())
+            cls.sessions = {}
+
+        for loop, session in items:
+            if loop.is_closed() or not loop.is_running():
+                continue
+            with suppress(Exception):
+                future = run_coroutine_threadsafe(session.close(), loop)
+                future.result(timeout=timeout_seconds)
+
+    @classmethod
+    def reset_for_testing(cls):
+        """
+        Forget about all shared sessions for testing purposes only.
+        """
+        with cls.lock:
+            cls.sessions = {}
+            cls.num_sessions_created = 0
@@ -177,6 +177,8 @@ class AsyncDirectAgentSession(AsyncAgentSession):
         # Create a message filter so as to minimize network traffic per what the user wants
         chat_filter: Dict[str, Any] = request_dict.get("chat_filter")
         message_filter: MessageFilter = MessageFilterFactory.create_message_filter(chat_filter)
+        # Have messages that would not get through never even be converted to dictionaries.
+        self.invocation_context.set_message_filter(message_filter)
 
         chat_context: Dict[str, Any] = request_dict.get("chat_context")
         sly_data: Dict[str, Any] = request_dict.get("sly_data")
@@ -207,8 +209,8 @@ class AsyncDirectAgentSession(AsyncAgentSession):
             #    interrupted by caller-side "aclose" method.
             # 3. And we suppress all exceptions while deleting resources to keep things quieter.
             async for message in queue_generator:
-                response_dict: Dict[str, Any] = copy(template_response_dict)
                 if message_filter.allow(message):
+                    response_dict: Dict[str, Any] = copy(template_response_dict)
                     # We expect the message to be a dictionary form of chat.ChatMessage
                     if message_processor is not None:
                         message_type: ChatMessageType = message.get("type")
@@ -16,19 +16,25 @@
 # END COPYRIGHT
 
 from typing import Any
+from typing import AsyncContextManager
 from typing import Dict
 from typing import Generator
 
 import asyncio
-import json
+
+from contextlib import nullcontext
 
 from aiohttp import ClientPayloadError
 from aiohttp import ClientOSError
 from aiohttp import ClientSession
 from aiohttp import ClientTimeout
 
+from leaf_common.time.timeout import Timeout
+
 from neuro_san.interfaces.async_agent_session import AsyncAgentSession
 from neuro_san.session.abstract_http_service_agent_session import AbstractHttpServiceAgentSession
+from neuro_san.session.aiohttp_session_pool import AiohttpSessionPool
+from neuro_san.session.line_delimited_json_framer import LineDelimitedJsonFramer
 
 
 class AsyncHttpServiceAgentSession(AbstractHttpServiceAgentSession, AsyncAgentSession):
@@ -36,6 +42,61 @@ class AsyncHttpServiceAgentSession(AbstractHttpServiceAgentSession, AsyncAgentSe
     Implementation of AsyncAgentSession that talks to an HTTP service.
     """
 
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, host: str = None,
+                 port: str = None,
+                 timeout_in_seconds: int = 30,
+                 metadata: Dict[str, str] = None,
+                 security_cfg: Dict[str, Any] = None,
+                 umbrella_timeout: Timeout = None,
+                 streaming_timeout_in_seconds: int = None,
+                 agent_name: str = None,
+                 use_session_pool: bool = False):
+        """
+        Creates a AsyncAgentSession that asynchronously connects to the
+        Agent Service and delegates its implementations to the service.
+
+        See AbstractHttpServiceAgentSession for a description of the common arguments.
+
+        :param use_session_pool: When True, requests go through the shared
+                        per-event-loop ClientSession of the AiohttpSessionPool,
+                        so that keep-alive connections get reused across requests
+                        and sessions. This is meant for long-lived processes
+                        like the server itself. Default is False, which opens
+                        a private ClientSession for each request.
+        """
+        super().__init__(host=host, port=port,
+                         timeout_in_seconds=timeout_in_seconds,
+                         metadata=metadata,
+                         security_cfg=security_cfg,
+                         umbrella_timeout=umbrella_timeout,
+                         streaming_timeout_in_seconds=streaming_timeout_in_seconds,
+                         agent_name=agent_name)
+        self.use_session_pool: bool = use_session_pool
+
+    def open_session(self) -> AsyncContextManager[ClientSession]:
+        """
+        :return: An async context manager yielding the ClientSession to issue a request on.
+                Headers and timeouts are expected to be passed per request
+                via get_request_kwargs().
+        """
+        if self.use_session_pool:
+            # The pooled session is shared, so never close it on exit.
+            return nullcontext(AiohttpSessionPool.get_session())
+        return ClientSession()
+
+    def get_request_kwargs(self, timeout_in_seconds: int) -> Dict[str, Any]:
+        """
+        :param timeout_in_seconds: The timeout for the request. None means use the session default.
+        :return: A dictionary of keyword arguments common to all requests
+        """
+        request_kwargs: Dict[str, Any] = {
+            "headers": self.get_headers()
+        }
+        if timeout_in_seconds is not None:
+            request_kwargs["timeout"] = ClientTimeout(timeout_in_seconds)
+        return request_kwargs
+
     async def function(self, request_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
         :param request_dict: A dictionary version of the FunctionRequest
@@ -48,14 +109,9 @@ class AsyncHttpServiceAgentSession(AbstractHttpServiceAgentSession, AsyncAgentSe
         path: str = self.get_request_path("function")
         result_dict: Dict[str, Any] = None
         try:
-            timeout: ClientTimeout = None
-            if self.timeout_in_seconds is not None:
-                timeout = ClientTimeout(self.timeout_in_seconds)
-
-            async with ClientSession(headers=self.get_headers(),
-                                     timeout=timeout
-                                     ) as session:
-                async with session.get(path, json=request_dict) as response:
+            request_kwargs: Dict[str, Any] = self.get_request_kwargs(self.timeout_in_seconds)
+            async with self.open_session() as session:
+                async with session.get(path, json=request_dict, **request_kwargs) as response:
                     result_dict = await response.json()
                     return result_dict
         except Exception as exc:  # pylint: disable=broad-exception-caught
@@ -75,13 +131,9 @@ class AsyncHttpServiceAgentSession(AbstractHttpServiceAgentSession, AsyncAgentSe
         path: str = self.get_request_path("connectivity")
         result_dict: Dict[str, Any] = None
         try:
-            timeout: ClientTimeout = None
-            if self.timeout_in_seconds is not None:
-                timeout = ClientTimeout(self.timeout_in_seconds)
-            async with ClientSession(headers=self.get_headers(),
-                                     timeout=timeout
-                                     ) as session:
-                async with session.get(path, json=request_dict) as response:
+            request_kwargs: Dict[str, Any] = self.get_request_kwargs(self.timeout_in_seconds)
+            async with self.open_session() as session:
+                async with session.get(path, json=request_dict, **request_kwargs) as response:
                     result_dict = await response.json()
                     return result_dict
         except Exception as exc:  # pylint: disable=broad-exception-caught
@@ -101,17 +153,12 @@ class AsyncHttpServiceAgentSession(AbstractHttpServiceAgentSession, AsyncAgentSe
             Note that responses to the chat input might be numerous and will come as they
             are produced until the system decides there are no more messages to be sent.
         """
-        separator: bytes = b"\n"
         max_chunk_size: int = 64 * 1024
         path: str = self.get_request_path("streaming_chat")
         try:
-            timeout: ClientTimeout = None
-            if self.streaming_timeout_in_seconds is not None:
-                timeout = ClientTimeout(self.streaming_timeout_in_seconds)
-            async with ClientSession(headers=self.get_headers(),
-                                     timeout=timeout
-                                     ) as session:
-                async with session.post(path, json=request_dict) as response:
+            request_kwargs: Dict[str, Any] = self.get_request_kwargs(self.streaming_timeout_in_seconds)
+            async with self.open_session() as session:
+                async with session.post(path, json=request_dict, **request_kwargs) as response:
                     # Check for successful response status
                     response.raise_for_status()
 
@@ -121,35 +168,13 @@ class AsyncHttpServiceAgentSession(AbstractHttpServiceAgentSession, AsyncAgentSe
                     #               ... blah blah ...
                     #       but that could fail with ValueError("Chunk too big")
                     #       if a single line was too long.
-                    accumulator: bytes = b""
+                    framer = LineDelimitedJsonFramer()
                     async for data in response.content.iter_chunked(max_chunk_size):
+                        for result_dict in framer.feed(data):
+                            yield result_dict
 
-                        # Concatenate data as it comes in
-                        accumulator += data
-
-                        # Try to find our line separator
-                        index: int = accumulator.find(separator)
-                        while index >= 0:
-
-                            # Grab a single line
-                            line: bytes = accumulator[:index]
-                            unicode_line = line.decode("utf-8")
-                            if unicode_line.strip():    # Skip empty lines
-
-                                # We have a line with something in it.
-                                # Decode and yield as a dictionary
-                                result_dict = json.loads(unicode_line)
-                                yield result_dict
-
-                            # Remove the previous line from the accumulator
-                            accumulator = accumulator[index + len(separator):]
-
-                            # Allow for case of multiple lines in one chunk
-                            index = accumulator.find(separator)
-
-                    # If there is anything left in the accumulator, yield it
-                    if len(accumulator) > 0:
-                        result_dict = json.loads(accumulator.decode("utf-8"))
+                    # If there is anything left over without a final newline, yield it
+                    for result_dict in framer.finish():
                         yield result_dict
 
         except (asyncio.TimeoutError, ClientOSError, ClientPayloadError) as exc:
@@ -111,8 +111,11 @@ class ExternalAgentSessionFactory(AsyncAgentSessionFactory):
             #   b)  We figure that the regular connection aspects to the server in question
             #       have already been sorted out in the obligitory call to function() that
             #       precedes any streaming_chat() call.
+            # External agent calls happen over and over from within a long-lived process,
+            # so use the shared connection pool to avoid re-connecting on every call.
             session = AsyncHttpServiceAgentSession(host, port, agent_name=agent_name,
-                                                   metadata=metadata, streaming_timeout_in_seconds=None)
+                                                   metadata=metadata, streaming_timeout_in_seconds=None,
+                                                   use_session_pool=True)
 
         return session
 
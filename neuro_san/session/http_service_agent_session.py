@@ -24,6 +24,7 @@ import requests
 
 from neuro_san.interfaces.agent_session import AgentSession
 from neuro_san.session.abstract_http_service_agent_session import AbstractHttpServiceAgentSession
+from neuro_san.session.line_delimited_json_framer import LineDelimitedJsonFramer
 
 
 class HttpServiceAgentSession(AbstractHttpServiceAgentSession, AgentSession):
@@ -91,9 +92,11 @@ class HttpServiceAgentSession(AbstractHttpServiceAgentSession, AgentSession):
                                timeout=self.streaming_timeout_in_seconds) as response:
                 response.raise_for_status()
 
-                for line in response.iter_lines(decode_unicode=True):
-                    if line.strip():  # Skip empty lines
-                        result_dict = json.loads(line)
-                        yield result_dict
+                # Frame the lines ourselves rather than use iter_lines(),
+                # whose cost grows with the square of the line length.
+                framer = LineDelimitedJsonFramer()
+                for data in response.iter_content(chunk_size=None):
+                    yield from framer.feed(data)
+                yield from framer.finish()
         except Exception as exc:  # pylint: disable=broad-exception-caught
             raise ValueError(self.help_message(path)) from exc
@@ -0,0 +1,104 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import List
+
+import json
+
+
+class LineDelimitedJsonFramer:
+    """
+    Incremental parser for streams of line-delimited JSON, as sent by
+    the server's streaming_chat endpoints.
+
+    Chunks of bytes are fed in as they arrive off the wire, in whatever
+    sizes the transport decides on, and complete JSON values are handed
+    back as soon as their terminating newline has been seen.
+
+    Work is linear in the size of the stream:
+        * incoming data is appended to a single bytearray,
+        * the search for the next newline picks up where the last one left off,
+          so no byte is scanned more than once, no matter how fragmented the stream,
+        * lines are decoded through a memoryview, and consumed data is dropped
+          from the front of the buffer once per chunk rather than once per line.
+    Bytes are only decoded once a full line is present, so multi-byte
+    UTF-8 characters split across chunks are handled as well.
+    """
+
+    SEPARATOR: bytes = b"\n"
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.buffer: bytearray = bytearray()
+
+        # Offset into the buffer at which to resume looking for a separator
+        self.scan_offset: int = 0
+
+    def feed(self, data: bytes) -> List[Any]:
+        """
+        :param data: The next chunk of bytes from the stream
+        :return: A list of the JSON values of all the lines completed by this chunk.
+                Empty lines are skipped.
+        """
+        results: List[Any] = []
+        if not data:
+            return results
+
+        self.buffer += data
+
+        start: int = 0
+        index: int = self.buffer.find(self.SEPARATOR, self.scan_offset)
+        if index >= 0:
+            with memoryview(self.buffer) as view:
+                while index >= 0:
+                    with view[start:index] as line:
+                        self.parse_line(line, results)
+                    start = index + len(self.SEPARATOR)
+                    index = self.buffer.find(self.SEPARATOR, start)
+
+            # Drop what has been consumed. Deleting from the front of
+            # a bytearray does not copy what remains.
+            del self.buffer[:start]
+
+        # Everything left in the buffer has been scanned already.
+        self.scan_offset = len(self.buffer)
+        return results
+
+    def finish(self) -> List[Any]:
+        """
+        Call once the stream has ended.
+        :return: A list with the JSON value of any unterminated last line, if there was one.
+        """
+        results: List[Any] = []
+        with memoryview(self.buffer) as view:
+            self.parse_line(view, results)
+        self.buffer = bytearray()
+        self.scan_offset = 0
+        return results
+
+    @staticmethod
+    def parse_line(line: memoryview, results: List[Any]):
+        """
+        :param line: A view on the bytes of a single line, without its separator
+        :param results: The list to append the parsed JSON value to
+        """
+        unicode_line: str = str(line, "utf-8")
+        if unicode_line.strip():    # Skip empty lines
+            results.append(json.loads(unicode_line))
@@ -27,6 +27,7 @@ from leaf_common.time.timeout import Timeout
 
 from neuro_san.interfaces.agent_session import AgentSession
 from neuro_san.session.abstract_http_service_agent_session import AbstractHttpServiceAgentSession
+from neuro_san.session.line_delimited_json_framer import LineDelimitedJsonFramer
 from neuro_san.session.mcp_chat_response_dictionary_converter import McpChatResponseDictionaryConverter
 
 # MCP protocol version supported by this MCP session
@@ -213,12 +214,13 @@ class McpServiceAgentSession(AbstractHttpServiceAgentSession, AgentSession):
             with requests.post(path, json=mcp_payload, headers=headers,
                                timeout=self.streaming_timeout_in_seconds) as response:
                 response.raise_for_status()
-                for line in response.iter_lines(decode_unicode=True):
-                    if line.strip():  # Skip empty lines
-                        # Each line is a JSON object representing an MCP tool call(chat) response
-                        result_dict = json.loads(line)
-                        result_dict = McpChatResponseDictionaryConverter().to_dict(result_dict)
-                        yield result_dict
+                framer = LineDelimitedJsonFramer()
+                for data in response.iter_content(chunk_size=None):
+                    # Each line is a JSON object representing an MCP tool call(chat) response
+                    for result_dict in framer.feed(data):
+                        yield McpChatResponseDictionaryConverter().to_dict(result_dict)
+                for result_dict in framer.finish():
+                    yield McpChatResponseDictionaryConverter().to_dict(result_dict)
         except Exception as exc:  # pylint: disable=broad-exception-caught
             raise ValueError(self.help_message(path)) from exc
 
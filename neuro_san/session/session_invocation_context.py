@@ -29,6 +29,7 @@ from leaf_server_common.logging.logging_setup import setup_extra_logging_fields
 
 from neuro_san.interfaces.reservationist import Reservationist
 from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
+from neuro_san.internals.filters.message_filter import MessageFilter
 from neuro_san.internals.interfaces.async_agent_session_factory import AsyncAgentSessionFactory
 from neuro_san.internals.interfaces.context_type_toolbox_factory import ContextTypeToolboxFactory
 from neuro_san.internals.interfaces.context_type_llm_factory import ContextTypeLlmFactory
@@ -86,6 +87,8 @@ class SessionInvocationContext(InvocationContext):
         # Internal
         # Get an async executor to run all tasks for this session instance:
         self.asyncio_executor: AsyncioExecutor = self.async_executors_pool.get_executor()
+        # Nested copies borrow the executor and must not give it back to the pool.
+        self.owns_executor: bool = True
         self.request_reporting: Dict[str, Any] = {}
         self.origination: Origination = Origination()
 
@@ -142,6 +145,13 @@ class SessionInvocationContext(InvocationContext):
         """
         return self.queue
 
+    def set_message_filter(self, message_filter: MessageFilter):
+        """
+        Lets the Journal skip messages that the consumer of the queue would filter out anyway.
+        :param message_filter: The MessageFilter the consumer of the queue applies
+        """
+        self.journal.set_message_filter(message_filter)
+
     def get_metadata(self) -> Dict[str, str]:
         """
         :return: The metadata to pass along with any request
@@ -153,7 +163,8 @@ class SessionInvocationContext(InvocationContext):
         Release resources owned by this context
         """
         if self.asyncio_executor is not None:
-            self.async_executors_pool.return_executor(self.asyncio_executor)
+            if self.owns_executor:
+                self.async_executors_pool.return_executor(self.asyncio_executor)
             self.asyncio_executor = None
         if self.queue is not None:
             self.queue.close()
@@ -220,3 +231,35 @@ class SessionInvocationContext(InvocationContext):
         invocation_context.journal: Journal = MessageJournal(invocation_context.queue)
 
         return invocation_context
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def nested_copy(self, agent_name: str,
+                    llm_factory: ContextTypeLlmFactory,
+                    toolbox_factory: ContextTypeToolboxFactory,
+                    metadata: Dict[str, str],
+                    reservationist: Reservationist) -> SessionInvocationContext:
+        """
+        Makes a copy of the invocation context for calling another agent network
+        hosted by the same server on the same executor, as if it were a request of its own.
+
+        :param agent_name: The name of the agent network being called
+        :param llm_factory: The ContextTypeLlmFactory of the agent network being called
+        :param toolbox_factory: The ContextTypeToolboxFactory of the agent network being called
+        :param metadata: The request metadata for the agent network being called
+        :param reservationist: The Reservationist instance for the agent network being called
+        :return: A SessionInvocationContext whose close() leaves the executor with this one
+        """
+        invocation_context: SessionInvocationContext = self.safe_shallow_copy()
+        invocation_context.agent_name = agent_name
+        invocation_context.llm_factory = llm_factory
+        invocation_context.toolbox_factory = toolbox_factory
+        invocation_context.metadata = metadata
+        invocation_context.reservationist = reservationist
+        invocation_context.owns_executor = False
+
+        # Token accounting and origins of the called network are its own business,
+        # just as when it is called over http.
+        invocation_context.request_reporting = {}
+        invocation_context.origination = Origination()
+
+        return invocation_context
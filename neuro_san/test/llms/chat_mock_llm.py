@@ -16,6 +16,7 @@
 # END COPYRIGHT
 
 from typing import Any
+from typing import ClassVar
 from typing import Dict
 from typing import Iterator
 from typing import List
@@ -31,6 +32,7 @@ from langchain_core.outputs import ChatGenerationChunk
 from langchain_core.outputs import ChatResult
 from pydantic import ConfigDict
 from pydantic import Field
+from tiktoken import Encoding
 from tiktoken import get_encoding
 
 
@@ -49,6 +51,9 @@ class ChatMockLlm(BaseChatModel):
     # Accept both argument name and alias
     model_config = ConfigDict(populate_by_name=True)
 
+    # Map of encoding name -> tiktoken Encoding, or None if it could not be loaded
+    encodings: ClassVar[Dict[str, Encoding]] = {}
+
     def _generate(
         self,
         messages: List[BaseMessage],
@@ -170,13 +175,25 @@ class ChatMockLlm(BaseChatModel):
         """
         Returns the number of tokens in a text string using tiktoken.
         The default encoding is the same one as gpt-4o.
+        If the encoding cannot be loaded, the number of tokens is estimated.
 
         :param string: Input string.
         :param encoding_name: Encoding model to use.
 
         :return: Number of token.
         """
-        encoding = get_encoding(encoding_name)
+        if encoding_name not in ChatMockLlm.encodings:
+            try:
+                ChatMockLlm.encodings[encoding_name] = get_encoding(encoding_name)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # tiktoken downloads encodings on first use, which cannot be done offline.
+                ChatMockLlm.encodings[encoding_name] = None
+
+        encoding: Encoding = ChatMockLlm.encodings.get(encoding_name)
+        if encoding is None:
+            # Estimate about 4 characters per token, as for English text
+            return (len(string) + 3) // 4
+
         num_tokens = len(encoding.encode(string))
         return num_tokens
 
@@ -0,0 +1,155 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import AsyncIterator
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+import asyncio
+import time
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk
+from langchain_core.outputs import ChatResult
+
+from neuro_san.test.llms.chat_mock_llm import ChatMockLlm
+
+
+class DelayedChatMockLlm(ChatMockLlm):  # pylint: disable=abstract-method
+    """
+    A ChatMockLlm that takes its time, like a real LLM would.
+
+    The delays are spent in asyncio.sleep() when called asynchronously, so that
+    the mock occupies no more threads than an LLM reached over the network would.
+    This makes it suitable for load testing the server without paying for LLM calls.
+    """
+
+    # Seconds to wait before the first chunk of the response
+    time_to_first_token_seconds: float = 0.0
+
+    # Seconds to wait before each subsequent chunk of the response.
+    # As with ChatMockLlm, each chunk is a single character of the echoed input.
+    seconds_per_token: float = 0.0
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """
+        Synchronously wait as long as it would take to stream the whole response, then respond.
+        See ChatMockLlm for a description of the arguments.
+        """
+        result: ChatResult = self._respond(messages, stop, **kwargs)
+        time.sleep(self._get_total_delay(result))
+        return result
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """
+        Asynchronously wait as long as it would take to stream the whole response, then respond.
+        See ChatMockLlm for a description of the arguments.
+        """
+        result: ChatResult = self._respond(messages, stop, **kwargs)
+        await asyncio.sleep(self._get_total_delay(result))
+        return result
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        """
+        Stream the chunks of the response, waiting synchronously before each one.
+        See ChatMockLlm for a description of the arguments.
+        """
+        delay: float = self.time_to_first_token_seconds
+        for chunk in self._respond_stream(messages, stop, **kwargs):
+            if chunk.text:
+                time.sleep(delay)
+                delay = self.seconds_per_token
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        """
+        Stream the chunks of the response, waiting asynchronously before each one.
+        See ChatMockLlm for a description of the arguments.
+        """
+        delay: float = self.time_to_first_token_seconds
+        for chunk in self._respond_stream(messages, stop, **kwargs):
+            if chunk.text:
+                await asyncio.sleep(delay)
+                delay = self.seconds_per_token
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    def _respond(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                 **kwargs: Any) -> ChatResult:
+        """
+        Subclasses can override this to respond with something other than an echo.
+        :param messages: the prompt composed of a list of messages.
+        :param stop: a list of strings on which the model should stop generating.
+        :return: chat result containing chat generation which includes ai message.
+        """
+        return ChatMockLlm._generate(self, messages, stop, None, **kwargs)
+
+    def _respond_stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                        **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        """
+        Subclasses can override this to stream something other than an echo.
+        Callbacks are left to the callers, which also add the delays.
+        :param messages: the prompt composed of a list of messages.
+        :param stop: a list of strings on which the model should stop generating.
+        :yields: ChatGenerationChunk objects containing the streamed model output.
+        """
+        yield from ChatMockLlm._stream(self, messages, stop, None, **kwargs)
+
+    def _get_total_delay(self, result: ChatResult) -> float:
+        """
+        :param result: The complete response
+        :return: The number of seconds it would take to stream the whole response
+        """
+        num_chunks: int = len(result.generations[0].message.content)
+        if num_chunks == 0:
+            return 0.0
+        return self.time_to_first_token_seconds + (num_chunks - 1) * self.seconds_per_token
+
+    @property
+    def _llm_type(self) -> str:
+        """Get the type of language model used by this chat model."""
+        return "delayed-echoing-chat-model"
@@ -0,0 +1,296 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Callable
+from typing import ClassVar
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+import json
+
+from threading import Lock
+
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessageChunk
+from langchain_core.messages import BaseMessage
+from langchain_core.messages import HumanMessage
+from langchain_core.outputs import ChatGeneration
+from langchain_core.outputs import ChatGenerationChunk
+from langchain_core.outputs import ChatResult
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import PrivateAttr
+
+from leaf_common.persistence.easy.easy_hocon_persistence import EasyHoconPersistence
+
+from neuro_san.test.llms.delayed_chat_mock_llm import DelayedChatMockLlm
+
+
+class ScriptedChatMockLlm(DelayedChatMockLlm):
+    """
+    A mock chat model that follows a script of responses and tool calls,
+    so that whole agent networks can be run deterministically without any LLM provider.
+
+    A script is a list of turns. Each turn is a dictionary with any of these keys:
+        "content"       The text of the response. When there are no "tool_calls",
+                        this defaults to echoing the last human message.
+        "tool_calls"    A list of {"name": <tool name>, "args": {<arguments>}} dictionaries
+                        for tools to call. All of them are called in parallel.
+        "error"         Instead of responding, raise a ValueError with this message.
+                        The agent's retries or fallbacks take it from there.
+        "times"         With "error", the number of calls that fail before the turn is skipped.
+                        Default is to fail every time, which is how to exercise fallbacks.
+
+    The turn to respond with is found from the number of AI messages since the last
+    human message, so each time an agent is called it starts over at the first turn,
+    and each round of tool calls moves it on to the next one. Error turns do not
+    produce any AI message, so they are passed over once they have failed enough times.
+
+    Each agent gets its own script, either inline with "script" in its llm_config,
+    or with a "script_key" into a shared "script_file" that maps keys to scripts.
+    Put "class" and "script_file" in the network's llm_config and a "script_key"
+    in each agent's llm_config.
+
+    Latency is added just as with DelayedChatMockLlm.
+    """
+
+    # An inline script for the agent
+    script: Optional[List[Dict[str, Any]]] = None
+
+    # A HOCON or JSON file of scripts keyed by script_key
+    script_file: Optional[str] = None
+
+    # The key of the script for the agent within the script_file
+    script_key: str = "default"
+
+    # Map of script file name -> its parsed contents, so each file is only read once
+    script_files: ClassVar[Dict[str, Dict[str, Any]]] = {}
+    script_files_lock: ClassVar[Lock] = Lock()
+
+    # Map of turn index -> number of times an error turn has failed for this instance.
+    # The same instance is used for the retries of a single agent call.
+    _failures: Dict[int, int] = PrivateAttr(default_factory=dict)
+
+    def bind_tools(
+        self,
+        tools: Sequence[Union[Dict[str, Any], type, Callable, BaseTool]],
+        *,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> Runnable[LanguageModelInput, AIMessage]:
+        """
+        Bind tool-like objects to this chat model.
+        The tools only serve to check that the script calls tools which actually exist.
+
+        :param tools: A list of tool definitions to bind to this chat model.
+        :param tool_choice: Which tool to require the model to call. Ignored by the script.
+        :return: A Runnable that calls this model with the tools bound.
+        """
+        _ = tool_choice
+        formatted_tools: List[Dict[str, Any]] = [convert_to_openai_tool(tool) for tool in tools]
+        return self.bind(tools=formatted_tools, **kwargs)
+
+    def _respond(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                 **kwargs: Any) -> ChatResult:
+        """
+        Respond with the next turn of the script.
+        See DelayedChatMockLlm for a description of the arguments.
+        """
+        _ = stop
+        turn_index, turn = self._next_turn(messages, kwargs.get("tools"))
+        message = AIMessage(
+            content=self._get_content(turn, messages),
+            tool_calls=self._get_tool_calls(turn_index, turn),
+            response_metadata={
+                "model_name": self.model_name,
+            },
+        )
+        message.usage_metadata = self._get_usage(messages, message)
+
+        generation = ChatGeneration(message=message)
+        return ChatResult(generations=[generation])
+
+    def _respond_stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                        **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        """
+        Stream the next turn of the script, one character of content at a time,
+        followed by one chunk for each tool call.
+        See DelayedChatMockLlm for a description of the arguments.
+        """
+        result: ChatResult = self._respond(messages, stop, **kwargs)
+        message: AIMessage = result.generations[0].message
+
+        for content_chunk in message.content:
+            yield ChatGenerationChunk(message=AIMessageChunk(content=content_chunk))
+
+        for index, tool_call in enumerate(message.tool_calls):
+            tool_call_chunk: Dict[str, Any] = {
+                "name": tool_call.get("name"),
+                "args": json.dumps(tool_call.get("args")),
+                "id": tool_call.get("id"),
+                "index": index,
+            }
+            yield ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=[tool_call_chunk]))
+
+        # Usage and model name come last, as with many providers
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(
+                content="",
+                usage_metadata=message.usage_metadata,
+                response_metadata={"model_name": self.model_name},
+            )
+        )
+
+    def _next_turn(self, messages: List[BaseMessage], tools: List[Dict[str, Any]]) -> Tuple[int, Dict[str, Any]]:
+        """
+        :param messages: the prompt composed of a list of messages.
+        :param tools: The OpenAI-format tools bound to the model, if any
+        :return: A tuple of the index of the turn in the script and the turn itself
+        """
+        script: List[Dict[str, Any]] = self._get_script()
+
+        # Count the AI messages since the last human message
+        num_responses: int = 0
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                break
+            if isinstance(message, AIMessage):
+                num_responses += 1
+
+        responses_seen: int = 0
+        for turn_index, turn in enumerate(script):
+            if "error" in turn:
+                failures: int = self._failures.get(turn_index, 0)
+                times: int = turn.get("times")
+                if responses_seen == num_responses and (times is None or failures < times):
+                    self._failures[turn_index] = failures + 1
+                    raise ValueError(turn.get("error"))
+                continue
+
+            if responses_seen == num_responses:
+                self._check_tool_names(turn, tools)
+                return turn_index, turn
+            responses_seen += 1
+
+        raise ValueError(f"Script {self.script_key} has no turn left after {num_responses} responses")
+
+    def _get_script(self) -> List[Dict[str, Any]]:
+        """
+        :return: The list of turns for the agent
+        """
+        if self.script is not None:
+            return self.script
+
+        if self.script_file is None:
+            raise ValueError("ScriptedChatMockLlm needs either a script or a script_file in its llm_config")
+
+        with ScriptedChatMockLlm.script_files_lock:
+            scripts: Dict[str, Any] = ScriptedChatMockLlm.script_files.get(self.script_file)
+            if scripts is None:
+                hocon = EasyHoconPersistence(full_ref=self.script_file, must_exist=True)
+                scripts = hocon.restore()
+                ScriptedChatMockLlm.script_files[self.script_file] = scripts
+
+        script: List[Dict[str, Any]] = scripts.get(self.script_key)
+        if script is None:
+            raise ValueError(f"No script {self.script_key} in {self.script_file}")
+        return script
+
+    @staticmethod
+    def _check_tool_names(turn: Dict[str, Any], tools: List[Dict[str, Any]]):
+        """
+        Checks that the tools the turn calls are bound to the model,
+        so mistakes in a script do not show up as mysterious agent failures.
+        :param turn: The turn of the script to respond with
+        :param tools: The OpenAI-format tools bound to the model, if any
+        """
+        tool_names: Set[str] = set()
+        for tool in tools or []:
+            tool_names.add(tool.get("function", {}).get("name"))
+
+        for tool_call in turn.get("tool_calls", []):
+            name: str = tool_call.get("name")
+            if name not in tool_names:
+                raise ValueError(f"Script calls tool {name}, but only {sorted(tool_names)} are available")
+
+    @staticmethod
+    def _get_content(turn: Dict[str, Any], messages: List[BaseMessage]) -> str:
+        """
+        :param turn: The turn of the script to respond with
+        :param messages: the prompt composed of a list of messages.
+        :return: The text content of the response
+        """
+        content: str = turn.get("content")
+        if content is not None:
+            return content
+        if turn.get("tool_calls"):
+            return ""
+
+        # Echo the last human message
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                return message.content
+        return ""
+
+    def _get_tool_calls(self, turn_index: int, turn: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        :param turn_index: The index of the turn in the script
+        :param turn: The turn of the script to respond with
+        :return: A list of ToolCall dictionaries with deterministic ids
+        """
+        tool_calls: List[Dict[str, Any]] = []
+        for call_index, tool_call in enumerate(turn.get("tool_calls", [])):
+            tool_calls.append({
+                "name": tool_call.get("name"),
+                "args": tool_call.get("args", {}),
+                "id": f"call_{self.script_key}_{turn_index}_{call_index}",
+                "type": "tool_call",
+            })
+        return tool_calls
+
+    def _get_usage(self, messages: List[BaseMessage], message: AIMessage) -> Dict[str, int]:
+        """
+        :param messages: the prompt composed of a list of messages.
+        :param message: The response
+        :return: A usage metadata dictionary with token counts for the prompt and the response
+        """
+        input_tokens: int = 0
+        for prompt_message in messages:
+            input_tokens += self._num_tokens_from_string(str(prompt_message.content))
+
+        output_tokens: int = self._num_tokens_from_string(str(message.content))
+        for tool_call in message.tool_calls:
+            output_tokens += self._num_tokens_from_string(tool_call.get("name") + json.dumps(tool_call.get("args")))
+
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+
+    @property
+    def _llm_type(self) -> str:
+        """Get the type of language model used by this chat model."""
+        return "scripted-chat-model"
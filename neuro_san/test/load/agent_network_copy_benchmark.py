@@ -0,0 +1,95 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+from copy import deepcopy
+
+import time
+import tracemalloc
+
+from neuro_san.internals.graph.persistence.registry_manifest_restorer import RegistryManifestRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+
+
+class AgentNetworkCopyBenchmark:
+    """
+    Measures the time and memory it takes to set up the per-session copies
+    of the agent networks of a manifest, the bundled registries by default.
+
+    The copy-on-write AgentNetwork.create_copy() is measured against the
+    copy.deepcopy() that used to be done for each chat session.
+    """
+
+    def __init__(self, num_sessions: int = 20, manifest_file: str = None):
+        """
+        Constructor
+
+        :param num_sessions: The number of sessions to set up a copy of every network for
+        :param manifest_file: The manifest of the agent networks to copy.
+                    Default of None means the manifest of the bundled registries.
+        """
+        self.num_sessions: int = num_sessions
+        self.manifest_file: str = manifest_file
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run the benchmark
+        :return: A report dictionary of the results
+        """
+        restored: Dict[str, Dict[str, AgentNetwork]] = RegistryManifestRestorer(self.manifest_file).restore()
+        networks: List[AgentNetwork] = []
+        for scoped_networks in restored.values():
+            networks.extend(scoped_networks.values())
+
+        report: Dict[str, Any] = {
+            "Networks": len(networks),
+            "Sessions": self.num_sessions,
+            "DeepCopy": self.measure(networks, deepcopy),
+            "CreateCopy": self.measure(networks, lambda network: network.create_copy()),
+        }
+        return report
+
+    def measure(self, networks: List[AgentNetwork], make_copy: Callable[[AgentNetwork], Any]) -> Dict[str, Any]:
+        """
+        :param networks: The networks as restored from the manifest
+        :param make_copy: How to make the per-session copy of a network
+        :return: A dictionary of the time and peak memory it takes to set up
+                all the sessions' worth of copies of all the networks
+        """
+        # Fresh networks, so that the one-time cost of the read-only snapshot is counted as well
+        fresh: List[AgentNetwork] = [AgentNetwork(network.get_config(), network.get_network_name())
+                                     for network in networks]
+
+        # Keep the copies around, as sessions would
+        kept: List[Any] = []
+        tracemalloc.start()
+        start: float = time.perf_counter()
+        for _ in range(self.num_sessions):
+            for network in fresh:
+                kept.append(make_copy(network))
+        seconds: float = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return {
+            "Seconds": seconds,
+            "MicrosecondsPerCopy": 1e6 * seconds / max(len(kept), 1),
+            "PeakKiB": peak / 1024,
+        }
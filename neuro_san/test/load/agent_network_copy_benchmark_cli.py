@@ -0,0 +1,86 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+import argparse
+import json
+import sys
+
+from neuro_san.test.load.agent_network_copy_benchmark import AgentNetworkCopyBenchmark
+
+
+class AgentNetworkCopyBenchmarkCli:
+    """
+    Command-line tool for measuring the time and memory it takes to set up
+    the per-session copies of agent networks, compared to deep copies of them.
+    A JSON report is printed.
+
+    Usage:
+        python -m neuro_san.test.load.agent_network_copy_benchmark_cli
+        python -m neuro_san.test.load.agent_network_copy_benchmark_cli --sessions 100
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.args = None
+
+    def main(self) -> int:
+        """
+        Main entry point for the agent network copy benchmark CLI.
+
+        :return: Exit code (0 if create_copy() took less time and memory than deepcopy(), 1 otherwise)
+        """
+        self.parse_args()
+
+        benchmark = AgentNetworkCopyBenchmark(num_sessions=self.args.sessions,
+                                              manifest_file=self.args.manifest_file)
+        report: Dict[str, Any] = benchmark.run()
+
+        report_text: str = json.dumps(report, indent=4)
+        print(report_text)
+        if self.args.output_file:
+            with open(self.args.output_file, "w", encoding="utf-8") as output:
+                output.write(report_text)
+
+        deep: Dict[str, Any] = report.get("DeepCopy")
+        create: Dict[str, Any] = report.get("CreateCopy")
+        if create.get("Seconds") >= deep.get("Seconds") or create.get("PeakKiB") >= deep.get("PeakKiB"):
+            return 1
+        return 0
+
+    def parse_args(self):
+        """
+        Parse command line arguments.
+        """
+        arg_parser = argparse.ArgumentParser(
+            description="Measure setting up per-session copies of agent networks against deep copies of them."
+        )
+        arg_parser.add_argument("--sessions", type=int, default=20,
+                                help="Number of sessions to set up a copy of every agent network for")
+        arg_parser.add_argument("--manifest_file", type=str, default=None,
+                                help="Manifest of the agent networks to copy."
+                                     " Default is the manifest of the bundled registries.")
+        arg_parser.add_argument("--output_file", type=str, default=None,
+                                help="File to write the JSON report to, in addition to stdout")
+        self.args = arg_parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(AgentNetworkCopyBenchmarkCli().main())
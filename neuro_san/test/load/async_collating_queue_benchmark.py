@@ -0,0 +1,203 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+
+from asyncio import AbstractEventLoop
+from concurrent.futures import Future
+from threading import Thread
+
+import asyncio
+import time
+
+from janus import Queue
+
+from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
+
+
+# pylint: disable=too-many-instance-attributes
+class AsyncCollatingQueueBenchmark:
+    """
+    Measures the per-message overhead of the AsyncCollatingQueue that carries chat messages
+    from the event loop running an agent network to the event loop of the request,
+    and how much it stalls the producer loop when the consumer writes to a slow client.
+
+    The same is measured for the janus sync-side put() the AsyncCollatingQueue replaced.
+    Producer loop stalls are measured by how late a short heartbeat on that loop gets.
+    """
+
+    HEARTBEAT_SECONDS: float = 0.001
+
+    def __init__(self, num_fast_messages: int = 5000,
+                 num_slow_messages: int = 1000,
+                 pause_seconds: float = 0.1,
+                 capacity: int = 100):
+        """
+        Constructor
+
+        :param num_fast_messages: The number of messages for a consumer that keeps up
+        :param num_slow_messages: The number of messages for a consumer that pauses
+        :param pause_seconds: How long the slow consumer pauses every 50 messages,
+                    standing in for a slow client socket
+        :param capacity: The capacity of the queues with the slow consumer
+        """
+        self.num_fast_messages: int = num_fast_messages
+        self.num_slow_messages: int = num_slow_messages
+        self.pause_seconds: float = pause_seconds
+        self.capacity: int = capacity
+
+        self.loop: AbstractEventLoop = None
+        self.beating: bool = False
+        self.max_stall_seconds: float = 0.0
+        self.max_pending: int = 0
+        self.janus_queue: Queue = None
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run the benchmark
+        :return: A report dictionary of the results
+        """
+        self.loop = asyncio.new_event_loop()
+        thread = Thread(target=self.loop.run_forever, daemon=True)
+        thread.start()
+        self.beating = True
+        heartbeat: Future = asyncio.run_coroutine_threadsafe(self.beat(), self.loop)
+        try:
+            report: Dict[str, Any] = {
+                "Capacity": self.capacity,
+                "SlowConsumerPauseSeconds": self.pause_seconds,
+            }
+            for name, num_messages, pause_seconds, bound in (
+                    ("FastConsumer", self.num_fast_messages, 0.0, 0),
+                    ("SlowConsumer", self.num_slow_messages, self.pause_seconds, self.capacity)):
+
+                queue = AsyncCollatingQueue(capacity=bound)
+                report[name] = {
+                    "Messages": num_messages,
+                    "AsyncCollatingQueue": self.measure(
+                        lambda count=num_messages, use_queue=queue: self.produce(use_queue, count),
+                        lambda pause=pause_seconds, use_queue=queue: self.consume(use_queue, pause)),
+                    # What used to be done: janus sync-side put() from the producer loop.
+                    "JanusSyncPut": self.measure(
+                        lambda count=num_messages: self.produce_janus(count),
+                        lambda pause=pause_seconds: self.consume(self.janus_items(), pause),
+                        janus_maxsize=bound),
+                }
+        finally:
+            self.beating = False
+            heartbeat.result(timeout=5.0)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            thread.join()
+            self.loop.close()
+
+        return report
+
+    async def beat(self):
+        """
+        Records the most the heartbeat on the producer loop was late by
+        """
+        while self.beating:
+            start: float = time.perf_counter()
+            await asyncio.sleep(self.HEARTBEAT_SECONDS)
+            late: float = time.perf_counter() - start - self.HEARTBEAT_SECONDS
+            self.max_stall_seconds = max(self.max_stall_seconds, late)
+
+    def measure(self, make_producer: Callable[[], Awaitable], make_consumer: Callable[[], Awaitable],
+                janus_maxsize: int = None) -> Dict[str, Any]:
+        """
+        :param make_producer: Makes the coroutine to run on the producer loop
+        :param make_consumer: Makes the coroutine to run on the consumer loop
+        :param janus_maxsize: When not None, the maxsize of a janus queue to create
+                    on the consumer loop, which it is bound to.
+        :return: A dictionary of measurements
+        """
+        async def run() -> Dict[str, Any]:
+            if janus_maxsize is not None:
+                self.janus_queue = Queue(maxsize=janus_maxsize)
+            self.max_stall_seconds = 0.0
+            self.max_pending = 0
+            future: Future = asyncio.run_coroutine_threadsafe(make_producer(), self.loop)
+            num_messages: int = await make_consumer()
+            put_seconds: float = future.result(timeout=300.0)
+            return {
+                "MicrosecondsPerPut": 1e6 * put_seconds / max(num_messages, 1),
+                "MaxProducerLoopStallSeconds": self.max_stall_seconds,
+                "MaxPending": self.max_pending,
+            }
+        return asyncio.run(run())
+
+    @staticmethod
+    async def consume(items: AsyncIterator, pause_seconds: float) -> int:
+        """
+        :param items: The items to consume
+        :param pause_seconds: How long to pause every 50 items
+        :return: The number of items consumed
+        """
+        count: int = 0
+        async for _ in items:
+            count += 1
+            if pause_seconds > 0.0 and count % 50 == 0:
+                # Stands in for a slow client socket
+                await asyncio.sleep(pause_seconds)
+        return count
+
+    async def produce(self, queue: AsyncCollatingQueue, count: int) -> float:
+        """
+        Puts a number of items and then the final item on the queue.
+        :return: The seconds spent in put(), including any waiting for room
+        """
+        put_seconds: float = 0.0
+        for index in range(count):
+            start: float = time.perf_counter()
+            await queue.put({"index": index})
+            put_seconds += time.perf_counter() - start
+            self.max_pending = max(self.max_pending, queue.qsize())
+            if index % 10 == 0:
+                # Messages come in bursts between LLM calls
+                await asyncio.sleep(0)
+        await queue.put_final_item()
+        return put_seconds
+
+    async def produce_janus(self, count: int) -> float:
+        """
+        Puts a number of items and then the final item on a janus queue from the sync side,
+        as was done before the AsyncCollatingQueue.
+        :return: The seconds spent in put(), including any waiting for room
+        """
+        put_seconds: float = 0.0
+        for index in range(count):
+            start: float = time.perf_counter()
+            self.janus_queue.sync_q.put({"index": index})
+            put_seconds += time.perf_counter() - start
+            self.max_pending = max(self.max_pending, self.janus_queue.sync_q.qsize())
+            if index % 10 == 0:
+                await asyncio.sleep(0)
+        self.janus_queue.sync_q.put(AsyncCollatingQueue.END_MESSAGE)
+        return put_seconds
+
+    async def janus_items(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterates over the janus queue from the async side, as AsyncCollatingQueue used to
+        """
+        while True:
+            item: Dict[str, Any] = await self.janus_queue.async_q.get()
+            if AsyncCollatingQueue.END_KEY in item:
+                return
+            yield item
@@ -0,0 +1,89 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+import argparse
+import json
+import sys
+
+from neuro_san.test.load.async_collating_queue_benchmark import AsyncCollatingQueueBenchmark
+
+
+class AsyncCollatingQueueBenchmarkCli:
+    """
+    Command-line tool for measuring the overhead of the AsyncCollatingQueue that carries
+    chat messages between event loops, compared to the janus queue it replaced.
+    A JSON report is printed.
+
+    Usage:
+        python -m neuro_san.test.load.async_collating_queue_benchmark_cli
+        python -m neuro_san.test.load.async_collating_queue_benchmark_cli --capacity 1000
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.args = None
+
+    def main(self) -> int:
+        """
+        Main entry point for the AsyncCollatingQueue benchmark CLI.
+
+        :return: Exit code (0 if the slow consumer's queue stayed within its capacity, 1 otherwise)
+        """
+        self.parse_args()
+
+        benchmark = AsyncCollatingQueueBenchmark(num_fast_messages=self.args.fast_messages,
+                                                 num_slow_messages=self.args.slow_messages,
+                                                 pause_seconds=self.args.pause_seconds,
+                                                 capacity=self.args.capacity)
+        report: Dict[str, Any] = benchmark.run()
+
+        report_text: str = json.dumps(report, indent=4)
+        print(report_text)
+        if self.args.output_file:
+            with open(self.args.output_file, "w", encoding="utf-8") as output:
+                output.write(report_text)
+
+        if report.get("SlowConsumer").get("AsyncCollatingQueue").get("MaxPending") > self.args.capacity:
+            return 1
+        return 0
+
+    def parse_args(self):
+        """
+        Parse command line arguments.
+        """
+        arg_parser = argparse.ArgumentParser(
+            description="Measure the AsyncCollatingQueue against a janus queue with fast and slow consumers."
+        )
+        arg_parser.add_argument("--fast_messages", type=int, default=5000,
+                                help="Number of messages for a consumer that keeps up")
+        arg_parser.add_argument("--slow_messages", type=int, default=1000,
+                                help="Number of messages for a consumer that pauses every 50 messages")
+        arg_parser.add_argument("--pause_seconds", type=float, default=0.1,
+                                help="How long the slow consumer pauses every 50 messages")
+        arg_parser.add_argument("--capacity", type=int, default=100,
+                                help="Capacity of the queues with the slow consumer")
+        arg_parser.add_argument("--output_file", type=str, default=None,
+                                help="File to write the JSON report to, in addition to stdout")
+        self.args = arg_parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(AsyncCollatingQueueBenchmarkCli().main())
@@ -0,0 +1,126 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+import asyncio
+import json
+import os
+import tempfile
+
+from neuro_san import REGISTRIES_DIR
+from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
+from neuro_san.test.load.load_test_driver import LoadTestDriver
+from neuro_san.test.load.load_test_server import LoadTestServer
+
+
+class ConcurrentToolCallsBenchmark:
+    """
+    Measures the wall-clock time of requests to the bundled chat_mock_llm_scripted network,
+    whose front man calls two tools in the same turn, with those tool calls made
+    one at a time and all at once.
+
+    Every agent of the network follows the script of a ScriptedChatMockLlm,
+    so no LLM provider is ever called. The tools are made to take their time
+    before answering, like a real LLM would.
+    """
+
+    AGENT_NAME: str = "chat_mock_llm_scripted"
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, num_sessions: int = 4,
+                 requests_per_session: int = 5,
+                 tool_delay_seconds: float = 0.2,
+                 timeout_seconds: float = 300.0):
+        """
+        Constructor
+
+        :param num_sessions: The number of chat sessions running at the same time
+        :param requests_per_session: The number of requests in each chat session
+        :param tool_delay_seconds: How long the llm of each tool takes before answering
+        :param timeout_seconds: The timeout for the server to start and for each request
+        """
+        self.num_sessions: int = num_sessions
+        self.requests_per_session: int = requests_per_session
+        self.tool_delay_seconds: float = tool_delay_seconds
+        self.timeout_seconds: float = timeout_seconds
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run the benchmark
+        :return: A report dictionary of the results
+        """
+        report: Dict[str, Any] = {
+            "ToolDelaySeconds": self.tool_delay_seconds,
+        }
+        # A max_concurrent_tool_calls of 0 means no limit
+        for name, max_concurrent_tool_calls in (("Serial", 1), ("Concurrent", 0)):
+            with tempfile.TemporaryDirectory(prefix="neuro_san_tool_calls_") as registry_dir:
+                manifest_file: str = self.write_registry(registry_dir, max_concurrent_tool_calls)
+                report[name] = self.measure(manifest_file)
+
+        serial: float = report.get("Serial").get("TotalLatencySeconds", {}).get("p50", 0.0)
+        concurrent: float = report.get("Concurrent").get("TotalLatencySeconds", {}).get("p50", 0.0)
+        report["MedianSpeedup"] = serial / concurrent if concurrent > 0.0 else 0.0
+        return report
+
+    def write_registry(self, registry_dir: str, max_concurrent_tool_calls: int) -> str:
+        """
+        Write a manifest with a copy of the chat_mock_llm_scripted network
+        whose tools take their time and whose tool calls are limited as given.
+        :param registry_dir: The directory to write the files to
+        :param max_concurrent_tool_calls: The number of tool calls of one turn to make at once
+        :return: The path to the manifest file
+        """
+        network_file: str = REGISTRIES_DIR.get_file_in_basis(f"{self.AGENT_NAME}.hocon")
+        network = AgentNetworkRestorer().restore(file_reference=network_file)
+        # Round trip through JSON for a plain dictionary that can be modified
+        config: Dict[str, Any] = json.loads(json.dumps(network.get_config()))
+        config["max_concurrent_tool_calls"] = max_concurrent_tool_calls
+
+        front_man: str = network.find_front_man()
+        for tool in config.get("tools"):
+            if tool.get("name") == front_man:
+                continue
+            llm_config: Dict[str, Any] = tool.get("llm_config")
+            for one_config in [llm_config] + llm_config.get("fallbacks", []):
+                one_config["time_to_first_token_seconds"] = self.tool_delay_seconds
+
+        # JSON is valid HOCON
+        with open(os.path.join(registry_dir, f"{self.AGENT_NAME}.hocon"), "w", encoding="utf-8") as network_out:
+            json.dump(config, network_out, indent=4)
+        manifest_file: str = os.path.join(registry_dir, "manifest.hocon")
+        with open(manifest_file, "w", encoding="utf-8") as manifest_out:
+            json.dump({f"{self.AGENT_NAME}.hocon": True}, manifest_out, indent=4)
+        return manifest_file
+
+    def measure(self, manifest_file: str) -> Dict[str, Any]:
+        """
+        :param manifest_file: The manifest for the server to serve
+        :return: The report of a load test against the network
+        """
+        server = LoadTestServer(manifest_file=manifest_file, timeout_seconds=self.timeout_seconds)
+        server.start()
+        try:
+            driver = LoadTestDriver(server.http_port, self.AGENT_NAME,
+                                    num_sessions=self.num_sessions,
+                                    requests_per_session=self.requests_per_session,
+                                    executor_pool=server.get_executor_pool(),
+                                    timeout_seconds=self.timeout_seconds)
+            return asyncio.run(driver.run())
+        finally:
+            server.stop()
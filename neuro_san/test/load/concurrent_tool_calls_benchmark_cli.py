@@ -0,0 +1,91 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+import argparse
+import json
+import sys
+
+from neuro_san.test.load.concurrent_tool_calls_benchmark import ConcurrentToolCallsBenchmark
+
+
+class ConcurrentToolCallsBenchmarkCli:
+    """
+    Command-line tool for measuring the wall-clock time of requests to a multi-agent network
+    whose front man calls several tools in one turn, with those tool calls made one at a time
+    and all at once, without calling any LLM provider.
+    A JSON report is printed.
+
+    Usage:
+        python -m neuro_san.test.load.concurrent_tool_calls_benchmark_cli
+        python -m neuro_san.test.load.concurrent_tool_calls_benchmark_cli --tool_delay_seconds 1.0
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.args = None
+
+    def main(self) -> int:
+        """
+        Main entry point for the concurrent tool calls benchmark CLI.
+
+        :return: Exit code (0 if every request succeeded, 1 otherwise)
+        """
+        self.parse_args()
+
+        benchmark = ConcurrentToolCallsBenchmark(num_sessions=self.args.sessions,
+                                                 requests_per_session=self.args.requests_per_session,
+                                                 tool_delay_seconds=self.args.tool_delay_seconds,
+                                                 timeout_seconds=self.args.timeout_seconds)
+        report: Dict[str, Any] = benchmark.run()
+
+        report_text: str = json.dumps(report, indent=4)
+        print(report_text)
+        if self.args.output_file:
+            with open(self.args.output_file, "w", encoding="utf-8") as output:
+                output.write(report_text)
+
+        for name in ("Serial", "Concurrent"):
+            if report.get(name).get("Errors") > 0:
+                return 1
+        return 0
+
+    def parse_args(self):
+        """
+        Parse command line arguments.
+        """
+        arg_parser = argparse.ArgumentParser(
+            description="Measure tool calls of one turn made one at a time against all at once."
+        )
+        arg_parser.add_argument("--sessions", type=int, default=4,
+                                help="Number of chat sessions running at the same time")
+        arg_parser.add_argument("--requests_per_session", type=int, default=5,
+                                help="Number of requests in each chat session")
+        arg_parser.add_argument("--tool_delay_seconds", type=float, default=0.2,
+                                help="How long the llm of each tool takes before answering")
+        arg_parser.add_argument("--timeout_seconds", type=float, default=300.0,
+                                help="Timeout for the server to start and for each request")
+        arg_parser.add_argument("--output_file", type=str, default=None,
+                                help="File to write the JSON report to, in addition to stdout")
+        self.args = arg_parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(ConcurrentToolCallsBenchmarkCli().main())
@@ -0,0 +1,77 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+import asyncio
+import os
+import threading
+
+from neuro_san.internals.authorization.null.always_yes_authorizer import AlwaysYesAuthorizer
+
+
+class DelayedAuthorizer(AlwaysYesAuthorizer):
+    """
+    Authorizer that lets all requests through, like the AlwaysYesAuthorizer,
+    but takes its time doing so, like a remote authorization service would.
+
+    Use it by setting the AGENT_AUTHORIZER env var to
+    neuro_san.test.load.delayed_authorizer.DelayedAuthorizer.
+    The delay of each authorize() call is set by the AGENT_TEST_AUTHORIZER_DELAY_SECONDS env var.
+    The delay is spent asynchronously, and how many calls are in flight at once is recorded.
+    """
+
+    # Statistics across all instances, as instances are created by the AuthorizerFactory
+    lock = threading.Lock()
+    num_authorizations: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    def __init__(self):
+        """
+        Constructor.
+        """
+        super().__init__()
+        self.delay_seconds: float = float(os.environ.get("AGENT_TEST_AUTHORIZER_DELAY_SECONDS", "0.01"))
+
+    async def authorize(self, actor: Dict[str, Any], action: str, resource: Dict[str, Any]) -> bool:
+        """
+        :param actor: The actor dictionary with the keys "type" and "id" identifying what
+                      is seeking permission.
+        :param action:  The action for which the user is asking permission for.
+        :param resource: The resource dictionary with the keys "type" and "id" identifying
+                      just what is to be authorized for use.
+        :return: True, after the delay
+        """
+        with DelayedAuthorizer.lock:
+            DelayedAuthorizer.num_authorizations += 1
+            DelayedAuthorizer.in_flight += 1
+            DelayedAuthorizer.max_in_flight = max(DelayedAuthorizer.max_in_flight, DelayedAuthorizer.in_flight)
+        try:
+            await asyncio.sleep(self.delay_seconds)
+        finally:
+            with DelayedAuthorizer.lock:
+                DelayedAuthorizer.in_flight -= 1
+        return await super().authorize(actor, action, resource)
+
+    @classmethod
+    def reset_statistics(cls):
+        """
+        Start counting anew
+        """
+        with cls.lock:
+            cls.num_authorizations = 0
+            cls.max_in_flight = cls.in_flight
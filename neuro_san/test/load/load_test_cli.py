@@ -0,0 +1,160 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+
+import argparse
+import asyncio
+import json
+import sys
+
+from neuro_san.test.load.load_test_driver import LoadTestDriver
+from neuro_san.test.load.load_test_server import LoadTestServer
+
+
+class LoadTestCli:
+    """
+    Command-line tool for load testing a neuro-san server without calling any LLM provider.
+
+    A real server (HTTP and MCP) is started within this process, hosting an agent network
+    answered by a DelayedChatMockLlm. A number of concurrent streaming chat sessions
+    are then run against it, after which a JSON report of latencies, throughput
+    and resource usage is printed.
+
+    Usage:
+        python -m neuro_san.test.load.load_test_cli --sessions 50 --requests_per_session 20
+        python -m neuro_san.test.load.load_test_cli --protocol mcp --time_to_first_token_seconds 0.5
+        python -m neuro_san.test.load.load_test_cli --agent load_test_external --external_agents_in_process compare
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.args = None
+
+    def main(self) -> int:
+        """
+        Main entry point for the load test CLI.
+
+        :return: Exit code (0 if all requests succeeded, 1 otherwise)
+        """
+        self.parse_args()
+
+        report: Dict[str, Any] = None
+        num_errors: int = 0
+        if self.args.external_agents_in_process == "compare":
+            report = {
+                "InProcess": self.run_load_test(external_agents_in_process=True),
+                "OverHttp": self.run_load_test(external_agents_in_process=False),
+            }
+            num_errors = report["InProcess"].get("Errors", 0) + report["OverHttp"].get("Errors", 0)
+        else:
+            report = self.run_load_test(self.args.external_agents_in_process == "true")
+            num_errors = report.get("Errors", 0)
+
+        report_text: str = json.dumps(report, indent=4)
+        print(report_text)
+        if self.args.output_file:
+            with open(self.args.output_file, "w", encoding="utf-8") as output:
+                output.write(report_text)
+
+        if num_errors > 0:
+            return 1
+        return 0
+
+    def run_load_test(self, external_agents_in_process: bool) -> Dict[str, Any]:
+        """
+        Start a server, run the load test against it and stop it again.
+
+        :param external_agents_in_process: When False, the server calls the external agents
+                    it hosts itself over http
+        :return: The report of the load test
+        """
+        server = LoadTestServer(time_to_first_token_seconds=self.args.time_to_first_token_seconds,
+                                seconds_per_token=self.args.seconds_per_token,
+                                manifest_file=self.args.manifest_file,
+                                http_port=self.args.http_port,
+                                max_concurrent_requests=self.args.max_concurrent_requests,
+                                external_agents_in_process=external_agents_in_process)
+        server.start()
+        try:
+            driver = LoadTestDriver(server.http_port,
+                                    self.args.agent,
+                                    protocol=self.args.protocol,
+                                    num_sessions=self.args.sessions,
+                                    requests_per_session=self.args.requests_per_session,
+                                    think_time_seconds=self.args.think_time_seconds,
+                                    user_text=self.args.user_text,
+                                    chat_filter_type=self.args.chat_filter,
+                                    executor_pool=server.get_executor_pool(),
+                                    sample_interval_seconds=self.args.sample_interval_seconds,
+                                    timeout_seconds=self.args.timeout_seconds)
+            return asyncio.run(driver.run())
+        finally:
+            server.stop()
+
+    def parse_args(self):
+        """
+        Parse command line arguments.
+        """
+        arg_parser = argparse.ArgumentParser(
+            description="Load test a neuro-san server against a mock LLM."
+        )
+        arg_parser.add_argument("--protocol", type=str, default="http", choices=LoadTestDriver.PROTOCOLS,
+                                help="Send requests to the http streaming_chat endpoint or as MCP tools/call")
+        arg_parser.add_argument("--sessions", type=int, default=10,
+                                help="Number of chat sessions running at the same time")
+        arg_parser.add_argument("--requests_per_session", type=int, default=10,
+                                help="Number of requests in each chat session")
+        arg_parser.add_argument("--think_time_seconds", type=float, default=0.0,
+                                help="Time each session waits between a response and its next request")
+        arg_parser.add_argument("--time_to_first_token_seconds", type=float, default=0.0,
+                                help="Delay of the mock LLM before the first chunk of its response")
+        arg_parser.add_argument("--seconds_per_token", type=float, default=0.0,
+                                help="Delay of the mock LLM before each subsequent chunk of its response")
+        arg_parser.add_argument("--user_text", type=str, default="Hello, load test!",
+                                help="Text of each chat request. The mock LLM echoes it one character at a time.")
+        arg_parser.add_argument("--chat_filter", type=str, default="MINIMAL", choices=["MINIMAL", "MAXIMAL"],
+                                help="MAXIMAL streams back all the messages of the agent network"
+                                     " instead of just the final answer")
+        arg_parser.add_argument("--manifest_file", type=str, default=None,
+                                help="Manifest of agent networks to serve instead of the mock one."
+                                     " Use with --agent.")
+        arg_parser.add_argument("--agent", type=str, default=LoadTestServer.DEFAULT_AGENT_NAME,
+                                help="Name of the agent network to send requests to")
+        arg_parser.add_argument("--http_port", type=int, default=0,
+                                help="Port for the server to listen on. 0 picks a free one.")
+        arg_parser.add_argument("--max_concurrent_requests", type=int, default=0,
+                                help="Server limit on requests served at the same time. 0 means no limit.")
+        arg_parser.add_argument("--external_agents_in_process", type=str, default="true",
+                                choices=["true", "false", "compare"],
+                                help="'false' calls external agents hosted by the server over http."
+                                     " 'compare' runs the load test both ways and reports on each."
+                                     f" Use with --agent {LoadTestServer.EXTERNAL_AGENT_NAME}"
+                                     " to call an external agent without any LLM.")
+        arg_parser.add_argument("--sample_interval_seconds", type=float, default=0.5,
+                                help="Time between samples of resource usage")
+        arg_parser.add_argument("--timeout_seconds", type=float, default=300.0,
+                                help="Timeout for each request")
+        arg_parser.add_argument("--output_file", type=str, default=None,
+                                help="File to write the JSON report to, in addition to stdout")
+        self.args = arg_parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(LoadTestCli().main())
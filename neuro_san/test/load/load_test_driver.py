@@ -0,0 +1,390 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import asyncio
+import time
+
+from aiohttp import ClientSession
+from aiohttp import ClientTimeout
+from aiohttp import TCPConnector
+
+from leaf_common.asyncio.asyncio_executor_pool import AsyncioExecutorPool
+
+from neuro_san.internals.graph.activations.coded_tool_thread_pool import CodedToolThreadPool
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+from neuro_san.service.mcp.interfaces.client_session_policy import MCP_PROTOCOL_VERSION
+from neuro_san.service.mcp.interfaces.client_session_policy import MCP_SESSION_ID
+from neuro_san.service.utils.service_resources import ServiceResources
+from neuro_san.session.line_delimited_json_framer import LineDelimitedJsonFramer
+from neuro_san.session.mcp_chat_response_dictionary_converter import McpChatResponseDictionaryConverter
+from neuro_san.session.mcp_service_agent_session import MCP_VERSION
+
+
+# pylint: disable=too-many-instance-attributes
+class LoadTestDriver:
+    """
+    Drives a number of concurrent streaming chat sessions against a running server
+    and reports on latencies, throughput and the resources used along the way.
+
+    Each session is a conversation of a number of requests, each one continuing
+    the chat_context of the last, with some think time in between.
+    Resources are sampled from the current process, so this is meant to be run
+    in the same process as the server (see LoadTestServer).
+    """
+
+    PROTOCOLS: List[str] = ["http", "mcp"]
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, port: int,
+                 agent_name: str,
+                 protocol: str = "http",
+                 num_sessions: int = 10,
+                 requests_per_session: int = 10,
+                 think_time_seconds: float = 0.0,
+                 user_text: str = "Hello, load test!",
+                 chat_filter_type: str = "MINIMAL",
+                 executor_pool: AsyncioExecutorPool = None,
+                 sample_interval_seconds: float = 0.5,
+                 timeout_seconds: float = 300.0,
+                 host: str = "localhost"):
+        """
+        Constructor
+
+        :param port: The port of the server
+        :param agent_name: The name of the agent network to chat with
+        :param protocol: Either "http" for the streaming_chat endpoint or "mcp" for MCP tools/call
+        :param num_sessions: The number of sessions running at the same time
+        :param requests_per_session: The number of chat requests in each session
+        :param think_time_seconds: The time each session waits between receiving
+                    a full response and sending its next request
+        :param user_text: The text of each chat request
+        :param chat_filter_type: The chat_filter_type of each chat request. "MAXIMAL" streams back
+                    all the messages of the agent network instead of just the final answer.
+        :param executor_pool: The AsyncioExecutorPool of the server, if its occupancy is to be reported
+        :param sample_interval_seconds: The time between samples of resource usage
+        :param timeout_seconds: The timeout for each request
+        :param host: The host of the server
+        """
+        if protocol not in self.PROTOCOLS:
+            raise ValueError(f"protocol must be one of {self.PROTOCOLS}, not {protocol}")
+
+        self.host: str = host
+        self.port: int = port
+        self.agent_name: str = agent_name
+        self.protocol: str = protocol
+        self.num_sessions: int = num_sessions
+        self.requests_per_session: int = requests_per_session
+        self.think_time_seconds: float = think_time_seconds
+        self.user_text: str = user_text
+        self.chat_filter_type: str = chat_filter_type
+        self.executor_pool: AsyncioExecutorPool = executor_pool
+        self.sample_interval_seconds: float = sample_interval_seconds
+        self.timeout_seconds: float = timeout_seconds
+
+        # Per successful request
+        self.ttfb_seconds: List[float] = []
+        self.total_seconds: List[float] = []
+        self.num_messages: int = 0
+        self.errors: List[str] = []
+
+        # Per resource sample
+        self.samples: List[Dict[str, int]] = []
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Run the load test
+        :return: A report dictionary of the results
+        """
+        # No connection limit, so that the only limits are those of the server.
+        connector = TCPConnector(limit=0)
+        async with ClientSession(connector=connector, timeout=ClientTimeout(self.timeout_seconds)) as session:
+
+            # Warm up the server with a request that is not counted,
+            # so that one-time loading of llm and toolbox info does not skew the numbers.
+            await self.run_session(session, num_requests=1)
+            self.reset()
+
+            keep_sampling = asyncio.Event()
+            keep_sampling.set()
+            sampler = asyncio.create_task(self.sample_resources(keep_sampling))
+
+            start: float = time.monotonic()
+            await asyncio.gather(*[self.run_session(session, self.requests_per_session)
+                                   for _ in range(self.num_sessions)])
+            wall_seconds: float = time.monotonic() - start
+
+            keep_sampling.clear()
+            await sampler
+
+        return self.build_report(wall_seconds)
+
+    def reset(self):
+        """
+        Forget about everything measured so far
+        """
+        self.ttfb_seconds = []
+        self.total_seconds = []
+        self.num_messages = 0
+        self.errors = []
+        self.samples = []
+
+    async def run_session(self, session: ClientSession, num_requests: int):
+        """
+        Run a single conversation
+        :param session: The aiohttp ClientSession to send requests with
+        :param num_requests: The number of requests in the conversation
+        """
+        mcp_headers: Dict[str, str] = None
+        chat_context: Dict[str, Any] = None
+        for index in range(num_requests):
+            if index > 0 and self.think_time_seconds > 0.0:
+                await asyncio.sleep(self.think_time_seconds)
+            try:
+                if self.protocol == "mcp":
+                    if mcp_headers is None:
+                        mcp_headers = await self.initialize_mcp(session)
+                    chat_context = await self.mcp_request(session, mcp_headers, chat_context)
+                else:
+                    chat_context = await self.http_request(session, chat_context)
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                self.errors.append(f"{type(exception).__name__}: {exception}")
+
+    def formulate_chat_request(self, chat_context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param chat_context: The chat_context of the last response in the conversation, if any
+        :return: A chat request dictionary
+        """
+        chat_request: Dict[str, Any] = {
+            "user_message": {
+                "type": ChatMessageType.HUMAN.name,
+                "text": self.user_text
+            },
+            "chat_filter": {
+                "chat_filter_type": self.chat_filter_type
+            }
+        }
+        if chat_context:
+            chat_request["chat_context"] = chat_context
+        return chat_request
+
+    async def http_request(self, session: ClientSession, chat_context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a single request to the streaming_chat endpoint and time its response
+        :param session: The aiohttp ClientSession to send the request with
+        :param chat_context: The chat_context of the last response in the conversation, if any
+        :return: The chat_context to continue the conversation with
+        """
+        path: str = f"http://{self.host}:{self.port}/api/v1/{self.agent_name}/streaming_chat"
+        request_dict: Dict[str, Any] = self.formulate_chat_request(chat_context)
+        start: float = time.monotonic()
+        async with session.post(path, json=request_dict) as response:
+            response.raise_for_status()
+            messages, ttfb = await self.read_messages(response, start)
+        self.record(start, ttfb, messages)
+
+        return self.get_chat_context(messages, chat_context)
+
+    async def initialize_mcp(self, session: ClientSession) -> Dict[str, str]:
+        """
+        Do the MCP handshake for one session
+        :param session: The aiohttp ClientSession to send the requests with
+        :return: The headers to send with subsequent MCP requests of the session
+        """
+        path: str = f"http://{self.host}:{self.port}/mcp"
+        handshake_dict: Dict[str, Any] = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": MCP_VERSION,
+                "capabilities": {},
+                "clientInfo": {
+                    "name": "Neuro SAN Load Test",
+                    "version": "1.0.0"
+                }
+            }
+        }
+        headers: Dict[str, str] = {}
+        async with session.post(path, json=handshake_dict) as response:
+            response.raise_for_status()
+            result: Dict[str, Any] = await response.json()
+            session_id: str = response.headers.get(MCP_SESSION_ID)
+        if session_id:
+            headers[MCP_SESSION_ID] = session_id
+        headers[MCP_PROTOCOL_VERSION] = result.get("result", {}).get("protocolVersion", MCP_VERSION)
+
+        ack_dict: Dict[str, Any] = {
+            "jsonrpc": "2.0",
+            "method": "notifications/initialized"
+        }
+        async with session.post(path, json=ack_dict, headers=headers) as response:
+            response.raise_for_status()
+        return headers
+
+    async def mcp_request(self, session: ClientSession, headers: Dict[str, str],
+                          chat_context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a single MCP tools/call request and time its response
+        :param session: The aiohttp ClientSession to send the request with
+        :param headers: The MCP headers of the session
+        :param chat_context: The chat_context of the last response in the conversation, if any
+        :return: The chat_context to continue the conversation with
+        """
+        path: str = f"http://{self.host}:{self.port}/mcp"
+        mcp_payload: Dict[str, Any] = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {
+                "name": self.agent_name,
+                "arguments": self.formulate_chat_request(chat_context),
+            },
+        }
+        start: float = time.monotonic()
+        async with session.post(path, json=mcp_payload, headers=headers) as response:
+            response.raise_for_status()
+            results, ttfb = await self.read_messages(response, start)
+        self.record(start, ttfb, results)
+
+        for result in results:
+            if result.get("error") is not None:
+                raise ValueError(f"MCP error: {result.get('error')}")
+        converter = McpChatResponseDictionaryConverter()
+        messages: List[Dict[str, Any]] = [converter.to_dict(result) for result in results]
+        return self.get_chat_context(messages, chat_context)
+
+    @staticmethod
+    async def read_messages(response, start: float) -> Tuple[List[Dict[str, Any]], float]:
+        """
+        :param response: The aiohttp response to read line-delimited JSON messages from
+        :param start: The monotonic time the request was sent
+        :return: A tuple of the list of messages and the seconds until the first byte of them arrived
+        """
+        ttfb: float = None
+        messages: List[Dict[str, Any]] = []
+        framer = LineDelimitedJsonFramer()
+        async for data in response.content.iter_any():
+            if ttfb is None:
+                ttfb = time.monotonic() - start
+            messages.extend(framer.feed(data))
+        messages.extend(framer.finish())
+        if ttfb is None:
+            ttfb = time.monotonic() - start
+        return messages, ttfb
+
+    def record(self, start: float, ttfb: float, messages: List[Dict[str, Any]]):
+        """
+        Record the measurements for a single successful request
+        :param start: The monotonic time the request was sent
+        :param ttfb: The seconds until the first byte of the response
+        :param messages: The messages of the response
+        """
+        self.total_seconds.append(time.monotonic() - start)
+        self.ttfb_seconds.append(ttfb)
+        self.num_messages += len(messages)
+
+    @staticmethod
+    def get_chat_context(messages: List[Dict[str, Any]], chat_context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :param messages: The chat response dictionaries of a single request
+        :param chat_context: The chat_context sent with the request
+        :return: The chat_context of the last message that has one,
+                or the one sent if there is none
+        """
+        for message in reversed(messages):
+            new_chat_context: Dict[str, Any] = message.get("response", {}).get("chat_context")
+            if new_chat_context:
+                return new_chat_context
+        return chat_context
+
+    async def sample_resources(self, keep_sampling: asyncio.Event):
+        """
+        Periodically sample resource usage until told to stop
+        :param keep_sampling: An asyncio.Event which is cleared when sampling is to stop
+        """
+        loop = asyncio.get_running_loop()
+        while keep_sampling.is_set():
+            # Enumerating file descriptors can take a while, so keep it off this loop.
+            sample: Dict[str, int] = await loop.run_in_executor(None, self.take_sample)
+            self.samples.append(sample)
+            await asyncio.sleep(self.sample_interval_seconds)
+
+    def take_sample(self) -> Dict[str, int]:
+        """
+        :return: A dictionary of the current resource usage of this process
+        """
+        fd_dict, _, _ = ServiceResources.get_fd_usage()
+        sample: Dict[str, int] = {
+            "RssBytes": ServiceResources.get_rss_bytes(),
+            "OpenFds": fd_dict.get("total", fd_dict.get("total_handles", 0)),
+            "CodedToolThreadsRunning": CodedToolThreadPool.get_stats().get("Running"),
+        }
+        if self.executor_pool is not None:
+            with self.executor_pool.lock:
+                sample["ExecutorsUsed"] = len(self.executor_pool.pool_used)
+                sample["ExecutorsAvailable"] = len(self.executor_pool.pool_available)
+        return sample
+
+    def build_report(self, wall_seconds: float) -> Dict[str, Any]:
+        """
+        :param wall_seconds: The wall clock time the load test took
+        :return: A report dictionary of the results
+        """
+        num_requests: int = len(self.total_seconds)
+        report: Dict[str, Any] = {
+            "Protocol": self.protocol,
+            "Sessions": self.num_sessions,
+            "RequestsPerSession": self.requests_per_session,
+            "ThinkTimeSeconds": self.think_time_seconds,
+            "ChatFilterType": self.chat_filter_type,
+            "Requests": num_requests,
+            "Errors": len(self.errors),
+            "WallSeconds": wall_seconds,
+            "RequestsPerSecond": num_requests / wall_seconds if wall_seconds > 0 else 0.0,
+            "MessagesPerSecond": self.num_messages / wall_seconds if wall_seconds > 0 else 0.0,
+            "TimeToFirstByteSeconds": self.summarize(self.ttfb_seconds),
+            "TotalLatencySeconds": self.summarize(self.total_seconds),
+        }
+        for key in ("RssBytes", "OpenFds", "CodedToolThreadsRunning", "ExecutorsUsed", "ExecutorsAvailable"):
+            values: List[int] = [sample[key] for sample in self.samples if key in sample]
+            if values:
+                report[f"Max{key}"] = max(values)
+        if self.errors:
+            # The first few are enough to know what went wrong
+            report["FirstErrors"] = self.errors[:5]
+        return report
+
+    @staticmethod
+    def summarize(values: List[float]) -> Dict[str, float]:
+        """
+        :param values: A list of measurements
+        :return: A dictionary of percentiles of the measurements
+        """
+        if not values:
+            return {}
+        ordered: List[float] = sorted(values)
+        summary: Dict[str, float] = {}
+        for percentile in (50, 95, 99):
+            # Nearest-rank percentile
+            rank: int = max(1, -(-percentile * len(ordered) // 100))
+            summary[f"p{percentile}"] = ordered[rank - 1]
+        summary["max"] = ordered[-1]
+        return summary
@@ -0,0 +1,253 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import time
+
+from asyncio import AbstractEventLoop
+from threading import Thread
+
+from leaf_common.asyncio.asyncio_executor_pool import AsyncioExecutorPool
+
+from neuro_san.service.main_loop.server_main_loop import ServerMainLoop
+from neuro_san.service.utils.server_status import ServerStatus
+
+
+# pylint: disable=too-many-instance-attributes
+class LoadTestServer:
+    """
+    Runs a real ServerMainLoop (HTTP and MCP) on a thread of the current process,
+    so that its resource usage and executor pool can be watched while it is under load.
+
+    Unless told otherwise, the server hosts an agent network whose front man
+    is answered by a DelayedChatMockLlm, so no LLM provider is ever called.
+    It also hosts another one whose front man calls the first as an external agent,
+    following the script of a ScriptedChatMockLlm.
+    """
+
+    DEFAULT_AGENT_NAME: str = "load_test"
+
+    # Calls the DEFAULT_AGENT_NAME network as an external agent hosted by the same server
+    EXTERNAL_AGENT_NAME: str = "load_test_external"
+
+    TIMEOUT_TO_START_SECONDS: float = 30.0
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, time_to_first_token_seconds: float = 0.0,
+                 seconds_per_token: float = 0.0,
+                 manifest_file: str = None,
+                 http_port: int = 0,
+                 max_concurrent_requests: int = 0,
+                 external_agents_in_process: bool = True,
+                 timeout_seconds: float = TIMEOUT_TO_START_SECONDS):
+        """
+        Constructor
+
+        :param time_to_first_token_seconds: Delay of the mock LLM before its first chunk
+        :param seconds_per_token: Delay of the mock LLM before each subsequent chunk
+        :param manifest_file: An optional manifest file to serve instead of the generated
+                    mock agent network. Networks in it are served as they are, real LLMs and all.
+        :param http_port: The port to serve on. 0 means to pick a free one.
+        :param max_concurrent_requests: The server's admission limit. 0 means no limit.
+        :param external_agents_in_process: When False, external agents hosted by the server
+                    are called over http, as other servers would call them.
+        :param timeout_seconds: How long start() waits for the server to be ready
+        """
+        self.time_to_first_token_seconds: float = time_to_first_token_seconds
+        self.seconds_per_token: float = seconds_per_token
+        self.manifest_file: str = manifest_file
+        self.http_port: int = http_port
+        self.max_concurrent_requests: int = max_concurrent_requests
+        self.external_agents_in_process: bool = external_agents_in_process
+        self.timeout_seconds: float = timeout_seconds
+
+        self.main_loop: ServerMainLoop = None
+        self.loop: AbstractEventLoop = None
+        self.thread: Thread = None
+        self.temp_dir: tempfile.TemporaryDirectory = None
+        self.previous_manifest_file: str = None
+
+    def start(self):
+        """
+        Start the server and wait until it is ready to take requests.
+        """
+        if self.http_port == 0:
+            self.http_port = self.find_free_port()
+
+        manifest_file: str = self.manifest_file
+        if manifest_file is None:
+            # pylint: disable=consider-using-with
+            self.temp_dir = tempfile.TemporaryDirectory(prefix="neuro_san_load_test_")
+            manifest_file = self.write_mock_registry(self.temp_dir.name)
+
+        # The manifest is only read from the environment
+        self.previous_manifest_file = os.environ.get("AGENT_MANIFEST_FILE")
+        os.environ["AGENT_MANIFEST_FILE"] = manifest_file
+
+        args: List[str] = [
+            "--http_port", str(self.http_port),
+            "--request_limit", "-1",
+            "--max_concurrent_requests", str(self.max_concurrent_requests),
+            "--http_server_instances", "1",
+            "--http_resources_monitor_interval_seconds", "0",
+            "--mcp_enable", "true",
+            "--external_agents_in_process", str(self.external_agents_in_process).lower(),
+        ]
+        self.main_loop = ServerMainLoop()
+        self.thread = Thread(target=self.run, args=(args,), name="load_test_server", daemon=True)
+        self.thread.start()
+
+        deadline: float = time.monotonic() + self.timeout_seconds
+        while not self.is_ready():
+            if not self.thread.is_alive():
+                raise RuntimeError("Load test server exited before it was ready")
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Load test server not ready after {self.timeout_seconds} seconds")
+            time.sleep(0.05)
+
+    def run(self, args: List[str]):
+        """
+        Thread entry point. Tornado serves on whatever asyncio event loop is current,
+        so give this thread one of its own that can be stopped from the outside.
+        :param args: The command line arguments for the ServerMainLoop
+        """
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.main_loop.main_loop(args)
+
+    def is_ready(self) -> bool:
+        """
+        :return: True if the server is taking requests
+        """
+        server_status: ServerStatus = self.main_loop.server_context.get_server_status()
+        return self.loop is not None and server_status is not None and server_status.is_server_ready()
+
+    def stop(self):
+        """
+        Stop the server and clean up after it.
+        """
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        if self.thread is not None:
+            self.thread.join(timeout=10.0)
+            self.thread = None
+        if self.main_loop is not None:
+            self.get_executor_pool().shutdown()
+
+        if self.previous_manifest_file is None:
+            os.environ.pop("AGENT_MANIFEST_FILE", None)
+        else:
+            os.environ["AGENT_MANIFEST_FILE"] = self.previous_manifest_file
+
+        if self.temp_dir is not None:
+            self.temp_dir.cleanup()
+            self.temp_dir = None
+
+    def get_executor_pool(self) -> AsyncioExecutorPool:
+        """
+        :return: The AsyncioExecutorPool the server runs its agent sessions on
+        """
+        return self.main_loop.server_context.get_executor_pool()
+
+    def write_mock_registry(self, registry_dir: str) -> str:
+        """
+        Write a manifest with an agent network using a DelayedChatMockLlm
+        and another one which calls the first as an external agent.
+        :param registry_dir: The directory to write the files to
+        :return: The path to the manifest file
+        """
+        # JSON is valid HOCON
+        agent_network: Dict[str, Any] = {
+            "metadata": {
+                "description": "Load testing neuro-san infrastructure with a mock llm.",
+                "tags": ["test"],
+            },
+            "llm_config": {
+                "class": "neuro_san.test.llms.delayed_chat_mock_llm.DelayedChatMockLlm",
+                "model_name": "echo",
+                "time_to_first_token_seconds": self.time_to_first_token_seconds,
+                "seconds_per_token": self.seconds_per_token,
+            },
+            "tools": [
+                {
+                    "name": "echoer",
+                    "function": {
+                        "description": "This is a mock llm that only echoes the input.",
+                    },
+                    "instructions": "System prompt for the mock llm",
+                },
+            ],
+        }
+        external_agent_network: Dict[str, Any] = {
+            "metadata": {
+                "description": "Load testing calls to external agents hosted by the same server.",
+                "tags": ["test"],
+            },
+            "llm_config": {
+                "class": "neuro_san.test.llms.scripted_chat_mock_llm.ScriptedChatMockLlm",
+                "model_name": "scripted",
+                "script": [
+                    {"tool_calls": [{"name": f"__{self.DEFAULT_AGENT_NAME}", "args": {}}]},
+                    {"content": f"The {self.DEFAULT_AGENT_NAME} network has answered."},
+                ],
+            },
+            "tools": [
+                {
+                    "name": "caller",
+                    "function": {
+                        "description": f"Calls the {self.DEFAULT_AGENT_NAME} network as an external agent.",
+                    },
+                    "instructions": "System prompt for the scripted mock llm",
+                    "tools": [f"/{self.DEFAULT_AGENT_NAME}"],
+                },
+            ],
+        }
+        manifest: Dict[str, Any] = {
+            f"{self.DEFAULT_AGENT_NAME}.hocon": {
+                "serve": True,
+                "mcp": True,
+            },
+            f"{self.EXTERNAL_AGENT_NAME}.hocon": True,
+        }
+
+        for agent_name, network in ((self.DEFAULT_AGENT_NAME, agent_network),
+                                    (self.EXTERNAL_AGENT_NAME, external_agent_network)):
+            network_file: str = os.path.join(registry_dir, f"{agent_name}.hocon")
+            with open(network_file, "w", encoding="utf-8") as network_out:
+                json.dump(network, network_out, indent=4)
+
+        manifest_file: str = os.path.join(registry_dir, "manifest.hocon")
+        with open(manifest_file, "w", encoding="utf-8") as manifest_out:
+            json.dump(manifest, manifest_out, indent=4)
+
+        return manifest_file
+
+    @staticmethod
+    def find_free_port() -> int:
+        """
+        :return: A port number on localhost that nothing is listening on right now
+        """
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("localhost", 0))
+            return sock.getsockname()[1]
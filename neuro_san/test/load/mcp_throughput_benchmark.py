@@ -0,0 +1,154 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import asyncio
+import time
+
+from aiohttp import ClientSession
+from aiohttp import ClientTimeout
+from aiohttp import TCPConnector
+
+from neuro_san.test.load.load_test_driver import LoadTestDriver
+from neuro_san.test.load.load_test_server import LoadTestServer
+
+
+class McpThroughputBenchmark:
+    """
+    Measures how many MCP "tools/list" and "tools/call" requests per second a server
+    takes on its mock agent network, with a number of requests going at once.
+
+    The mock network answers without any delay, so what is measured is the MCP handling
+    around the agent network: validating requests, listing tools and converting responses.
+    """
+
+    METHODS: List[str] = ["tools/list", "tools/call"]
+
+    def __init__(self, num_requests: int = 500,
+                 concurrency: int = 8,
+                 timeout_seconds: float = 300.0):
+        """
+        Constructor
+
+        :param num_requests: The number of requests to send for each method
+        :param concurrency: The number of requests going at once
+        :param timeout_seconds: The timeout for the server to start and for each request
+        """
+        self.num_requests: int = num_requests
+        self.concurrency: int = concurrency
+        self.timeout_seconds: float = timeout_seconds
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run the benchmark
+        :return: A report dictionary of the results
+        """
+        server = LoadTestServer(timeout_seconds=self.timeout_seconds)
+        try:
+            server.start()
+            report: Dict[str, Any] = {
+                "Requests": self.num_requests,
+                "Concurrency": self.concurrency,
+            }
+            for method in self.METHODS:
+                report[method] = asyncio.run(self.measure(server.http_port, method))
+        finally:
+            server.stop()
+
+        return report
+
+    async def measure(self, port: int, method: str) -> Dict[str, Any]:
+        """
+        :param port: The port of the server
+        :param method: The MCP method to send requests for
+        :return: A dictionary of the throughput, latencies and errors of the requests
+        """
+        driver = LoadTestDriver(port, LoadTestServer.DEFAULT_AGENT_NAME, protocol="mcp",
+                                timeout_seconds=self.timeout_seconds)
+        seconds: List[float] = []
+        errors: List[str] = []
+
+        # No connection limit, so that the only limits are those of the server.
+        connector = TCPConnector(limit=0)
+        async with ClientSession(connector=connector, timeout=ClientTimeout(self.timeout_seconds)) as session:
+            headers: Dict[str, str] = await driver.initialize_mcp(session)
+
+            # Warm up with a request that is not counted
+            await self.send_request(driver, session, headers, method)
+
+            counts: List[int] = [self.num_requests // self.concurrency] * self.concurrency
+            for index in range(self.num_requests % self.concurrency):
+                counts[index] += 1
+
+            start: float = time.perf_counter()
+            await asyncio.gather(*[self.send_requests(driver, session, headers, method, count, seconds, errors)
+                                   for count in counts])
+            wall_seconds: float = time.perf_counter() - start
+
+        report: Dict[str, Any] = {
+            "RequestsPerSecond": len(seconds) / wall_seconds,
+            "LatencySeconds": LoadTestDriver.summarize(seconds),
+            "Errors": len(errors),
+        }
+        if errors:
+            # The first few are enough to know what went wrong
+            report["FirstErrors"] = errors[:5]
+        return report
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    async def send_requests(self, driver: LoadTestDriver, session: ClientSession, headers: Dict[str, str],
+                            method: str, count: int, seconds: List[float], errors: List[str]):
+        """
+        Send a number of requests one after the other
+        :param driver: The LoadTestDriver to send tools/call requests with
+        :param session: The aiohttp ClientSession to send requests with
+        :param headers: The MCP headers of the session
+        :param method: The MCP method to send requests for
+        :param count: The number of requests to send
+        :param seconds: The list to add the seconds each successful request took to
+        :param errors: The list to add a description of each failed request to
+        """
+        for _ in range(count):
+            start: float = time.perf_counter()
+            try:
+                await self.send_request(driver, session, headers, method)
+                seconds.append(time.perf_counter() - start)
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                errors.append(f"{type(exception).__name__}: {exception}")
+
+    async def send_request(self, driver: LoadTestDriver, session: ClientSession, headers: Dict[str, str],
+                           method: str):
+        """
+        Send a single request and check its response
+        :param driver: The LoadTestDriver to send tools/call requests with
+        :param session: The aiohttp ClientSession to send requests with
+        :param headers: The MCP headers of the session
+        :param method: The MCP method to send a request for
+        """
+        if method == "tools/call":
+            await driver.mcp_request(session, headers, None)
+            return
+
+        path: str = f"http://{driver.host}:{driver.port}/mcp"
+        payload: Dict[str, Any] = {"jsonrpc": "2.0", "id": 1, "method": method}
+        async with session.post(path, json=payload, headers=headers) as response:
+            response.raise_for_status()
+            result: Dict[str, Any] = await response.json()
+        if not result.get("result", {}).get("tools"):
+            raise ValueError(f"No tools listed: {result.get('error')}")
@@ -0,0 +1,87 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+import argparse
+import json
+import sys
+
+from neuro_san.test.load.mcp_throughput_benchmark import McpThroughputBenchmark
+
+
+class McpThroughputBenchmarkCli:
+    """
+    Command-line tool for measuring how many MCP tools/list and tools/call requests
+    per second a server takes on a mock agent network, without calling any LLM provider.
+    A JSON report is printed.
+
+    Usage:
+        python -m neuro_san.test.load.mcp_throughput_benchmark_cli
+        python -m neuro_san.test.load.mcp_throughput_benchmark_cli --requests 2000 --concurrency 32
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.args = None
+
+    def main(self) -> int:
+        """
+        Main entry point for the MCP throughput benchmark CLI.
+
+        :return: Exit code (0 if every request succeeded, 1 otherwise)
+        """
+        self.parse_args()
+
+        benchmark = McpThroughputBenchmark(num_requests=self.args.requests,
+                                           concurrency=self.args.concurrency,
+                                           timeout_seconds=self.args.timeout_seconds)
+        report: Dict[str, Any] = benchmark.run()
+
+        report_text: str = json.dumps(report, indent=4)
+        print(report_text)
+        if self.args.output_file:
+            with open(self.args.output_file, "w", encoding="utf-8") as output:
+                output.write(report_text)
+
+        for method in McpThroughputBenchmark.METHODS:
+            if report.get(method).get("Errors") > 0:
+                return 1
+        return 0
+
+    def parse_args(self):
+        """
+        Parse command line arguments.
+        """
+        arg_parser = argparse.ArgumentParser(
+            description="Measure the throughput of MCP tools/list and tools/call requests on a mock agent network."
+        )
+        arg_parser.add_argument("--requests", type=int, default=500,
+                                help="Number of requests to send for each of tools/list and tools/call")
+        arg_parser.add_argument("--concurrency", type=int, default=8,
+                                help="Number of requests going at once")
+        arg_parser.add_argument("--timeout_seconds", type=float, default=300.0,
+                                help="Timeout for the server to start and for each request")
+        arg_parser.add_argument("--output_file", type=str, default=None,
+                                help="File to write the JSON report to, in addition to stdout")
+        self.args = arg_parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(McpThroughputBenchmarkCli().main())
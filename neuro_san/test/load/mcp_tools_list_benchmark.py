@@ -0,0 +1,174 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from aiohttp import ClientSession
+from aiohttp import ClientTimeout
+
+from neuro_san.service.utils.mcp_server_context import McpServerContext
+from neuro_san.test.load.delayed_authorizer import DelayedAuthorizer
+from neuro_san.test.load.load_test_driver import LoadTestDriver
+from neuro_san.test.load.load_test_server import LoadTestServer
+
+
+class McpToolsListBenchmark:
+    """
+    Measures how long MCP "tools/list" requests take on a server hosting many agent networks,
+    with an authorizer that takes its time on every check like a remote one would.
+
+    The same requests are timed with authorization checks made one at a time
+    and with up to a number of them at once.
+    The agent networks are generated, each answered by a DelayedChatMockLlm,
+    though no LLM is called to list them.
+    """
+
+    # The env vars that the benchmark sets up for its server
+    AUTHORIZER_ENV: Dict[str, str] = {
+        "AGENT_AUTHORIZER": "neuro_san.test.load.delayed_authorizer.DelayedAuthorizer",
+        "AGENT_TEST_AUTHORIZER_DELAY_SECONDS": None,
+    }
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(self, num_networks: int = 200,
+                 authorizer_delay_seconds: float = 0.01,
+                 num_requests: int = 10,
+                 max_concurrent_authorizations: int = 16,
+                 timeout_seconds: float = 300.0):
+        """
+        Constructor
+
+        :param num_networks: The number of agent networks the server hosts as MCP tools
+        :param authorizer_delay_seconds: How long each authorization check takes
+        :param num_requests: The number of tools/list requests to time for each setting
+        :param max_concurrent_authorizations: The number of authorization checks
+                    a request may have going at once, to compare with one at a time
+        :param timeout_seconds: The timeout for the server to start and for each request
+        """
+        self.num_networks: int = num_networks
+        self.authorizer_delay_seconds: float = authorizer_delay_seconds
+        self.num_requests: int = num_requests
+        self.max_concurrent_authorizations: int = max_concurrent_authorizations
+        self.timeout_seconds: float = timeout_seconds
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run the benchmark
+        :return: A report dictionary of the results
+        """
+        previous_env: Dict[str, str] = {key: os.environ.get(key) for key in self.AUTHORIZER_ENV}
+        os.environ["AGENT_AUTHORIZER"] = self.AUTHORIZER_ENV.get("AGENT_AUTHORIZER")
+        os.environ["AGENT_TEST_AUTHORIZER_DELAY_SECONDS"] = str(self.authorizer_delay_seconds)
+
+        with tempfile.TemporaryDirectory(prefix="neuro_san_tools_list_") as registry_dir:
+            server = LoadTestServer(manifest_file=self.write_registry(registry_dir),
+                                    timeout_seconds=self.timeout_seconds)
+            try:
+                server.start()
+                mcp_context: McpServerContext = server.main_loop.server_context.get_mcp_server_context()
+                report: Dict[str, Any] = {
+                    "Networks": self.num_networks,
+                    "AuthorizerDelaySeconds": self.authorizer_delay_seconds,
+                    "Requests": self.num_requests,
+                }
+                for name, bound in (("OneAtATime", 1), ("Concurrent", self.max_concurrent_authorizations)):
+                    mcp_context.max_concurrent_authorizations = bound
+                    report[name] = asyncio.run(self.measure(server.http_port))
+                    report[name]["MaxConcurrentAuthorizations"] = bound
+                report["DescriptorBuilds"] = mcp_context.get_tool_descriptor_cache().num_builds
+            finally:
+                server.stop()
+                for key, value in previous_env.items():
+                    if value is None:
+                        os.environ.pop(key, None)
+                    else:
+                        os.environ[key] = value
+
+        return report
+
+    def write_registry(self, registry_dir: str) -> str:
+        """
+        Write a manifest of agent networks which are all served as MCP tools
+        :param registry_dir: The directory to write the files to
+        :return: The path to the manifest file
+        """
+        manifest: Dict[str, Any] = {}
+        for index in range(self.num_networks):
+            network_name: str = f"tool_{index:04d}"
+            # JSON is valid HOCON
+            agent_network: Dict[str, Any] = {
+                "llm_config": {
+                    "class": "neuro_san.test.llms.delayed_chat_mock_llm.DelayedChatMockLlm",
+                    "model_name": "echo",
+                },
+                "tools": [
+                    {
+                        "name": "echoer",
+                        "function": {
+                            "description": f"Echoes the input, as tool number {index}.",
+                        },
+                        "instructions": "System prompt for the mock llm",
+                    },
+                ],
+            }
+            with open(os.path.join(registry_dir, f"{network_name}.hocon"), "w", encoding="utf-8") as network_out:
+                json.dump(agent_network, network_out)
+            manifest[f"{network_name}.hocon"] = {"serve": True, "mcp": True}
+
+        manifest_file: str = os.path.join(registry_dir, "manifest.hocon")
+        with open(manifest_file, "w", encoding="utf-8") as manifest_out:
+            json.dump(manifest, manifest_out, indent=4)
+        return manifest_file
+
+    async def measure(self, port: int) -> Dict[str, Any]:
+        """
+        Time a number of tools/list requests, one after the other
+        :param port: The port of the server
+        :return: A dictionary of the timings, the number of tools listed
+                 and the most authorization checks that were going at once
+        """
+        driver = LoadTestDriver(port, LoadTestServer.DEFAULT_AGENT_NAME, timeout_seconds=self.timeout_seconds)
+        path: str = f"http://localhost:{port}/mcp"
+        payload: Dict[str, Any] = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+        seconds: List[float] = []
+        num_tools: int = 0
+
+        DelayedAuthorizer.reset_statistics()
+        async with ClientSession(timeout=ClientTimeout(self.timeout_seconds)) as session:
+            headers: Dict[str, str] = await driver.initialize_mcp(session)
+            for _ in range(self.num_requests):
+                start: float = time.perf_counter()
+                async with session.post(path, json=payload, headers=headers) as response:
+                    response.raise_for_status()
+                    result: Dict[str, Any] = await response.json()
+                seconds.append(time.perf_counter() - start)
+                num_tools = len(result.get("result", {}).get("tools", []))
+
+        return {
+            "Tools": num_tools,
+            "MedianSeconds": statistics.median(seconds),
+            "MaxSeconds": max(seconds),
+            "Authorizations": DelayedAuthorizer.num_authorizations,
+            "MaxAuthorizationsInFlight": DelayedAuthorizer.max_in_flight,
+        }
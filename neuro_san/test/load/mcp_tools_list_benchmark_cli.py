@@ -0,0 +1,92 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+import argparse
+import json
+import sys
+
+from neuro_san.test.load.mcp_tools_list_benchmark import McpToolsListBenchmark
+
+
+class McpToolsListBenchmarkCli:
+    """
+    Command-line tool for measuring how long MCP tools/list requests take on a server
+    hosting many agent networks, with an authorizer that is slow like a remote one.
+    A JSON report comparing authorization checks made one at a time and concurrently is printed.
+
+    Usage:
+        python -m neuro_san.test.load.mcp_tools_list_benchmark_cli --networks 200
+        python -m neuro_san.test.load.mcp_tools_list_benchmark_cli --authorizer_delay_seconds 0.05
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.args = None
+
+    def main(self) -> int:
+        """
+        Main entry point for the tools/list benchmark CLI.
+
+        :return: Exit code (0 if every network got listed as a tool both ways, 1 otherwise)
+        """
+        self.parse_args()
+
+        benchmark = McpToolsListBenchmark(num_networks=self.args.networks,
+                                          authorizer_delay_seconds=self.args.authorizer_delay_seconds,
+                                          num_requests=self.args.requests,
+                                          max_concurrent_authorizations=self.args.max_concurrent_authorizations,
+                                          timeout_seconds=self.args.timeout_seconds)
+        report: Dict[str, Any] = benchmark.run()
+
+        report_text: str = json.dumps(report, indent=4)
+        print(report_text)
+        if self.args.output_file:
+            with open(self.args.output_file, "w", encoding="utf-8") as output:
+                output.write(report_text)
+
+        for name in ("OneAtATime", "Concurrent"):
+            if report.get(name).get("Tools") != self.args.networks:
+                return 1
+        return 0
+
+    def parse_args(self):
+        """
+        Parse command line arguments.
+        """
+        arg_parser = argparse.ArgumentParser(
+            description="Measure MCP tools/list requests on a server hosting many agent networks."
+        )
+        arg_parser.add_argument("--networks", type=int, default=200,
+                                help="Number of agent networks the server hosts as MCP tools")
+        arg_parser.add_argument("--authorizer_delay_seconds", type=float, default=0.01,
+                                help="How long each authorization check takes")
+        arg_parser.add_argument("--requests", type=int, default=10,
+                                help="Number of tools/list requests to time each way")
+        arg_parser.add_argument("--max_concurrent_authorizations", type=int, default=16,
+                                help="Number of authorization checks a request may have going at once")
+        arg_parser.add_argument("--timeout_seconds", type=float, default=300.0,
+                                help="Timeout for the server to start and for each request")
+        arg_parser.add_argument("--output_file", type=str, default=None,
+                                help="File to write the JSON report to, in addition to stdout")
+        self.args = arg_parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(McpToolsListBenchmarkCli().main())
@@ -0,0 +1,292 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from aiohttp import ClientSession
+from aiohttp import ClientTimeout
+
+from neuro_san.internals.graph.persistence.agent_network_config_restorer import AgentNetworkConfigRestorer
+from neuro_san.internals.graph.persistence.manifest_filter_chain import ManifestFilterChain
+from neuro_san.internals.graph.persistence.raw_manifest_restorer import RawManifestRestorer
+from neuro_san.internals.graph.persistence.registry_manifest_restorer import RegistryManifestRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.test.load.load_test_driver import LoadTestDriver
+from neuro_san.test.load.load_test_server import LoadTestServer
+
+
+class StartupBenchmark:
+    """
+    Measures how long a neuro-san server takes to start up with a large manifest,
+    broken down into phases:
+
+        Import      Importing the server's modules in a fresh interpreter,
+                    and which llm provider packages that drags in.
+        Restore     Reading the manifest, then parsing, filtering and validating
+                    every agent network file, then building the AgentNetworks.
+                    This is done once in this process and once with worker processes.
+        Server      Starting a real server on the manifest until it is ready to take requests,
+                    then sending it a first request.
+
+    The manifest and its agent networks are generated, each network answered by a
+    ScriptedChatMockLlm so that no LLM provider is ever called.
+    """
+
+    # Packages of llm providers and MCP clients which should not be imported
+    # until an agent network actually uses them.
+    PROVIDER_MODULES: List[str] = [
+        "anthropic",
+        "boto3",
+        "google.auth",
+        "langchain_anthropic",
+        "langchain_aws",
+        "langchain_google_genai",
+        "langchain_mcp_adapters",
+        "langchain_nvidia_ai_endpoints",
+        "langchain_ollama",
+        "langchain_openai",
+        "mcp",
+        "openai",
+    ]
+
+    # The module a server is started from
+    SERVER_MODULE: str = "neuro_san.service.main_loop.server_main_loop"
+
+    def __init__(self, num_networks: int = 500,
+                 agents_per_network: int = 5,
+                 max_workers: int = 2,
+                 timeout_seconds: float = 600.0):
+        """
+        Constructor
+
+        :param num_networks: The number of agent networks in the generated manifest
+        :param agents_per_network: The number of agents in each generated agent network
+        :param max_workers: The number of worker processes for the parallel restore
+        :param timeout_seconds: The timeout for the server to start and for its first request
+        """
+        self.num_networks: int = num_networks
+        self.agents_per_network: int = agents_per_network
+        self.max_workers: int = max_workers
+        self.timeout_seconds: float = timeout_seconds
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run the benchmark
+        :return: A report dictionary of the results
+        """
+        with tempfile.TemporaryDirectory(prefix="neuro_san_startup_") as registry_dir:
+            manifest_file: str = self.write_registry(registry_dir)
+            report: Dict[str, Any] = {
+                "Networks": self.num_networks,
+                "AgentsPerNetwork": self.agents_per_network,
+                "Workers": self.max_workers,
+                "Import": self.measure_import(),
+                "SequentialRestore": self.measure_restore(manifest_file, max_workers=1),
+                "ParallelRestore": self.measure_restore(manifest_file, max_workers=self.max_workers),
+                "Server": self.measure_server(manifest_file),
+            }
+        return report
+
+    def write_registry(self, registry_dir: str) -> str:
+        """
+        Write a manifest and its agent networks, using the usual HOCON features
+        of includes and substitutions so that parsing them is representative.
+        :param registry_dir: The directory to write the files to
+        :return: The path to the manifest file
+        """
+        common_file: str = os.path.join(registry_dir, "common.hocon")
+        with open(common_file, "w", encoding="utf-8") as common_out:
+            common_out.write("""
+llm_config = {
+    "class": "neuro_san.test.llms.scripted_chat_mock_llm.ScriptedChatMockLlm",
+    "model_name": "scripted",
+    "script": [{"content": "Started up."}],
+}
+preamble = "You are one of the agents of a generated network used to benchmark server startup."
+""")
+
+        manifest: Dict[str, Any] = {}
+        for index in range(self.num_networks):
+            network_name: str = f"startup_{index:04d}"
+            network_file: str = os.path.join(registry_dir, f"{network_name}.hocon")
+            with open(network_file, "w", encoding="utf-8") as network_out:
+                network_out.write(self.generate_network(common_file))
+            manifest[f"{network_name}.hocon"] = True
+
+        # JSON is valid HOCON
+        manifest_file: str = os.path.join(registry_dir, "manifest.hocon")
+        with open(manifest_file, "w", encoding="utf-8") as manifest_out:
+            json.dump(manifest, manifest_out, indent=4)
+
+        return manifest_file
+
+    def generate_network(self, common_file: str) -> str:
+        """
+        :param common_file: The path to the file of definitions common to all networks
+        :return: The HOCON text of an agent network
+        """
+        tool_names: List[str] = [f"specialist_{index}" for index in range(1, self.agents_per_network)]
+        tools: List[str] = [f"""
+        {{
+            "name": "coordinator",
+            "function": {{
+                "description": "Answers questions by consulting the specialists."
+            }},
+            "instructions": ${{preamble}}" Delegate to the specialists and summarize what they say.",
+            "tools": {json.dumps(tool_names)}
+        }}"""]
+        for tool_name in tool_names:
+            tools.append(f"""
+        {{
+            "name": "{tool_name}",
+            "function": {{
+                "description": "Answers questions about the area of {tool_name}.",
+                "parameters": {{
+                    "type": "object",
+                    "properties": {{
+                        "inquiry": {{
+                            "type": "string",
+                            "description": "The question to answer"
+                        }}
+                    }},
+                    "required": ["inquiry"]
+                }}
+            }},
+            "instructions": ${{preamble}}" Answer questions about the area of {tool_name}."
+        }}""")
+
+        return f"""
+{{
+    include "{common_file}"
+    "metadata": {{
+        "description": "A generated agent network for benchmarking server startup.",
+        "tags": ["test"],
+    }},
+    "llm_config": ${{llm_config}},
+    "tools": [{",".join(tools)}
+    ]
+}}
+"""
+
+    def measure_import(self) -> Dict[str, Any]:
+        """
+        :return: A dictionary of how long the server modules take to import in a fresh interpreter
+                and which provider packages get imported along with them
+        """
+        code: str = f"""
+import json, sys, time
+start = time.perf_counter()
+import {self.SERVER_MODULE}
+seconds = time.perf_counter() - start
+modules = [module for module in {self.PROVIDER_MODULES!r} if module in sys.modules]
+print(json.dumps({{"Seconds": seconds, "ProviderModules": modules}}))
+"""
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                timeout=self.timeout_seconds, check=True)
+        # Deprecation warnings can go to stdout as well
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    # pylint: disable=too-many-locals
+    def measure_restore(self, manifest_file: str, max_workers: int) -> Dict[str, Any]:
+        """
+        Go through the same steps as RegistryManifestRestorer.restore(), timing each one.
+        :param manifest_file: The manifest to restore
+        :param max_workers: The number of worker processes to restore with
+        :return: A dictionary of the seconds each phase of the restore took
+        """
+        restorer = RegistryManifestRestorer(manifest_file, max_workers=max_workers)
+
+        start: float = time.perf_counter()
+        raw_manifest: Dict[str, Any] = RawManifestRestorer().restore(file_reference=manifest_file)
+        one_manifest: Dict[str, Any] = ManifestFilterChain(manifest_file).filter_config(raw_manifest)
+        manifest_done: float = time.perf_counter()
+
+        manifest_keys: List[str] = list(one_manifest.keys())
+        config_restorer = AgentNetworkConfigRestorer(os.path.dirname(manifest_file), restorer.agent_mapper,
+                                                     restorer.find_external_network_names(one_manifest))
+        results: List[Tuple[Dict[str, Any], List[str]]] = restorer.restore_configs(config_restorer, manifest_keys)
+        restore_done: float = time.perf_counter()
+
+        num_errors: int = 0
+        for manifest_key, (config, errors) in zip(manifest_keys, results):
+            num_errors += len(errors)
+            if config is not None:
+                agent_filepath: str = restorer.agent_mapper.agent_name_to_filepath(manifest_key)
+                _ = AgentNetwork(config, restorer.agent_mapper.filepath_to_agent_network_name(agent_filepath))
+        build_done: float = time.perf_counter()
+
+        return {
+            "Workers": max_workers,
+            "ManifestSeconds": manifest_done - start,
+            "ParseFilterValidateSeconds": restore_done - manifest_done,
+            "BuildSeconds": build_done - restore_done,
+            "TotalSeconds": build_done - start,
+            "Errors": num_errors,
+        }
+
+    def measure_server(self, manifest_file: str) -> Dict[str, Any]:
+        """
+        :param manifest_file: The manifest for the server to serve
+        :return: A dictionary of how long a server takes to be ready and to answer its first request,
+                and which provider packages have been imported by each of those points
+        """
+        previous_workers: str = os.environ.get("AGENT_MANIFEST_RESTORE_WORKERS")
+        os.environ["AGENT_MANIFEST_RESTORE_WORKERS"] = str(self.max_workers)
+        server = LoadTestServer(manifest_file=manifest_file, timeout_seconds=self.timeout_seconds)
+        try:
+            start: float = time.perf_counter()
+            server.start()
+            ready: float = time.perf_counter()
+            ready_modules: List[str] = self.imported_provider_modules()
+            asyncio.run(self.first_request(server.http_port))
+            answered: float = time.perf_counter()
+        finally:
+            server.stop()
+            if previous_workers is None:
+                os.environ.pop("AGENT_MANIFEST_RESTORE_WORKERS", None)
+            else:
+                os.environ["AGENT_MANIFEST_RESTORE_WORKERS"] = previous_workers
+
+        return {
+            "ReadySeconds": ready - start,
+            "FirstRequestSeconds": answered - ready,
+            "ProviderModulesWhenReady": ready_modules,
+            "ProviderModulesAfterFirstRequest": self.imported_provider_modules(),
+        }
+
+    def imported_provider_modules(self) -> List[str]:
+        """
+        :return: The provider packages which have been imported in this process so far
+        """
+        return [module for module in self.PROVIDER_MODULES if module in sys.modules]
+
+    async def first_request(self, port: int):
+        """
+        :param port: The port of the server
+        """
+        driver = LoadTestDriver(port, "startup_0000", timeout_seconds=self.timeout_seconds)
+        async with ClientSession(timeout=ClientTimeout(self.timeout_seconds)) as session:
+            await driver.http_request(session, None)
@@ -0,0 +1,91 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+import argparse
+import json
+import os
+import sys
+
+from neuro_san.test.load.startup_benchmark import StartupBenchmark
+
+
+class StartupBenchmarkCli:
+    """
+    Command-line tool for measuring how long a neuro-san server takes to start up
+    with a large generated manifest, without calling any LLM provider.
+    A JSON report with a breakdown of the time spent in each phase is printed.
+
+    Usage:
+        python -m neuro_san.test.load.startup_benchmark_cli --networks 500
+        python -m neuro_san.test.load.startup_benchmark_cli --networks 100 --workers 8
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.args = None
+
+    def main(self) -> int:
+        """
+        Main entry point for the startup benchmark CLI.
+
+        :return: Exit code (0 if every generated network was restored, 1 otherwise)
+        """
+        self.parse_args()
+
+        benchmark = StartupBenchmark(num_networks=self.args.networks,
+                                     agents_per_network=self.args.agents_per_network,
+                                     max_workers=self.args.workers,
+                                     timeout_seconds=self.args.timeout_seconds)
+        report: Dict[str, Any] = benchmark.run()
+
+        report_text: str = json.dumps(report, indent=4)
+        print(report_text)
+        if self.args.output_file:
+            with open(self.args.output_file, "w", encoding="utf-8") as output:
+                output.write(report_text)
+
+        if report.get("SequentialRestore").get("Errors") > 0 or report.get("ParallelRestore").get("Errors") > 0:
+            return 1
+        return 0
+
+    def parse_args(self):
+        """
+        Parse command line arguments.
+        """
+        default_workers: int = max(2, os.cpu_count() or 1)
+        arg_parser = argparse.ArgumentParser(
+            description="Measure the startup time of a neuro-san server with a large generated manifest."
+        )
+        arg_parser.add_argument("--networks", type=int, default=500,
+                                help="Number of agent networks in the generated manifest")
+        arg_parser.add_argument("--agents_per_network", type=int, default=5,
+                                help="Number of agents in each generated agent network")
+        arg_parser.add_argument("--workers", type=int, default=default_workers,
+                                help="Number of worker processes for the parallel restore and the server."
+                                     " Default is the number of CPUs, but at least 2.")
+        arg_parser.add_argument("--timeout_seconds", type=float, default=600.0,
+                                help="Timeout for the server to start and for its first request")
+        arg_parser.add_argument("--output_file", type=str, default=None,
+                                help="File to write the JSON report to, in addition to stdout")
+        self.args = arg_parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(StartupBenchmarkCli().main())
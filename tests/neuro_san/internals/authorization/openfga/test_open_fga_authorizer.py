@@ -0,0 +1,149 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+
+import pytest
+
+from neuro_san.internals.authorization.openfga.open_fga_authorizer import OpenFgaAuthorizer
+from neuro_san.internals.authorization.openfga.open_fga_decision_cache import OpenFgaDecisionCache
+from neuro_san.internals.authorization.openfga.open_fga_init import OpenFgaInit
+
+from tests.neuro_san.utils.fake_fga_server import FakeFgaServer
+
+
+class TestOpenFgaAuthorizer:
+    """
+    Tests for caching of decisions by the OpenFgaAuthorizer against a fake OpenFGA server
+    """
+
+    STORE_ID: str = "01ARZ3NDEKTSV4RRFFQ69G5FAV"
+    ALICE: Dict[str, Any] = {"type": "User", "id": "alice"}
+    HELLO: Dict[str, Any] = {"type": "AgentNetwork", "id": "hello_world"}
+    ECHO: Dict[str, Any] = {"type": "AgentNetwork", "id": "echo"}
+
+    @pytest.fixture(autouse=True)
+    def fga_env(self, monkeypatch):
+        """
+        Keep the FGA environment variables set by tests to the tests
+        """
+        monkeypatch.delenv("FGA_API_TOKEN", raising=False)
+        yield monkeypatch
+
+    async def make_authorizer(self, fga_env, server: FakeFgaServer, **cache_args) -> OpenFgaAuthorizer:
+        """
+        :param fga_env: The monkeypatch fixture to set environment variables with
+        :param server: The FakeFgaServer to start and talk to
+        :return: An OpenFgaAuthorizer with its own client and cache
+        """
+        fga_env.setenv("FGA_API_URL", await server.start())
+        fga_client = OpenFgaInit.initialize_one_client(store_id=self.STORE_ID)
+        decision_cache = OpenFgaDecisionCache(**cache_args)
+        return OpenFgaAuthorizer(fga_client=fga_client, decision_cache=decision_cache)
+
+    @pytest.mark.asyncio
+    async def test_repeated_checks(self, fga_env):
+        """
+        Repeated decisions, allowed or denied, only go to the server once.
+        """
+        server = FakeFgaServer()
+        server.tuples.add(("User:alice", "read", "AgentNetwork:hello_world"))
+        authorizer = await self.make_authorizer(fga_env, server, ttl_seconds=60, negative_ttl_seconds=60)
+        try:
+            for _ in range(10):
+                async with authorizer as auth:
+                    assert await auth.authorize(self.ALICE, "read", self.HELLO)
+                    assert not await auth.authorize(self.ALICE, "read", self.ECHO)
+        finally:
+            await authorizer.close()
+            await server.stop()
+        assert server.num_checks == 2
+        assert authorizer.decision_cache.get_stats().get("hits") == 18
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, fga_env):
+        """
+        A disabled cache sends every check to the server.
+        """
+        server = FakeFgaServer()
+        authorizer = await self.make_authorizer(fga_env, server, ttl_seconds=0)
+        try:
+            for _ in range(5):
+                assert not await authorizer.authorize(self.ALICE, "read", self.HELLO)
+        finally:
+            await authorizer.close()
+            await server.stop()
+        assert server.num_checks == 5
+
+    @pytest.mark.asyncio
+    async def test_grant_and_revoke_invalidate(self, fga_env):
+        """
+        Cached decisions do not outlive grants and revokes.
+        """
+        server = FakeFgaServer()
+        authorizer = await self.make_authorizer(fga_env, server, ttl_seconds=60, negative_ttl_seconds=60)
+        try:
+            assert not await authorizer.authorize(self.ALICE, "read", self.HELLO)
+            assert await authorizer.grant(self.ALICE, "read", self.HELLO)
+            assert await authorizer.authorize(self.ALICE, "read", self.HELLO)
+            assert await authorizer.revoke(self.ALICE, "read", self.HELLO)
+            assert not await authorizer.authorize(self.ALICE, "read", self.HELLO)
+        finally:
+            await authorizer.close()
+            await server.stop()
+        assert server.num_checks == 3
+
+    @pytest.mark.asyncio
+    async def test_list_answers_checks(self, fga_env):
+        """
+        Checks for objects in a listing of the same type are allowed by the listing.
+        Objects missing from it are still checked with the server.
+        """
+        server = FakeFgaServer()
+        server.tuples.add(("User:alice", "read", "AgentNetwork:hello_world"))
+        authorizer = await self.make_authorizer(fga_env, server, ttl_seconds=60, negative_ttl_seconds=60)
+        try:
+            ids = await authorizer.list(self.ALICE, "read", {"type": "AgentNetwork"})
+            assert ids == ["hello_world"]
+            assert await authorizer.authorize(self.ALICE, "read", self.HELLO)
+            assert not await authorizer.authorize(self.ALICE, "read", self.ECHO)
+        finally:
+            await authorizer.close()
+            await server.stop()
+        assert server.num_list_objects == 1
+        assert server.num_checks == 1
+
+    @pytest.mark.asyncio
+    async def test_truncated_list_does_not_deny(self, fga_env):
+        """
+        Objects left out of a truncated listing are not denied.
+        """
+        server = FakeFgaServer()
+        server.tuples.add(("User:alice", "read", "AgentNetwork:echo"))
+        server.tuples.add(("User:alice", "read", "AgentNetwork:hello_world"))
+        server.max_list_results = 1
+        authorizer = await self.make_authorizer(fga_env, server, ttl_seconds=60, negative_ttl_seconds=60)
+        try:
+            ids = await authorizer.list(self.ALICE, "read", {"type": "AgentNetwork"})
+            assert ids == ["echo"]
+            assert await authorizer.authorize(self.ALICE, "read", self.ECHO)
+            assert await authorizer.authorize(self.ALICE, "read", self.HELLO)
+        finally:
+            await authorizer.close()
+            await server.stop()
+        assert server.num_checks == 1
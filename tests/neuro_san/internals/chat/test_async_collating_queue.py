@@ -0,0 +1,177 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Awaitable
+from typing import Dict
+from typing import List
+
+from asyncio import AbstractEventLoop
+from concurrent.futures import Future
+from threading import Thread
+from unittest import TestCase
+
+import asyncio
+import time
+
+from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
+
+
+class ProducerLoop:
+    """
+    Stands in for the AsyncioExecutor whose event loop runs the agent network
+    and produces the messages, separate from the event loop of the request.
+    """
+
+    def __init__(self):
+        self.loop: AbstractEventLoop = asyncio.new_event_loop()
+        self.thread = Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def run(self, coroutine: Awaitable) -> Future:
+        """
+        :param coroutine: The coroutine to run on the producer loop
+        :return: A concurrent Future for its result
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def stop(self):
+        """
+        Stops the loop
+        """
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+class TestAsyncCollatingQueue(TestCase):
+    """
+    Tests for the AsyncCollatingQueue.
+    """
+
+    def setUp(self):
+        self.producer = ProducerLoop()
+        self.max_pending: int = 0
+
+    def tearDown(self):
+        self.producer.stop()
+
+    def test_across_loops(self):
+        """
+        Items put from one event loop come out in order on another.
+        """
+        async def consume(queue: AsyncCollatingQueue) -> List[Dict[str, Any]]:
+            future: Future = self.producer.run(self.produce(queue, 500))
+            received: List[Dict[str, Any]] = [item async for item in queue]
+            self.assertEqual(500, future.result(timeout=5.0))
+            return received
+
+        queue = AsyncCollatingQueue(capacity=0)
+        received: List[Dict[str, Any]] = asyncio.run(consume(queue))
+        self.assertEqual(list(range(500)), [item["index"] for item in received])
+
+    def test_backpressure(self):
+        """
+        A full queue makes the producer wait, without stalling its loop,
+        until the consumer works through what it has taken.
+        """
+        async def consume(queue: AsyncCollatingQueue) -> List[Dict[str, Any]]:
+            future: Future = self.producer.run(self.produce(queue, 100))
+            deadline: float = time.monotonic() + 5.0
+            while queue.num_backpressure_waits == 0:
+                self.assertLess(time.monotonic(), deadline)
+                await asyncio.sleep(0.01)
+            self.assertFalse(future.done())
+            self.assertEqual(10, queue.qsize())
+
+            # The waiting producer leaves its loop free for other work
+            self.assertEqual(1, self.producer.run(asyncio.sleep(0, result=1)).result(timeout=5.0))
+
+            received: List[Dict[str, Any]] = [item async for item in queue]
+            self.assertEqual(100, future.result(timeout=5.0))
+            return received
+
+        queue = AsyncCollatingQueue(capacity=10)
+        received: List[Dict[str, Any]] = asyncio.run(consume(queue))
+        self.assertEqual(100, len(received))
+        self.assertGreater(queue.num_backpressure_waits, 0)
+
+    def test_close(self):
+        """
+        Closing the queue releases a waiting producer with an error.
+        """
+        queue = AsyncCollatingQueue(capacity=5)
+        future: Future = self.producer.run(self.produce(queue, 10))
+        time.sleep(0.2)
+        self.assertFalse(future.done())
+
+        queue.close()
+        with self.assertRaises(RuntimeError):
+            future.result(timeout=5.0)
+
+    def test_drain(self):
+        """
+        Synchronous consumers get everything, final item included, and make room for producers.
+        """
+        queue = AsyncCollatingQueue(capacity=5)
+        future: Future = self.producer.run(self.produce(queue, 10))
+        drained: List[Any] = []
+        deadline: float = time.monotonic() + 5.0
+        while not drained or not queue.is_final_item(drained[-1]):
+            self.assertLess(time.monotonic(), deadline)
+            drained.extend(queue.drain())
+            time.sleep(0.01)
+        self.assertEqual(10, future.result(timeout=5.0))
+        self.assertEqual(11, len(drained))
+
+    def test_slow_consumer(self):
+        """
+        A consumer that writes to a slow HTTP client gets everything, in order,
+        without more than the capacity of the queue ever pending.
+        For how this compares to the janus queue it replaces, see the
+        neuro_san.test.load.async_collating_queue_benchmark_cli.
+        """
+        capacity: int = 100
+
+        async def consume(queue: AsyncCollatingQueue) -> List[Dict[str, Any]]:
+            future: Future = self.producer.run(self.produce(queue, 1000))
+            received: List[Dict[str, Any]] = []
+            async for item in queue:
+                received.append(item)
+                if len(received) % 50 == 0:
+                    # Stands in for a slow client socket
+                    await asyncio.sleep(0.01)
+            self.assertEqual(1000, future.result(timeout=5.0))
+            return received
+
+        queue = AsyncCollatingQueue(capacity=capacity)
+        received: List[Dict[str, Any]] = asyncio.run(consume(queue))
+        self.assertEqual(list(range(1000)), [item["index"] for item in received])
+        self.assertLessEqual(self.max_pending, capacity)
+        self.assertGreater(queue.num_backpressure_waits, 0)
+
+    async def produce(self, queue: AsyncCollatingQueue, count: int) -> int:
+        """
+        Puts a number of items and then the final item on the queue.
+        :return: The number of items
+        """
+        for index in range(count):
+            await queue.put({"index": index})
+            self.max_pending = max(self.max_pending, queue.qsize())
+            if index % 10 == 0:
+                # Messages come in bursts between LLM calls
+                await asyncio.sleep(0)
+        await queue.put_final_item()
+        return count
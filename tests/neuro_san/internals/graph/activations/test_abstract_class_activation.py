@@ -21,12 +21,16 @@ from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import threading
+
 from langchain_core.messages.ai import AIMessage
 import pytest
 
 from neuro_san.interfaces.coded_tool import CodedTool
 from neuro_san.internals.graph.activations.abstract_class_activation import AbstractClassActivation
 from neuro_san.internals.graph.activations.branch_activation import BranchActivation
+from neuro_san.internals.graph.activations.coded_tool_class_cache import CodedToolClassCache
+from neuro_san.internals.graph.activations.coded_tool_thread_pool import CodedToolThreadPool
 
 CREATE_RUN_CONTEXT_PATH = (
     "neuro_san.internals.graph.activations.abstract_class_activation."
@@ -99,6 +103,14 @@ class MockCodedToolWithConstructor(CodedTool):
         return "should_not_reach"
 
 
+@pytest.fixture(autouse=True)
+def clear_class_cache():
+    """Start every test with nothing resolved yet."""
+    CodedToolClassCache.invalidate()
+    yield
+    CodedToolClassCache.invalidate()
+
+
 @pytest.fixture
 def mock_run_context():
     """Create a mock RunContext."""
@@ -151,6 +163,7 @@ def activation_instance(mock_run_context, mock_factory, basic_agent_tool_spec):
             return activation
 
 
+# pylint: disable=too-many-public-methods
 class TestAbstractClassActivation:
     """Test suite for AbstractClassActivation."""
 
@@ -263,6 +276,59 @@ class TestAbstractClassActivation:
             assert paths_tried[1] == "test_tools.network"
             assert paths_tried[2] == "test_tools"
 
+    def test_resolve_class_cached(self, activation_instance):
+        """Test that repeated resolution of the same class does not import again."""
+        call_count = 0
+
+        def mock_resolver_factory(packages):
+            nonlocal call_count
+            call_count += 1
+            resolver = MagicMock()
+            if packages[0] != "test_tools":
+                resolver.resolve_class_in_module.side_effect = ValueError("Not found")
+            else:
+                resolver.resolve_class_in_module.return_value = MockCodedTool
+            return resolver
+
+        imports_before = CodedToolClassCache.get_stats()["Imports"]
+        with patch(RESOLVER_PATH, side_effect=mock_resolver_factory):
+            for _ in range(100):
+                assert activation_instance.resolve_class("TestClass", "test_module") == MockCodedTool
+
+        # Only the first resolution went through the Resolver
+        assert call_count == 3
+        stats = CodedToolClassCache.get_stats()
+        assert stats["Imports"] - imports_before == 3
+        assert stats["Classes"] == 1
+        assert stats["Failures"] == 2
+
+    def test_resolve_class_negative_cache(self, activation_instance):
+        """Test that known failed paths are skipped, and that invalidation retries them."""
+        mock_resolver = MagicMock()
+        mock_resolver.resolve_class_in_module.side_effect = ValueError("Not found")
+
+        with patch(RESOLVER_PATH, return_value=mock_resolver):
+            for _ in range(2):
+                with pytest.raises(ValueError) as exc_info:
+                    activation_instance.resolve_class("TestClass", "test_module")
+                assert "Could not find class" in str(exc_info.value)
+
+            # Three levels tried once, not again on the second attempt
+            assert mock_resolver.resolve_class_in_module.call_count == 3
+
+            # Invalidating another network changes nothing
+            CodedToolClassCache.invalidate("other_network")
+            with pytest.raises(ValueError):
+                activation_instance.resolve_class("TestClass", "test_module")
+            assert mock_resolver.resolve_class_in_module.call_count == 3
+
+            # Reloading the network looks again
+            CodedToolClassCache.invalidate("network/subnetwork")
+            mock_resolver.resolve_class_in_module.side_effect = None
+            mock_resolver.resolve_class_in_module.return_value = MockCodedTool
+            assert activation_instance.resolve_class("TestClass", "test_module") == MockCodedTool
+            assert mock_resolver.resolve_class_in_module.call_count == 4
+
     def test_instantiate_coded_tool_standard(self, activation_instance):
         """Test instantiating a standard CodedTool with no-args constructor."""
         result = activation_instance.instantiate_coded_tool(MockCodedTool)
@@ -316,18 +382,60 @@ class TestAbstractClassActivation:
                 raise NotImplementedError()
 
         mock_tool = SyncOnlyTool()
-        mock_executor = MagicMock()
-        mock_loop = MagicMock()
-        mock_loop.run_in_executor = AsyncMock(return_value="sync_result")
-        mock_executor.get_event_loop.return_value = mock_loop
-
-        invocation_context = activation_instance.run_context.get_invocation_context()
-        invocation_context.get_asyncio_executor.return_value = mock_executor
+        completed_before = CodedToolThreadPool.get_stats()["Completed"]
 
         result = await activation_instance.attempt_invoke(mock_tool, {"arg": "value"}, {"sly": "data"})
 
         assert result == "sync_result"
-        mock_loop.run_in_executor.assert_called_once()
+        # Ran on the dedicated pool
+        assert CodedToolThreadPool.get_stats()["Completed"] == completed_before + 1
+
+    @pytest.mark.asyncio
+    async def test_attempt_invoke_sync_timeout(self, activation_instance):
+        """Test that a synchronous invoke() running past its timeout becomes a tool error."""
+        release = threading.Event()
+
+        class SlowSyncTool(CodedTool):
+            """Mock CodedTool with only a slow sync invoke."""
+            def invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Any:
+                release.wait(5.0)
+                return "too_late"
+
+            async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Any:
+                raise NotImplementedError()
+
+        activation_instance.agent_tool_spec["invoke_timeout_seconds"] = 0.1
+        timed_out_before = CodedToolThreadPool.get_stats()["TimedOut"]
+        try:
+            result = await activation_instance.attempt_invoke(SlowSyncTool(), {}, {})
+        finally:
+            release.set()
+
+        assert "Error:" in result
+        assert "did not finish within 0.1 seconds" in result
+        assert CodedToolThreadPool.get_stats()["TimedOut"] == timed_out_before + 1
+
+    @pytest.mark.asyncio
+    async def test_attempt_invoke_sync_own_timeout(self, activation_instance):
+        """Test that a TimeoutError raised by invoke() itself is reported as it is."""
+        class TimingOutSyncTool(CodedTool):
+            """Mock CodedTool whose sync invoke times out on something of its own."""
+            def invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Any:
+                raise TimeoutError("socket read timed out")
+
+            async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Any:
+                raise NotImplementedError()
+
+        for timeout_seconds in (None, 5.0):
+            activation_instance.agent_tool_spec["invoke_timeout_seconds"] = timeout_seconds
+            timed_out_before = CodedToolThreadPool.get_stats()["TimedOut"]
+
+            result = await activation_instance.attempt_invoke(TimingOutSyncTool(), {}, {})
+
+            assert "Error:" in result
+            assert "socket read timed out" in result
+            assert "did not finish within" not in result
+            assert CodedToolThreadPool.get_stats()["TimedOut"] == timed_out_before
 
     @pytest.mark.asyncio
     async def test_attempt_invoke_with_exception(self, activation_instance):
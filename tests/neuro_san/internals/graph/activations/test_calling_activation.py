@@ -0,0 +1,236 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import List
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import asyncio
+
+from langchain_core.messages.ai import AIMessage
+import pytest
+
+from neuro_san.internals.graph.activations.calling_activation import CallingActivation
+
+CREATE_RUN_CONTEXT_PATH = (
+    "neuro_san.internals.graph.activations.calling_activation."
+    "RunContextFactory.create_run_context"
+)
+# How long a build waits for the others it expects to run alongside it, before failing the test
+ARRIVAL_TIMEOUT_SECONDS: float = 10.0
+
+
+class BuildTracker:
+    """
+    Keeps track of how many builds run at once.
+    Builds wait until the expected number of them are running together.
+    """
+
+    def __init__(self, expected: int):
+        self.expected: int = expected
+        self.running: int = 0
+        self.max_running: int = 0
+        self.all_running = asyncio.Event()
+
+    async def arrive(self):
+        """
+        Count a build as running, and wait for the expected number of them to be running.
+        """
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        if self.running >= self.expected:
+            self.all_running.set()
+        # Give any other builds that are allowed to run a chance to start
+        await asyncio.sleep(0)
+        await asyncio.wait_for(self.all_running.wait(), ARRIVAL_TIMEOUT_SECONDS)
+
+    def leave(self):
+        """
+        Count a build as done.
+        """
+        self.running -= 1
+
+
+class SlowActivation:
+    """
+    Stands in for a CallableActivation whose build() waits on other builds.
+    """
+
+    def __init__(self, name: str, index: int, tracker: BuildTracker):
+        self.name: str = name
+        self.index: int = index
+        self.tracker: BuildTracker = tracker
+        self.sly_data: Dict[str, Any] = {}
+        self.deleted: bool = False
+
+    async def build(self) -> AIMessage:
+        """
+        Wait for the other builds expected alongside this one, and answer.
+        """
+        try:
+            await self.tracker.arrive()
+            if self.name == "broken":
+                raise ValueError("broken tool")
+        finally:
+            self.tracker.leave()
+        return AIMessage(content=f"{self.name} answered")
+
+    def get_origin(self) -> List[Dict[str, Any]]:
+        """
+        :return: The origin this activation was created with
+        """
+        return [{"tool": self.name, "instantiation_index": self.index}]
+
+    async def delete_resources(self, _parent_run_context):
+        """
+        Record cleanup
+        """
+        self.deleted = True
+
+
+class FakeToolCall:
+    """
+    Stands in for a ToolCall
+    """
+
+    def __init__(self, call_id: str, name: str):
+        self.call_id: str = call_id
+        self.name: str = name
+
+    def get_id(self) -> str:
+        """
+        :return: the id
+        """
+        return self.call_id
+
+    def get_function_name(self) -> str:
+        """
+        :return: the tool name
+        """
+        return self.name
+
+    def get_function_arguments(self) -> Dict[str, Any]:
+        """
+        :return: the tool arguments
+        """
+        return {}
+
+
+class TestCallingActivation:
+    """
+    Tests for fanning out tool calls in CallingActivation
+    """
+
+    @staticmethod
+    def make_activation(tool_names: List[str], max_concurrent: int = None):
+        """
+        :return: A tuple of (CallingActivation, list of created activations, tracker)
+        """
+        # Builds expect to all run together, unless they are limited
+        tracker = BuildTracker(max_concurrent or len(tool_names))
+        created: List[SlowActivation] = []
+
+        def create_agent_activation(_run_context, _spec, tool_name, _sly_data, _args):
+            activation = SlowActivation(tool_name, len(created) + 1, tracker)
+            created.append(activation)
+            return activation
+
+        factory = MagicMock()
+        factory.get_config.return_value = {}
+        factory.create_agent_activation.side_effect = create_agent_activation
+
+        agent_tool_spec: Dict[str, Any] = {
+            "name": "front_man",
+            "tools": tool_names,
+        }
+        if max_concurrent is not None:
+            agent_tool_spec["max_concurrent_tool_calls"] = max_concurrent
+
+        run_context = MagicMock()
+        run_context.submit_tool_outputs = AsyncMock(side_effect=lambda run, outputs: outputs)
+        with patch(CREATE_RUN_CONTEXT_PATH, return_value=run_context):
+            activation = CallingActivation(None, factory, agent_tool_spec, {})
+        return activation, created, tracker
+
+    @staticmethod
+    def make_run(tool_names: List[str]):
+        """
+        :return: A mock Run asking for the given tool calls
+        """
+        run = MagicMock()
+        run.get_tool_calls.return_value = [FakeToolCall(f"call_{index}", name)
+                                           for index, name in enumerate(tool_names)]
+        return run
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fan_out(self):
+        """
+        Independent tool calls run at the same time and come back in the order asked for.
+        """
+        tool_names: List[str] = ["first", "second", "third"]
+        activation, created, tracker = self.make_activation(tool_names)
+
+        # Would time out if the builds did not all run at the same time
+        outputs: List[Dict[str, Any]] = await activation.make_tool_function_calls(self.make_run(tool_names))
+
+        assert tracker.max_running == 3
+        assert [output["tool_call_id"] for output in outputs] == ["call_0", "call_1", "call_2"]
+        assert [output["origin"][0]["tool"] for output in outputs] == tool_names
+        assert [output["origin"][0]["instantiation_index"] for output in outputs] == [1, 2, 3]
+        assert all(one.deleted for one in created)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """
+        The agent spec can bound the number of tool calls running at once.
+        """
+        tool_names: List[str] = ["first", "second", "third"]
+        activation, _, tracker = self.make_activation(tool_names, max_concurrent=1)
+
+        outputs: List[Dict[str, Any]] = await activation.make_tool_function_calls(self.make_run(tool_names))
+
+        assert tracker.max_running == 1
+        assert [output["tool_call_id"] for output in outputs] == ["call_0", "call_1", "call_2"]
+
+    @pytest.mark.asyncio
+    async def test_failure_cleans_up(self):
+        """
+        A failing tool call is reported, and every activation is cleaned up.
+        """
+        tool_names: List[str] = ["broken", "second"]
+        activation, created, _ = self.make_activation(tool_names)
+
+        with pytest.raises(ValueError):
+            await activation.make_tool_function_calls(self.make_run(tool_names))
+
+        assert all(one.deleted for one in created)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_across_calls(self):
+        """
+        The bound also holds when each tool call of a turn comes with a call of its own,
+        as it does when langchain's AgentExecutor makes the tool calls.
+        """
+        tool_names: List[str] = ["first", "second", "third"]
+        activation, _, tracker = self.make_activation(tool_names, max_concurrent=1)
+
+        await asyncio.gather(*[activation.make_tool_function_calls(self.make_run([name]))
+                               for name in tool_names])
+
+        assert tracker.max_running == 1
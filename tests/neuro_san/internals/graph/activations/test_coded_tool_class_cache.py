@@ -0,0 +1,97 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+
+from unittest import TestCase
+
+import time
+
+from neuro_san.internals.graph.activations.coded_tool_class_cache import CodedToolClassCache
+from neuro_san.internals.network_providers.expiring_agent_network_storage import ExpiringAgentNetworkStorage
+from neuro_san.internals.reservations.agent_reservation import AgentReservation
+
+
+class TestCodedToolClassCache(TestCase):
+    """
+    Tests for the bounds on the process-wide CodedToolClassCache
+    """
+
+    def setUp(self):
+        CodedToolClassCache.invalidate()
+        self.max_entries: int = CodedToolClassCache.max_entries
+
+    def tearDown(self):
+        CodedToolClassCache.max_entries = self.max_entries
+        CodedToolClassCache.invalidate()
+
+    def test_least_recently_used_go_first(self):
+        """
+        Entries beyond the bound are dropped, least recently used first.
+        """
+        CodedToolClassCache.max_entries = 2
+        CodedToolClassCache.put_class("one", "tools.one", "module", "Tool", dict)
+        CodedToolClassCache.put_class("two", "tools.two", "module", "Tool", list)
+        self.assertIs(CodedToolClassCache.get_class("one", "tools.one", "module", "Tool"), dict)
+        CodedToolClassCache.put_class("three", "tools.three", "module", "Tool", set)
+
+        self.assertIs(CodedToolClassCache.get_class("one", "tools.one", "module", "Tool"), dict)
+        self.assertIsNone(CodedToolClassCache.get_class("two", "tools.two", "module", "Tool"))
+        self.assertIs(CodedToolClassCache.get_class("three", "tools.three", "module", "Tool"), set)
+
+        for index in range(5):
+            CodedToolClassCache.put_failure("one", f"tools.{index}", "module", "Tool", ValueError("Not found"))
+        self.assertEqual(CodedToolClassCache.get_stats().get("Failures"), 2)
+
+    def test_failures_keep_no_exceptions(self):
+        """
+        Failures come back as new exceptions of the same type and message,
+        so the traceback of the original is not kept alive.
+        """
+        original: Exception = None
+        try:
+            raise AttributeError("No such class")
+        except AttributeError as exception:
+            original = exception
+        CodedToolClassCache.put_failure("one", "tools", "module", "Tool", original)
+
+        failure: Exception = CodedToolClassCache.get_failure("one", "tools", "module", "Tool")
+        self.assertIsNot(failure, original)
+        self.assertIsInstance(failure, AttributeError)
+        self.assertEqual(str(failure), "No such class")
+        self.assertIsNone(failure.__traceback__)
+
+    def test_expired_temp_networks_are_forgotten(self):
+        """
+        Classes resolved for temporary networks go away when the networks expire.
+        """
+        agent_spec: Dict[str, Any] = {"tools": [{"name": "greeter", "instructions": "Say hello."}]}
+        storage = ExpiringAgentNetworkStorage()
+        reservation = AgentReservation(60.0, prefix="temp")
+        reservation.set_expiration_from(time.time() - 120.0, 60.0)
+        storage.add_reservations({reservation: agent_spec})
+
+        agent_name: str = reservation.get_reservation_id()
+        CodedToolClassCache.put_class(agent_name, "tools", "module", "Tool", dict)
+        CodedToolClassCache.put_failure(agent_name, "tools", "module", "Other", ValueError("Not found"))
+        CodedToolClassCache.put_class("permanent", "tools", "module", "Tool", dict)
+
+        storage.expire_reservations()
+        self.assertIsNone(CodedToolClassCache.get_class(agent_name, "tools", "module", "Tool"))
+        self.assertIsNone(CodedToolClassCache.get_failure(agent_name, "tools", "module", "Other"))
+        self.assertIs(CodedToolClassCache.get_class("permanent", "tools", "module", "Tool"), dict)
@@ -0,0 +1,106 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import List
+
+from concurrent.futures import Future
+from threading import Condition
+from threading import Event
+from threading import Lock
+from threading import current_thread
+from unittest import TestCase
+
+import time
+
+from neuro_san.internals.graph.activations.coded_tool_thread_pool import CodedToolThreadPool
+
+
+class TestCodedToolThreadPool(TestCase):
+    """
+    Tests for the CodedToolThreadPool.
+    """
+
+    def setUp(self):
+        self.lock = Lock()
+        # Notified whenever another blocking call has started
+        self.arrived = Condition(self.lock)
+        self.concurrent: int = 0
+        self.max_concurrent: int = 0
+
+    def blocking_call(self, release: Event) -> str:
+        """
+        Stands in for a synchronous CodedTool.invoke() that blocks until released
+        :return: The name of the thread it ran on
+        """
+        with self.lock:
+            self.concurrent += 1
+            self.max_concurrent = max(self.max_concurrent, self.concurrent)
+            self.arrived.notify_all()
+        release.wait(5.0)
+        with self.lock:
+            self.concurrent -= 1
+        return current_thread().name
+
+    def test_per_tool_limit(self):
+        """
+        Calls of a limited tool run at most that many at a time,
+        while calls of other tools are not held up behind them.
+        """
+        release = Event()
+        slow_futures: List[Future] = [
+            CodedToolThreadPool.submit("test/slow", 2, self.blocking_call, release) for _ in range(6)
+        ]
+
+        # Wait for the slow calls allowed to run to have started
+        with self.arrived:
+            self.assertTrue(self.arrived.wait_for(lambda: self.concurrent == 2, timeout=5.0))
+
+        # Another tool gets a thread right away, even though the slow one has calls waiting.
+        other: Future = CodedToolThreadPool.submit("test/other", 0, current_thread)
+        self.assertTrue(other.result(timeout=5.0).name.startswith("coded_tool"))
+        self.assertEqual(2, self.max_concurrent)
+        self.assertGreaterEqual(CodedToolThreadPool.get_stats()["Queued"], 4)
+
+        release.set()
+        for future in slow_futures:
+            self.assertTrue(future.result(timeout=5.0).startswith("coded_tool"))
+        self.assertEqual(2, self.max_concurrent)
+        self.assertNotIn("test/slow", CodedToolThreadPool.running)
+        self.assertNotIn("test/slow", CodedToolThreadPool.pending)
+
+    def test_cancel_waiting(self):
+        """
+        Cancelled calls that have not started never run, and do not hold up others.
+        """
+        release = Event()
+        first: Future = CodedToolThreadPool.submit("test/cancel", 1, self.blocking_call, release)
+        ran: List[bool] = []
+        cancelled: Future = CodedToolThreadPool.submit("test/cancel", 1, ran.append, True)
+        last: Future = CodedToolThreadPool.submit("test/cancel", 1, time.monotonic)
+
+        self.assertTrue(cancelled.cancel())
+        release.set()
+        first.result(timeout=5.0)
+        last.result(timeout=5.0)
+        self.assertEqual([], ran)
+
+    def test_exception(self):
+        """
+        Exceptions from the call are passed on through the future.
+        """
+        future: Future = CodedToolThreadPool.submit("test/exception", 0, int, "not a number")
+        with self.assertRaises(ValueError):
+            future.result(timeout=5.0)
+        self.assertNotIn("test/exception", CodedToolThreadPool.running)
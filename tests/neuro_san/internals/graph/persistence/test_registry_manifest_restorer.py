@@ -0,0 +1,185 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Dict
+from typing import List
+
+import os
+
+from pathlib import Path
+from unittest import TestCase
+
+import tempfile
+
+from neuro_san.internals.graph.persistence.agent_network_file_cache import AgentNetworkFileCache
+from neuro_san.internals.graph.persistence.registry_manifest_restorer import RegistryManifestRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.interfaces.agent_state_listener import AgentStateListener
+from neuro_san.internals.interfaces.agent_storage_source import AgentStorageSource
+from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+
+NETWORK_TEMPLATE: str = """
+{
+    include "COMMON"
+    "tools": [
+        {
+            "name": "front_man",
+            "function": {
+                "description": "Answers questions"
+            },
+            "instructions": ${instructions}
+        }
+    ]
+}
+"""
+
+
+class RecordingListener(AgentStateListener):
+    """
+    AgentStateListener that records what it is told
+    """
+
+    def __init__(self):
+        self.events: List[str] = []
+
+    def agent_added(self, agent_name: str, source: AgentStorageSource):
+        self.events.append(f"added {agent_name}")
+
+    def agent_modified(self, agent_name: str, source: AgentStorageSource):
+        self.events.append(f"modified {agent_name}")
+
+    def agent_removed(self, agent_name: str, source: AgentStorageSource):
+        self.events.append(f"removed {agent_name}")
+
+
+class TestRegistryManifestRestorer(TestCase):
+    """
+    Tests for incremental manifest restoring with an AgentNetworkFileCache
+    """
+
+    def setUp(self):
+        """
+        Set up a registry directory with a manifest and two networks, one of which includes a common file
+        """
+        # pylint: disable=consider-using-with
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.registry_dir = Path(self.temp_dir.name)
+        self.write("manifest.hocon", '{ "one.hocon": true, "two.hocon": true }')
+        self.write("common.hocon", 'instructions = "Be helpful."')
+        self.write("one.hocon", NETWORK_TEMPLATE)
+        self.write("two.hocon", NETWORK_TEMPLATE.replace('include "COMMON"', 'instructions = "Be brief."'))
+
+        self.cache = AgentNetworkFileCache()
+        self.manifest_file: str = str(self.registry_dir / "manifest.hocon")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, name: str, contents: str):
+        """
+        Write a file in the registry directory, making sure its modification time changes
+        """
+        path: Path = self.registry_dir / name
+        old_mtime_ns: int = path.stat().st_mtime_ns if path.exists() else 0
+        path.write_text(contents.replace("COMMON", str(self.registry_dir / "common.hocon")), encoding="utf-8")
+        if path.stat().st_mtime_ns == old_mtime_ns:
+            os.utime(path, ns=(old_mtime_ns + 1000, old_mtime_ns + 1000))
+
+    def restore(self) -> Dict[str, AgentNetwork]:
+        """
+        :return: The public networks from a restore with the shared cache
+        """
+        restorer = RegistryManifestRestorer(self.manifest_file, network_cache=self.cache)
+        return restorer.restore().get("public")
+
+    def test_unchanged_networks_are_reused(self):
+        """
+        Networks whose files have not changed are not parsed again, even if they were touched.
+        """
+        first: Dict[str, AgentNetwork] = self.restore()
+        self.assertEqual(set(first.keys()), {"one", "two"})
+        self.assertEqual(self.cache.num_misses, 2)
+
+        stat = os.stat(self.registry_dir / "two.hocon")
+        os.utime(self.registry_dir / "two.hocon", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        second: Dict[str, AgentNetwork] = self.restore()
+        self.assertIs(second.get("one"), first.get("one"))
+        self.assertIs(second.get("two"), first.get("two"))
+        self.assertEqual(self.cache.num_hits, 2)
+
+    def test_included_file_invalidates_dependents(self):
+        """
+        A change to an included file re-parses only the networks which include it.
+        """
+        first: Dict[str, AgentNetwork] = self.restore()
+        self.write("common.hocon", 'instructions = "Be very helpful."')
+
+        second: Dict[str, AgentNetwork] = self.restore()
+        self.assertIsNot(second.get("one"), first.get("one"))
+        self.assertIs(second.get("two"), first.get("two"))
+        tool: Dict[str, str] = second.get("one").get_agent_tool_spec("front_man")
+        self.assertEqual(tool.get("instructions"), "Be very helpful.")
+
+    def test_storage_gets_deltas(self):
+        """
+        Storage listeners only hear about what actually changed.
+        """
+        storage = AgentNetworkStorage()
+        listener = RecordingListener()
+        storage.add_listener(listener)
+
+        storage.setup_agent_networks(self.restore())
+        self.assertEqual(sorted(listener.events), ["added one", "added two"])
+
+        listener.events = []
+        self.write("manifest.hocon", '{ "one.hocon": true, "three.hocon": true }')
+        self.write("one.hocon", NETWORK_TEMPLATE.replace("front_man", "greeter"))
+        self.write("three.hocon", NETWORK_TEMPLATE)
+        storage.setup_agent_networks(self.restore())
+        self.assertEqual(sorted(listener.events), ["added three", "modified one", "removed two"])
+
+        listener.events = []
+        storage.setup_agent_networks(self.restore())
+        self.assertEqual(listener.events, [])
+
+        # Networks no longer in the manifest are forgotten
+        self.assertEqual(len(self.cache.entries), 2)
+
+    def test_worker_processes_restore_the_same(self):
+        """
+        Restoring with worker processes gives the same networks and the same errors, in the same order.
+        """
+        self.write("manifest.hocon", '{ "one.hocon": true, "broken.hocon": true, "two.hocon": true }')
+        self.write("broken.hocon", '{ "tools": [ ')
+
+        results: List[List] = []
+        for max_workers in (1, 2):
+            restorer = RegistryManifestRestorer(self.manifest_file, max_workers=max_workers)
+            # Few enough networks to make sure worker processes are used
+            restorer.MIN_NETWORKS_FOR_WORKERS = 2   # pylint: disable=invalid-name
+            with self.assertLogs(level="ERROR") as logs:
+                networks: Dict[str, AgentNetwork] = restorer.restore().get("public")
+            results.append([{name: network.get_config() for name, network in networks.items()},
+                            [record.getMessage() for record in logs.records]])
+
+        sequential: List = results[0]
+        parallel: List = results[1]
+        self.assertEqual(set(sequential[0].keys()), {"one", "two"})
+        self.assertEqual(parallel[0], sequential[0])
+        self.assertEqual(parallel[1], sequential[1])
+        self.assertTrue(parallel[1][0].startswith("Parse error in registry item broken.hocon"))
@@ -0,0 +1,120 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+import json
+import pickle
+
+from copy import deepcopy
+from unittest import TestCase
+
+from neuro_san.internals.graph.persistence.registry_manifest_restorer import RegistryManifestRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+
+
+class TestAgentNetwork(TestCase):
+    """
+    Tests for the copy-on-write copies of AgentNetworks made for each chat session
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Restore the bundled registries once for all tests
+        """
+        networks: Dict[str, Dict[str, AgentNetwork]] = RegistryManifestRestorer().restore()
+        cls.networks: List[AgentNetwork] = list(networks.get("public").values()) \
+            + list(networks.get("protected").values())
+
+    def test_copies_share_read_only_specs(self):
+        """
+        Copies share specs, which cannot be modified, but which can be deep copied into modifiable ones.
+        """
+        network: AgentNetwork = AgentNetwork(deepcopy(self.networks[0].get_config()), "private")
+        front_man: str = network.find_front_man()
+
+        one: AgentNetwork = network.create_copy()
+        two: AgentNetwork = network.create_copy()
+        spec: Dict[str, Any] = one.get_agent_tool_spec(front_man)
+        self.assertIs(spec, two.get_agent_tool_spec(front_man))
+        self.assertEqual(spec, network.get_agent_tool_spec(front_man))
+
+        with self.assertRaises(TypeError):
+            spec["instructions"] = "Something else"
+        with self.assertRaises(TypeError):
+            spec.get("tools").append("another_agent")
+        with self.assertRaises(TypeError):
+            one.get_config().pop("tools")
+
+        # Read-only specs still look like regular ones to everyone else
+        self.assertIsInstance(spec, dict)
+        self.assertEqual(json.loads(json.dumps(spec)), spec)
+        self.assertEqual(pickle.loads(pickle.dumps(spec)), spec)
+
+        modifiable: Dict[str, Any] = deepcopy(spec)
+        modifiable["instructions"] = "Something else"
+        modifiable.get("tools").append("another_agent")
+
+        # The original network is untouched and can still be modified as before
+        network.get_config()["metadata"] = {}
+
+    def test_replace_agent_tool_spec(self):
+        """
+        Changes to the agent specs of a copy stay with that copy.
+        """
+        network: AgentNetwork = self.networks[0]
+        front_man: str = network.find_front_man()
+        original: Dict[str, Any] = network.get_agent_tool_spec(front_man)
+
+        one: AgentNetwork = network.create_copy()
+        two: AgentNetwork = network.create_copy()
+        replacement: Dict[str, Any] = deepcopy(original)
+        replacement["instructions"] = "Something else"
+        one.replace_agent_tool_spec(front_man, replacement)
+
+        self.assertEqual(one.get_agent_tool_spec(front_man).get("instructions"), "Something else")
+        self.assertEqual(two.get_agent_tool_spec(front_man), original)
+        self.assertIs(network.get_agent_tool_spec(front_man), original)
+
+    def test_copies_share_structure(self):
+        """
+        Copies of every bundled network share the one read-only snapshot of its config
+        instead of each having their own, and only the map of agent specs is per copy.
+        """
+        for network in self.networks:
+            one: AgentNetwork = network.create_copy()
+            two: AgentNetwork = network.create_copy()
+
+            self.assertIs(one.get_config(), two.get_config())
+            self.assertIsNot(one.get_config(), network.get_config())
+            self.assertIsNot(one.agent_spec_map, two.agent_spec_map)
+            for name, agent_spec in one.agent_spec_map.items():
+                self.assertIs(agent_spec, two.get_agent_tool_spec(name))
+
+            with self.assertRaises(TypeError):
+                one.get_config()["llm_config"] = {}
+
+            # Replacing one spec in a copy leaves the rest of the structure shared
+            front_man: str = one.find_front_man()
+            one.replace_agent_tool_spec(front_man, {"instructions": "Something else"})
+            self.assertIsNot(one.get_agent_tool_spec(front_man), two.get_agent_tool_spec(front_man))
+            for name, agent_spec in two.agent_spec_map.items():
+                if name != front_man:
+                    self.assertIs(agent_spec, one.get_agent_tool_spec(name))
@@ -0,0 +1,198 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from copy import copy
+from unittest import TestCase
+from unittest.mock import patch
+
+import asyncio
+import json
+
+from langchain_core.messages.ai import AIMessage
+from langchain_core.messages.base import BaseMessage
+from langchain_core.messages.system import SystemMessage
+
+from neuro_san import REGISTRIES_DIR
+from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
+from neuro_san.internals.filters.answer_message_filter import AnswerMessageFilter
+from neuro_san.internals.filters.chat_context_message_filter import ChatContextMessageFilter
+from neuro_san.internals.filters.maximal_message_filter import MaximalMessageFilter
+from neuro_san.internals.filters.message_filter import MessageFilter
+from neuro_san.internals.filters.minimal_message_filter import MinimalMessageFilter
+from neuro_san.internals.filters.token_accounting_message_filter import TokenAccountingMessageFilter
+from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.journals.message_journal import MessageJournal
+from neuro_san.internals.messages.agent_framework_message import AgentFrameworkMessage
+from neuro_san.internals.messages.agent_message import AgentMessage
+from neuro_san.internals.messages.agent_tool_result_message import AgentToolResultMessage
+from neuro_san.internals.messages.base_message_dictionary_converter import BaseMessageDictionaryConverter
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+
+
+class TestMessageJournal(TestCase):
+    """
+    Tests for filtering messages in the MessageJournal before they are converted to dictionaries.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        restorer = AgentNetworkRestorer(registry_dir=REGISTRIES_DIR.get_file_in_basis(""))
+        cls.agent_network: AgentNetwork = restorer.restore("music_nerd_pro_multi_agents.hocon")
+
+    def test_may_allow_is_conservative(self):
+        """
+        No message that a filter would allow as a dictionary is turned away before conversion.
+        """
+        message_filters: List[MessageFilter] = [
+            MinimalMessageFilter(), MaximalMessageFilter(), AnswerMessageFilter(),
+            ChatContextMessageFilter(), TokenAccountingMessageFilter()
+        ]
+        for message, origin in self.make_request_messages():
+            message_dict: Dict[str, Any] = BaseMessageDictionaryConverter(origin=origin).to_dict(message)
+            message_type: ChatMessageType = ChatMessageType.from_message(message)
+            for message_filter in message_filters:
+                if message_filter.allow(message_dict):
+                    self.assertTrue(message_filter.may_allow(message_type, origin),
+                                    f"{message_filter.__class__.__name__} on {message_dict}")
+
+    def test_filtered_journal(self):
+        """
+        Clients get the same responses whether or not the journal filters,
+        with far fewer messages converted under the default MINIMAL filter.
+        """
+        for message_filter in (MinimalMessageFilter(), MaximalMessageFilter()):
+            unfiltered: List[Dict[str, Any]] = asyncio.run(self.run_request(message_filter, False))[0]
+            filtered: List[Dict[str, Any]] = asyncio.run(self.run_request(message_filter, True))[0]
+            self.assertEqual(unfiltered, filtered)
+
+    def test_music_nerd_pro_allocations(self):
+        """
+        Count dictionary allocations per request for a music_nerd_pro_multi_agents
+        message stream under the default MINIMAL filter, before and after journal filtering.
+        """
+        message_filter = MinimalMessageFilter()
+        num_messages: int = len(self.make_request_messages())
+
+        # Before: every message converted and every response dict copied.
+        _, num_allocations = asyncio.run(self.run_request(message_filter, False))
+        self.assertEqual(2 * num_messages, num_allocations)
+
+        # After: only the final chat_context message.
+        _, num_allocations = asyncio.run(self.run_request(message_filter, True))
+        self.assertEqual(2, num_allocations)
+
+    async def run_request(self, message_filter: MessageFilter,
+                          journal_filters: bool) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Journal the messages of one request and consume them the way AsyncDirectAgentSession does.
+
+        :param message_filter: The MessageFilter the client asked for
+        :param journal_filters: True if the MessageJournal is to filter before conversion,
+                    and responses are only copied for messages allowed through.
+                    False for how it was before that.
+        :return: A tuple of (responses yielded, number of message and response dictionaries allocated)
+        """
+        messages: List[Tuple[BaseMessage, List[Dict[str, Any]]]] = self.make_request_messages()
+        queue = AsyncCollatingQueue()
+        journal = MessageJournal(queue, message_filter if journal_filters else None)
+
+        num_allocations: int = 0
+        original_to_dict = BaseMessageDictionaryConverter.to_dict
+
+        def counting_to_dict(converter: BaseMessageDictionaryConverter, obj: BaseMessage) -> Dict[str, Any]:
+            nonlocal num_allocations
+            num_allocations += 1
+            return original_to_dict(converter, obj)
+
+        responses: List[Dict[str, Any]] = []
+        with patch.object(BaseMessageDictionaryConverter, "to_dict", counting_to_dict):
+            for message, origin in messages:
+                await journal.write_message(message, origin)
+            await queue.put_final_item(synchronous=True)
+
+        template_response_dict: Dict[str, Any] = {}
+        async for message_dict in queue:
+            response_dict: Dict[str, Any] = None
+            if not journal_filters:
+                response_dict = copy(template_response_dict)
+                num_allocations += 1
+            if message_filter.allow(message_dict):
+                if journal_filters:
+                    response_dict = copy(template_response_dict)
+                    num_allocations += 1
+                response_dict["response"] = message_dict
+                responses.append(response_dict)
+
+        queue.close()
+        return responses, num_allocations
+
+    def make_request_messages(self) -> List[Tuple[BaseMessage, List[Dict[str, Any]]]]:
+        """
+        :return: A list of (message, origin) tuples as journaled over the course of
+                one request to music_nerd_pro_multi_agents: the front man calls MusicGuru,
+                then Accountant, which calls its accounting_tool CodedTool.
+        """
+        def origin_of(*names: str) -> List[Dict[str, Any]]:
+            return [{"tool": name, "instantiation_index": 1} for name in names]
+
+        def instructions(name: str) -> str:
+            return self.agent_network.get_agent_tool_spec(name).get("instructions", "")
+
+        def token_accounting(cost: float) -> AgentMessage:
+            return AgentMessage(content="", structure={"total_tokens": 1234, "prompt_tokens": 1000,
+                                                       "completion_tokens": 234, "total_cost": cost})
+
+        front_man: List[Dict[str, Any]] = origin_of("MusicNerdPro")
+        guru: List[Dict[str, Any]] = origin_of("MusicNerdPro", "MusicGuru")
+        accountant: List[Dict[str, Any]] = origin_of("MusicNerdPro", "Accountant")
+        tool: List[Dict[str, Any]] = origin_of("MusicNerdPro", "Accountant", "accounting_tool")
+
+        answer: str = ("The Beatles' 'Abbey Road' closes with a medley that Paul McCartney pieced together "
+                       "from unfinished songs, recorded in the summer of 1969. " * 8)
+        final: str = json.dumps({"answer": answer, "running_cost": 3.0})
+        chat_context: Dict[str, Any] = {
+            "chat_histories": [{
+                "origin": front_man,
+                "messages": [{"type": "HUMAN", "text": "Tell me about Abbey Road."},
+                             {"type": "AI", "text": final}]
+            }]
+        }
+
+        return [
+            (SystemMessage(content=instructions("MusicNerdPro")), front_man),
+            (AIMessage(content="Calling MusicGuru with the question."), front_man),
+            (SystemMessage(content=instructions("MusicGuru")), guru),
+            (AgentMessage(content=json.dumps({"query": "Tell me about Abbey Road."})), guru),
+            (AIMessage(content=answer), guru),
+            (token_accounting(0.01), guru),
+            (AgentToolResultMessage(content=answer, tool_result_origin=guru), front_man),
+            (AIMessage(content="Calling Accountant with the running cost."), front_man),
+            (SystemMessage(content=instructions("Accountant")), accountant),
+            (AgentMessage(content=json.dumps({"running_cost": 0.0})), accountant),
+            (AgentMessage(content=json.dumps({"running_cost": 0.0})), tool),
+            (AgentMessage(content=json.dumps({"running_cost": 3.0})), tool),
+            (AIMessage(content="The updated running cost is 3.0"), accountant),
+            (token_accounting(0.005), accountant),
+            (AgentToolResultMessage(content="3.0", tool_result_origin=accountant), front_man),
+            (AIMessage(content=final), front_man),
+            (token_accounting(0.02), front_man),
+            (AgentFrameworkMessage(content=final, chat_context=chat_context, structure=json.loads(final)), None),
+        ]
@@ -0,0 +1,82 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from unittest import TestCase
+
+import asyncio
+
+from langchain_core.tools.base import BaseTool
+
+from neuro_san import REGISTRIES_DIR
+from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.run_context.interfaces.agent_network_inspector import AgentNetworkInspector
+from neuro_san.internals.run_context.interfaces.tool_caller import ToolCaller
+from neuro_san.internals.run_context.langchain.core.base_tool_factory import BaseToolFactory
+
+
+# pylint: disable=abstract-method
+class NetworkToolCaller(ToolCaller):
+    """
+    Stands in for the CallingTool of one agent in an agent network.
+    Only what is needed to create tools is implemented.
+    """
+
+    def __init__(self, inspector: AgentNetworkInspector, name: str):
+        self.inspector: AgentNetworkInspector = inspector
+        self.name: str = name
+
+    def get_inspector(self) -> AgentNetworkInspector:
+        return self.inspector
+
+    def get_agent_tool_spec(self) -> Dict[str, Any]:
+        return self.inspector.get_agent_tool_spec(self.name)
+
+    def get_name(self) -> str:
+        return self.name
+
+
+class TestBaseToolFactory(TestCase):
+    """
+    Tests for BaseToolFactory
+    """
+
+    def test_internal_tools_of_shared_network(self):
+        """
+        Tools for internal agents can be created from the read-only specs
+        that copies of an agent network share.
+        """
+        file_reference: str = REGISTRIES_DIR.get_file_in_basis("music_nerd_pro_multi_agents.hocon")
+        network: AgentNetwork = AgentNetworkRestorer().restore(file_reference=file_reference)
+        session_network: AgentNetwork = network.create_copy()
+
+        front_man: str = session_network.find_front_man()
+        tool_caller = NetworkToolCaller(session_network, front_man)
+        factory = BaseToolFactory(tool_caller, None, None)
+
+        tool_names: List[str] = session_network.get_agent_tool_spec(front_man).get("tools")
+        self.assertGreater(len(tool_names), 0)
+        for tool_name in tool_names:
+            tool: BaseTool = asyncio.run(factory.create_base_tool(tool_name))
+            self.assertEqual(tool.name, tool_name)
+
+            # The shared spec is left as it was
+            self.assertNotIn("name", session_network.get_agent_tool_spec(tool_name).get("function"))
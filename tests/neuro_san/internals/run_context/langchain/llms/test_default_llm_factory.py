@@ -0,0 +1,183 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+from pathlib import Path
+from unittest.mock import patch
+
+import time
+
+import pytest
+
+from neuro_san import REGISTRIES_DIR
+from neuro_san.internals.graph.persistence.agent_network_restorer import AgentNetworkRestorer
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.run_context.langchain.llms.default_llm_factory import DefaultLlmFactory
+
+
+class TestDefaultLlmFactory:
+    """
+    Tests for the memoized llm config resolution of the DefaultLlmFactory
+    """
+
+    def test_cached_full_config(self):
+        """
+        Same llm_config, same fully specified config, which callers can modify freely.
+        """
+        factory = DefaultLlmFactory()
+        factory.load()
+        llm_config: Dict[str, Any] = {"model_name": "gpt-4o", "temperature": 0.5}
+
+        first: Dict[str, Any] = factory.create_full_llm_config(llm_config)
+        assert first.get("model_name") == "gpt-4o-2024-08-06"
+        assert first.get("temperature") == 0.5
+        assert first.get("class") == "openai"
+        assert len(factory.full_config_cache) == 1
+
+        first["temperature"] = 1.0
+        first["default_headers"] = {"X-Test": "modified"}
+        second: Dict[str, Any] = factory.create_full_llm_config({"temperature": 0.5, "model_name": "gpt-4o"})
+        assert second.get("temperature") == 0.5
+        assert "default_headers" not in second
+        assert len(factory.full_config_cache) == 1
+
+        # Different llm_config, different entry
+        third: Dict[str, Any] = factory.create_full_llm_config({"model_name": "gpt-4o", "temperature": 0.7})
+        assert third.get("temperature") == 0.7
+        assert len(factory.full_config_cache) == 2
+
+        # Bad configs keep on failing
+        for _ in range(2):
+            try:
+                factory.create_full_llm_config({"model_name": "no-such-model"})
+                assert False, "Expected ValueError"
+            except ValueError:
+                pass
+        assert len(factory.full_config_cache) == 2
+
+    def test_load_invalidates(self, tmp_path: Path):
+        """
+        Re-reading the llm info files makes configs get resolved again.
+        """
+        llm_info_file: Path = tmp_path / "llm_info.hocon"
+        llm_info_file.write_text('{ "gpt-4o-2024-08-06": { "max_output_tokens": 1000 } }', encoding="utf-8")
+        factory = DefaultLlmFactory({"llm_info_file": str(llm_info_file)})
+        factory.load()
+
+        llm_config: Dict[str, Any] = {"model_name": "gpt-4o", "prompt_token_fraction": 0.5}
+        assert factory.create_full_llm_config(llm_config).get("max_tokens") == 500
+
+        llm_info_file.write_text('{ "gpt-4o-2024-08-06": { "max_output_tokens": 3000 } }', encoding="utf-8")
+        assert factory.create_full_llm_config(llm_config).get("max_tokens") == 500
+
+        factory.load()
+        assert len(factory.full_config_cache) == 0
+        assert factory.create_full_llm_config(llm_config).get("max_tokens") == 1500
+
+    def test_bundled_registries_memoized(self):
+        """
+        Resolving the llm configs of the agents of the bundled registries over and over,
+        as happens for every agent on every request, only resolves each distinct config once.
+        """
+        factory = DefaultLlmFactory()
+        factory.load()
+        usable: List[Dict[str, Any]] = self.get_usable_llm_configs(factory)
+        assert len(usable) > 0
+        num_distinct: int = len({factory.get_full_config_cache_key(llm_config) for llm_config in usable})
+
+        with patch.object(factory, "resolve_full_llm_config", wraps=factory.resolve_full_llm_config) as resolve:
+            for _ in range(5):
+                for llm_config in usable:
+                    factory.create_full_llm_config(llm_config)
+        assert resolve.call_count == num_distinct
+
+        # Same results either way
+        for llm_config in usable:
+            assert factory.create_full_llm_config(llm_config) == factory.resolve_full_llm_config(llm_config)
+
+    @pytest.mark.integration
+    def test_bundled_registries_profile(self):
+        """
+        Measure llm config resolution for the agents of the bundled registries,
+        as it happens for every agent on every request.
+        This only reports timings, so it is not part of the unit tests.
+        """
+        factory = DefaultLlmFactory()
+        factory.load()
+        usable: List[Dict[str, Any]] = self.get_usable_llm_configs(factory)
+
+        num_rounds: int = 100
+        start: float = time.perf_counter()
+        for _ in range(num_rounds):
+            for llm_config in usable:
+                factory.resolve_full_llm_config(llm_config)
+        uncached_seconds: float = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(num_rounds):
+            for llm_config in usable:
+                factory.create_full_llm_config(llm_config)
+        cached_seconds: float = time.perf_counter() - start
+
+        num_calls: int = num_rounds * len(usable)
+        print(f"\nllm config resolution for {len(usable)} agent llm_configs of the bundled registries:"
+              f"\n  uncached: {1e6 * uncached_seconds / num_calls:.1f} us per agent"
+              f"\n  cached:   {1e6 * cached_seconds / num_calls:.1f} us per agent")
+
+    def get_usable_llm_configs(self, factory: DefaultLlmFactory) -> List[Dict[str, Any]]:
+        """
+        :param factory: The DefaultLlmFactory to resolve configs with
+        :return: The llm_configs of the agents of the bundled registries which resolve.
+                Some bundled configs refer to models or classes not in the default llm info.
+                Those fail the same way with or without the cache.
+        """
+        usable: List[Dict[str, Any]] = []
+        for llm_config in self.get_bundled_llm_configs():
+            try:
+                factory.resolve_full_llm_config(llm_config)
+                usable.append(llm_config)
+            except ValueError:
+                pass
+        return usable
+
+    @staticmethod
+    def get_bundled_llm_configs() -> List[Dict[str, Any]]:
+        """
+        :return: A list of the llm_configs as they would be given to the factory
+                for the agents of the bundled registries
+        """
+        llm_configs: List[Dict[str, Any]] = []
+        registry_dir = Path(REGISTRIES_DIR.get_file_in_basis(""))
+        restorer = AgentNetworkRestorer(registry_dir=str(registry_dir))
+        for hocon_file in sorted(registry_dir.rglob("*.hocon")):
+            if hocon_file.name == "manifest.hocon":
+                continue
+            try:
+                agent_network: AgentNetwork = restorer.restore(str(hocon_file.relative_to(registry_dir)))
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Not all files under the registries are agent networks
+                continue
+            network_llm_config: Dict[str, Any] = agent_network.get_config().get("llm_config", {})
+            for agent_spec in agent_network.get_config().get("tools", []):
+                if agent_spec.get("class") is not None or agent_spec.get("toolbox") is not None:
+                    # CodedTools and toolbox tools do not have an LLM
+                    continue
+                llm_config: Dict[str, Any] = dict(network_llm_config)
+                llm_config.update(agent_spec.get("llm_config", {}))
+                llm_configs.append(llm_config)
+        return llm_configs
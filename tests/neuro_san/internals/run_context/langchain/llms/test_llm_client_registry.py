@@ -0,0 +1,175 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+from unittest.mock import patch
+
+import asyncio
+
+import pytest
+
+from neuro_san.internals.run_context.langchain.llms.llm_client_registry import LlmClientRegistry
+from neuro_san.internals.run_context.langchain.llms.openai_llm_policy import OpenAILlmPolicy
+
+from tests.neuro_san.utils.stub_http_server import StubHttpServer
+
+
+class TestLlmClientRegistry:
+    """
+    Tests for sharing LLM web clients across requests
+    """
+
+    @pytest.fixture(autouse=True)
+    def reset_registry(self):
+        """
+        Start and end each test with an empty registry
+        """
+        LlmClientRegistry.reset_for_testing()
+        yield
+        LlmClientRegistry.reset_for_testing()
+
+    @staticmethod
+    def make_config(port: int) -> Dict[str, Any]:
+        """
+        :param port: The port of the stub server
+        :return: a fully-specified llm config pointing at the stub server
+        """
+        return {
+            "class": "openai",
+            "model_name": "gpt-4o",
+            "openai_api_key": "not-a-real-key",
+            "openai_api_base": f"http://127.0.0.1:{port}/v1",
+            "request_timeout": 10,
+            "max_retries": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_connection_reuse(self):
+        """
+        Consecutive requests with the same llm config reuse the same connection.
+        """
+        server = StubHttpServer()
+        port: int = await server.start()
+        config: Dict[str, Any] = self.make_config(port)
+
+        http_clients = []
+        for _ in range(3):
+            # Each iteration stands in for a new request creating its own llm.
+            policy = OpenAILlmPolicy()
+            llm, _ = policy.create_llm_resources_components(config)
+            assert llm is not None
+            response = await policy.http_client.get(f"http://127.0.0.1:{port}/v1/models")
+            assert response.status_code == 200
+            http_clients.append(policy.http_client)
+            await policy.delete_resources()
+
+        assert http_clients[0] is http_clients[1] is http_clients[2]
+        assert server.num_connections == 1
+        assert LlmClientRegistry.get_num_pooled() == 1
+
+        # Idle clients get closed when evicted
+        await LlmClientRegistry.evict_idle(idle_seconds=0.0)
+        assert LlmClientRegistry.get_num_pooled() == 0
+        assert http_clients[0].is_closed
+
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_different_config_not_shared(self):
+        """
+        Different credentials get different clients.
+        """
+        config: Dict[str, Any] = self.make_config(1)
+        other_config: Dict[str, Any] = dict(config)
+        other_config["openai_api_key"] = "another-fake-key"
+
+        policy = OpenAILlmPolicy()
+        policy.create_llm_resources_components(config)
+        other_policy = OpenAILlmPolicy()
+        other_policy.create_llm_resources_components(other_config)
+
+        assert policy.http_client is not other_policy.http_client
+        assert LlmClientRegistry.get_num_pooled("OpenAILlmPolicy") == 2
+
+        await policy.delete_resources()
+        await other_policy.delete_resources()
+
+    @pytest.mark.asyncio
+    async def test_provider_limit(self, monkeypatch):
+        """
+        Past the per-provider limit clients are not pooled and get closed on release.
+        """
+        monkeypatch.setattr(LlmClientRegistry, "MAX_CLIENTS_PER_PROVIDER", 1)
+
+        policy = OpenAILlmPolicy()
+        policy.create_llm_resources_components(self.make_config(1))
+        other_policy = OpenAILlmPolicy()
+        other_policy.create_llm_resources_components(self.make_config(2))
+
+        assert LlmClientRegistry.get_num_pooled() == 1
+        assert other_policy.client_pool_key is None
+
+        http_client = other_policy.http_client
+        await other_policy.delete_resources()
+        assert http_client.is_closed
+
+        await policy.delete_resources()
+
+    def test_closed_loops_dropped(self, monkeypatch):
+        """
+        Clients of closed event loops are never handed out again,
+        and do not count against the per-provider limit.
+        """
+        monkeypatch.setattr(LlmClientRegistry, "MAX_CLIENTS_PER_PROVIDER", 1)
+
+        async def acquire() -> Any:
+            client, key = LlmClientRegistry.acquire("provider", {"base_url": "here"}, object)
+            assert key is not None
+            return client
+
+        first: Any = asyncio.run(acquire())
+        assert LlmClientRegistry.get_num_pooled("provider") == 1
+
+        second: Any = asyncio.run(acquire())
+        assert second is not first
+        assert LlmClientRegistry.get_num_pooled("provider") == 1
+
+    def test_same_key_other_loop(self):
+        """
+        An entry is only a hit on the very loop it was created on.
+        """
+        async def acquire() -> Any:
+            return LlmClientRegistry.acquire("provider", {"base_url": "here"}, object)
+
+        with patch.object(LlmClientRegistry, "make_key", return_value="same"):
+            first, _ = asyncio.run(acquire())
+            loop = asyncio.new_event_loop()
+            try:
+                second, key = loop.run_until_complete(acquire())
+            finally:
+                loop.close()
+        assert key == "same"
+        assert second is not first
+
+    def test_no_running_loop(self):
+        """
+        Without a running event loop, nothing is shared.
+        """
+        policy = OpenAILlmPolicy()
+        policy.create_llm_resources_components(self.make_config(1))
+        assert policy.client_pool_key is None
+        assert LlmClientRegistry.get_num_pooled() == 0
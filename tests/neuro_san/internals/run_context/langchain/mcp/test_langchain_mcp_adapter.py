@@ -23,6 +23,7 @@ import pytest
 from langchain_core.tools import StructuredTool
 
 from neuro_san.internals.run_context.langchain.mcp.langchain_mcp_adapter import LangChainMcpAdapter
+from neuro_san.internals.run_context.langchain.mcp.mcp_tools_cache import McpToolsCache
 
 
 class TestLangChainMcpAdapter:
@@ -46,8 +47,10 @@ class TestLangChainMcpAdapter:
         """Reset class-level state before and after each test"""
         # pylint: disable=protected-access
         LangChainMcpAdapter._mcp_servers_info = None
+        McpToolsCache.reset_for_testing()
         yield
         LangChainMcpAdapter._mcp_servers_info = None
+        McpToolsCache.reset_for_testing()
 
     def test_init(self, adapter):
         """Test adapter initialization"""
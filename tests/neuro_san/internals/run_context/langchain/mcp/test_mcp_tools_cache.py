@@ -0,0 +1,126 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import List
+
+import asyncio
+
+import pytest
+
+from langchain_core.tools import BaseTool
+
+from neuro_san.internals.run_context.langchain.mcp.langchain_mcp_adapter import LangChainMcpAdapter
+from neuro_san.internals.run_context.langchain.mcp.mcp_tools_cache import McpToolsCache
+
+from tests.neuro_san.utils.stub_mcp_server import StubMcpServer
+
+
+class TestMcpToolsCache:
+    """
+    Tests for sharing MCP tool discovery across requests
+    """
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        """
+        Start and end each test with an empty cache and no MCP servers info
+        """
+        # pylint: disable=protected-access
+        LangChainMcpAdapter._mcp_servers_info = {}
+        McpToolsCache.reset_for_testing()
+        yield
+        LangChainMcpAdapter._mcp_servers_info = None
+        McpToolsCache.reset_for_testing()
+
+    @pytest.fixture
+    def mcp_server(self):
+        """
+        A local MCP server
+        """
+        server = StubMcpServer()
+        server.start()
+        yield server
+        server.stop()
+
+    @pytest.mark.asyncio
+    async def test_discovery_is_cached(self, mcp_server: StubMcpServer):
+        """
+        Concurrent and subsequent requests for the same server share one tools/list,
+        and the tools still work.
+        """
+        url: str = mcp_server.url
+        results: List[List[BaseTool]] = await asyncio.gather(
+            *[LangChainMcpAdapter().get_mcp_tools(url) for _ in range(5)])
+        results.append(await LangChainMcpAdapter().get_mcp_tools(url))
+
+        assert mcp_server.get_num_list_tools() == 1
+        assert McpToolsCache.num_fetches == 1
+        for tools in results:
+            assert [tool.name for tool in tools] == ["add"]
+
+        # Different headers are a different cache entry
+        await LangChainMcpAdapter().get_mcp_tools(url, headers={"Authorization": "Bearer other"})
+        assert mcp_server.get_num_list_tools() == 2
+
+        # Invalidation forces a new discovery
+        McpToolsCache.invalidate(url)
+        tools: List[BaseTool] = await LangChainMcpAdapter().get_mcp_tools(url)
+        assert mcp_server.get_num_list_tools() == 3
+
+        # Cached tools open their own session when called
+        result = await tools[0].ainvoke({"a": 2, "b": 3})
+        assert "5" in str(result)
+
+    @pytest.mark.asyncio
+    async def test_expiry(self, monkeypatch):
+        """
+        Stale entries are fetched again.
+        """
+        num_calls: List[int] = [0]
+
+        async def fetch_tools():
+            num_calls[0] += 1
+            return []
+
+        monkeypatch.setattr(McpToolsCache, "TTL_SECONDS", 0.05)
+        await McpToolsCache.get_tools("http://example.com/mcp", None, fetch_tools)
+        await McpToolsCache.get_tools("http://example.com/mcp", None, fetch_tools)
+        assert num_calls[0] == 1
+        await asyncio.sleep(0.1)
+        await McpToolsCache.get_tools("http://example.com/mcp", None, fetch_tools)
+        assert num_calls[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_shared_not_cached(self):
+        """
+        Waiters see the failure of the fetch they joined, but the next request tries again.
+        """
+        num_calls: List[int] = [0]
+
+        async def failing_fetch():
+            num_calls[0] += 1
+            await asyncio.sleep(0.05)
+            raise ConnectionError("down")
+
+        results = await asyncio.gather(
+            *[McpToolsCache.get_tools("http://example.com/mcp", None, failing_fetch) for _ in range(3)],
+            return_exceptions=True)
+        assert num_calls[0] == 1
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+        with pytest.raises(ConnectionError):
+            await McpToolsCache.get_tools("http://example.com/mcp", None, failing_fetch)
+        assert num_calls[0] == 2
@@ -0,0 +1,260 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+from unittest import TestCase
+
+import asyncio
+import json
+import os
+import tempfile
+
+from aiohttp import ClientSession
+from aiohttp import ClientTimeout
+
+from leaf_common.asyncio.asyncio_executor_pool import AsyncioExecutorPool
+
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.service.generic.in_process_agent_session import InProcessAgentSession
+from neuro_san.service.generic.service_external_agent_session_factory import ServiceExternalAgentSessionFactory
+from neuro_san.test.load.load_test_driver import LoadTestDriver
+from neuro_san.test.load.load_test_server import LoadTestServer
+
+
+class StubInvocationContext:
+    """
+    Just enough of an InvocationContext to decide where an external agent lives.
+    """
+
+    def __init__(self, port: int, metadata: Dict[str, Any]):
+        self.port: int = port
+        self.metadata: Dict[str, Any] = metadata
+
+    def get_port(self) -> int:
+        """
+        :return: The port of the server
+        """
+        return self.port
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """
+        :return: The request metadata
+        """
+        return self.metadata
+
+
+class TestServiceExternalAgentSessionFactory(TestCase):
+    """
+    Tests for the ServiceExternalAgentSessionFactory.
+    """
+
+    PORT: int = 8080
+
+    def setUp(self):
+        network_storage = AgentNetworkStorage()
+        network_storage.add_agent_network("inner", AgentNetwork({"tools": []}, "inner"))
+        self.factory = ServiceExternalAgentSessionFactory({"public": network_storage},
+                                                          agent_policy=None,
+                                                          forwarded_request_metadata=["request_id", "user_id"])
+
+    def test_is_hosted_here(self):
+        """
+        Only agent networks in storage on the port of the server are called in-process.
+        """
+        context = StubInvocationContext(self.PORT, {})
+        self.assertTrue(self.factory.is_hosted_here(
+            {"host": "localhost", "port": self.PORT, "agent_name": "inner"}, context))
+        self.assertTrue(self.factory.is_hosted_here(
+            {"host": "127.0.0.1", "port": str(self.PORT), "agent_name": "inner"}, context))
+
+        # Another server on the same machine
+        self.assertFalse(self.factory.is_hosted_here(
+            {"host": "localhost", "port": self.PORT + 1, "agent_name": "inner"}, context))
+        # Another machine
+        self.assertFalse(self.factory.is_hosted_here(
+            {"host": "example.com", "port": self.PORT, "agent_name": "inner"}, context))
+        # Not hosted here
+        self.assertFalse(self.factory.is_hosted_here(
+            {"host": "localhost", "port": self.PORT, "agent_name": "outer"}, context))
+        # No server port to compare with
+        self.assertFalse(self.factory.is_hosted_here(
+            {"host": "localhost", "port": self.PORT, "agent_name": "inner"}, StubInvocationContext(None, {})))
+
+    def test_create_session(self):
+        """
+        Agent networks hosted here get an InProcessAgentSession with the forwarded metadata.
+        """
+        context = StubInvocationContext(self.PORT, {"request_id": "abc", "user_id": "me", "secret": "shh"})
+        session = self.factory.create_session_from_location_dict(
+            {"host": "localhost", "port": self.PORT, "agent_name": "inner"}, context)
+        self.assertIsInstance(session, InProcessAgentSession)
+        self.assertEqual("inner", session.agent_name)
+        self.assertEqual({"request_id": "abc", "user_id": "me"}, session.metadata)
+
+    def test_forward_metadata(self):
+        """
+        Metadata is forwarded as it would arrive in http headers.
+        """
+        self.assertEqual({"user_id": "None"}, self.factory.forward_metadata(None))
+        self.assertEqual({"user_id": "me"}, self.factory.forward_metadata({"user_id": "me"}))
+
+
+class TestInProcessExternalAgents(TestCase):
+    """
+    Compares calling an external agent network hosted by the same server
+    in-process with calling it over http.
+    """
+
+    INNER_ANSWER: str = "The inner network has spoken."
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.temp_dir = tempfile.TemporaryDirectory(prefix="neuro_san_in_process_")
+        self.manifest_file: str = self.write_registry(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_registry(self, registry_dir: str) -> str:
+        """
+        Write an outer network whose front man calls the front man of an inner network
+        as an external agent, both answered by a ScriptedChatMockLlm.
+        :param registry_dir: The directory to write the files to
+        :return: The path to the manifest file
+        """
+        llm_config: Dict[str, Any] = {
+            "class": "neuro_san.test.llms.scripted_chat_mock_llm.ScriptedChatMockLlm",
+            "model_name": "scripted",
+        }
+        outer: Dict[str, Any] = {
+            "llm_config": llm_config,
+            "tools": [
+                {
+                    "name": "outer",
+                    "function": {
+                        "description": "Asks the inner network",
+                    },
+                    "instructions": "System prompt for the scripted mock llm",
+                    "llm_config": {
+                        "script": [
+                            {"tool_calls": [{"name": "__inner", "args": {"inquiry": "Speak up"}}]},
+                            {"content": "The outer network heard back."},
+                        ]
+                    },
+                    "tools": ["/inner"]
+                },
+            ],
+        }
+        inner: Dict[str, Any] = {
+            "llm_config": llm_config,
+            "tools": [
+                {
+                    "name": "inner",
+                    "function": {
+                        "description": "Answers the outer network",
+                        "parameters": {
+                            "type": "object",
+                            "properties": {
+                                "inquiry": {
+                                    "type": "string",
+                                    "description": "What to answer"
+                                }
+                            },
+                            "required": ["inquiry"]
+                        }
+                    },
+                    "instructions": "System prompt for the scripted mock llm",
+                    "llm_config": {
+                        "script": [
+                            {"content": self.INNER_ANSWER},
+                        ]
+                    },
+                },
+            ],
+        }
+        manifest: Dict[str, Any] = {
+            "outer.hocon": True,
+            "inner.hocon": True,
+        }
+        for file_name, contents in (("outer.hocon", outer), ("inner.hocon", inner), ("manifest.hocon", manifest)):
+            with open(os.path.join(registry_dir, file_name), "w", encoding="utf-8") as out:
+                json.dump(contents, out, indent=4)
+        return os.path.join(registry_dir, "manifest.hocon")
+
+    @staticmethod
+    async def chat_once(port: int) -> List[Dict[str, Any]]:
+        """
+        :param port: The port of the server
+        :return: All the messages of a single chat with the outer network
+        """
+        driver = LoadTestDriver(port, "outer", chat_filter_type="MAXIMAL")
+        path: str = f"http://localhost:{port}/api/v1/outer/streaming_chat"
+        async with ClientSession(timeout=ClientTimeout(30.0)) as session:
+            async with session.post(path, json=driver.formulate_chat_request(None)) as response:
+                response.raise_for_status()
+                messages, _ = await LoadTestDriver.read_messages(response, 0.0)
+        return messages
+
+    def run_server(self, external_agents_in_process: bool) -> Dict[str, Any]:
+        """
+        :param external_agents_in_process: Whether the server calls its own external agents in-process
+        :return: The report of a small load test against the outer network, with the number of
+                executors a single chat took as "ExecutorsForOneChat"
+        """
+        server = LoadTestServer(manifest_file=self.manifest_file,
+                                external_agents_in_process=external_agents_in_process)
+        server.start()
+        try:
+            messages: List[Dict[str, Any]] = asyncio.run(self.chat_once(server.http_port))
+            self.assertIn(self.INNER_ANSWER, json.dumps(messages))
+            self.assertIn("The outer network heard back.", json.dumps(messages))
+
+            # Executors are kept for reuse, so the pool has as many as the chat needed at once.
+            executor_pool: AsyncioExecutorPool = server.get_executor_pool()
+            with executor_pool.lock:
+                executors_for_one_chat: int = len(executor_pool.pool_used) + len(executor_pool.pool_available)
+
+            driver = LoadTestDriver(server.http_port, "outer",
+                                    num_sessions=4,
+                                    requests_per_session=5,
+                                    executor_pool=server.get_executor_pool(),
+                                    sample_interval_seconds=0.05,
+                                    timeout_seconds=30.0)
+            report: Dict[str, Any] = asyncio.run(driver.run())
+        finally:
+            server.stop()
+
+        self.assertEqual(0, report.get("Errors"), report.get("FirstErrors"))
+        self.assertEqual(20, report.get("Requests"))
+        report["ExecutorsForOneChat"] = executors_for_one_chat
+        return report
+
+    def test_in_process_versus_http(self):
+        """
+        Both ways get the same answers. In-process calls take no executor of their own.
+        """
+        in_process: Dict[str, Any] = self.run_server(external_agents_in_process=True)
+        over_http: Dict[str, Any] = self.run_server(external_agents_in_process=False)
+
+        # Over http, the inner request takes another executor while the outer one waits on it.
+        self.assertEqual(1, in_process.get("ExecutorsForOneChat"))
+        self.assertEqual(2, over_http.get("ExecutorsForOneChat"))
+
+        # Inner requests run on the executor of their outer request, so no more are used than sessions.
+        self.assertLessEqual(in_process.get("MaxExecutorsUsed"), in_process.get("Sessions"))
@@ -0,0 +1,100 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import Tuple
+
+from unittest import TestCase
+
+import asyncio
+import copy
+
+from aiohttp import ClientSession
+
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.test.load.load_test_server import LoadTestServer
+
+
+class TestConnectivityHandler(TestCase):
+    """
+    Tests for ETag support of the "function" and "connectivity" handlers against a LoadTestServer.
+    """
+
+    server: LoadTestServer = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LoadTestServer()
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    async def get(self, method: str, etag: str = None) -> Tuple[int, str, str]:
+        """
+        :param method: The API method to call, "function" or "connectivity"
+        :param etag: The ETag to send as If-None-Match, if any
+        :return: A tuple of the status, the ETag and the body of the response
+        """
+        headers: Dict[str, str] = {}
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        url: str = f"http://localhost:{self.server.http_port}/api/v1/{LoadTestServer.DEFAULT_AGENT_NAME}/{method}"
+        async with ClientSession() as session:
+            async with session.get(url, headers=headers) as response:
+                return response.status, response.headers.get("Etag"), await response.text()
+
+    def test_not_modified(self):
+        """
+        Clients that already have the response get a 304 without a body.
+        """
+        for method in ("function", "connectivity"):
+            status, etag, body = asyncio.run(self.get(method))
+            self.assertEqual(status, 200)
+            self.assertIsNotNone(etag)
+            self.assertIn(method, body)
+
+            status, same_etag, body = asyncio.run(self.get(method, etag))
+            self.assertEqual(status, 304)
+            self.assertEqual(same_etag, etag)
+            self.assertEqual(body, "")
+
+            status, _, _ = asyncio.run(self.get(method, '"something-else"'))
+            self.assertEqual(status, 200)
+
+    def test_modified_network(self):
+        """
+        A modified agent network gets a new response and ETag.
+        """
+        _, etag, _ = asyncio.run(self.get("function"))
+
+        agent_name: str = LoadTestServer.DEFAULT_AGENT_NAME
+        storage: AgentNetworkStorage = self.server.main_loop.server_context.get_network_storage_dict().get("public")
+        agent_network: AgentNetwork = storage.get_agent_network_provider(agent_name).get_agent_network()
+        config: Dict[str, Any] = copy.deepcopy(agent_network.get_config())
+        front_man: Dict[str, Any] = config.get("tools")[0]
+        front_man["function"]["description"] = "A freshly modified description"
+        storage.add_agent_network(agent_name, AgentNetwork(config, agent_name))
+        try:
+            status, new_etag, body = asyncio.run(self.get("function", etag))
+            self.assertEqual(status, 200)
+            self.assertNotEqual(new_etag, etag)
+            self.assertIn("A freshly modified description", body)
+        finally:
+            storage.add_agent_network(agent_name, agent_network)
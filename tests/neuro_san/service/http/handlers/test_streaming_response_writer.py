@@ -0,0 +1,201 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Type
+
+import asyncio
+import json
+
+from tornado.iostream import StreamClosedError
+
+from neuro_san.service.http.handlers.sse_response_writer import SseResponseWriter
+from neuro_san.service.http.handlers.streaming_chat_handler import StreamingChatHandler
+from neuro_san.service.http.handlers.streaming_response_writer import StreamingResponseWriter
+from tests.neuro_san.utils.fake_agent_policy import FakeAgentPolicy
+from tests.neuro_san.utils.fake_service_app_test_case import FakeServiceAppTestCase
+
+
+class FakeHandler:
+    """
+    Stands in for a Tornado RequestHandler, recording what gets flushed.
+    """
+
+    def __init__(self, closed: bool = False):
+        self.pending: List[str] = []
+        self.flushed: List[str] = []
+        self.closed: bool = closed
+
+    def write(self, chunk: str):
+        """
+        Record a chunk written
+        """
+        self.pending.append(chunk)
+
+    async def flush(self):
+        """
+        Move pending chunks to flushed ones
+        """
+        if self.closed:
+            raise StreamClosedError()
+        self.flushed.append("".join(self.pending))
+        self.pending = []
+
+
+class FakeService:
+    """
+    Stands in for an AsyncAgentService streaming a fixed number of messages.
+    """
+
+    def __init__(self, num_messages: int, delay_seconds: float):
+        self.num_messages: int = num_messages
+        self.delay_seconds: float = delay_seconds
+
+    def get_request_timeout_seconds(self) -> float:
+        """
+        :return: No timeout
+        """
+        return 0.0
+
+    async def streaming_chat(self, _request: Dict[str, Any], _metadata: Dict[str, Any]):
+        """
+        Yield a number of chat responses
+        """
+        for index in range(self.num_messages):
+            await asyncio.sleep(self.delay_seconds)
+            yield {"response": {"type": "AGENT", "text": f"message {index}"}}
+
+
+class RecordingStreamingChatHandler(StreamingChatHandler):
+    """
+    StreamingChatHandler which keeps the response writers it creates,
+    with a flush window longer than any test.
+    """
+
+    writers: List[StreamingResponseWriter] = []
+
+    def create_response_writer(self, writer_class: Type[StreamingResponseWriter] = StreamingResponseWriter) \
+            -> StreamingResponseWriter:
+        writer: StreamingResponseWriter = writer_class(self, max_delay_seconds=60.0)
+        RecordingStreamingChatHandler.writers.append(writer)
+        return writer
+
+
+class TestStreamingResponseWriter(FakeServiceAppTestCase):
+    """
+    Tests for StreamingResponseWriter, both standalone and as used by StreamingChatHandler.
+    """
+
+    NUM_MESSAGES: int = 40
+
+    def get_app(self):
+        return self.make_app([(r"/api/v1/(.+)/streaming_chat", RecordingStreamingChatHandler)],
+                             FakeAgentPolicy(FakeService(self.NUM_MESSAGES, 0.0)))
+
+    def test_streaming_coalesces(self):
+        """
+        Streams a chatty response end to end and checks that messages are not
+        flushed one at a time, but go out together through the response writer.
+        """
+        response = self.fetch("/api/v1/test/streaming_chat", method="POST",
+                              body=json.dumps({"user_message": {"text": "hi"}}))
+
+        self.assertEqual(200, response.code)
+        lines: List[str] = [line for line in response.body.decode("utf-8").split("\n") if line.strip()]
+        self.assertEqual(self.NUM_MESSAGES, len(lines))
+        self.assertEqual("message 0", json.loads(lines[0])["response"]["text"])
+        self.assertEqual(f"message {self.NUM_MESSAGES - 1}", json.loads(lines[-1])["response"]["text"])
+
+        # The flush window is longer than the whole stream, so everything went out in the final flush.
+        writer: StreamingResponseWriter = RecordingStreamingChatHandler.writers[-1]
+        self.assertEqual(self.NUM_MESSAGES, writer.num_messages)
+        self.assertEqual(1, writer.num_flushes)
+
+    def test_coalescing(self):
+        """
+        Messages arriving within the window go out together in a single flush.
+        """
+        handler = FakeHandler()
+        writer = StreamingResponseWriter(handler, max_delay_seconds=0.05)
+
+        async def produce():
+            for index in range(5):
+                await writer.write({"index": index})
+            self.assertEqual(0, len(handler.flushed))
+            # Wait for the window to expire
+            await writer.timer_task
+            self.assertEqual(1, len(handler.flushed))
+            await writer.close()
+
+        self.io_loop.run_sync(produce)
+        self.assertEqual(1, writer.num_flushes)
+        self.assertEqual(5, len(handler.flushed[0].splitlines()))
+
+    def test_size_threshold(self):
+        """
+        Buffer size limit forces a flush without waiting for the window.
+        """
+        handler = FakeHandler()
+        writer = StreamingResponseWriter(handler, max_delay_seconds=10.0, max_buffer_bytes=100)
+
+        async def produce():
+            for index in range(10):
+                await writer.write({"index": index, "padding": "x" * 20})
+            await writer.close()
+
+        self.io_loop.run_sync(produce)
+        self.assertGreater(writer.num_flushes, 1)
+        lines: List[str] = "".join(handler.flushed).splitlines()
+        self.assertEqual([json.loads(line)["index"] for line in lines], list(range(10)))
+
+    def test_closed_stream(self):
+        """
+        A closed client connection is reported to the producer.
+        """
+        handler = FakeHandler(closed=True)
+        writer = StreamingResponseWriter(handler, max_delay_seconds=0.0)
+
+        async def produce():
+            with self.assertRaises(StreamClosedError):
+                await writer.write({"index": 0})
+            with self.assertRaises(StreamClosedError):
+                await writer.write({"index": 1})
+
+        self.io_loop.run_sync(produce)
+
+    def test_server_sent_events(self):
+        """
+        The SSE writer sends each message as its own event, coalesced all the same.
+        """
+        handler = FakeHandler()
+        writer = SseResponseWriter(handler, max_delay_seconds=0.05)
+
+        async def produce():
+            for index in range(3):
+                await writer.write({"text": f"line {index}\nof text"})
+            await writer.close()
+
+        self.io_loop.run_sync(produce)
+        self.assertEqual(1, writer.num_flushes)
+        events: List[str] = handler.flushed[0].split("\n\n")
+        self.assertEqual(events[-1], "")
+        self.assertEqual(len(events), 4)
+        for index, event in enumerate(events[:-1]):
+            lines: List[str] = event.split("\n")
+            self.assertEqual(lines[0], "event: message")
+            self.assertEqual(len(lines), 2)
+            self.assertEqual(json.loads(lines[1][len("data: "):]), {"text": f"line {index}\nof text"})
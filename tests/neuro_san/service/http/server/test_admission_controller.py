@@ -0,0 +1,175 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import asyncio
+import json
+
+from tornado.httpclient import HTTPResponse
+from tornado.testing import gen_test
+
+from neuro_san.service.http.handlers.function_handler import FunctionHandler
+from neuro_san.service.http.handlers.streaming_chat_handler import StreamingChatHandler
+from neuro_san.service.http.server.admission_controller import AdmissionController
+from neuro_san.service.utils.cached_response import CachedResponse
+from tests.neuro_san.utils.fake_agent_policy import FakeAgentPolicy
+from tests.neuro_san.utils.fake_service_app_test_case import FakeServiceAppTestCase
+
+
+class SlowService:
+    """
+    Stands in for an AsyncAgentService whose chats wait to be let go of,
+    and whose function response is ready right away.
+    """
+
+    def __init__(self):
+        self.release = asyncio.Event()
+
+    def get_request_timeout_seconds(self) -> float:
+        """
+        :return: No timeout
+        """
+        return 0.0
+
+    async def streaming_chat(self, _request: Dict[str, Any], _metadata: Dict[str, Any]):
+        """
+        Yield a single chat response once released
+        """
+        await self.release.wait()
+        yield {"response": {"type": "AI", "text": "slow"}}
+
+    async def get_function_response(self, _request: Dict[str, Any], _metadata: Dict[str, Any]) -> CachedResponse:
+        """
+        :return: A function description
+        """
+        return CachedResponse({"function": {"description": "fast"}})
+
+
+class TestAdmissionController(FakeServiceAppTestCase):
+    """
+    Tests for AdmissionController, both standalone and as used by the request handlers.
+    """
+
+    def setUp(self):
+        self.admission_controller = AdmissionController(max_in_flight=2, max_queued=1,
+                                                        queue_timeout_seconds=5.0)
+        self.service = SlowService()
+        super().setUp()
+
+    def get_app(self):
+        return self.make_app([(r"/api/v1/(.+)/streaming_chat", StreamingChatHandler),
+                              (r"/api/v1/(.+)/function", FunctionHandler)],
+                             FakeAgentPolicy(self.service),
+                             admission_controller=self.admission_controller)
+
+    @gen_test
+    async def test_saturated_server(self):
+        """
+        Two requests run, one waits and the rest get a fast 503 with Retry-After.
+        Cheap calls like "function" are served all the while.
+        """
+        url: str = self.get_url("/api/v1/test/streaming_chat")
+        body: str = json.dumps({"user_message": {"text": "hi"}})
+        fetches: List[asyncio.Task] = [
+            asyncio.ensure_future(self.http_client.fetch(url, method="POST", body=body, raise_error=False))
+            for _ in range(5)
+        ]
+
+        rejected: List[HTTPResponse] = []
+        for fetch in asyncio.as_completed(fetches):
+            response: HTTPResponse = await fetch
+            rejected.append(response)
+            if len(rejected) == 2:
+                break
+        for response in rejected:
+            self.assertEqual(503, response.code)
+            self.assertEqual("1", response.headers.get("Retry-After"))
+
+        stats: Dict[str, Any] = self.admission_controller.get_stats()
+        self.assertEqual(2, stats["InFlight"])
+        self.assertEqual(1, stats["Queued"])
+
+        response = await self.http_client.fetch(self.get_url("/api/v1/test/function"))
+        self.assertEqual("fast", json.loads(response.body)["function"]["description"])
+
+        self.service.release.set()
+        responses: List[HTTPResponse] = await asyncio.gather(*fetches)
+        codes: List[int] = sorted(response.code for response in responses)
+        self.assertEqual([200, 200, 200, 503, 503], codes)
+
+        stats = self.admission_controller.get_stats()
+        self.assertEqual(0, stats["InFlight"])
+        self.assertEqual(0, stats["Queued"])
+        self.assertEqual(3, stats["Admitted"])
+        self.assertEqual(2, stats["Rejected"])
+        self.assertIn("'Rejected': 2", self._app.get_stats())
+
+    def test_queue_timeout(self):
+        """
+        Queued requests give up after their deadline, and slots are handed over in order.
+        """
+        controller = AdmissionController(max_in_flight=1, max_queued=2, queue_timeout_seconds=0.1)
+
+        async def run():
+            self.assertTrue(await controller.acquire())
+            self.assertFalse(await controller.acquire())
+            self.assertEqual(1, controller.num_timed_out)
+
+            waiter = asyncio.create_task(controller.acquire())
+            await asyncio.sleep(0.01)
+            self.assertEqual(1, len(controller.waiters))
+            controller.release()
+            self.assertTrue(await waiter)
+            self.assertEqual(1, controller.in_flight)
+            controller.release()
+            self.assertEqual(0, controller.in_flight)
+
+        self.io_loop.run_sync(run)
+
+    def test_cancelled_waiter(self):
+        """
+        A cancelled waiter neither keeps its place in the queue nor swallows a slot.
+        """
+        controller = AdmissionController(max_in_flight=1, max_queued=2, queue_timeout_seconds=5.0)
+
+        async def run():
+            self.assertTrue(await controller.acquire())
+            waiter = asyncio.create_task(controller.acquire())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await waiter
+            self.assertEqual(0, len(controller.waiters))
+            controller.release()
+            self.assertEqual(0, controller.in_flight)
+
+        self.io_loop.run_sync(run)
+
+    def test_unlimited(self):
+        """
+        Default controller admits everything.
+        """
+        controller = AdmissionController()
+
+        async def run():
+            for _ in range(100):
+                self.assertTrue(await controller.acquire())
+            self.assertEqual(100, controller.in_flight)
+
+        self.io_loop.run_sync(run)
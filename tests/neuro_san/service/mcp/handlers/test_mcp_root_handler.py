@@ -0,0 +1,159 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+from unittest import TestCase
+
+import asyncio
+import json
+import time
+
+from aiohttp import ClientSession
+
+from neuro_san.test.load.load_test_driver import LoadTestDriver
+from neuro_san.test.load.load_test_server import LoadTestServer
+
+
+class TestMcpRootHandler(TestCase):
+    """
+    Tests for MCP tools/call responses of the McpRootHandler against a LoadTestServer with a mock LLM.
+    """
+
+    TIME_TO_FIRST_TOKEN_SECONDS: float = 2.0
+
+    server: LoadTestServer = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LoadTestServer(time_to_first_token_seconds=cls.TIME_TO_FIRST_TOKEN_SECONDS,
+                                    seconds_per_token=0.001)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def get_tool_call(self, progress_token: str = None) -> Dict[str, Any]:
+        """
+        :param progress_token: The progress token to ask for progress notifications with, if any
+        :return: A tools/call request for the mock agent
+        """
+        params: Dict[str, Any] = {
+            "name": LoadTestServer.DEFAULT_AGENT_NAME,
+            "arguments": {
+                "user_message": {"text": "Hello, stream!"},
+                "chat_filter": {"chat_filter_type": "MAXIMAL"},
+            },
+        }
+        if progress_token is not None:
+            params["_meta"] = {"progressToken": progress_token}
+        return {"jsonrpc": "2.0", "id": 7, "method": "tools/call", "params": params}
+
+    async def call_tool(self, accept: str, progress_token: str = None) -> List[Dict[str, Any]]:
+        """
+        :param accept: The Accept header to send
+        :param progress_token: The progress token to ask for progress notifications with, if any
+        :return: The JSON-RPC messages of the response, in order
+        """
+        driver = LoadTestDriver(self.server.http_port, LoadTestServer.DEFAULT_AGENT_NAME)
+        async with ClientSession() as session:
+            headers: Dict[str, str] = await driver.initialize_mcp(session)
+            headers["Accept"] = accept
+            async with session.post(f"http://localhost:{self.server.http_port}/mcp",
+                                    json=self.get_tool_call(progress_token), headers=headers) as response:
+                self.assertEqual(response.status, 200)
+                body: str = await response.text()
+                if response.content_type == "application/json":
+                    return [json.loads(body)]
+
+                self.assertEqual(response.content_type, "text/event-stream")
+                messages: List[Dict[str, Any]] = []
+                for event in body.split("\n\n"):
+                    for line in event.splitlines():
+                        if line.startswith("data: "):
+                            messages.append(json.loads(line[len("data: "):]))
+                return messages
+
+    def test_event_stream_with_progress(self):
+        """
+        Agent messages stream as progress notifications ahead of the result,
+        which is the same as the one of a plain JSON response.
+        """
+        plain: List[Dict[str, Any]] = asyncio.run(self.call_tool("application/json"))
+        streamed: List[Dict[str, Any]] = asyncio.run(self.call_tool("application/json, text/event-stream",
+                                                                    progress_token="progress-1"))
+        self.assertEqual(len(plain), 1)
+        self.assertGreater(len(streamed), 1)
+
+        notifications: List[Dict[str, Any]] = streamed[:-1]
+        for index, notification in enumerate(notifications):
+            self.assertEqual(notification.get("method"), "notifications/progress")
+            params: Dict[str, Any] = notification.get("params")
+            self.assertEqual(params.get("progressToken"), "progress-1")
+            self.assertEqual(params.get("progress"), index + 1)
+        self.assertEqual(notifications[-1].get("params").get("_meta").get("messageType"), "AGENT_FRAMEWORK")
+
+        result: Dict[str, Any] = streamed[-1]
+        self.assertEqual(result.get("id"), "7")
+        self.assertFalse(result.get("result").get("isError"))
+        self.assertEqual(result.get("result").get("content"), plain[0].get("result").get("content"))
+
+    def test_event_stream_without_progress_token(self):
+        """
+        Without a progress token, the event stream only has the result.
+        """
+        streamed: List[Dict[str, Any]] = asyncio.run(self.call_tool("text/event-stream"))
+        self.assertEqual(len(streamed), 1)
+        self.assertIn("Hello, stream!", streamed[0].get("result").get("content")[0].get("text"))
+
+    def test_disconnect_cancels_tool_call(self):
+        """
+        A client going away stops the agents from working on its tool call.
+        """
+        asyncio.run(self.disconnect_during_tool_call())
+
+    async def disconnect_during_tool_call(self):
+        """
+        Start a streamed tool call and hang up on it before the mock LLM answers.
+        """
+        pool = self.server.get_executor_pool()
+        driver = LoadTestDriver(self.server.http_port, LoadTestServer.DEFAULT_AGENT_NAME)
+        async with ClientSession() as session:
+            headers: Dict[str, str] = await driver.initialize_mcp(session)
+            headers["Accept"] = "text/event-stream"
+            start: float = time.monotonic()
+            response = await session.post(f"http://localhost:{self.server.http_port}/mcp",
+                                          json=self.get_tool_call("progress-2"), headers=headers)
+            self.assertEqual(response.content_type, "text/event-stream")
+            self.assertTrue(await self.wait_for(lambda: len(pool.pool_used) > 0))
+            response.close()
+
+        self.assertTrue(await self.wait_for(lambda: len(pool.pool_used) == 0))
+        self.assertLess(time.monotonic() - start, self.TIME_TO_FIRST_TOKEN_SECONDS)
+
+    async def wait_for(self, condition) -> bool:
+        """
+        :param condition: A function returning True when what is waited for has happened
+        :return: True if it happened before the mock LLM would have answered
+        """
+        deadline: float = time.monotonic() + self.TIME_TO_FIRST_TOKEN_SECONDS
+        while time.monotonic() < deadline:
+            if condition():
+                return True
+            await asyncio.sleep(0.02)
+        return False
@@ -0,0 +1,166 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from unittest import TestCase
+
+import asyncio
+import json
+
+from tornado.iostream import StreamClosedError
+
+from neuro_san import TOP_LEVEL_DIR
+from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.service.http.logging.http_logger import HttpLogger
+from neuro_san.service.mcp.processors.mcp_tools_processor import McpToolsProcessor
+from neuro_san.service.mcp.util.mcp_tool_descriptor_cache import McpToolDescriptorCache
+from neuro_san.service.mcp.validation.tool_request_validator import ToolRequestValidator
+from tests.neuro_san.service.mcp.util.test_mcp_tool_descriptor_cache import create_network
+from tests.neuro_san.utils.fake_agent_policy import FakeAgentPolicy
+from tests.neuro_san.utils.fake_service_app_test_case import FakeServiceAppTestCase
+
+
+class SlowAgentPolicy:
+    """
+    Stands in for an AgentAuthorizer whose checks take a while, recording how many run at once.
+    """
+
+    def __init__(self, agent_names: List[str], denied: List[str]):
+        self.agent_names: List[str] = agent_names
+        self.denied: List[str] = denied
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+        self.checked: List[str] = []
+
+    async def list_agents(self, _metadata: Dict[str, Any]) -> List[str]:
+        """
+        :return: All agents
+        """
+        return self.agent_names
+
+    async def allow_agent(self, agent_name: str, _metadata: Dict[str, Any]) -> Tuple[bool, Any]:
+        """
+        :return: Whether the agent is allowed, and a stand-in for its service provider
+        """
+        self.checked.append(agent_name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return agent_name not in self.denied, self
+
+
+class StreamingToolService:
+    """
+    Stands in for an AsyncAgentService available as an MCP tool.
+    """
+
+    def __init__(self, streaming_chat: Callable):
+        """
+        :param streaming_chat: The streaming_chat() of the service
+        """
+        self.streaming_chat: Callable = streaming_chat
+
+    def is_mcp_tool(self) -> bool:
+        """
+        :return: True
+        """
+        return True
+
+    def get_request_timeout_seconds(self) -> float:
+        """
+        :return: No timeout
+        """
+        return 0.0
+
+
+class TestMcpToolsProcessor(TestCase):
+    """
+    Tests for listing tools with the McpToolsProcessor
+    """
+
+    def setUp(self):
+        FakeServiceAppTestCase.use_repo_logging()
+
+    def test_list_tools(self):
+        """
+        Authorization checks run concurrently up to the bound, and only for MCP tools.
+        Tools come back in storage order, without the ones that are not allowed.
+        """
+        storage = AgentNetworkStorage()
+        cache = McpToolDescriptorCache()
+        storage.add_listener(cache)
+        agent_names: List[str] = [f"tool_{index:02d}" for index in range(20)]
+        for agent_name in agent_names:
+            storage.add_agent_network(agent_name, create_network(agent_name, f"About {agent_name}",
+                                                                 mcp=agent_name != "tool_03"))
+
+        with open(TOP_LEVEL_DIR.get_file_in_basis("api/grpc/agent_service.json"), "r", encoding="utf-8") as spec:
+            validator = ToolRequestValidator(json.load(spec))
+        policy = SlowAgentPolicy(agent_names, denied=["tool_07"])
+        processor = McpToolsProcessor(HttpLogger([]), {"public": storage}, policy, validator,
+                                      cache, max_concurrent_authorizations=4)
+
+        result: Dict[str, Any] = asyncio.run(processor.list_tools(5, {}))
+
+        tools: List[Dict[str, Any]] = result.get("result").get("tools")
+        expected: List[str] = [name for name in agent_names if name not in ("tool_03", "tool_07")]
+        self.assertEqual([tool.get("name") for tool in tools], expected)
+        self.assertEqual(tools[0].get("description"), "About tool_00")
+        self.assertEqual(tools[0].get("inputSchema"), validator.get_request_schema())
+
+        self.assertNotIn("tool_03", policy.checked)
+        self.assertEqual(policy.max_in_flight, 4)
+        self.assertEqual(cache.num_builds, len(agent_names))
+
+    def test_call_tool_cancelled(self):
+        """
+        Cancelling a tool call cancels it, rather than turning it into an error result,
+        while a closed stream still gets one.
+        """
+        started = asyncio.Event()
+
+        async def stall(_request: Dict[str, Any], _metadata: Dict[str, Any]):
+            started.set()
+            await asyncio.Event().wait()
+            yield {}
+
+        async def close_stream(_request: Dict[str, Any], _metadata: Dict[str, Any]):
+            raise StreamClosedError()
+            yield {}    # pylint: disable=unreachable
+
+        async def call(streaming_chat) -> asyncio.Task:
+            started.clear()
+            policy = FakeAgentPolicy(StreamingToolService(streaming_chat))
+            processor = McpToolsProcessor(HttpLogger([]), {}, policy, None, McpToolDescriptorCache())
+            task: asyncio.Task = asyncio.create_task(processor.call_tool(5, {}, "tool", {"text": "Hi"},
+                                                                         None, None, None))
+            await asyncio.wait([task, asyncio.create_task(started.wait())], return_when=asyncio.FIRST_COMPLETED)
+            if not task.done():
+                task.cancel()
+            await asyncio.wait([task])
+            return task
+
+        task: asyncio.Task = asyncio.run(call(stall))
+        self.assertTrue(task.cancelled())
+
+        task = asyncio.run(call(close_stream))
+        self.assertFalse(task.cancelled())
+        self.assertTrue(task.result().get("result").get("isError"))
@@ -0,0 +1,95 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+from unittest import TestCase
+
+from neuro_san.internals.graph.registry.agent_network import AgentNetwork
+from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.service.mcp.util.mcp_tool_descriptor_cache import McpToolDescriptorCache
+
+
+def create_network(name: str, description: str, mcp: bool = True) -> AgentNetwork:
+    """
+    :param name: The name of the agent network
+    :param description: The description of its front man
+    :param mcp: Whether the agent network is served as an MCP tool
+    :return: A single-agent AgentNetwork
+    """
+    config: Dict[str, Any] = {
+        "tools": [
+            {
+                "name": "front_man",
+                "function": {
+                    "description": description
+                },
+                "instructions": "Be helpful."
+            }
+        ]
+    }
+    agent_network = AgentNetwork(config, name)
+    if mcp:
+        agent_network.set_as_mcp_tool()
+    return agent_network
+
+
+class TestMcpToolDescriptorCache(TestCase):
+    """
+    Tests for the McpToolDescriptorCache listening to an AgentNetworkStorage
+    """
+
+    def setUp(self):
+        self.storage = AgentNetworkStorage()
+        self.cache = McpToolDescriptorCache()
+        self.storage.add_listener(self.cache)
+
+    def test_built_once_when_added(self):
+        """
+        Descriptors are built when networks are added, not when they are asked for.
+        """
+        self.storage.add_agent_network("one", create_network("one", "First tool"))
+        self.storage.add_agent_network("private", create_network("private", "Not a tool", mcp=False))
+        self.assertEqual(self.cache.num_builds, 2)
+
+        for _ in range(3):
+            self.assertEqual(self.cache.get_descriptor("one", self.storage),
+                             {"name": "one", "description": "First tool"})
+            self.assertIsNone(self.cache.get_descriptor("private", self.storage))
+        self.assertEqual(self.cache.num_builds, 2)
+
+    def test_modified_and_removed(self):
+        """
+        Modified networks get new descriptors, removed ones are forgotten.
+        """
+        self.storage.add_agent_network("one", create_network("one", "First tool"))
+        self.storage.add_agent_network("one", create_network("one", "Better tool"))
+        self.assertEqual(self.cache.get_descriptor("one", self.storage).get("description"), "Better tool")
+
+        self.storage.remove_agent_network("one")
+        self.assertIsNone(self.cache.get_descriptor("one", self.storage))
+        self.assertEqual(self.cache.descriptors, {})
+
+    def test_built_on_first_use(self):
+        """
+        Networks added before the cache started listening are built when first asked for.
+        """
+        storage = AgentNetworkStorage()
+        storage.add_agent_network("early", create_network("early", "Early tool"))
+        cache = McpToolDescriptorCache()
+        self.assertEqual(cache.get_descriptor("early", storage).get("description"), "Early tool")
+        self.assertEqual(cache.get_descriptor("early", storage).get("description"), "Early tool")
+        self.assertEqual(cache.num_builds, 1)
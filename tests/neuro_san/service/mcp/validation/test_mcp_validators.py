@@ -0,0 +1,255 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import AsyncGenerator
+from typing import Dict
+from typing import List
+
+import json
+
+from unittest.mock import patch
+
+from tornado.httpclient import HTTPResponse
+from tornado.testing import gen_test
+
+from neuro_san import TOP_LEVEL_DIR
+from neuro_san.service.mcp.handlers.mcp_root_handler import McpRootHandler
+from neuro_san.service.mcp.interfaces.client_session_policy import MCP_PROTOCOL_VERSION
+from neuro_san.service.mcp.util.mcp_request_util import McpRequestUtil
+from neuro_san.service.mcp.validation.mcp_request_validator import McpRequestValidator
+from neuro_san.service.mcp.validation.tool_request_validator import ToolRequestValidator
+from neuro_san.service.utils.mcp_server_context import McpServerContext
+from tests.neuro_san.utils.fake_agent_policy import FakeAgentPolicy
+from tests.neuro_san.utils.fake_service_app_test_case import FakeServiceAppTestCase
+
+
+class EchoService:
+    """
+    Stands in for an AsyncAgentService that echoes the user message without any LLM.
+    """
+
+    def is_mcp_tool(self) -> bool:
+        """
+        :return: Always available as an MCP tool
+        """
+        return True
+
+    def get_request_timeout_seconds(self) -> float:
+        """
+        :return: No timeout
+        """
+        return 0.0
+
+    async def function(self, _request: Dict[str, Any], _metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :return: A function description
+        """
+        return {"function": {"description": "echo"}}
+
+    async def streaming_chat(self, request: Dict[str, Any],
+                             _metadata: Dict[str, Any]) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        :return: A single final response echoing the user message
+        """
+        yield {
+            "response": {
+                "type": "AGENT_FRAMEWORK",
+                "text": request.get("user_message", {}).get("text")
+            }
+        }
+
+
+class EchoNetwork:
+    """
+    Stands in for both the AgentNetworkProvider and the AgentNetwork of an MCP tool.
+    """
+
+    def get_agent_network(self) -> "EchoNetwork":
+        """
+        :return: Ourselves as the AgentNetwork
+        """
+        return self
+
+    def is_mcp_tool(self) -> bool:
+        """
+        :return: Always an MCP tool
+        """
+        return True
+
+    def find_front_man(self) -> str:
+        """
+        :return: The name of the front man
+        """
+        return "echoer"
+
+    def get_agent_tool_spec(self, _name: str) -> Dict[str, Any]:
+        """
+        :return: The spec of the front man
+        """
+        return {"function": {"description": "echo"}}
+
+
+class EchoStorage:
+    """
+    Stands in for the AgentNetworkStorage with a number of echo networks.
+    """
+
+    def __init__(self, agent_names: List[str]):
+        self.agent_names: List[str] = agent_names
+
+    def get_agent_names(self) -> List[str]:
+        """
+        :return: The names of the networks
+        """
+        return self.agent_names
+
+    def get_agent_network_provider(self, _agent_name: str) -> EchoNetwork:
+        """
+        :return: An echo network provider
+        """
+        return EchoNetwork()
+
+
+class EchoServerContext:
+    """
+    Stands in for the ServerContext.
+    """
+
+    def __init__(self, agent_names: List[str]):
+        self.mcp_context = McpServerContext()
+        self.mcp_context.set_enabled(True)
+        self.network_storage_dict: Dict[str, EchoStorage] = {"public": EchoStorage(agent_names)}
+
+    def get_mcp_server_context(self) -> McpServerContext:
+        """
+        :return: The McpServerContext
+        """
+        return self.mcp_context
+
+    def get_network_storage_dict(self) -> Dict[str, EchoStorage]:
+        """
+        :return: The network storage dictionary
+        """
+        return self.network_storage_dict
+
+
+class TestMcpValidators(FakeServiceAppTestCase):
+    """
+    Tests for the MCP request validators, and for their use by the McpRootHandler.
+    """
+
+    AGENT_NAMES: List[str] = [f"echo_{index}" for index in range(10)]
+
+    def setUp(self):
+        with open(TOP_LEVEL_DIR.get_file_in_basis("api/grpc/agent_service.json"), "r", encoding="utf-8") as spec:
+            self.service_spec: Dict[str, Any] = json.load(spec)
+        self.server_context = EchoServerContext(self.AGENT_NAMES)
+        super().setUp()
+
+    def get_app(self):
+        handler_data: Dict[str, Any] = {
+            "openapi_service_spec": self.service_spec,
+            "server_context": self.server_context,
+        }
+        return self.make_app([(r"/mcp", McpRootHandler)], FakeAgentPolicy(EchoService(), self.AGENT_NAMES),
+                             handler_data)
+
+    def test_validation(self):
+        """
+        Compiled validators accept and reject the same requests as before.
+        """
+        mcp_context: McpServerContext = self.server_context.get_mcp_server_context()
+        request_validator = mcp_context.get_request_validator()
+        self.assertIsNone(request_validator.validate(self.tools_call_request(1)))
+        self.assertIsNone(request_validator.validate(self.tools_list_request(2)))
+        self.assertIsNotNone(request_validator.validate({"jsonrpc": "2.0", "id": 3}))
+
+        tool_validator = ToolRequestValidator(self.service_spec)
+        self.assertIsNone(tool_validator.validate({"user_message": {"text": "hi"}}))
+        self.assertIsNotNone(tool_validator.validate({"chat_filter": {"chat_filter_type": "MAXIMAL"}}))
+        self.assertIsNotNone(tool_validator.validate({"user_message": {"text": 42}}))
+
+    @gen_test(timeout=60)
+    async def test_handler_requests(self):
+        """
+        tools/list and tools/call on a mock network, with validators built once and shared by all requests.
+        """
+        num_requests: int = 20
+        original_tool_init = ToolRequestValidator.__init__
+        original_request_init = McpRequestValidator.__init__
+        with patch.object(ToolRequestValidator, "__init__", autospec=True,
+                          side_effect=original_tool_init) as tool_init, \
+                patch.object(McpRequestValidator, "__init__", autospec=True,
+                             side_effect=original_request_init) as request_init:
+            for method, make_request in (("tools/list", self.tools_list_request),
+                                         ("tools/call", self.tools_call_request)):
+                for index in range(num_requests):
+                    response: HTTPResponse = await self.post_mcp(make_request(index))
+                    self.assertEqual(200, response.code)
+                    result: Dict[str, Any] = json.loads(response.body)["result"]
+                    if method == "tools/list":
+                        self.assertEqual(len(self.AGENT_NAMES), len(result["tools"]))
+                    else:
+                        self.assertEqual(f"hello {index}", result["content"][0]["text"])
+
+        # The protocol validator was built with the McpServerContext, the tool validator on first use.
+        self.assertEqual(0, request_init.call_count)
+        self.assertEqual(1, tool_init.call_count)
+
+        # One validator for all those requests
+        tool_validator = self.server_context.get_mcp_server_context().get_tool_request_validator()
+        self.assertIsNotNone(tool_validator)
+        response = await self.post_mcp(self.tools_call_request(0))
+        self.assertIs(tool_validator, self.server_context.get_mcp_server_context().get_tool_request_validator())
+
+        # Bad tool arguments are still rejected
+        bad_request: Dict[str, Any] = self.tools_call_request(0)
+        bad_request["params"]["arguments"] = {"user_message": {"text": 42}}
+        response = await self.post_mcp(bad_request)
+        self.assertEqual(400, response.code)
+
+    async def post_mcp(self, request: Dict[str, Any]) -> HTTPResponse:
+        """
+        :param request: The MCP request dictionary
+        :return: The HTTPResponse
+        """
+        return await self.http_client.fetch(
+            self.get_url("/mcp"), method="POST", body=json.dumps(request),
+            headers={MCP_PROTOCOL_VERSION: McpRequestUtil.get_mcp_version(),
+                     "Content-Type": "application/json"},
+            raise_error=False)
+
+    @staticmethod
+    def tools_list_request(request_id: int) -> Dict[str, Any]:
+        """
+        :return: A tools/list request
+        """
+        return {"jsonrpc": "2.0", "id": request_id, "method": "tools/list", "params": {}}
+
+    @staticmethod
+    def tools_call_request(request_id: int) -> Dict[str, Any]:
+        """
+        :return: A tools/call request for one of the echo networks
+        """
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools/call",
+            "params": {
+                "name": "echo_0",
+                "arguments": {"user_message": {"text": f"hello {request_id}"}}
+            }
+        }
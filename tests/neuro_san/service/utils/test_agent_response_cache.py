@@ -0,0 +1,138 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+from unittest import TestCase
+
+import time
+
+from neuro_san.internals.network_providers.agent_network_storage import AgentNetworkStorage
+from neuro_san.internals.network_providers.expiring_agent_network_storage import ExpiringAgentNetworkStorage
+from neuro_san.internals.reservations.agent_reservation import AgentReservation
+from neuro_san.service.utils.agent_response_cache import AgentResponseCache
+from neuro_san.service.utils.cached_response import CachedResponse
+from tests.neuro_san.service.mcp.util.test_mcp_tool_descriptor_cache import create_network
+
+
+class TestAgentResponseCache(TestCase):
+    """
+    Tests for the AgentResponseCache listening to an AgentNetworkStorage
+    """
+
+    def setUp(self):
+        self.storage = AgentNetworkStorage()
+        self.cache = AgentResponseCache(vary_metadata=["user_id"])
+        self.storage.add_listener(self.cache)
+        self.storage.add_agent_network("one", create_network("one", "First tool"))
+
+    def put(self, response: Dict[str, Any], metadata: Dict[str, Any] = None) -> CachedResponse:
+        """
+        :param response: The response to keep for the "function" call of agent network "one"
+        :param metadata: The request metadata
+        :return: The CachedResponse
+        """
+        version: int = self.cache.get_network_version("one")
+        return self.cache.put_response("one", "function", version, metadata, response)
+
+    def test_kept_per_allowed_metadata(self):
+        """
+        Responses are shared by requests that only differ in metadata responses do not vary on.
+        """
+        cached: CachedResponse = self.put({"function": {"description": "First tool"}},
+                                          {"user_id": "alice", "request_id": "1"})
+        self.assertIs(self.cache.get_response("one", "function", {"user_id": "alice", "request_id": "2"}),
+                      cached)
+        self.assertIsNone(self.cache.get_response("one", "function", {"user_id": "bob"}))
+        self.assertIsNone(self.cache.get_response("one", "connectivity", {"user_id": "alice"}))
+
+    def test_forgotten_when_network_changes(self):
+        """
+        Modified and removed agent networks have their responses forgotten.
+        """
+        self.put({"function": {"description": "First tool"}})
+        self.storage.add_agent_network("one", create_network("one", "Better tool"))
+        self.assertIsNone(self.cache.get_response("one", "function", None))
+
+        self.put({"function": {"description": "Better tool"}})
+        self.storage.remove_agent_network("one")
+        self.assertIsNone(self.cache.get_response("one", "function", None))
+
+    def test_removed_and_added_again(self):
+        """
+        A response computed before an agent network was removed and added again is not kept.
+        """
+        version: int = self.cache.get_network_version("one")
+        self.storage.remove_agent_network("one")
+        self.storage.add_agent_network("one", create_network("one", "Better tool"))
+        self.cache.put_response("one", "function", version, None, {"function": {"description": "First tool"}})
+        self.assertIsNone(self.cache.get_response("one", "function", None))
+
+    def test_expired_temp_networks_are_forgotten(self):
+        """
+        Nothing is left behind for temporary networks once they expire.
+        """
+        agent_spec: Dict[str, Any] = {"tools": [{"name": "greeter", "instructions": "Say hello."}]}
+        temp_storage = ExpiringAgentNetworkStorage()
+        temp_storage.add_listener(self.cache)
+        reservation = AgentReservation(60.0, prefix="temp")
+        reservation.set_expiration_from(time.time() - 120.0, 60.0)
+        temp_storage.add_reservations({reservation: agent_spec})
+
+        agent_name: str = reservation.get_reservation_id()
+        version: int = self.cache.get_network_version(agent_name)
+        self.assertNotEqual(version, 0)
+        self.cache.put_response(agent_name, "function", version, None, {"function": {}})
+        self.assertIsNotNone(self.cache.get_response(agent_name, "function", None))
+
+        temp_storage.expire_reservations()
+        self.assertNotIn(agent_name, self.cache.versions)
+        self.assertEqual(list(self.cache.versions), ["one"])
+        self.assertEqual([key[0] for key in self.cache.responses], [])
+
+    def test_stale_response_not_kept(self):
+        """
+        A response computed while the agent network changed is returned, but not kept.
+        """
+        version: int = self.cache.get_network_version("one")
+        self.storage.add_agent_network("one", create_network("one", "Better tool"))
+        cached: CachedResponse = self.cache.put_response("one", "function", version, None,
+                                                         {"function": {"description": "First tool"}})
+        self.assertEqual(cached.get_response().get("function").get("description"), "First tool")
+        self.assertIsNone(self.cache.get_response("one", "function", None))
+
+    def test_max_entries(self):
+        """
+        The oldest responses are dropped first.
+        """
+        self.cache.max_entries = 2
+        for user in ("alice", "bob", "carol"):
+            self.put({"function": {"description": user}}, {"user_id": user})
+        self.assertIsNone(self.cache.get_response("one", "function", {"user_id": "alice"}))
+        self.assertIsNotNone(self.cache.get_response("one", "function", {"user_id": "carol"}))
+
+    def test_etag(self):
+        """
+        Equal responses have equal ETags, and callers cannot change what is kept.
+        """
+        first = CachedResponse({"b": 1, "a": [1, 2]})
+        second = CachedResponse({"a": [1, 2], "b": 1})
+        self.assertEqual(first.get_etag(), second.get_etag())
+        self.assertNotEqual(first.get_etag(), CachedResponse({"a": [1]}).get_etag())
+
+        first.get_response()["a"].append(3)
+        self.assertEqual(first.get_response(), {"a": [1, 2], "b": 1})
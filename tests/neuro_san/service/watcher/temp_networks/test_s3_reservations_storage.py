@@ -0,0 +1,197 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+from json import dumps
+from unittest import TestCase
+
+import math
+import os
+import time
+
+import pytest
+
+from boto3 import client as boto3_client
+from moto import mock_aws
+
+from neuro_san.interfaces.reservation import Reservation
+from neuro_san.internals.reservations.agent_reservation import AgentReservation
+from neuro_san.internals.reservations.reservation_dictionary_converter import ReservationDictionaryConverter
+from neuro_san.service.watcher.temp_networks.s3_reservations_storage import S3ReservationsStorage
+
+
+class RecordingReservationsStorage:
+    """
+    Stands in for the in-memory sync target, remembering what was synced to it.
+    """
+
+    def __init__(self):
+        self.reservations: Dict[str, Dict[str, Any]] = {}
+
+    def add_reservations(self, reservations_dict: Dict[Reservation, Any], _source: str = None):
+        """
+        Remembers the reservations by id
+        """
+        for reservation, agent_spec in reservations_dict.items():
+            self.reservations[reservation.get_reservation_id()] = agent_spec
+
+
+class TestS3ReservationsStorage(TestCase):
+    """
+    Tests for the S3ReservationsStorage against the moto S3 stand-in.
+    """
+
+    BUCKET: str = "test-reservations"
+
+    def setUp(self):
+        # Make sure nothing ever reaches real AWS
+        for env_var, value in (("AWS_ACCESS_KEY_ID", "testing"), ("AWS_SECRET_ACCESS_KEY", "testing"),
+                               ("AWS_SESSION_TOKEN", "testing"), ("AWS_DEFAULT_REGION", "us-east-1")):
+            os.environ[env_var] = value
+
+        self.mock = mock_aws()
+        self.mock.start()
+        boto3_client("s3").create_bucket(Bucket=self.BUCKET)
+
+        self.storage = S3ReservationsStorage(bucket_name=self.BUCKET)
+        self.storage.start()
+        self.target = RecordingReservationsStorage()
+        self.storage.set_sync_target(self.target)
+
+        # Count the S3 calls that go out
+        self.calls: Dict[str, int] = {}
+        self.storage.s3_client.meta.events.register("before-call.s3", self.count_call)
+
+    def tearDown(self):
+        self.storage.stop()
+        self.mock.stop()
+
+    def count_call(self, model, **_kwargs):
+        """
+        Counts one S3 call by operation name
+        """
+        self.calls[model.name] = self.calls.get(model.name, 0) + 1
+
+    def make_reservations(self, count: int, expires_in_seconds: float) -> Dict[Reservation, Any]:
+        """
+        :param count: The number of reservations to make
+        :param expires_in_seconds: Seconds from now until the reservations expire.
+                    Negative values make reservations that are expired already.
+        :return: A reservations dictionary as given to add_reservations()
+        """
+        reservations_dict: Dict[Reservation, Any] = {}
+        for index in range(count):
+            reservation = AgentReservation(abs(expires_in_seconds), prefix="test")
+            reservation.set_expiration_from(time.time() + min(expires_in_seconds, 0.0), abs(expires_in_seconds))
+            reservations_dict[reservation] = {"tools": [{"name": f"agent_{index}", "instructions": "Hi."}]}
+        return reservations_dict
+
+    def test_many_reservations(self):
+        """
+        Sync sees all reservations past the 1000 objects of a single listing page,
+        and expiry deletes in batches without downloading any objects.
+        """
+        self.assert_many_reservations(2100)
+
+    @pytest.mark.integration
+    def test_10k_reservations(self):
+        """
+        Same as above at a scale that takes about a minute against moto.
+        """
+        self.assert_many_reservations(10000)
+
+    def assert_many_reservations(self, num_reservations: int):
+        """
+        :param num_reservations: The total number of reservations to work with,
+                    half of them expired
+        """
+        half: int = num_reservations // 2
+        active: Dict[Reservation, Any] = self.make_reservations(half, 3600.0)
+        expired: Dict[Reservation, Any] = self.make_reservations(half, -60.0)
+
+        self.storage.add_reservations(active)
+        self.storage.add_reservations(expired)
+
+        self.storage.sync_reservations()
+        self.assertEqual(num_reservations, len(self.target.reservations))
+        self.assertEqual(math.ceil(num_reservations / 1000), self.calls.get("ListObjectsV2"))
+
+        self.calls.clear()
+        self.storage.expire_reservations()
+        self.assertNotIn("GetObject", self.calls)
+        self.assertEqual(math.ceil(half / 1000), self.calls.get("DeleteObjects"))
+        self.assertNotIn("DeleteObject", self.calls)
+
+        remaining: List[str] = [obj["Key"] for obj in self.storage.list_objects()]
+        self.assertEqual(sorted(self.storage.get_key(reservation) for reservation in active), sorted(remaining))
+
+    def test_incremental_sync(self):
+        """
+        Objects not modified since the last sync are not read again.
+        """
+        self.storage.add_reservations(self.make_reservations(3, 3600.0))
+        self.storage.sync_reservations()
+        self.assertEqual(3, self.calls.get("GetObject"))
+
+        # LastModified only has a resolution of seconds
+        time.sleep(1.1)
+        self.calls.clear()
+        self.storage.add_reservations(self.make_reservations(2, 3600.0))
+        self.storage.sync_reservations()
+        self.assertEqual(2, self.calls.get("GetObject"))
+        self.assertEqual(5, len(self.target.reservations))
+
+    def test_restored_reservation(self):
+        """
+        A reservation stored again with a later expiration is only read once, with its latest expiration.
+        """
+        reservations_dict: Dict[Reservation, Any] = self.make_reservations(1, 60.0)
+        reservation: Reservation = next(iter(reservations_dict))
+        self.storage.add_reservations(reservations_dict)
+        reservation.set_expiration_from(time.time(), 3600.0)
+        self.storage.add_reservations(reservations_dict)
+
+        self.storage.sync_reservations()
+        self.assertEqual(1, self.calls.get("GetObject"))
+        synced: Dict[str, Any] = self.target.reservations[reservation.get_reservation_id()]
+        self.assertEqual(reservation.get_expiration_time_in_seconds(),
+                         synced["metadata"]["reservation"]["expiration_time_in_seconds"])
+
+    def test_older_key_format(self):
+        """
+        Objects stored under keys without the expiration time are still synced and expired.
+        """
+        converter = ReservationDictionaryConverter()
+        for expires_in_seconds in (-60.0, 3600.0):
+            reservation = AgentReservation(abs(expires_in_seconds), prefix="older")
+            reservation.set_expiration_from(time.time() + min(expires_in_seconds, 0.0), abs(expires_in_seconds))
+            agent_spec: Dict[str, Any] = {
+                "tools": [{"name": "older", "instructions": "Hi."}],
+                "metadata": {"reservation": converter.to_dict(reservation), "stored_at": time.time()}
+            }
+            self.storage.s3_client.put_object(Bucket=self.BUCKET,
+                                              Key=f"reservations/{reservation.get_reservation_id()}.json",
+                                              Body=dumps(agent_spec))
+
+        self.storage.sync_reservations()
+        self.assertEqual(2, len(self.target.reservations))
+
+        self.calls.clear()
+        self.storage.expire_reservations()
+        self.assertEqual(2, self.calls.get("GetObject"))
+        self.assertEqual(1, len(self.storage.list_objects()))
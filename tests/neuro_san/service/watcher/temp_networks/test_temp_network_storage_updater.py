@@ -0,0 +1,190 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+from asyncio import Event
+from unittest import TestCase
+
+import asyncio
+import threading
+
+from janus import Queue
+
+from neuro_san.interfaces.reservation import Reservation
+from neuro_san.internals.chat.async_collating_queue import AsyncCollatingQueue
+from neuro_san.internals.interfaces.reservations_storage import ReservationsStorage
+from neuro_san.internals.network_providers.expiring_agent_network_storage import ExpiringAgentNetworkStorage
+from neuro_san.internals.reservations.agent_reservation import AgentReservation
+from neuro_san.service.generic.service_agent_reservationist import ServiceAgentReservationist
+from neuro_san.service.watcher.temp_networks.temp_network_storage_updater import TempNetworkStorageUpdater
+
+
+class SlowSyncStorage(ReservationsStorage):
+    """
+    ReservationsStorage whose sync_reservations() stands in for a long remote sync.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.syncing = threading.Event()
+        self.release = threading.Event()
+
+    def set_sync_target(self, sync_target: ReservationsStorage):
+        """
+        :param sync_target: Ignored
+        """
+
+    def add_reservations(self, reservations_dict: Dict[Reservation, Any],
+                         source: str = None):
+        """
+        :param reservations_dict: Ignored
+        :param source: Ignored
+        """
+
+    def sync_reservations(self):
+        """
+        Block until released
+        """
+        self.syncing.set()
+        self.release.wait()
+
+    def expire_reservations(self):
+        """
+        Nothing to expire
+        """
+
+
+class TestTempNetworkStorageUpdater(TestCase):
+    """
+    Tests for the deployment of temporary networks by the TempNetworkStorageUpdater.
+    """
+
+    # Much longer than the deployment wait, so only a wakeup can deploy in time.
+    UPDATE_PERIOD_SECONDS: int = 3600
+
+    DEPLOY_TIMEOUT_SECONDS: float = 10.0
+
+    AGENT_SPEC: Dict[str, Any] = {
+        "tools": [
+            {
+                "name": "greeter",
+                "instructions": "Say hello."
+            }
+        ]
+    }
+
+    def test_deploy_on_wakeup(self):
+        """
+        Deployments happen as soon as they are put on a queue, not on the next watcher period.
+        """
+        asyncio.run(self.deploy_and_wait(num_deployments=20, with_wakeup=True))
+
+    def test_safety_net(self):
+        """
+        Without any wakeup, the periodic update_storage() still deploys what was queued.
+        """
+        asyncio.run(self.deploy_and_wait(num_deployments=1, with_wakeup=False))
+
+    def test_deploy_during_slow_sync(self):
+        """
+        A long sync in update_storage() does not hold up deployments on wakeup.
+        """
+        asyncio.run(self.deploy_during_slow_sync())
+
+    async def deploy_during_slow_sync(self):
+        """
+        Deploy a temp network while the StorageWatcher is stuck syncing.
+        """
+        temp_storage = ExpiringAgentNetworkStorage()
+        slow_storage = SlowSyncStorage()
+        queues: Queue[AsyncCollatingQueue] = Queue()
+        wakeup = threading.Event()
+        watcher_config: Dict[str, Any] = {
+            "temporary_network_update_period_seconds": self.UPDATE_PERIOD_SECONDS
+        }
+        updater = TempNetworkStorageUpdater({"temp": temp_storage}, watcher_config, queues, wakeup)
+        updater.reservations_storage.add(slow_storage)
+        updater.start()
+
+        reservationist = ServiceAgentReservationist(wakeup=wakeup)
+        queues.sync_q.put(reservationist.get_queue())
+
+        # Stands in for the StorageWatcher coming around
+        watcher = threading.Thread(target=updater.update_storage, daemon=True)
+        watcher.start()
+        try:
+            self.assertTrue(await asyncio.to_thread(slow_storage.syncing.wait, self.DEPLOY_TIMEOUT_SECONDS))
+
+            reservation: Reservation = await reservationist.reserve(60.0, prefix="slow_sync")
+            agent_reservation = AgentReservation(60.0, prefix="slow_sync")
+            deployed = Event()
+            await reservationist.deploy({reservation: {deployed: {agent_reservation: self.AGENT_SPEC}}})
+            await asyncio.wait_for(deployed.wait(), timeout=self.DEPLOY_TIMEOUT_SECONDS)
+
+            agent_name: str = agent_reservation.get_reservation_id()
+            self.assertIsNotNone(temp_storage.get_agent_network_provider(agent_name).get_agent_network())
+            self.assertTrue(watcher.is_alive())
+
+            await reservationist.close()
+        finally:
+            slow_storage.release.set()
+            watcher.join(timeout=self.DEPLOY_TIMEOUT_SECONDS)
+            updater.stop()
+
+    async def deploy_and_wait(self, num_deployments: int, with_wakeup: bool):
+        """
+        Deploy a number of temp networks one after the other, waiting for each.
+
+        :param num_deployments: The number of temp networks to deploy
+        :param with_wakeup: True if the Reservationist should wake up the updater
+        """
+        temp_storage = ExpiringAgentNetworkStorage()
+        queues: Queue[AsyncCollatingQueue] = Queue()
+        wakeup = threading.Event()
+        watcher_config: Dict[str, Any] = {
+            "temporary_network_update_period_seconds": self.UPDATE_PERIOD_SECONDS
+        }
+        updater = TempNetworkStorageUpdater({"temp": temp_storage}, watcher_config, queues, wakeup)
+        updater.start()
+
+        reservationist = ServiceAgentReservationist(wakeup=wakeup if with_wakeup else None)
+        queues.sync_q.put(reservationist.get_queue())
+
+        try:
+            for _ in range(num_deployments):
+                reservation: Reservation = await reservationist.reserve(60.0, prefix="latency")
+                agent_reservation = AgentReservation(60.0, prefix="latency")
+                deployed = Event()
+
+                await reservationist.deploy({reservation: {deployed: {agent_reservation: self.AGENT_SPEC}}})
+                if not with_wakeup:
+                    # Stands in for the StorageWatcher coming around
+                    await asyncio.to_thread(updater.update_storage)
+                await asyncio.wait_for(deployed.wait(), timeout=self.DEPLOY_TIMEOUT_SECONDS)
+
+                agent_name: str = agent_reservation.get_reservation_id()
+                self.assertIsNotNone(temp_storage.get_agent_network_provider(agent_name).get_agent_network())
+
+            await reservationist.close()
+        finally:
+            updater.stop()
+
+        # The finished queue is dropped from the pool one way or another
+        updater.update_storage()
+        self.assertEqual(0, len(updater.queue_pool))
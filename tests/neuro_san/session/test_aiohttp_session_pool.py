@@ -0,0 +1,79 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+import pytest
+
+from neuro_san.session.aiohttp_session_pool import AiohttpSessionPool
+from neuro_san.session.async_http_service_agent_session import AsyncHttpServiceAgentSession
+
+from tests.neuro_san.utils.stub_http_server import StubHttpServer
+
+
+class TestAiohttpSessionPool:
+    """
+    Tests for sharing aiohttp connections across AsyncHttpServiceAgentSessions
+    """
+
+    NUM_REQUESTS: int = 100
+
+    @pytest.fixture(autouse=True)
+    def reset_pool(self):
+        """
+        Start and end each test with an empty pool
+        """
+        AiohttpSessionPool.reset_for_testing()
+        yield
+        AiohttpSessionPool.reset_for_testing()
+
+    async def call_function(self, use_session_pool: bool) -> int:
+        """
+        Call function() NUM_REQUESTS times, each time with a new session object
+        as the ExternalAgentSessionFactory would.
+        :return: The number of connections the server saw
+        """
+        server = StubHttpServer(body=b'{"function": {"description": "stub"}}')
+        port: int = await server.start()
+        try:
+            for index in range(self.NUM_REQUESTS):
+                session = AsyncHttpServiceAgentSession("127.0.0.1", port, agent_name="stub",
+                                                       metadata={"request_id": str(index)},
+                                                       use_session_pool=use_session_pool)
+                response = await session.function({})
+                assert response.get("function").get("description") == "stub"
+        finally:
+            await server.stop()
+        assert server.num_requests == self.NUM_REQUESTS
+        return server.num_connections
+
+    @pytest.mark.asyncio
+    async def test_pooled_connection_reuse(self):
+        """
+        Pooled sessions share a single keep-alive connection.
+        """
+        num_connections: int = await self.call_function(use_session_pool=True)
+        assert num_connections == 1
+        assert AiohttpSessionPool.num_sessions_created == 1
+        await AiohttpSessionPool.close_session()
+        assert len(AiohttpSessionPool.sessions) == 0
+
+    @pytest.mark.asyncio
+    async def test_unpooled_connections(self):
+        """
+        Without the pool every request opens its own connection, as before.
+        """
+        num_connections: int = await self.call_function(use_session_pool=False)
+        assert num_connections == self.NUM_REQUESTS
+        assert AiohttpSessionPool.num_sessions_created == 0
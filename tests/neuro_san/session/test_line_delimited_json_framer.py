@@ -0,0 +1,125 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+
+import json
+
+import pytest
+
+from neuro_san.session.async_http_service_agent_session import AsyncHttpServiceAgentSession
+from neuro_san.session.line_delimited_json_framer import LineDelimitedJsonFramer
+
+from tests.neuro_san.utils.stub_http_server import StubHttpServer
+
+
+class TestLineDelimitedJsonFramer:
+    """
+    Tests for incremental parsing of line-delimited JSON streams
+    """
+
+    @staticmethod
+    def make_stream(messages: List[Dict[str, Any]]) -> bytes:
+        """
+        :param messages: The messages to encode
+        :return: The line-delimited byte stream a server would send
+        """
+        return b"".join(json.dumps(message).encode("utf-8") + b"\n" for message in messages)
+
+    @staticmethod
+    def frame(stream: bytes, chunk_size: int) -> List[Any]:
+        """
+        :param stream: The bytes to parse
+        :param chunk_size: The size of the chunks to feed the framer
+        :return: The list of parsed messages
+        """
+        framer = LineDelimitedJsonFramer()
+        results: List[Any] = []
+        for start in range(0, len(stream), chunk_size):
+            results.extend(framer.feed(stream[start:start + chunk_size]))
+        results.extend(framer.finish())
+        return results
+
+    def test_fragmented_stream(self):
+        """
+        Single-byte chunks, blank lines, CRLF and multi-byte characters
+        split across chunks all come out intact.
+        """
+        messages: List[Dict[str, Any]] = [{"response": {"text": f"héllo wörld {index} ✓"}}
+                                          for index in range(500)]
+        stream: bytes = self.make_stream(messages)
+        stream = stream.replace(b"\n", b"\r\n\n", 10)
+        assert self.frame(stream, 1) == messages
+        assert self.frame(stream, 7) == messages
+        assert self.frame(stream, len(stream)) == messages
+
+    def test_unterminated_last_line(self):
+        """
+        A last line without a newline is still delivered, but only once the stream ends.
+        """
+        framer = LineDelimitedJsonFramer()
+        assert framer.feed(b'{"a": 1}\n{"b": ') == [{"a": 1}]
+        assert len(framer.feed(b"2}")) == 0
+        assert framer.finish() == [{"b": 2}]
+        assert len(framer.finish()) == 0
+
+    def test_multi_megabyte_stream(self):
+        """
+        Multi-megabyte lines delivered in small chunks are scanned once.
+        Re-concatenating and re-scanning the whole buffer for every chunk
+        as was done before takes minutes for this.
+        """
+        big_text: str = "x" * (8 * 1024 * 1024)
+        messages: List[Dict[str, Any]] = [{"response": {"text": big_text}},
+                                          {"response": {"text": "small"}},
+                                          {"response": {"text": big_text}}]
+        stream: bytes = self.make_stream(messages)
+        longest_line: int = max(len(line) for line in stream.split(b"\n"))
+
+        framer = LineDelimitedJsonFramer()
+        results: List[Any] = []
+        chunk_size: int = 1024
+        for start in range(0, len(stream), chunk_size):
+            results.extend(framer.feed(stream[start:start + chunk_size]))
+
+            # Only the unfinished line is kept, and all of it has been scanned already,
+            # so the next chunk is the only thing left to look at.
+            assert len(framer.buffer) <= longest_line
+            assert framer.scan_offset == len(framer.buffer)
+        results.extend(framer.finish())
+
+        assert results == messages
+
+    @pytest.mark.asyncio
+    async def test_streaming_chat(self):
+        """
+        AsyncHttpServiceAgentSession yields every message of a streamed response.
+        """
+        messages: List[Dict[str, Any]] = [{"response": {"text": "y" * (100 * 1024 + index)}}
+                                          for index in range(20)]
+        server = StubHttpServer(body=self.make_stream(messages), content_type="application/x-ndjson")
+        port: int = await server.start()
+        try:
+            session = AsyncHttpServiceAgentSession("127.0.0.1", port, agent_name="stub")
+            results: List[Dict[str, Any]] = []
+            async for result_dict in session.streaming_chat({}):
+                results.append(result_dict)
+        finally:
+            await server.stop()
+
+        assert results == messages
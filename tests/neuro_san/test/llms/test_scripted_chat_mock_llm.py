@@ -0,0 +1,171 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+from unittest import TestCase
+
+import asyncio
+import json
+import os
+import tempfile
+
+from langchain_core.messages import AIMessage
+from langchain_core.messages import HumanMessage
+from langchain_core.messages import SystemMessage
+from langchain_core.messages import ToolMessage
+from langchain_core.runnables import Runnable
+from langchain_core.tools import tool
+
+from neuro_san.client.direct_agent_session_factory import DirectAgentSessionFactory
+from neuro_san.interfaces.agent_session import AgentSession
+from neuro_san.internals.messages.chat_message_type import ChatMessageType
+from neuro_san.test.llms.scripted_chat_mock_llm import ScriptedChatMockLlm
+
+
+@tool
+def researcher(inquiry: str) -> str:
+    """
+    Finds the facts
+    """
+    return f"Facts about {inquiry}"
+
+
+class TestScriptedChatMockLlm(TestCase):
+    """
+    Tests for the ScriptedChatMockLlm.
+    """
+
+    SCRIPT: List[Dict[str, Any]] = [
+        {"tool_calls": [{"name": "researcher", "args": {"inquiry": "tests"}}]},
+        {"content": "All done."},
+    ]
+
+    def test_tool_calls(self):
+        """
+        Tests that the script is followed one round of tool calls at a time
+        """
+        llm: Runnable = ScriptedChatMockLlm(model_name="scripted", script=self.SCRIPT).bind_tools([researcher])
+        messages: List[Any] = [SystemMessage("Be scripted"), HumanMessage("Go")]
+
+        first: AIMessage = llm.invoke(messages)
+        self.assertEqual(first.content, "")
+        self.assertEqual(len(first.tool_calls), 1)
+        self.assertEqual(first.tool_calls[0].get("name"), "researcher")
+        self.assertEqual(first.tool_calls[0].get("args"), {"inquiry": "tests"})
+        self.assertGreater(first.usage_metadata.get("input_tokens"), 0)
+        self.assertGreater(first.usage_metadata.get("output_tokens"), 0)
+
+        messages.extend([first, ToolMessage("Facts about tests", tool_call_id=first.tool_calls[0].get("id"))])
+        second: AIMessage = asyncio.run(llm.ainvoke(messages))
+        self.assertEqual(second.content, "All done.")
+        self.assertEqual(second.tool_calls, [])
+
+        # A new human message starts the script over
+        messages.extend([second, HumanMessage("Again")])
+        third: AIMessage = llm.invoke(messages)
+        self.assertEqual(third.tool_calls[0].get("name"), "researcher")
+
+    def test_stream(self):
+        """
+        Tests that streaming adds up to the same response as invoking, latency included
+        """
+        llm: Runnable = ScriptedChatMockLlm(model_name="scripted", script=self.SCRIPT,
+                                            time_to_first_token_seconds=0.01).bind_tools([researcher])
+        messages: List[Any] = [HumanMessage("Go")]
+
+        streamed: AIMessage = None
+        for chunk in llm.stream(messages):
+            streamed = chunk if streamed is None else streamed + chunk
+        invoked: AIMessage = llm.invoke(messages)
+
+        self.assertEqual(streamed.tool_calls, invoked.tool_calls)
+        self.assertEqual(streamed.usage_metadata, invoked.usage_metadata)
+
+    def test_echo(self):
+        """
+        Tests that a turn without content or tool calls echoes the human
+        """
+        llm = ScriptedChatMockLlm(model_name="scripted", script=[{}])
+        self.assertEqual(llm.invoke("Hello").content, "Hello")
+
+    def test_errors(self):
+        """
+        Tests that error turns fail the given number of times before being passed over
+        """
+        script: List[Dict[str, Any]] = [
+            {"error": "Scripted failure", "times": 2},
+            {"content": "Recovered"},
+        ]
+        llm = ScriptedChatMockLlm(model_name="scripted", script=script)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                llm.invoke("Go")
+        self.assertEqual(llm.invoke("Go").content, "Recovered")
+
+        # Without tools bound, the script cannot call any
+        llm = ScriptedChatMockLlm(model_name="scripted", script=self.SCRIPT)
+        with self.assertRaises(ValueError):
+            llm.invoke("Go")
+
+    def test_script_file(self):
+        """
+        Tests finding a script by its key in a script file
+        """
+        scripts: Dict[str, Any] = {
+            "greeter": [{"content": "Hello there"}],
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script_file: str = os.path.join(temp_dir, "scripts.hocon")
+            with open(script_file, "w", encoding="utf-8") as script_out:
+                json.dump(scripts, script_out)
+
+            llm = ScriptedChatMockLlm(model_name="scripted", script_file=script_file, script_key="greeter")
+            self.assertEqual(llm.invoke("Hi").content, "Hello there")
+
+            llm = ScriptedChatMockLlm(model_name="scripted", script_file=script_file, script_key="missing")
+            with self.assertRaises(ValueError):
+                llm.invoke("Hi")
+
+    def test_agent_network(self):
+        """
+        Tests a whole agent network where the front man fans out to two agents,
+        one of which needs a retry and the other a fallback.
+        """
+        factory = DirectAgentSessionFactory()
+        session: AgentSession = factory.create_session("neuro_san/registries/chat_mock_llm_scripted.hocon")
+        request: Dict[str, Any] = {
+            "user_message": {
+                "type": "HUMAN",
+                "text": "Go",
+            },
+            "chat_filter": {
+                "chat_filter_type": "MAXIMAL",
+            },
+        }
+
+        answers: Dict[str, str] = {}
+        for response in session.streaming_chat(request):
+            message: Dict[str, Any] = response.get("response", {})
+            if ChatMessageType.from_response_type(message.get("type")) == ChatMessageType.AI:
+                agent: str = message.get("origin")[-1].get("tool")
+                answers[agent] = message.get("text")
+
+        self.assertEqual(answers.get("researcher"), "Here are the facts.")
+        self.assertEqual(answers.get("writer"), "Here is the report.")
+        self.assertEqual(answers.get("coordinator"), "The research is in and the report is written.")
@@ -0,0 +1,39 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+from unittest import TestCase
+
+from neuro_san.test.load.agent_network_copy_benchmark import AgentNetworkCopyBenchmark
+
+
+class TestAgentNetworkCopyBenchmark(TestCase):
+    """
+    Tests for the AgentNetworkCopyBenchmark over the bundled registries.
+    """
+
+    def test_run(self):
+        """
+        Every bundled network is copied both ways, and the copy-on-write copies take less memory.
+        """
+        benchmark = AgentNetworkCopyBenchmark(num_sessions=2)
+        report: Dict[str, Any] = benchmark.run()
+
+        self.assertGreater(report.get("Networks"), 0)
+        self.assertEqual(report.get("Sessions"), 2)
+        self.assertLess(report.get("CreateCopy").get("PeakKiB"), report.get("DeepCopy").get("PeakKiB"))
@@ -0,0 +1,46 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+from unittest import TestCase
+
+from neuro_san.test.load.concurrent_tool_calls_benchmark import ConcurrentToolCallsBenchmark
+
+
+class TestConcurrentToolCallsBenchmark(TestCase):
+    """
+    Tests for the ConcurrentToolCallsBenchmark with a single request each way.
+    """
+
+    TOOL_DELAY_SECONDS: float = 0.1
+
+    def test_run(self):
+        """
+        Every request succeeds, and serial tool calls wait for one tool after the other.
+        """
+        benchmark = ConcurrentToolCallsBenchmark(num_sessions=1, requests_per_session=1,
+                                                 tool_delay_seconds=self.TOOL_DELAY_SECONDS)
+        report: Dict[str, Any] = benchmark.run()
+
+        for name in ("Serial", "Concurrent"):
+            self.assertEqual(report.get(name).get("Errors"), 0, report.get(name).get("FirstErrors"))
+            self.assertEqual(report.get(name).get("Requests"), 1)
+
+        # Both tools wait before answering
+        self.assertGreaterEqual(report.get("Serial").get("TotalLatencySeconds").get("p50"),
+                                2 * self.TOOL_DELAY_SECONDS)
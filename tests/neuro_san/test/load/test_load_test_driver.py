@@ -0,0 +1,103 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+from unittest import TestCase
+
+import asyncio
+
+from neuro_san.test.load.load_test_driver import LoadTestDriver
+from neuro_san.test.load.load_test_server import LoadTestServer
+
+
+class TestLoadTestDriver(TestCase):
+    """
+    Tests for the LoadTestDriver against a LoadTestServer with a mock LLM.
+    """
+
+    TIME_TO_FIRST_TOKEN_SECONDS: float = 0.02
+
+    server: LoadTestServer = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = LoadTestServer(time_to_first_token_seconds=cls.TIME_TO_FIRST_TOKEN_SECONDS,
+                                    seconds_per_token=0.001)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def run_driver(self, protocol: str) -> Dict[str, Any]:
+        """
+        :param protocol: The protocol to drive the server with
+        :return: The report of a small load test
+        """
+        driver = LoadTestDriver(self.server.http_port,
+                                LoadTestServer.DEFAULT_AGENT_NAME,
+                                protocol=protocol,
+                                num_sessions=4,
+                                requests_per_session=3,
+                                think_time_seconds=0.01,
+                                chat_filter_type="MAXIMAL",
+                                executor_pool=self.server.get_executor_pool(),
+                                sample_interval_seconds=0.05,
+                                timeout_seconds=30.0)
+        return asyncio.run(driver.run())
+
+    def assert_report(self, report: Dict[str, Any]):
+        """
+        :param report: The report of a small load test without errors
+        """
+        self.assertEqual(0, report.get("Errors"), report.get("FirstErrors"))
+        self.assertEqual(12, report.get("Requests"))
+        self.assertGreater(report.get("MessagesPerSecond"), 0.0)
+
+        ttfb: Dict[str, float] = report.get("TimeToFirstByteSeconds")
+        total: Dict[str, float] = report.get("TotalLatencySeconds")
+        self.assertGreaterEqual(ttfb.get("p50"), self.TIME_TO_FIRST_TOKEN_SECONDS)
+        self.assertLessEqual(ttfb.get("p50"), ttfb.get("p95"))
+        self.assertLessEqual(ttfb.get("p95"), ttfb.get("p99"))
+        self.assertLessEqual(ttfb.get("max"), total.get("max"))
+
+        self.assertGreater(report.get("MaxRssBytes"), 0)
+        self.assertGreater(report.get("MaxOpenFds"), 0)
+        self.assertGreaterEqual(report.get("MaxExecutorsUsed"), 1)
+
+    def test_http(self):
+        """
+        Sessions run against the streaming_chat endpoint.
+        """
+        report: Dict[str, Any] = self.run_driver("http")
+        self.assert_report(report)
+        # Maximal chat filter gets more than just the final answer
+        self.assertGreater(report.get("MessagesPerSecond"), report.get("RequestsPerSecond"))
+
+    def test_mcp(self):
+        """
+        Sessions run as MCP tools/call requests.
+        """
+        self.assert_report(self.run_driver("mcp"))
+
+    def test_summarize(self):
+        """
+        Percentiles are nearest-rank.
+        """
+        summary: Dict[str, float] = LoadTestDriver.summarize([float(value) for value in range(100, 0, -1)])
+        self.assertEqual({"p50": 50.0, "p95": 95.0, "p99": 99.0, "max": 100.0}, summary)
+        self.assertEqual({}, LoadTestDriver.summarize([]))
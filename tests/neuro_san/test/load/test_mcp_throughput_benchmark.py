@@ -0,0 +1,39 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+from unittest import TestCase
+
+from neuro_san.test.load.mcp_throughput_benchmark import McpThroughputBenchmark
+
+
+class TestMcpThroughputBenchmark(TestCase):
+    """
+    Tests for the McpThroughputBenchmark with a few requests.
+    """
+
+    def test_run(self):
+        """
+        Every tools/list and tools/call request succeeds.
+        """
+        benchmark = McpThroughputBenchmark(num_requests=5, concurrency=2)
+        report: Dict[str, Any] = benchmark.run()
+
+        for method in McpThroughputBenchmark.METHODS:
+            self.assertEqual(report.get(method).get("Errors"), 0, report.get(method).get("FirstErrors"))
+            self.assertGreater(report.get(method).get("RequestsPerSecond"), 0.0)
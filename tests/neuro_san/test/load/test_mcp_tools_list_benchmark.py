@@ -0,0 +1,41 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+from unittest import TestCase
+
+from neuro_san.test.load.mcp_tools_list_benchmark import McpToolsListBenchmark
+
+
+class TestMcpToolsListBenchmark(TestCase):
+    """
+    Tests for the McpToolsListBenchmark on a few networks.
+    """
+
+    def test_run(self):
+        """
+        Every network is listed both ways, with as many authorization checks at once as allowed.
+        """
+        benchmark = McpToolsListBenchmark(num_networks=6, authorizer_delay_seconds=0.01,
+                                          num_requests=2, max_concurrent_authorizations=3)
+        report: Dict[str, Any] = benchmark.run()
+
+        self.assertEqual(report.get("OneAtATime").get("Tools"), 6)
+        self.assertEqual(report.get("OneAtATime").get("MaxAuthorizationsInFlight"), 1)
+        self.assertEqual(report.get("Concurrent").get("Tools"), 6)
+        self.assertEqual(report.get("Concurrent").get("MaxAuthorizationsInFlight"), 3)
+        self.assertEqual(report.get("DescriptorBuilds"), 6)
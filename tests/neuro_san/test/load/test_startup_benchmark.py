@@ -0,0 +1,50 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+
+from unittest import TestCase
+
+import tempfile
+
+from neuro_san.test.load.startup_benchmark import StartupBenchmark
+
+
+class TestStartupBenchmark(TestCase):
+    """
+    Tests for the StartupBenchmark on a small generated manifest.
+    """
+
+    def test_restore_generated_registry(self):
+        """
+        Every generated network restores without errors.
+        """
+        benchmark = StartupBenchmark(num_networks=3, agents_per_network=3)
+        with tempfile.TemporaryDirectory() as registry_dir:
+            manifest_file: str = benchmark.write_registry(registry_dir)
+            report: Dict[str, Any] = benchmark.measure_restore(manifest_file, max_workers=1)
+
+        self.assertEqual(report.get("Errors"), 0)
+        self.assertEqual(report.get("Workers"), 1)
+        self.assertGreater(report.get("TotalSeconds"), 0.0)
+
+    def test_import_leaves_out_providers(self):
+        """
+        Importing the server does not import any llm provider packages.
+        """
+        benchmark = StartupBenchmark()
+        report: Dict[str, Any] = benchmark.measure_import()
+        self.assertEqual(report.get("ProviderModules"), [])
@@ -0,0 +1,55 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+class FakeAgentPolicy:
+    """
+    Stands in for the AgentPolicy, allowing everything, and for the
+    AsyncAgentServiceProvider of the single fake service it hands out for any agent.
+    """
+
+    def __init__(self, service: Any, agent_names: List[str] = None):
+        """
+        Constructor
+
+        :param service: The fake AsyncAgentService to hand out
+        :param agent_names: The names of the agents to list, if any
+        """
+        self.service: Any = service
+        self.agent_names: List[str] = agent_names or []
+
+    async def list_agents(self, _metadata: Dict[str, Any]) -> List[str]:
+        """
+        :return: All agents
+        """
+        return self.agent_names
+
+    async def allow_agent(self, _agent_name: str, _metadata: Dict[str, Any]) -> Tuple[bool, Any]:
+        """
+        :return: Always authorized, with this as the service provider
+        """
+        return True, self
+
+    def get_service(self) -> Any:
+        """
+        Stands in for AsyncAgentServiceProvider.get_service()
+        """
+        return self.service
@@ -0,0 +1,99 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from typing import Any
+from typing import Dict
+from typing import Set
+from typing import Tuple
+
+from aiohttp import web
+
+
+class FakeFgaServer:
+    """
+    Minimal in-memory stand-in for an OpenFGA server for tests.
+    Only direct relationship tuples are understood, and calls to each endpoint are counted.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.tuples: Set[Tuple[str, str, str]] = set()
+        self.num_checks: int = 0
+        self.num_list_objects: int = 0
+        self.num_writes: int = 0
+        # Like the server's max results for list-objects, None for no limit
+        self.max_list_results: int = None
+        self.runner: web.AppRunner = None
+
+    async def start(self) -> str:
+        """
+        :return: the url the server listens on
+        """
+        app = web.Application()
+        app.router.add_post("/stores/{store_id}/check", self.check)
+        app.router.add_post("/stores/{store_id}/list-objects", self.list_objects)
+        app.router.add_post("/stores/{store_id}/write", self.write)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port: int = self.runner.addresses[0][1]
+        return f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        """
+        Stop the server
+        """
+        await self.runner.cleanup()
+
+    async def check(self, request: web.Request) -> web.Response:
+        """
+        Answer a single check
+        """
+        self.num_checks += 1
+        body: Dict[str, Any] = await request.json()
+        tuple_key: Dict[str, str] = body.get("tuple_key")
+        allowed: bool = (tuple_key.get("user"), tuple_key.get("relation"), tuple_key.get("object")) in self.tuples
+        return web.json_response({"allowed": allowed, "resolution": ""})
+
+    async def list_objects(self, request: web.Request) -> web.Response:
+        """
+        List all objects of a type the user has the relation to
+        """
+        self.num_list_objects += 1
+        body: Dict[str, Any] = await request.json()
+        prefix: str = f"{body.get('type')}:"
+        objects = sorted(fga_object for user, relation, fga_object in self.tuples
+                         if user == body.get("user") and relation == body.get("relation")
+                         and fga_object.startswith(prefix))
+        if self.max_list_results is not None:
+            objects = objects[:self.max_list_results]
+        return web.json_response({"objects": objects})
+
+    async def write(self, request: web.Request) -> web.Response:
+        """
+        Add and remove tuples
+        """
+        self.num_writes += 1
+        body: Dict[str, Any] = await request.json()
+        for tuple_key in (body.get("writes") or {}).get("tuple_keys", []):
+            self.tuples.add((tuple_key.get("user"), tuple_key.get("relation"), tuple_key.get("object")))
+        for tuple_key in (body.get("deletes") or {}).get("tuple_keys", []):
+            self.tuples.discard((tuple_key.get("user"), tuple_key.get("relation"), tuple_key.get("object")))
+        return web.json_response({})
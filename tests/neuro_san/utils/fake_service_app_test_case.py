@@ -0,0 +1,69 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+import os
+
+from tornado.testing import AsyncHTTPTestCase
+
+from neuro_san import DEPLOY_DIR
+from neuro_san.service.http.logging.http_logger import HttpLogger
+from neuro_san.service.http.server.admission_controller import AdmissionController
+from neuro_san.service.http.server.http_server_app import HttpServerApp
+from tests.neuro_san.utils.fake_agent_policy import FakeAgentPolicy
+
+
+# pylint: disable=abstract-method
+class FakeServiceAppTestCase(AsyncHTTPTestCase):
+    """
+    Base class for tests of request handlers served by an HttpServerApp,
+    with fake agent services standing in for real agent networks.
+    """
+
+    def setUp(self):
+        self.use_repo_logging()
+        super().setUp()
+
+    @staticmethod
+    def use_repo_logging():
+        """
+        Same as what the server main loop does for running from the repo
+        """
+        if os.environ.get("AGENT_SERVICE_LOG_JSON") is None:
+            os.environ["AGENT_SERVICE_LOG_JSON"] = DEPLOY_DIR.get_file_in_basis("logging.json")
+
+    @staticmethod
+    def make_app(routes: List[Tuple[str, Any]], agent_policy: FakeAgentPolicy,
+                 handler_data: Dict[str, Any] = None,
+                 admission_controller: AdmissionController = None) -> HttpServerApp:
+        """
+        :param routes: A list of (url pattern, request handler class) tuples
+        :param agent_policy: The FakeAgentPolicy for the handlers to get their services from
+        :param handler_data: Any further data to initialize the handlers with
+        :param admission_controller: The AdmissionController of the app, if any
+        :return: An HttpServerApp serving the handlers
+        """
+        all_handler_data: Dict[str, Any] = {
+            "agent_policy": agent_policy,
+            "forwarded_request_metadata": [],
+        }
+        all_handler_data.update(handler_data or {})
+        handlers = [(pattern, handler_class, all_handler_data) for pattern, handler_class in routes]
+        return HttpServerApp(handlers, -1, HttpLogger([]), [], admission_controller=admission_controller)
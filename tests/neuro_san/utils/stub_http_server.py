@@ -0,0 +1,78 @@
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import List
+
+import asyncio
+
+
+class StubHttpServer:
+    """
+    Minimal keep-alive HTTP/1.1 server for tests that counts the connections it accepts.
+    Every request is answered with the same body.
+    """
+
+    def __init__(self, body: bytes = b"{}", content_type: str = "application/json"):
+        """
+        Constructor
+
+        :param body: The body to answer every request with
+        :param content_type: The content type of the body
+        """
+        self.body: bytes = body
+        self.content_type: str = content_type
+        self.num_connections: int = 0
+        self.num_requests: int = 0
+        self.server: asyncio.Server = None
+
+    async def start(self) -> int:
+        """
+        :return: the port the server listens on
+        """
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """
+        Stop the server
+        """
+        self.server.close()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Answer every request on the connection
+        """
+        self.num_connections += 1
+        try:
+            while True:
+                request: bytes = await reader.readuntil(b"\r\n\r\n")
+                content_length: int = 0
+                header_lines: List[str] = request.decode("latin-1").split("\r\n")
+                for header_line in header_lines:
+                    if header_line.lower().startswith("content-length:"):
+                        content_length = int(header_line.split(":", 1)[1].strip())
+                if content_length > 0:
+                    await reader.readexactly(content_length)
+
+                self.num_requests += 1
+                writer.write(b"HTTP/1.1 200 OK\r\n"
+                             + f"Content-Type: {self.content_type}\r\n".encode("latin-1")
+                             + f"Content-Length: {len(self.body)}\r\n\r\n".encode("latin-1")
+                             + self.body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
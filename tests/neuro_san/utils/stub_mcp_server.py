@@ -0,0 +1,90 @@
+
+# Copyright © 2023-2026 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+from typing import List
+
+import threading
+import time
+
+import uvicorn
+
+from mcp.server.fastmcp import FastMCP
+from mcp.types import Tool
+
+
+class CountingFastMCP(FastMCP):
+    """
+    FastMCP server which counts the tools/list requests it gets.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.num_list_tools: int = 0
+
+    async def list_tools(self) -> List[Tool]:
+        self.num_list_tools += 1
+        return await super().list_tools()
+
+
+class StubMcpServer:
+    """
+    Local streamable http MCP server for tests, run by uvicorn in a background thread.
+    Offers a single "add" tool.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.mcp = CountingFastMCP("stub")
+        self.mcp.add_tool(self.add, name="add", description="Adds two numbers")
+        self.server: uvicorn.Server = None
+        self.thread: threading.Thread = None
+        self.url: str = None
+
+    @staticmethod
+    def add(a: int, b: int) -> int:
+        """
+        The stub tool
+        """
+        return a + b
+
+    def start(self) -> str:
+        """
+        :return: The url of the MCP endpoint
+        """
+        config = uvicorn.Config(self.mcp.streamable_http_app(), host="127.0.0.1", port=0, log_level="warning")
+        self.server = uvicorn.Server(config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        port: int = self.server.servers[0].sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/mcp"
+        return self.url
+
+    def stop(self):
+        """
+        Stop the server
+        """
+        self.server.should_exit = True
+        self.thread.join(timeout=5)
+
+    def get_num_list_tools(self) -> int:
+        """
+        :return: The number of tools/list requests the server got
+        """
+        return self.mcp.num_list_tools